@@ -11,7 +11,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from app.core.database import Base
-from app.models import Resume, Job, Enhancement
+from app.models import Resume, Job, Enhancement, LLMResult
 from app.core.config import settings
 
 # this is the Alembic Config object, which provides
@@ -0,0 +1,33 @@
+"""Add worker lease columns for concurrent job claiming
+
+Revision ID: 005_worker_lease
+Revises: 004_security_columns
+Create Date: 2026-10-16 09:00:00.000000
+
+This migration adds lease columns to the enhancements table so several
+worker slots (threads or processes) can run side by side without
+processing the same enhancement twice:
+- claimed_by: Identifier of the worker slot that owns the row
+- lease_expires_at: Claim expiry, lets another worker recover rows
+  abandoned by a crashed worker
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '005_worker_lease'
+down_revision = '004_security_columns'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add lease columns to enhancements table."""
+    op.add_column('enhancements', sa.Column('claimed_by', sa.String(255), nullable=True))
+    op.add_column('enhancements', sa.Column('lease_expires_at', sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    """Remove lease columns from enhancements table."""
+    op.drop_column('enhancements', 'lease_expires_at')
+    op.drop_column('enhancements', 'claimed_by')
@@ -0,0 +1,29 @@
+"""Add partial_content column for streamed generation progress
+
+Revision ID: 006_partial_content
+Revises: 005_worker_lease
+Create Date: 2026-10-16 11:00:00.000000
+
+This migration adds a column holding the text streamed from Claude while a
+resume or cover letter is still being generated. The worker flushes chunks
+into it as they arrive and clears it once the final content is stored, and
+GET /enhancements/{id}/stream relays it to the browser as Server-Sent Events.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '006_partial_content'
+down_revision = '005_worker_lease'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add partial_content column to enhancements table."""
+    op.add_column('enhancements', sa.Column('partial_content', sa.Text(), nullable=True))
+
+
+def downgrade():
+    """Remove partial_content column from enhancements table."""
+    op.drop_column('enhancements', 'partial_content')
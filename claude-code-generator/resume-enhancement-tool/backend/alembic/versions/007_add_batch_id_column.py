@@ -0,0 +1,31 @@
+"""Add batch_id column for Message Batches mode
+
+Revision ID: 007_batch_id
+Revises: 006_partial_content
+Create Date: 2026-10-16 13:00:00.000000
+
+This migration adds the id of the Message Batch an enhancement was submitted
+in by `worker.py --batch`. Rows with a batch_id are skipped by the regular
+worker slots until the batch results are collected, at which point the
+column is cleared and the row continues through the normal render pipeline.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '007_batch_id'
+down_revision = '006_partial_content'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add batch_id column and index to enhancements table."""
+    op.add_column('enhancements', sa.Column('batch_id', sa.String(255), nullable=True))
+    op.create_index('ix_enhancements_batch_id', 'enhancements', ['batch_id'])
+
+
+def downgrade():
+    """Remove batch_id column and index from enhancements table."""
+    op.drop_index('ix_enhancements_batch_id', table_name='enhancements')
+    op.drop_column('enhancements', 'batch_id')
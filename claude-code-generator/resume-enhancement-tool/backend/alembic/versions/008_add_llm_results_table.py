@@ -0,0 +1,40 @@
+"""Add llm_results table for the generation result cache
+
+Revision ID: 008_llm_results
+Revises: 007_batch_id
+Create Date: 2026-10-16 14:00:00.000000
+
+This migration adds a content-addressed cache of Claude generations. Rows
+are keyed on a SHA-256 of the normalized request (model, system prompt,
+sanitized resume and job description, instructions), expire after
+LLM_CACHE_TTL_SECONDS and are evicted least-recently-used first once
+LLM_CACHE_MAX_ENTRIES is exceeded.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '008_llm_results'
+down_revision = '007_batch_id'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create llm_results table."""
+    op.create_table('llm_results',
+        sa.Column('cache_key', sa.String(length=64), nullable=False),
+        sa.Column('model', sa.String(length=100), nullable=False),
+        sa.Column('content', sa.Text(), nullable=False),
+        sa.Column('hit_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('last_used_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('cache_key')
+    )
+    op.create_index('ix_llm_results_last_used_at', 'llm_results', ['last_used_at'])
+
+
+def downgrade():
+    """Drop llm_results table."""
+    op.drop_index('ix_llm_results_last_used_at', table_name='llm_results')
+    op.drop_table('llm_results')
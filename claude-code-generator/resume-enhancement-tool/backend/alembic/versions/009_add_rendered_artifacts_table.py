@@ -0,0 +1,41 @@
+"""Add rendered_artifacts table for the PDF/DOCX render cache
+
+Revision ID: 009_rendered_artifacts
+Revises: 008_llm_results
+Create Date: 2026-10-16 22:00:00.000000
+
+This migration adds a cache of rendered downloads. Rows are keyed on a
+SHA-256 of the markdown source, output format, template and generator
+version, so a document is rendered once per version and survives
+redeploys that wipe the workspace. Least recently used rows are evicted
+once ARTIFACT_CACHE_MAX_ENTRIES is exceeded.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '009_rendered_artifacts'
+down_revision = '008_llm_results'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create rendered_artifacts table."""
+    op.create_table('rendered_artifacts',
+        sa.Column('cache_key', sa.String(length=64), nullable=False),
+        sa.Column('format', sa.String(length=10), nullable=False),
+        sa.Column('content', sa.LargeBinary(), nullable=False),
+        sa.Column('size_bytes', sa.Integer(), nullable=False),
+        sa.Column('hit_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('last_used_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('cache_key')
+    )
+    op.create_index('ix_rendered_artifacts_last_used_at', 'rendered_artifacts', ['last_used_at'])
+
+
+def downgrade():
+    """Drop rendered_artifacts table."""
+    op.drop_index('ix_rendered_artifacts_last_used_at', table_name='rendered_artifacts')
+    op.drop_table('rendered_artifacts')
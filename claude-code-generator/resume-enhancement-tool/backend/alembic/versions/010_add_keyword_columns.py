@@ -0,0 +1,37 @@
+"""Add keyword columns to resumes, jobs and enhancements
+
+Revision ID: 010_keyword_columns
+Revises: 009_rendered_artifacts
+Create Date: 2026-10-16 23:00:00.000000
+
+This migration adds the keyword sets extracted when a resume is uploaded,
+a job is created or an enhanced resume is stored, so analysis and job
+matching no longer re-read and re-scan the text on every request.
+keywords_version records the extractor and skills taxonomy version; run
+backfill_keywords.py after upgrading to index existing rows (rows that are
+not backfilled are indexed on first use).
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '010_keyword_columns'
+down_revision = '009_rendered_artifacts'
+branch_labels = None
+depends_on = None
+
+TABLES = ('resumes', 'jobs', 'enhancements')
+
+
+def upgrade():
+    """Add keywords and keywords_version columns."""
+    for table in TABLES:
+        op.add_column(table, sa.Column('keywords', sa.Text(), nullable=True))
+        op.add_column(table, sa.Column('keywords_version', sa.String(length=64), nullable=True))
+
+
+def downgrade():
+    """Remove keywords and keywords_version columns."""
+    for table in TABLES:
+        op.drop_column(table, 'keywords_version')
+        op.drop_column(table, 'keywords')
@@ -0,0 +1,32 @@
+"""Add style signal columns to jobs
+
+Revision ID: 011_job_style_signals
+Revises: 010_keyword_columns
+Create Date: 2026-10-17 09:00:00.000000
+
+This migration stores the job signals StyleAnalyzer extracts (seniority,
+industry, technical depth, ...) on the job row together with the content
+hash they were computed for. Style checks against a job then only do the
+scoring arithmetic; signals are recomputed when the title, description,
+signal rules or skills taxonomy change the hash.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '011_job_style_signals'
+down_revision = '010_keyword_columns'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add style_signals and style_signals_key columns to jobs table."""
+    op.add_column('jobs', sa.Column('style_signals', sa.Text(), nullable=True))
+    op.add_column('jobs', sa.Column('style_signals_key', sa.String(length=64), nullable=True))
+
+
+def downgrade():
+    """Remove style_signals and style_signals_key columns from jobs table."""
+    op.drop_column('jobs', 'style_signals_key')
+    op.drop_column('jobs', 'style_signals')
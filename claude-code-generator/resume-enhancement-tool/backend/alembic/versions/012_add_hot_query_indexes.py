@@ -0,0 +1,65 @@
+"""Add composite and partial indexes for the hot queries
+
+Revision ID: 012_hot_query_indexes
+Revises: 011_job_style_signals
+Create Date: 2026-10-17 12:00:00.000000
+
+This migration indexes the queries run on every request or worker poll,
+which could otherwise only use the single-column user_id indexes:
+- List endpoints filter by user_id and page on (created_at, id), newest
+  first: composite (user_id, created_at, id) indexes on enhancements, jobs
+  and resumes serve the filter, the seek and the order.
+- The worker claims the oldest pending enhancement or pending cover letter:
+  partial indexes on created_at cover only the rows waiting in each queue,
+  so they stay small however many enhancements have completed.
+- The batch_id index is rebuilt as a partial index over rows in a Message
+  Batch. It held an entry for every enhancement (nearly all NULL), and
+  planners picked it for the claim query's `batch_id IS NULL` and then
+  sorted the whole result.
+
+tests/test_query_plans.py checks that these queries keep using them.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '012_hot_query_indexes'
+down_revision = '011_job_style_signals'
+branch_labels = None
+depends_on = None
+
+PENDING_ENHANCEMENT = "status = 'pending'"
+PENDING_COVER_LETTER = "status = 'completed' AND cover_letter_status = 'pending' AND job_id IS NOT NULL"
+IN_BATCH = "batch_id IS NOT NULL"
+
+
+def upgrade():
+    """Create list and claim queue indexes; make the batch_id index partial."""
+    for table in ('enhancements', 'jobs', 'resumes'):
+        op.create_index(f'ix_{table}_user_id_created_at_id', table, ['user_id', 'created_at', 'id'])
+
+    op.create_index(
+        'ix_enhancements_pending_created_at', 'enhancements', ['created_at'],
+        postgresql_where=sa.text(PENDING_ENHANCEMENT), sqlite_where=sa.text(PENDING_ENHANCEMENT),
+    )
+    op.create_index(
+        'ix_enhancements_pending_cover_letter_created_at', 'enhancements', ['created_at'],
+        postgresql_where=sa.text(PENDING_COVER_LETTER), sqlite_where=sa.text(PENDING_COVER_LETTER),
+    )
+
+    op.drop_index('ix_enhancements_batch_id', table_name='enhancements')
+    op.create_index(
+        'ix_enhancements_batch_id', 'enhancements', ['batch_id'],
+        postgresql_where=sa.text(IN_BATCH), sqlite_where=sa.text(IN_BATCH),
+    )
+
+
+def downgrade():
+    """Drop list and claim queue indexes; restore the full batch_id index."""
+    op.drop_index('ix_enhancements_batch_id', table_name='enhancements')
+    op.create_index('ix_enhancements_batch_id', 'enhancements', ['batch_id'])
+
+    op.drop_index('ix_enhancements_pending_cover_letter_created_at', table_name='enhancements')
+    op.drop_index('ix_enhancements_pending_created_at', table_name='enhancements')
+    for table in ('resumes', 'jobs', 'enhancements'):
+        op.drop_index(f'ix_{table}_user_id_created_at_id', table_name=table)
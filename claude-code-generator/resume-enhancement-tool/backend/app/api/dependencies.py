@@ -10,7 +10,7 @@ to support token revocation on password change/logout.
 """
 
 import logging
-from typing import Generator
+from typing import Generator, Optional
 from pathlib import Path
 from functools import lru_cache
 
@@ -22,8 +22,14 @@ from sqlalchemy.orm import Session
 from ..core.database import SessionLocal
 from ..core.config import settings
 from ..services.anthropic_service import AnthropicService
+from ..services.artifact_cache import ArtifactCache
+from ..services.keyword_index import KeywordIndex
+from ..services.relevance_index import JobRelevanceIndex
 from ..services.workspace_service import WorkspaceService
+from ..services.job_notifier import JobNotifier, create_job_notifier
+from ..services.parse_pool import PDFParsePool
 from ..utils.document_parser import DocumentParser
+from ..utils.style_analyzer import StyleAnalyzer
 from ..utils.auth import decode_access_token, verify_token_version
 from ..models.user import User
 
@@ -69,6 +75,67 @@ def get_workspace_service() -> WorkspaceService:
     return WorkspaceService(WORKSPACE_ROOT)
 
 
+@lru_cache()
+def get_parse_pool() -> Optional[PDFParsePool]:
+    """
+    Get PDF parse pool singleton.
+
+    Worker processes are started on first use and stopped on app shutdown.
+
+    Returns:
+        PDFParsePool, or None if PARSE_POOL_WORKERS is 0
+    """
+    if settings.PARSE_POOL_WORKERS <= 0:
+        return None
+    return PDFParsePool(settings.PARSE_POOL_WORKERS, settings.PARSE_TIMEOUT_SECONDS)
+
+
+@lru_cache()
+def get_artifact_cache() -> Optional[ArtifactCache]:
+    """
+    Get rendered download cache singleton.
+
+    Returns:
+        ArtifactCache, or None if ARTIFACT_CACHE_ENABLED is off
+    """
+    if not settings.ARTIFACT_CACHE_ENABLED:
+        return None
+    return ArtifactCache(max_entries=settings.ARTIFACT_CACHE_MAX_ENTRIES)
+
+
+@lru_cache()
+def get_keyword_index() -> KeywordIndex:
+    """
+    Get keyword index singleton.
+
+    Returns:
+        KeywordIndex for the stored keyword sets on resumes, jobs and enhancements
+    """
+    return KeywordIndex()
+
+
+@lru_cache()
+def get_style_analyzer() -> StyleAnalyzer:
+    """
+    Get style analyzer singleton.
+
+    Returns:
+        StyleAnalyzer whose job signal memo is shared by all requests
+    """
+    return StyleAnalyzer()
+
+
+@lru_cache()
+def get_relevance_index() -> JobRelevanceIndex:
+    """
+    Get job relevance index singleton.
+
+    Returns:
+        JobRelevanceIndex over all stored job descriptions
+    """
+    return JobRelevanceIndex(sync_interval=settings.RELEVANCE_SYNC_SECONDS)
+
+
 @lru_cache()
 def get_document_parser() -> DocumentParser:
     """
@@ -78,16 +145,31 @@ def get_document_parser() -> DocumentParser:
     is reused across all requests.
 
     Returns:
-        DocumentParser instance
+        DocumentParser instance backed by the parse pool
+    """
+    return DocumentParser(pool=get_parse_pool())
+
+
+@lru_cache()
+def get_job_notifier() -> JobNotifier:
+    """
+    Get job notifier singleton.
+
+    Used by enhancement routes to wake the worker as soon as a job is queued.
+
+    Returns:
+        JobNotifier for the JOB_NOTIFIER backend configured in settings
     """
-    return DocumentParser()
+    return create_job_notifier(
+        settings.JOB_NOTIFIER, settings.DATABASE_URL, settings.JOB_NOTIFY_PORT
+    )
 
 
 # Authentication
 security = HTTPBearer()
 
 
-async def get_current_user(
+def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
 ) -> User:
@@ -148,7 +230,7 @@ async def get_current_user(
     return user
 
 
-async def get_current_active_user(
+def get_current_active_user(
     current_user: User = Depends(get_current_user)
 ) -> User:
     """Ensure user is active.
@@ -178,7 +260,7 @@ class RequiresRole:
 
     Example:
         @router.get("/admin/users")
-        async def list_all_users(
+        def list_all_users(
             current_user: User = Depends(RequiresRole("admin"))
         ):
             ...
@@ -192,7 +274,7 @@ class RequiresRole:
         """
         self.required_role = required_role
 
-    async def __call__(
+    def __call__(
         self,
         current_user: User = Depends(get_current_active_user)
     ) -> User:
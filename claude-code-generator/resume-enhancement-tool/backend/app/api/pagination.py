@@ -0,0 +1,122 @@
+"""Keyset pagination and lean loading for list endpoints.
+
+Lists are ordered newest first on (created_at, id). A page ends with an
+opaque cursor encoding the last row's (created_at, id); the next page
+continues from it with a `(created_at, id) < cursor` seek instead of an
+OFFSET, so it reads the same few index entries however deep the user is
+in their history. `skip` is still accepted for older clients.
+
+Only the columns the list response shows are loaded (load_only), so the
+large Text columns (enhanced_content, extracted_text, ...) never leave the
+database for a list. Totals are counted up to LIST_COUNT_LIMIT rows; past
+that the total is reported as a lower bound.
+"""
+
+import base64
+import binascii
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, List, Optional, Tuple, Type
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from pydantic import BaseModel
+from sqlalchemy import func, literal, select, tuple_
+from sqlalchemy.orm import Query, load_only
+
+from ..core.config import settings
+
+
+def encode_cursor(created_at: datetime, row_id: UUID) -> str:
+    """Opaque cursor for the position after a row."""
+    return base64.urlsafe_b64encode(f"{created_at.isoformat()}|{row_id}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    Parse a cursor made by encode_cursor().
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, row_id = raw.split("|")
+        return datetime.fromisoformat(created_at), UUID(row_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def summary_columns(model: Any, schema: Type[BaseModel]) -> Any:
+    """Loader option restricting a query to the model columns a response schema shows."""
+    columns = model.__table__.columns
+    return load_only(*(getattr(model, name) for name in schema.model_fields if name in columns))
+
+
+def count_up_to(query: Query, limit: int) -> Tuple[int, bool]:
+    """
+    Count a query's rows, stopping after limit.
+
+    Returns:
+        (count, exact); count is limit and exact False if there are more rows
+    """
+    bounded = query.with_entities(literal(1)).order_by(None).limit(limit + 1).subquery()
+    count = query.session.execute(select(func.count()).select_from(bounded)).scalar_one()
+    if count > limit:
+        return limit, False
+    return count, True
+
+
+@dataclass
+class Page:
+    """One page of rows and the fields of schemas.PageInfo."""
+
+    items: List[Any]
+    next_cursor: Optional[str]
+    total: Optional[int]
+    total_exact: bool
+
+    def info(self) -> dict:
+        """Keyword arguments for a PageInfo response."""
+        return {"total": self.total, "total_exact": self.total_exact, "next_cursor": self.next_cursor}
+
+
+def paginate(
+    query: Query,
+    model: Any,
+    schema: Type[BaseModel],
+    limit: int,
+    cursor: Optional[str] = None,
+    skip: int = 0,
+    include_total: bool = True,
+) -> Page:
+    """
+    Fetch one page of a list query, newest first.
+
+    Args:
+        query: Query for the model, filtered to the records to list
+        model: Model with created_at and id columns
+        schema: Response schema of one item (decides which columns are loaded)
+        limit: Page size
+        cursor: next_cursor of the previous page
+        skip: Rows to skip (OFFSET); prefer cursor
+        include_total: Count the matching records (see count_up_to)
+
+    Returns:
+        Page of rows
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    total, total_exact = count_up_to(query, settings.LIST_COUNT_LIMIT) if include_total else (None, True)
+
+    page_query = query.options(summary_columns(model, schema))
+    if cursor is not None:
+        page_query = page_query.filter(tuple_(model.created_at, model.id) < tuple_(*decode_cursor(cursor)))
+    page_query = page_query.order_by(model.created_at.desc(), model.id.desc())
+    if skip:
+        page_query = page_query.offset(skip)
+
+    rows = page_query.limit(limit + 1).all()
+    next_cursor = encode_cursor(rows[limit - 1].created_at, rows[limit - 1].id) if len(rows) > limit else None
+    return Page(items=rows[:limit], next_cursor=next_cursor, total=total, total_exact=total_exact)
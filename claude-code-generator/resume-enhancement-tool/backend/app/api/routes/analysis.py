@@ -2,19 +2,36 @@
 
 import logging
 from pathlib import Path
+from typing import Optional
 from uuid import UUID
 import json
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
+from app.config.styles import validate_style
+from app.core.concurrency import cpu_bound
 from app.core.database import get_db
 from app.models import Enhancement, Resume, Job
 from app.models.user import User
-from app.schemas.analysis import AnalysisResponse, AchievementSuggestionsResponse
-from app.utils.ats_analyzer import ATSAnalyzer
+from app.schemas.analysis import (
+    AnalysisResponse,
+    AchievementSuggestionsResponse,
+    JobMatchRequest,
+    JobMatchResponse,
+    StyleMatchResponse,
+)
+from app.utils.ats_analyzer import ATSAnalyzer, scored_terms
 from app.utils.achievement_detector import AchievementDetector
-from app.api.dependencies import get_current_active_user
+from app.utils.style_analyzer import StyleAnalyzer
+from app.api.dependencies import (
+    get_current_active_user,
+    get_keyword_index,
+    get_relevance_index,
+    get_style_analyzer,
+)
+from app.services.keyword_index import KeywordIndex
+from app.services.relevance_index import JobRelevanceIndex
 
 logger = logging.getLogger(__name__)
 
@@ -26,11 +43,36 @@ ats_analyzer = ATSAnalyzer()
 achievement_detector = AchievementDetector()
 
 
+def read_text_file(path: Path, description: str) -> str:
+    """Read a workspace text file, mapping failures to HTTP errors."""
+    if not path.exists():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"{description} file not found: {path}"
+        )
+    try:
+        return path.read_text(encoding='utf-8')
+    except Exception as e:
+        logger.error(f"Failed to read {path}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to read {description.lower()} text: {str(e)}"
+        )
+
+
+def resume_text_of(resume: Resume) -> str:
+    """Original resume text, from the database or extracted.txt for older rows."""
+    if resume.extracted_text is not None:
+        return resume.extracted_text
+    return read_text_file(Path(resume.extracted_text_path), "Resume text")
+
+
 @router.get("/enhancements/{enhancement_id}/analysis", response_model=AnalysisResponse)
-async def get_analysis(
+def get_analysis(
     enhancement_id: UUID,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    keyword_index: KeywordIndex = Depends(get_keyword_index)
 ):
     """Get ATS and job match analysis for an enhancement.
 
@@ -96,43 +138,26 @@ async def get_analysis(
                    "This enhancement does not have an associated job."
         )
 
-    # Read texts from workspace
+    # Keywords were extracted when the texts were stored; files are only read
+    # for rows indexed before that (or with a stale taxonomy version).
     # Use enhanced resume if available, otherwise fall back to original
-    if enhancement.output_path and Path(enhancement.output_path).exists():
-        resume_text_path = Path(enhancement.output_path)
-        logger.info(f"Using enhanced resume for analysis: {resume_text_path}")
+    if enhancement.enhanced_content or (enhancement.output_path and Path(enhancement.output_path).exists()):
+        logger.info(f"Using enhanced resume for analysis: {enhancement_id}")
+        resume_row = enhancement
+        load_resume_text = lambda: enhancement.enhanced_content or read_text_file(Path(enhancement.output_path), "Enhanced resume")
     else:
-        resume_text_path = Path(resume.extracted_text_path)
-        logger.info(f"Using original resume for analysis: {resume_text_path}")
-
-    job_text_path = Path(job.file_path)
-
-    if not resume_text_path.exists():
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Resume text file not found: {resume_text_path}"
-        )
-
-    if not job_text_path.exists():
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Job description file not found: {job_text_path}"
-        )
-
-    try:
-        resume_text = resume_text_path.read_text(encoding='utf-8')
-        job_text = job_text_path.read_text(encoding='utf-8')
-    except Exception as e:
-        logger.error(f"Failed to read text files: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to read resume or job text: {str(e)}"
-        )
+        logger.info(f"Using original resume for analysis: {resume.id}")
+        resume_row = resume
+        load_resume_text = lambda: resume_text_of(resume)
 
     # Run analysis
     logger.info(f"Running ATS analysis for enhancement {enhancement_id}")
     try:
-        analysis_result = ats_analyzer.analyze_resume_vs_job(resume_text, job_text)
+        resume_keywords = keyword_index.keywords_for(resume_row, load_resume_text)
+        job_keywords = keyword_index.keywords_for(job, lambda: job.description_text)
+        analysis_result = ats_analyzer.analyze_keywords(resume_keywords, job_keywords)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"ATS analysis failed: {e}")
         raise HTTPException(
@@ -159,7 +184,7 @@ async def get_analysis(
 
 
 @router.get("/enhancements/{enhancement_id}/achievements", response_model=AchievementSuggestionsResponse)
-async def get_achievement_suggestions(
+def get_achievement_suggestions(
     enhancement_id: UUID,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -240,3 +265,170 @@ async def get_achievement_suggestions(
         # Continue even if caching fails
 
     return suggestions
+
+
+@router.post("/resumes/{resume_id}/match", response_model=JobMatchResponse)
+def match_resume_to_jobs(
+    resume_id: UUID,
+    request: JobMatchRequest,
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db),
+    keyword_index: KeywordIndex = Depends(get_keyword_index),
+    relevance_index: JobRelevanceIndex = Depends(get_relevance_index)
+):
+    """Rank saved jobs by ATS keyword match with a resume.
+
+    The stored keyword sets of the resume and every selected job are scored
+    in one pass (see ATSAnalyzer.rank_jobs), so comparing a resume with all
+    saved jobs takes one request instead of one enhancement per job. Job
+    descriptions are only loaded for jobs whose keyword set is missing or stale.
+
+    Every match also carries a BM25 relevance score of the full job text
+    against the resume (see app/services/relevance_index.py), which counts
+    terms outside the skills taxonomy; rank_by="relevance" orders by it.
+
+    Args:
+        resume_id: UUID of the resume
+        request: Jobs to score (default: all of the user's jobs), how many to return and the ordering
+
+    Returns:
+        JobMatchResponse with jobs ranked best match first
+
+    Raises:
+        404: Resume not found, or a requested job not found
+    """
+
+    resume = db.query(Resume).filter(Resume.id == resume_id).first()
+    # SECURITY: Use 404 to prevent enumeration
+    if not resume or resume.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Resume not found"
+        )
+
+    query = db.query(Job.id, Job.title, Job.company, Job.keywords, Job.keywords_version).filter(
+        Job.user_id == current_user.id
+    )
+    if request.job_ids is not None:
+        query = query.filter(Job.id.in_(request.job_ids))
+    jobs = query.all()
+
+    if request.job_ids is not None:
+        missing = set(request.job_ids) - {job.id for job in jobs}
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Job not found: {sorted(str(job_id) for job_id in missing)[0]}"
+            )
+
+    logger.info(f"Ranking {len(jobs)} jobs against resume {resume_id}")
+    with cpu_bound():
+        resume_text = resume_text_of(resume)
+        resume_keywords = keyword_index.keywords_for(resume, lambda: resume_text)
+        relevance = {
+            result.doc_id: result
+            for result in relevance_index.score(db, resume_text, [job.id for job in jobs])
+        }
+
+        job_keywords = {job.id: keyword_index.stored(job.keywords, job.keywords_version) for job in jobs}
+        stale = [job_id for job_id, keywords in job_keywords.items() if keywords is None]
+        if stale:
+            logger.info(f"Indexing keywords for {len(stale)} jobs")
+            for job in db.query(Job).filter(Job.id.in_(stale)):
+                job_keywords[job.id] = keyword_index.index(job, job.description_text)
+
+        by_relevance = request.rank_by == "relevance"
+        ranked = ats_analyzer.rank_jobs(
+            resume_keywords,
+            ((job, job_keywords[job.id]) for job in jobs),
+            limit=None if by_relevance else request.limit,
+        )
+        if by_relevance:
+            ranked.sort(key=lambda pair: -relevance[pair[0].id].score)
+            ranked = ranked[:request.limit]
+
+    if db.dirty:
+        db.commit()  # Keep keyword sets indexed above
+
+    return {
+        'resume_id': resume_id,
+        'resume_keyword_count': len(scored_terms(resume_keywords)),
+        'jobs_scored': len(jobs),
+        'matches': [
+            {
+                'job_id': job.id,
+                'title': job.title,
+                'company': job.company,
+                'match_score': match['match_score'],
+                'match_count': match['match_count'],
+                'job_keyword_count': match['job_keyword_count'],
+                'keywords_found': match['keywords_found'],
+                'keywords_missing': match['keywords_missing'],
+                'relevance_score': round(relevance[job.id].score, 3),
+                'relevance_terms': [term for term, _ in relevance[job.id].top_terms],
+            }
+            for job, match in ranked
+        ],
+    }
+
+
+@router.get("/resumes/{resume_id}/style-match/{job_id}", response_model=StyleMatchResponse)
+def match_style_to_job(
+    resume_id: UUID,
+    job_id: UUID,
+    style: Optional[str] = Query(None, description="Style to check (default: the resume's selected style)"),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db),
+    style_analyzer: StyleAnalyzer = Depends(get_style_analyzer)
+):
+    """Check whether a resume's writing style suits a saved job.
+
+    The job's style signals (seniority, industry, technical depth, ...) are
+    extracted when the job is created and stored on its row, so the check is
+    arithmetic over them; the description is only rescanned if it changed
+    since (see StyleAnalyzer.signals_for_job).
+
+    Args:
+        resume_id: UUID of the resume
+        job_id: UUID of the job
+        style: Style to check instead of the resume's selected style
+
+    Returns:
+        StyleMatchResponse with the style's fit and a recommendation
+
+    Raises:
+        400: Unknown style, or no style given and none selected
+        404: Resume or job not found
+    """
+    resume = db.query(Resume).filter(Resume.id == resume_id).first()
+    # SECURITY: Use 404 to prevent enumeration
+    if not resume or resume.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Resume not found"
+        )
+
+    job = db.query(Job).filter(Job.id == job_id).first()
+    if not job or job.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+
+    style = style or resume.selected_style
+    if not style or not validate_style(style):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown or missing style: {style}" if style else "No style selected for this resume"
+        )
+
+    signals = style_analyzer.signals_for_job(job)
+    if db.dirty:
+        db.commit()  # Keep signals re-extracted above
+
+    return {
+        'resume_id': resume_id,
+        'job_id': job_id,
+        'current_style': style,
+        **style_analyzer.match_style(signals, style),
+    }
@@ -83,7 +83,7 @@ def clear_refresh_token_cookie(response: Response) -> None:
 
 @router.post("/signup", response_model=AuthResponse, status_code=status.HTTP_201_CREATED)
 @limiter.limit(AUTH_RATE_LIMIT)  # SECURITY: 5/minute to prevent abuse
-async def signup(
+def signup(
     request: Request,  # Required for rate limiter
     user_data: UserCreate,
     response: Response,
@@ -178,7 +178,7 @@ async def signup(
 
 @router.post("/login", response_model=AuthResponse)
 @limiter.limit(AUTH_RATE_LIMIT)  # SECURITY: 5/minute to prevent brute force
-async def login(
+def login(
     request: Request,  # Required for rate limiter
     credentials: UserLogin,
     response: Response,
@@ -281,7 +281,7 @@ async def login(
 
 @router.post("/refresh", response_model=RefreshResponse)
 @limiter.limit("10/minute")  # SECURITY: Higher limit for authenticated refresh
-async def refresh_token(
+def refresh_token(
     request: Request,  # Required for rate limiter
     response: Response,
     db: Session = Depends(get_db),
@@ -368,7 +368,7 @@ async def refresh_token(
 
 
 @router.post("/logout", response_model=LogoutResponse)
-async def logout(
+def logout(
     response: Response,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
@@ -414,7 +414,7 @@ async def logout(
 
 
 @router.post("/change-password", response_model=LogoutResponse)
-async def change_password(
+def change_password(
     password_data: PasswordChangeRequest,
     response: Response,
     current_user: User = Depends(get_current_active_user),
@@ -489,7 +489,7 @@ async def change_password(
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user_info(
+def get_current_user_info(
     current_user: User = Depends(get_current_active_user)
 ):
     """Get current authenticated user's information.
@@ -20,7 +20,7 @@ WORKSPACE_ROOT = Path("workspace")
 
 
 @router.get("/enhancements/{enhancement_id}/comparison", response_model=ComparisonResponse)
-async def get_comparison(
+def get_comparison(
     enhancement_id: UUID,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -9,16 +9,22 @@ SECURITY IMPLEMENTATION:
 IMPORTANT: Rate limits MUST be enforced BEFORE any AI model call is made.
 """
 
+import asyncio
+import json
 import logging
+import time
 from pathlib import Path
+from typing import Optional
 from uuid import UUID
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, status, Request
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, status, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, Response, StreamingResponse
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.concurrency import cpu_bound
+from app.core.database import get_db, SessionLocal
 from app.core.security import limiter, AI_RATE_LIMIT
 from app.models import Enhancement, Resume, Job
 from app.models.user import User
@@ -27,15 +33,32 @@ from app.schemas import (
     EnhancementRevampCreate,
     EnhancementResponse,
     EnhancementListResponse,
+    MAX_PAGE_SIZE,
 )
 from app.services.workspace_service import WorkspaceService
+from app.services.job_notifier import JobNotifier
+from app.services.artifact_cache import ArtifactCache, artifact_cache_key, etag_for, etag_matches
 from app.utils.error_sanitizer import sanitize_error_message
-from app.api.dependencies import get_workspace_service, get_current_active_user, WORKSPACE_ROOT
+from app.api.dependencies import (
+    get_workspace_service,
+    get_artifact_cache,
+    get_current_active_user,
+    get_job_notifier,
+    WORKSPACE_ROOT,
+)
+from app.api.pagination import paginate
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Streaming progress (GET /enhancements/{id}/stream)
+STREAM_POLL_SECONDS = 0.5  # How often the stream re-reads the enhancement row
+STREAM_KEEPALIVE_SECONDS = 15  # Comment frame interval so proxies keep the connection open
+STREAM_MAX_SECONDS = 600  # Close long-lived streams; clients reconnect or fall back to polling
+
+DOCX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
 
 def check_resource_ownership(resource, current_user: User, resource_name: str = "Resource"):
     """Check if user owns the resource, raise 404 if not.
@@ -114,12 +137,13 @@ except (ImportError, OSError, TypeError) as e:
     status_code=status.HTTP_201_CREATED,
 )
 @limiter.limit(AI_RATE_LIMIT)  # SECURITY: 10/hour - cost control for AI operations
-async def create_tailoring_enhancement(
+def create_tailoring_enhancement(
     request: Request,  # Required for rate limiter
     enhancement: EnhancementTailorCreate,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
     workspace_service: WorkspaceService = Depends(get_workspace_service),
+    job_notifier: JobNotifier = Depends(get_job_notifier),
 ):
     """
     Create a job-tailoring enhancement request.
@@ -187,6 +211,9 @@ async def create_tailoring_enhancement(
     db.commit()
     db.refresh(db_enhancement)
 
+    # Wake an idle worker slot instead of waiting for its next poll
+    job_notifier.notify(db)
+
     return db_enhancement
 
 
@@ -196,12 +223,13 @@ async def create_tailoring_enhancement(
     status_code=status.HTTP_201_CREATED,
 )
 @limiter.limit(AI_RATE_LIMIT)  # SECURITY: 10/hour - cost control for AI operations
-async def create_revamp_enhancement(
+def create_revamp_enhancement(
     request: Request,  # Required for rate limiter
     enhancement: EnhancementRevampCreate,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
     workspace_service: WorkspaceService = Depends(get_workspace_service),
+    job_notifier: JobNotifier = Depends(get_job_notifier),
 ):
     """
     Create an industry-revamp enhancement request.
@@ -267,39 +295,48 @@ async def create_revamp_enhancement(
     db.commit()
     db.refresh(db_enhancement)
 
+    # Wake an idle worker slot instead of waiting for its next poll
+    job_notifier.notify(db)
+
     return db_enhancement
 
 
 @router.get("/enhancements", response_model=EnhancementListResponse)
-async def list_enhancements(
-    skip: int = 0,
-    limit: int = 100,
+def list_enhancements(
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    skip: int = Query(0, ge=0),
+    include_total: bool = True,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):
     """
-    List all enhancement requests for the current user.
+    List enhancement requests for the current user, newest first.
 
     Query parameters:
-    - skip: Number of records to skip (default: 0)
     - limit: Maximum number of records to return (default: 100)
+    - cursor: next_cursor of the previous page (keyset pagination)
+    - skip: Number of records to skip (default: 0); prefer cursor for deep pages
+    - include_total: Whether to count matching records (default: true)
 
-    Returns a list of enhancements with their metadata and status.
+    Returns a page of enhancement requests with their metadata. Large text columns are
+    not loaded; `total` is a lower bound when total_exact is false.
     """
-    enhancements = (
-        db.query(Enhancement)
-        .filter(Enhancement.user_id == current_user.id)
-        .offset(skip)
-        .limit(limit)
-        .all()
+    page = paginate(
+        db.query(Enhancement).filter(Enhancement.user_id == current_user.id),
+        Enhancement,
+        EnhancementResponse,
+        limit=limit,
+        cursor=cursor,
+        skip=skip,
+        include_total=include_total,
     )
-    total = db.query(Enhancement).filter(Enhancement.user_id == current_user.id).count()
 
-    return EnhancementListResponse(enhancements=enhancements, total=total)
+    return EnhancementListResponse(enhancements=page.items, **page.info())
 
 
 @router.get("/enhancements/{enhancement_id}", response_model=EnhancementResponse)
-async def get_enhancement(
+def get_enhancement(
     enhancement_id: UUID,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
@@ -346,8 +383,145 @@ async def get_enhancement(
     return enhancement
 
 
+def _sse_event(event: str, data: dict) -> str:
+    """Format a single server-sent event frame."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def build_stream_events(enhancement, sent: dict) -> tuple[list[str], bool]:
+    """
+    Build SSE frames for whatever changed since the last snapshot.
+
+    The worker streams Claude output into ``partial_content`` and moves the
+    final text into ``enhanced_content`` / ``cover_letter_content``, so each
+    phase is sent as appended deltas against ``sent``.
+
+    Args:
+        enhancement: Enhancement row (or any object with the same attributes)
+        sent: Per-stream state, updated in place
+
+    Returns:
+        Tuple of (frames to send, whether the stream is finished)
+    """
+    partial = enhancement.partial_content or ""
+    resume_text = enhancement.enhanced_content or partial
+    cover_letter_text = enhancement.cover_letter_content or (
+        partial if enhancement.enhanced_content else ""
+    )
+
+    frames = []
+    for phase, text in (("resume", resume_text), ("cover_letter", cover_letter_text)):
+        sent_length = sent.get(phase, 0)
+        if len(text) < sent_length:
+            # Generation restarted (e.g. lease expired and another worker retried)
+            frames.append(_sse_event("reset", {"phase": phase}))
+            sent_length = 0
+        if len(text) > sent_length:
+            frames.append(_sse_event(phase, {"text": text[sent_length:]}))
+        sent[phase] = len(text)
+
+    statuses = {
+        "status": enhancement.status,
+        "cover_letter_status": enhancement.cover_letter_status,
+    }
+    if statuses != sent.get("statuses"):
+        frames.append(_sse_event("status", statuses))
+        sent["statuses"] = statuses
+
+    finished = enhancement.status == "failed" or (
+        enhancement.status == "completed"
+        and (
+            not enhancement.job_id
+            or enhancement.cover_letter_status in ("completed", "failed", "skipped")
+        )
+    )
+    if finished:
+        frames.append(_sse_event("done", statuses))
+
+    return frames, finished
+
+
+def _load_enhancement_snapshot(enhancement_id: UUID):
+    """Read the enhancement row in a short-lived session for the stream loop."""
+    db = SessionLocal()
+    try:
+        enhancement = db.query(Enhancement).filter(Enhancement.id == enhancement_id).first()
+        if enhancement is not None:
+            db.expunge(enhancement)
+        return enhancement
+    finally:
+        db.close()
+
+
+@router.get("/enhancements/{enhancement_id}/stream")
+async def stream_enhancement(
+    enhancement_id: UUID,
+    request: Request,
+    current_user: User = Depends(get_current_active_user),
+):
+    """
+    Stream generation progress as server-sent events.
+
+    Events:
+    - "resume" / "cover_letter": {"text": ...} appended to the document so far
+    - "reset": {"phase": ...} discard that phase's text (generation restarted)
+    - "status": {"status": ..., "cover_letter_status": ...} on every change
+    - "done": final statuses, sent once before the stream closes
+
+    Clients that connect after generation finished receive the full text
+    followed by "done". Requires the bearer token, so browsers should read
+    this with fetch() streaming rather than EventSource.
+    """
+    # Blocking queries run in the threadpool, never on the event loop
+    enhancement = await run_in_threadpool(_load_enhancement_snapshot, enhancement_id)
+
+    if not enhancement:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Enhancement not found: {enhancement_id}",
+        )
+
+    # SECURITY: Use 404 to prevent enumeration
+    check_resource_ownership(enhancement, current_user, "Enhancement")
+
+    async def event_stream():
+        # Each poll reads through its own short-lived session
+        sent: dict = {}
+        started = last_frame = time.monotonic()
+
+        while time.monotonic() - started < STREAM_MAX_SECONDS:
+            if await request.is_disconnected():
+                return
+
+            snapshot = await run_in_threadpool(_load_enhancement_snapshot, enhancement_id)
+            if snapshot is None:
+                yield _sse_event("done", {"status": "deleted", "cover_letter_status": None})
+                return
+
+            frames, finished = build_stream_events(snapshot, sent)
+            for frame in frames:
+                yield frame
+            if finished:
+                return
+
+            now = time.monotonic()
+            if frames:
+                last_frame = now
+            elif now - last_frame >= STREAM_KEEPALIVE_SECONDS:
+                yield ": keep-alive\n\n"
+                last_frame = now
+
+            await asyncio.sleep(STREAM_POLL_SECONDS)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post("/enhancements/{enhancement_id}/finalize")
-async def finalize_enhancement(
+def finalize_enhancement(
     enhancement_id: UUID,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
@@ -392,10 +566,11 @@ async def finalize_enhancement(
     # Generate PDF
     try:
         pdf_path = WORKSPACE_ROOT / "resumes" / "enhanced" / str(enhancement_id) / "enhanced.pdf"
-        pdf_generator.markdown_to_pdf(
-            enhanced_md_path,
-            pdf_path,
-        )
+        with cpu_bound():
+            pdf_generator.markdown_to_pdf(
+                enhanced_md_path,
+                pdf_path,
+            )
 
         # Update enhancement record
         enhancement.output_path = str(enhanced_md_path)
@@ -480,12 +655,86 @@ def ensure_file_from_db_content(
         return False
 
 
+def render_download(
+    request: Request,
+    db: Session,
+    artifact_cache: Optional[ArtifactCache],
+    markdown_path: Path,
+    output_path: Path,
+    format: str,
+    filename: str,
+) -> Response:
+    """
+    Serve a PDF or DOCX rendering of a markdown file.
+
+    Renders are cached in the rendered_artifacts table keyed on the markdown,
+    format, template and generator version, so a document is rendered once per
+    version even when the workspace is wiped by a redeploy. The key is also
+    the ETag: a matching If-None-Match gets a 304 without loading the artifact.
+
+    Args:
+        request: Incoming request (for If-None-Match)
+        db: Database session
+        artifact_cache: Render cache, or None if disabled
+        markdown_path: Source markdown (must exist)
+        output_path: Where the rendered file is written in the workspace
+        format: "pdf" or "docx"
+        filename: Download filename
+
+    Returns:
+        Response with the rendered document, or 304 Not Modified
+    """
+    if format == "pdf":
+        def render(md_path: Path, path: Path) -> None:
+            result = pdf_generator.markdown_to_pdf(md_path, path)
+            if not result.get("success"):
+                raise RuntimeError(result.get("error", "PDF generation failed"))
+
+        template = pdf_generator.template_fingerprint()
+        version = pdf_generator.RENDER_VERSION
+        media_type = "application/pdf"
+    else:
+        from app.utils.docx_generator import DOCXGenerator
+
+        render = DOCXGenerator().markdown_to_docx
+        template = "default"
+        version = DOCXGenerator.RENDER_VERSION
+        media_type = DOCX_MEDIA_TYPE
+
+    key = artifact_cache_key(markdown_path.read_text(encoding="utf-8"), format, template, version)
+    headers = {"ETag": etag_for(key), "Cache-Control": "private, no-cache"}
+
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    def render_artifact() -> bytes:
+        # A file rendered after the markdown was written (e.g. by the worker) is current
+        if output_path.exists() and output_path.stat().st_mtime >= markdown_path.stat().st_mtime:
+            return output_path.read_bytes()
+
+        logger.info(f"Rendering {output_path.name} from {markdown_path}")
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with cpu_bound():
+            render(markdown_path, output_path)
+        return output_path.read_bytes()
+
+    if artifact_cache is None:
+        content = render_artifact()
+    else:
+        content = artifact_cache.get_or_render(db, key, format, render_artifact)
+
+    headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return Response(content=content, media_type=media_type, headers=headers)
+
+
 @router.get("/enhancements/{enhancement_id}/download")
-async def download_enhancement(
+def download_enhancement(
+    request: Request,
     enhancement_id: UUID,
     format: str = "pdf",
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
+    artifact_cache: Optional[ArtifactCache] = Depends(get_artifact_cache),
 ):
     """
     Download the enhanced resume.
@@ -517,17 +766,7 @@ async def download_enhancement(
         if not md_path.exists() and enhancement.enhanced_content:
             ensure_file_from_db_content(md_path, enhancement.enhanced_content, enhancement_id)
 
-        # Try to generate PDF if markdown exists but PDF doesn't
-        if md_path.exists() and not pdf_path.exists() and PDF_AVAILABLE:
-            try:
-                pdf_generator.markdown_to_pdf(md_path, pdf_path)
-                enhancement.pdf_path = str(pdf_path)
-                db.commit()
-                logger.info(f"Regenerated PDF for enhancement {enhancement_id}")
-            except Exception as e:
-                logger.error(f"Failed to regenerate PDF for enhancement {enhancement_id}: {e}")
-
-        if not pdf_path.exists():
+        if not md_path.exists() or not PDF_AVAILABLE:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="PDF file not found. Please finalize the enhancement first using POST /enhancements/{id}/finalize",
@@ -541,11 +780,24 @@ async def download_enhancement(
                 detail="Access denied: Invalid file path"
             )
 
-        return FileResponse(
-            path=str(pdf_path),
-            media_type="application/pdf",
-            filename=f"enhanced_resume_{enhancement_id}.pdf",
-        )
+        # Rendered once per markdown version (cached across redeploys)
+        try:
+            response = render_download(
+                request, db, artifact_cache, md_path, pdf_path, "pdf",
+                f"enhanced_resume_{enhancement_id}.pdf",
+            )
+        except Exception as e:
+            logger.error(f"Failed to regenerate PDF for enhancement {enhancement_id}: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="PDF file not found. Please finalize the enhancement first using POST /enhancements/{id}/finalize",
+            )
+
+        if pdf_path.exists() and enhancement.pdf_path != str(pdf_path):
+            enhancement.pdf_path = str(pdf_path)
+            db.commit()
+
+        return response
 
     elif format == "md":
         # Try to regenerate from database if file is missing
@@ -580,24 +832,22 @@ async def download_enhancement(
 
 
 @router.get("/enhancements/{enhancement_id}/download/docx")
-async def download_enhancement_docx(
+def download_enhancement_docx(
+    request: Request,
     enhancement_id: UUID,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
+    artifact_cache: Optional[ArtifactCache] = Depends(get_artifact_cache),
 ):
     """
     Download the enhanced resume as DOCX.
 
     Converts the enhanced markdown to a styled Word document.
-    The DOCX is generated on first request and cached for subsequent requests.
+    The DOCX is rendered once per markdown version and cached (see render_download).
 
     Returns:
-        FileResponse with DOCX file
+        Response with DOCX file (304 if the client's ETag is current)
     """
-    from app.utils.docx_generator import DOCXGenerator
-
-    docx_generator = DOCXGenerator()
-
     enhancement = db.query(Enhancement).filter(Enhancement.id == enhancement_id).first()
     if not enhancement:
         raise HTTPException(
@@ -608,25 +858,6 @@ async def download_enhancement_docx(
     # SECURITY: Use 404 to prevent enumeration
     check_resource_ownership(enhancement, current_user, "Enhancement")
 
-    # Check if DOCX already exists (cached)
-    if enhancement.docx_path and Path(enhancement.docx_path).exists():
-        logger.info(f"Returning cached DOCX for enhancement {enhancement_id}")
-
-        # Security: Validate path to prevent traversal attacks
-        docx_path = Path(enhancement.docx_path)
-        if not validate_safe_path(docx_path, WORKSPACE_ROOT):
-            logger.error(f"Path traversal attempt detected: {docx_path}")
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Access denied: Invalid file path"
-            )
-
-        return FileResponse(
-            path=enhancement.docx_path,
-            media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            filename=f"enhanced_resume_{enhancement_id}.docx"
-        )
-
     # Check if markdown file exists, regenerate from DB if needed
     enhanced_md_path = WORKSPACE_ROOT / "resumes" / "enhanced" / str(enhancement_id) / "enhanced.md"
     if not enhanced_md_path.exists():
@@ -647,29 +878,26 @@ async def download_enhancement_docx(
     # Generate DOCX from markdown
     docx_path = WORKSPACE_ROOT / "resumes" / "enhanced" / str(enhancement_id) / "enhanced.docx"
 
+    # Security: Validate path to prevent traversal attacks
+    if not validate_safe_path(docx_path, WORKSPACE_ROOT):
+        logger.error(f"Path traversal attempt detected: {docx_path}")
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied: Invalid file path"
+        )
+
     try:
-        logger.info(f"Generating DOCX for enhancement {enhancement_id}")
-        docx_generator.markdown_to_docx(enhanced_md_path, docx_path)
+        response = render_download(
+            request, db, artifact_cache, enhanced_md_path, docx_path, "docx",
+            f"enhanced_resume_{enhancement_id}.docx",
+        )
 
         # Update enhancement record with DOCX path
-        enhancement.docx_path = str(docx_path)
-        db.commit()
-
-        logger.info(f"DOCX generated successfully for enhancement {enhancement_id}")
-
-        # Security: Validate path to prevent traversal attacks
-        if not validate_safe_path(docx_path, WORKSPACE_ROOT):
-            logger.error(f"Path traversal attempt detected: {docx_path}")
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Access denied: Invalid file path"
-            )
+        if docx_path.exists() and enhancement.docx_path != str(docx_path):
+            enhancement.docx_path = str(docx_path)
+            db.commit()
 
-        return FileResponse(
-            path=str(docx_path),
-            media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            filename=f"enhanced_resume_{enhancement_id}.docx"
-        )
+        return response
 
     except (IOError, OSError) as e:
         # File system errors
@@ -695,7 +923,7 @@ async def download_enhancement_docx(
 
 
 @router.delete("/enhancements/{enhancement_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_enhancement(
+def delete_enhancement(
     enhancement_id: UUID,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
@@ -730,7 +958,7 @@ async def delete_enhancement(
 
 
 @router.delete("/enhancements", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_all_enhancements(
+def delete_all_enhancements(
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
     workspace_service: WorkspaceService = Depends(get_workspace_service),
@@ -755,11 +983,13 @@ async def delete_all_enhancements(
 
 
 @router.get("/enhancements/{enhancement_id}/download/cover-letter")
-async def download_cover_letter(
+def download_cover_letter(
+    request: Request,
     enhancement_id: UUID,
     format: str = "md",
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
+    artifact_cache: Optional[ArtifactCache] = Depends(get_artifact_cache),
 ):
     """
     Download the cover letter in specified format.
@@ -770,7 +1000,8 @@ async def download_cover_letter(
     Returns the file as a download attachment.
 
     The cover letter is generated automatically after the resume is complete.
-    DOCX and PDF formats are generated lazily on first request and cached.
+    DOCX and PDF formats are rendered once per cover letter version and cached
+    (see render_download).
     """
     enhancement = db.query(Enhancement).filter(Enhancement.id == enhancement_id).first()
 
@@ -831,21 +1062,8 @@ async def download_cover_letter(
         )
 
     elif format == "docx":
-        # Lazy DOCX generation with caching
         docx_path = WORKSPACE_ROOT / "resumes" / "enhanced" / str(enhancement_id) / "cover_letter.docx"
 
-        if not docx_path.exists():
-            logger.info(f"Generating DOCX for cover letter {enhancement_id}")
-            from app.utils.docx_generator import DOCXGenerator
-            docx_generator = DOCXGenerator()
-            docx_generator.markdown_to_docx(cover_letter_md, docx_path)
-
-            # Cache path in database
-            enhancement.cover_letter_docx_path = str(docx_path)
-            db.commit()
-        else:
-            logger.info(f"Returning cached DOCX for cover letter {enhancement_id}")
-
         # Security: Validate path to prevent traversal attacks
         if not validate_safe_path(docx_path, WORKSPACE_ROOT):
             logger.error(f"Path traversal attempt detected: {docx_path}")
@@ -854,12 +1072,18 @@ async def download_cover_letter(
                 detail="Access denied: Invalid file path"
             )
 
-        return FileResponse(
-            path=str(docx_path),
-            media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            filename=f"cover_letter_{enhancement_id}.docx"
+        response = render_download(
+            request, db, artifact_cache, cover_letter_md, docx_path, "docx",
+            f"cover_letter_{enhancement_id}.docx",
         )
 
+        # Cache path in database
+        if docx_path.exists() and enhancement.cover_letter_docx_path != str(docx_path):
+            enhancement.cover_letter_docx_path = str(docx_path)
+            db.commit()
+
+        return response
+
     elif format == "pdf":
         # Check if PDF generation is available
         if not PDF_AVAILABLE:
@@ -868,19 +1092,8 @@ async def download_cover_letter(
                 detail="PDF generation not available on this system. Please use Docker or install GTK libraries. You can still download markdown or DOCX versions."
             )
 
-        # Lazy PDF generation with caching
         pdf_path = WORKSPACE_ROOT / "resumes" / "enhanced" / str(enhancement_id) / "cover_letter.pdf"
 
-        if not pdf_path.exists():
-            logger.info(f"Generating PDF for cover letter {enhancement_id}")
-            pdf_generator.markdown_to_pdf(str(cover_letter_md), str(pdf_path))
-
-            # Cache path in database
-            enhancement.cover_letter_pdf_path = str(pdf_path)
-            db.commit()
-        else:
-            logger.info(f"Returning cached PDF for cover letter {enhancement_id}")
-
         # Security: Validate path to prevent traversal attacks
         if not validate_safe_path(pdf_path, WORKSPACE_ROOT):
             logger.error(f"Path traversal attempt detected: {pdf_path}")
@@ -889,12 +1102,18 @@ async def download_cover_letter(
                 detail="Access denied: Invalid file path"
             )
 
-        return FileResponse(
-            path=str(pdf_path),
-            media_type="application/pdf",
-            filename=f"cover_letter_{enhancement_id}.pdf"
+        response = render_download(
+            request, db, artifact_cache, cover_letter_md, pdf_path, "pdf",
+            f"cover_letter_{enhancement_id}.pdf",
         )
 
+        # Cache path in database
+        if pdf_path.exists() and enhancement.cover_letter_pdf_path != str(pdf_path):
+            enhancement.cover_letter_pdf_path = str(pdf_path)
+            db.commit()
+
+        return response
+
     else:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
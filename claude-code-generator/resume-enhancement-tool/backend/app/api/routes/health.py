@@ -18,7 +18,7 @@ router = APIRouter()
 
 
 @router.get("/health")
-async def health_check(db: Session = Depends(get_db)) -> Dict[str, Any]:
+def health_check(db: Session = Depends(get_db)) -> Dict[str, Any]:
     """
     Comprehensive health check endpoint.
 
@@ -8,17 +8,28 @@ SECURITY IMPLEMENTATION:
 
 import logging
 from pathlib import Path
+from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.models import Job
 from app.models.user import User
-from app.schemas import JobCreate, JobResponse, JobListResponse
+from app.schemas import JobCreate, JobResponse, JobListResponse, MAX_PAGE_SIZE
+from app.services.keyword_index import KeywordIndex
+from app.services.relevance_index import JobRelevanceIndex
 from app.services.workspace_service import WorkspaceService
-from app.api.dependencies import get_workspace_service, get_current_active_user
+from app.utils.style_analyzer import StyleAnalyzer
+from app.api.dependencies import (
+    get_workspace_service,
+    get_current_active_user,
+    get_keyword_index,
+    get_relevance_index,
+    get_style_analyzer,
+)
+from app.api.pagination import paginate
 
 logger = logging.getLogger(__name__)
 
@@ -47,11 +58,14 @@ def check_job_ownership(job, current_user: User):
 
 
 @router.post("/jobs", response_model=JobResponse, status_code=status.HTTP_201_CREATED)
-async def create_job(
+def create_job(
     job: JobCreate,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
     workspace_service: WorkspaceService = Depends(get_workspace_service),
+    keyword_index: KeywordIndex = Depends(get_keyword_index),
+    relevance_index: JobRelevanceIndex = Depends(get_relevance_index),
+    style_analyzer: StyleAnalyzer = Depends(get_style_analyzer),
 ):
     """
     Create a new job description.
@@ -59,7 +73,9 @@ async def create_job(
     This endpoint:
     1. Validates the job description
     2. Stores it in the workspace
-    3. Saves metadata to the database
+    3. Extracts its ATS keywords and writing style signals
+    4. Saves metadata to the database
+    5. Adds it to the relevance index used for job matching
 
     Request body should include:
     - title: Job title
@@ -98,44 +114,53 @@ async def create_job(
         file_path=str(job_dir / "description.txt"),
         source=job.source,
     )
+    keyword_index.index(db_job, job.description_text)
+    style_analyzer.signals_for_job(db_job)
 
     db.add(db_job)
     db.commit()
     db.refresh(db_job)
+    relevance_index.add_job(db_job.id, db_job.description_text)
 
     return db_job
 
 
 @router.get("/jobs", response_model=JobListResponse)
-async def list_jobs(
-    skip: int = 0,
-    limit: int = 100,
+def list_jobs(
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    skip: int = Query(0, ge=0),
+    include_total: bool = True,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):
     """
-    List all job descriptions for the current user.
+    List job descriptions for the current user, newest first.
 
     Query parameters:
-    - skip: Number of records to skip (default: 0)
     - limit: Maximum number of records to return (default: 100)
+    - cursor: next_cursor of the previous page (keyset pagination)
+    - skip: Number of records to skip (default: 0); prefer cursor for deep pages
+    - include_total: Whether to count matching records (default: true)
 
-    Returns a list of jobs with their metadata.
+    Returns a page of job descriptions with their metadata. Large text columns are
+    not loaded; `total` is a lower bound when total_exact is false.
     """
-    jobs = (
-        db.query(Job)
-        .filter(Job.user_id == current_user.id)
-        .offset(skip)
-        .limit(limit)
-        .all()
+    page = paginate(
+        db.query(Job).filter(Job.user_id == current_user.id),
+        Job,
+        JobResponse,
+        limit=limit,
+        cursor=cursor,
+        skip=skip,
+        include_total=include_total,
     )
-    total = db.query(Job).filter(Job.user_id == current_user.id).count()
 
-    return JobListResponse(jobs=jobs, total=total)
+    return JobListResponse(jobs=page.items, **page.info())
 
 
 @router.get("/jobs/{job_id}", response_model=JobResponse)
-async def get_job(
+def get_job(
     job_id: UUID,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
@@ -7,28 +7,28 @@ SECURITY IMPLEMENTATION:
 - Audit logging: All operations logged with user context
 """
 
-import os
-import tempfile
 import logging
 from pathlib import Path
 from uuid import UUID
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, UploadFile, File, Depends, HTTPException, status, Request
+from fastapi import APIRouter, UploadFile, File, Depends, HTTPException, Query, status, Request
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
-from app.core.security import limiter, UPLOAD_RATE_LIMIT
+from app.core.security import limiter, UPLOAD_RATE_LIMIT, MAX_UPLOAD_SIZE
 from app.models import Resume
 from app.models.user import User
-from app.schemas import ResumeResponse, ResumeListResponse
+from app.schemas import ResumeResponse, ResumeListResponse, MAX_PAGE_SIZE
 from app.api.dependencies import get_current_active_user
+from app.api.pagination import paginate
 from app.schemas.style_preview import StyleUpdateRequest, StyleUpdateResponse
 from app.utils.document_parser import DocumentParser
 from app.utils.error_sanitizer import sanitize_error_message
-from app.services.workspace_service import WorkspaceService
+from app.services.workspace_service import WorkspaceService, FileTooLargeError
 from app.config.styles import STYLES
-from app.api.dependencies import get_workspace_service, get_document_parser, WORKSPACE_ROOT
+from app.api.dependencies import get_workspace_service, get_document_parser, get_keyword_index, WORKSPACE_ROOT
+from app.services.keyword_index import KeywordIndex
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -57,27 +57,30 @@ def check_resume_ownership(resume, current_user: User):
         )
 
 # Constants
-MAX_FILE_SIZE = 10 * 1024 * 1024  # 10 MB
+MAX_FILE_SIZE = MAX_UPLOAD_SIZE  # 10 MB
 
 
 @router.post("/resumes/upload", response_model=ResumeResponse, status_code=status.HTTP_201_CREATED)
 @limiter.limit(UPLOAD_RATE_LIMIT)  # SECURITY: 10/minute to prevent abuse
-async def upload_resume(
+def upload_resume(
     request: Request,
     file: UploadFile = File(..., description="Resume file (PDF or DOCX)"),
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
     workspace_service: WorkspaceService = Depends(get_workspace_service),
     document_parser: DocumentParser = Depends(get_document_parser),
+    keyword_index: KeywordIndex = Depends(get_keyword_index),
 ):
     """
     Upload a resume file (PDF or DOCX).
 
     This endpoint:
     1. Validates the file format
-    2. Extracts text content from the file
-    3. Stores the file in the workspace
-    4. Saves metadata to the database
+    2. Streams the file into the workspace (size limit, SHA-256)
+    3. Stores it in the content-addressed blob store (identical files are kept once)
+    4. Extracts text content from the file (reused for files parsed before)
+    5. Extracts its ATS keywords
+    6. Saves metadata to the database
 
     Returns the created resume with ID and metadata.
     """
@@ -95,37 +98,50 @@ async def upload_resume(
             detail=f"Unsupported file format: {file_ext}. Only PDF and DOCX are supported.",
         )
 
-    # Save uploaded file to temporary location
-    with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext) as temp_file:
-        content = await file.read()
-
-        # Validate file size
-        if len(content) > MAX_FILE_SIZE:
-            raise HTTPException(
-                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                detail=f"File too large. Maximum file size is {MAX_FILE_SIZE / 1024 / 1024:.0f} MB, uploaded file is {len(content) / 1024 / 1024:.1f} MB.",
-            )
+    # Stream the upload into the blob store's staging area in fixed-size
+    # chunks, hashing as it goes and stopping as soon as it exceeds the limit
+    # (oversized request bodies are already cut off by UploadSizeLimitMiddleware)
+    try:
+        staged_path, file_size, sha256 = workspace_service.stage_upload(
+            file.file, file_ext, max_bytes=MAX_FILE_SIZE
+        )
+    except FileTooLargeError:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File too large. Maximum file size is {MAX_FILE_SIZE / 1024 / 1024:.0f} MB.",
+        )
 
-        if len(content) == 0:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Uploaded file is empty.",
-            )
+    if file_size == 0:
+        staged_path.unlink(missing_ok=True)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Uploaded file is empty.",
+        )
 
-        temp_file.write(content)
-        temp_file_path = Path(temp_file.name)
+    # Identical bytes share one blob; this upload gets its own resume ID
+    resume_id, source_path = workspace_service.store_blob(staged_path, sha256)
 
+    stored = False
     try:
-        # Parse document to extract text
-        try:
-            parse_result = document_parser.parse_file(temp_file_path)
-        except Exception as e:
-            # Security: Sanitize error message to prevent PII leakage
-            safe_message = sanitize_error_message(e, "document parsing")
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Failed to parse document: {safe_message}",
-            )
+        # Parse document to extract text, unless this exact file was parsed before
+        parse_result = workspace_service.get_cached_parse(sha256)
+        if parse_result is not None:
+            logger.info(f"Reusing cached parse for blob {sha256[:12]}")
+        else:
+            try:
+                # PDFs are parsed in the parse pool's worker processes
+                parse_result = document_parser.parse_file(source_path)
+            except Exception as e:
+                # Security: Sanitize error message to prevent PII leakage
+                safe_message = sanitize_error_message(e, "document parsing")
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Failed to parse document: {safe_message}",
+                )
+
+            # Only successful extractions are cached; failures may be transient (time budget)
+            if parse_result.get("success") and parse_result.get("text"):
+                workspace_service.cache_parse(sha256, parse_result)
 
         extracted_text = parse_result.get("text", "")
 
@@ -160,19 +176,16 @@ async def upload_resume(
         if word_count < 100:
             logger.warning(f"Resume has only {word_count} words - consider if this is sufficient")
 
-        # Store in workspace
+        # Store extracted text and metadata alongside the source file
         metadata = {
             "filename": file.filename,
             "original_format": file_ext.replace(".", ""),
-            "file_size_bytes": len(content),
+            "file_size_bytes": file_size,
             "word_count": word_count,
+            "sha256": sha256,
         }
 
-        resume_id, resume_dir = workspace_service.store_resume(
-            temp_file_path,
-            extracted_text,
-            metadata,
-        )
+        resume_dir = workspace_service.create_resume(resume_id, sha256, file_ext, extracted_text, metadata)
 
         # Save to database (including extracted_text for DB-based storage)
         db_resume = Resume(
@@ -183,52 +196,62 @@ async def upload_resume(
             file_path=str(resume_dir / f"source{file_ext}"),
             extracted_text_path=str(resume_dir / "extracted.txt"),
             extracted_text=extracted_text,  # Store content in DB for Render compatibility
-            file_size_bytes=len(content),
+            file_size_bytes=file_size,
             word_count=word_count,
         )
+        keyword_index.index(db_resume, extracted_text)
 
         db.add(db_resume)
         db.commit()
         db.refresh(db_resume)
+        stored = True
 
         return db_resume
 
     finally:
-        # Clean up temporary file
-        if temp_file_path.exists():
-            os.unlink(temp_file_path)
+        # Drop rejected uploads (the blob goes too unless another resume uses it)
+        if not stored:
+            if workspace_service.get_resume_path(resume_id).exists():
+                workspace_service.delete_resume(resume_id)
+            workspace_service.release_blob(sha256, resume_id)
 
 
 @router.get("/resumes", response_model=ResumeListResponse)
-async def list_resumes(
-    skip: int = 0,
-    limit: int = 100,
+def list_resumes(
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    skip: int = Query(0, ge=0),
+    include_total: bool = True,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):
     """
-    List all uploaded resumes for the current user.
+    List uploaded resumes for the current user, newest first.
 
     Query parameters:
-    - skip: Number of records to skip (default: 0)
     - limit: Maximum number of records to return (default: 100)
+    - cursor: next_cursor of the previous page (keyset pagination)
+    - skip: Number of records to skip (default: 0); prefer cursor for deep pages
+    - include_total: Whether to count matching records (default: true)
 
-    Returns a list of resumes with their metadata.
+    Returns a page of uploaded resumes with their metadata. Large text columns are
+    not loaded; `total` is a lower bound when total_exact is false.
     """
-    resumes = (
-        db.query(Resume)
-        .filter(Resume.user_id == current_user.id)
-        .offset(skip)
-        .limit(limit)
-        .all()
+    page = paginate(
+        db.query(Resume).filter(Resume.user_id == current_user.id),
+        Resume,
+        ResumeResponse,
+        limit=limit,
+        cursor=cursor,
+        skip=skip,
+        include_total=include_total,
     )
-    total = db.query(Resume).filter(Resume.user_id == current_user.id).count()
 
-    return ResumeListResponse(resumes=resumes, total=total)
+    return ResumeListResponse(resumes=page.items, **page.info())
 
 
 @router.get("/resumes/{resume_id}", response_model=ResumeResponse)
-async def get_resume(
+def get_resume(
     resume_id: UUID,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
@@ -253,7 +276,7 @@ async def get_resume(
 
 
 @router.delete("/resumes/{resume_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_resume(
+def delete_resume(
     resume_id: UUID,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
@@ -288,7 +311,7 @@ async def delete_resume(
 
 
 @router.delete("/resumes", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_all_resumes(
+def delete_all_resumes(
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
     workspace_service: WorkspaceService = Depends(get_workspace_service),
@@ -313,7 +336,7 @@ async def delete_all_resumes(
 
 
 @router.patch("/{resume_id}/update-style", response_model=StyleUpdateResponse)
-async def update_resume_style(
+def update_resume_style(
     resume_id: UUID,
     style_update: StyleUpdateRequest,
     current_user: User = Depends(get_current_active_user),
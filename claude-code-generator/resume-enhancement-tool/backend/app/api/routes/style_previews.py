@@ -28,7 +28,7 @@ WORKSPACE_ROOT = Path("workspace")
 
 
 @router.post("/resumes/{resume_id}/style-previews", response_model=StylePreviewsResponse, deprecated=True)
-async def generate_style_previews(
+def generate_style_previews(
     resume_id: UUID,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
@@ -70,7 +70,7 @@ async def generate_style_previews(
 
 
 @router.get("/resumes/{resume_id}/style-previews", response_model=StylePreviewsResponse)
-async def get_style_previews(
+def get_style_previews(
     resume_id: UUID,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
@@ -136,7 +136,7 @@ async def get_style_previews(
 
 
 @router.post("/resumes/{resume_id}/select-style", response_model=StyleSelectionResponse)
-async def select_style(
+def select_style(
     resume_id: UUID,
     style_selection: StyleSelectionRequest,
     current_user: User = Depends(get_current_active_user),
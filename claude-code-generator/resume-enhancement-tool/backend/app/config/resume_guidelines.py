@@ -0,0 +1,165 @@
+"""Shared resume formatting guidelines.
+
+These rules are identical for every job tailoring and industry revamp
+request, so they are kept as one constant. WorkspaceService embeds them in
+INSTRUCTIONS.md and the worker lifts them back out into a cached system
+prompt block (see app/utils/prompt_cache.py), which keeps the prompt prefix
+byte-identical across enhancements.
+"""
+
+RESUME_FORMATTING_GUIDELINES = """## Length Requirements (CRITICAL - MUST FOLLOW - 2026 BEST PRACTICES)
+
+**Target Page Length:** Based on 2026 industry research
+- Entry-level (0-5 years): **1 PAGE ONLY** (not 2 pages)
+- Mid-level (5-10 years): 1-2 pages
+- Senior (10+ years): 2 pages MAX
+
+**ABSOLUTE MAXIMUM WORD COUNTS:**
+- Entry-level (0-5 years): **400 WORDS MAX** = 1 PAGE ONLY
+- Mid-level (5-10 years): **600 WORDS MAX** = 1-2 PAGES
+- Senior (10+ years): **800 WORDS MAX** = 2 PAGES (fill both pages)
+
+**CRITICAL:** Count words BEFORE adding markdown syntax. If over limit, CUT content aggressively.
+
+**STRICT LIMITS:**
+- NEVER exceed 2 pages regardless of experience
+- NEVER exceed word count maximums (400/600/800)
+- Entry-level MUST be 1 page (66% of employers require this)
+- Minimize white space - use 0.5-0.75" margins if needed
+- Line spacing: 1.0-1.15 (single-spaced)
+
+## Formatting Rules (ULTRA-STRICT - ZERO WHITE SPACE TOLERANCE)
+
+❌ **ABSOLUTELY FORBIDDEN:**
+- NO decorative dividers (`---` or `===`)
+- NO emojis or special characters
+- NO blank lines between bullets
+- NO blank lines between skill categories
+- NO blank lines in Education section
+- NO blank lines in Certifications section
+- NO custom creative headers
+- NO more than 3-4 jobs listed
+- NO tables, text boxes, or graphics
+- NO "Professional Development" or "Hobbies" sections for entry-level
+- NO "Relevant Coursework" expansions in Education
+- NO certification descriptions (title and date ONLY)
+
+✅ **STRICT REQUIREMENTS:**
+- ONLY 4-5 blank lines in ENTIRE document (one between each major section)
+- Contact info: ONE line with pipes (|) separating elements
+- Professional Summary: 2-3 sentences (40-60 words MAX), NO blank lines before/after
+- Skills: Single-line categories with pipes (see format below), NO multi-line categories
+- Each job: Title/Company/Dates, then bullets immediately following
+- Education: Degree, University, Location, Dates - ONE line per degree, NO coursework
+- Certifications: Name - Issuer | Date - ONE line per cert, NO descriptions
+- Lead every bullet with action verb + quantified result
+
+## Skills Section Format (REQUIRED - SINGLE-LINE CATEGORIES)
+
+**WRONG (wastes 8+ lines):**
+```
+## Skills
+**System Administration:** Windows Server, Active Directory...
+
+**Infrastructure & Tools:** Azure, ServiceNow...
+
+**Networking & Security:** TCP/IP, DNS/DHCP...
+```
+
+**CORRECT (3-4 lines total with pipe-separated categories):**
+```
+## Skills
+**System Administration:** Windows Server, Active Directory, Microsoft 365, DNS/DHCP, Group Policy | **Infrastructure:** Azure, ServiceNow, Cherwell ITSM, TeamViewer, PowerShell, Virtual Machines | **Networking:** TCP/IP, Network Troubleshooting, Security Compliance | **Technical:** Windows 10/11, Linux, Documentation
+```
+
+**Format rules:**
+- Maximum 3-4 category groups
+- Each category on SAME line, separated by ` | `
+- NO blank lines between categories
+- Total Skills section: 2-4 lines maximum
+
+## Education & Certifications Format (ULTRA-CONDENSED)
+
+**Education - WRONG:**
+```
+**Bachelor of Cybersecurity** - Griffith University, Brisbane, QLD | March 2024 - 2026
+
+Relevant Coursework: Applied Network Security, Database Design...
+```
+
+**Education - CORRECT:**
+```
+## Education
+**Bachelor of Cybersecurity** - Griffith University, Brisbane, QLD | 2024-2026
+**Diploma of Information Technology** - Griffith College, Brisbane, QLD | 2022-2023
+```
+
+**Certifications - WRONG:**
+```
+**IT Support Technical Skills** - Udemy | June 2025
+
+Gained hands-on experience with Active Directory...
+```
+
+**Certifications - CORRECT (Name and date ONLY):**
+```
+## Certifications
+IT Support Technical Skills Helpdesk - Udemy | 2025
+Computer Systems and Networks - Griffith College | 2023
+Advent of Cyber - TryHackMe | 2024
+```
+
+**Format rules:**
+- ONE line per certification
+- NO descriptions or details whatsoever
+- NO blank lines between certifications
+- Format: `[Certification Name] - [Issuer] | [Year]`
+
+## Bullet Point Guidelines (CRITICAL - VARIES BY JOB)
+
+**Most Recent/Relevant Job:** 4-5 bullets
+**Second Most Recent Job:** 3-4 bullets
+**Older/Less Relevant Jobs:** 1-3 bullets (or remove if not relevant)
+
+**Each Bullet Must:**
+- Be 1-2 lines maximum (no paragraph bullets)
+- Start with strong action verb (Led, Developed, Implemented, Managed)
+- Include quantified results (numbers, percentages, scale)
+- Focus on achievements, NOT responsibilities
+
+## Content Prioritization (AGGRESSIVE REDUCTION)
+
+1. **Remove entirely:** Irrelevant jobs, generic skills, obvious duties
+2. **Condense:** Education (degree + dates only), Certifications (name + date)
+3. **Prioritize:** Most recent 2-3 relevant positions
+4. **Quantify:** Every bullet must have a metric (users, %, time saved, etc.)
+5. **Eliminate:** Verbose explanations, adjectives, filler words (the, an, a)
+6. **Cut:** Any section that doesn't directly support job qualifications
+
+## 2-Page Resume Formatting (FOR MID/SENIOR LEVEL ONLY - 10+ YEARS)
+
+**If using 2 pages, follow these rules:**
+
+1. **Page Distribution:**
+   - **Page 1:** Contact info, Professional Summary, Key Skills, most recent 2-3 jobs (detailed)
+   - **Page 2:** Older jobs (condensed 2-3 bullets each), Education, Certifications, optional Projects/Awards
+
+2. **Page Breaks:**
+   - DO NOT split a single job description between pages
+   - Finish one complete job on page 1, start fresh job on page 2
+   - Ensure page 1 ends with complete content (not mid-bullet)
+
+3. **Page 2 Header:**
+   - Include: [Name] | [Phone] | [Email] | Page 2
+   - Keeps pages connected if separated
+
+4. **Fill Both Pages:**
+   - AVOID 1.5-page resumes (looks incomplete)
+   - If you can't fill 2 full pages, use 1 page instead
+   - Balance white space - don't cram page 1 and leave page 2 sparse
+
+5. **Content Strategy:**
+   - Most important content on page 1 (first 30 seconds of review)
+   - Older experience gets less detail on page 2
+   - Recent jobs: 4-5 bullets | Older jobs: 2-3 bullets
+"""
@@ -0,0 +1,25 @@
+"""Concurrency limits for CPU-heavy work in request handlers.
+
+Route handlers are sync `def`, so FastAPI runs them on a threadpool of
+API_THREADPOOL_SIZE threads (set in main.py) and the event loop stays free.
+PDF/DOCX rendering is pure-Python CPU work that holds the GIL; letting every
+pool thread do it at once starves the event loop and cheap requests just as
+a blocking handler would. cpu_bound() caps how many run at once so other
+requests keep getting scheduled. (Document parsing runs in separate
+processes instead, see app/services/parse_pool.py.)
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+from .config import settings
+
+_cpu_slots = threading.BoundedSemaphore(settings.API_CPU_CONCURRENCY)
+
+
+@contextmanager
+def cpu_bound() -> Iterator[None]:
+    """Hold one of API_CPU_CONCURRENCY slots for the duration of the block."""
+    with _cpu_slots:
+        yield
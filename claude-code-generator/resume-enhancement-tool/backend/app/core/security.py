@@ -3,6 +3,7 @@
 This module implements:
 - Rate limiting per specification (auth, AI, global)
 - Security headers (HSTS, CSP, X-Frame-Options, etc.)
+- Upload body size limit (enforced while the body streams)
 - CORS configuration helpers
 - Request sanitization
 
@@ -21,7 +22,9 @@ from datetime import datetime
 
 from fastapi import FastAPI, Request, Response, HTTPException, status
 from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
@@ -91,6 +94,11 @@ API_RATE_LIMIT = "60/minute"
 # File upload routes
 UPLOAD_RATE_LIMIT = "10/minute"
 
+# Upload size limit (resume files)
+MAX_UPLOAD_SIZE = 10 * 1024 * 1024  # 10 MB
+UPLOAD_PATHS = ("/api/resumes/upload",)
+MULTIPART_OVERHEAD_BYTES = 64 * 1024  # Boundaries and part headers around the file
+
 
 def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded) -> JSONResponse:
     """Custom handler for rate limit exceeded errors.
@@ -184,6 +192,59 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         return response
 
 
+# =============================================================================
+# UPLOAD SIZE LIMIT MIDDLEWARE
+# =============================================================================
+
+class UploadSizeLimitMiddleware:
+    """Reject oversized upload bodies while they are still arriving.
+
+    SECURITY: Without this, the multipart parser spools the whole body to disk
+    before the route can check the file size. Requests declaring a larger
+    Content-Length are rejected before any body is read; chunked bodies are
+    counted as they stream and aborted once over the limit.
+
+    Pure ASGI (not BaseHTTPMiddleware) so it sees the receive channel.
+    """
+
+    def __init__(self, app: ASGIApp, max_bytes: int, paths: tuple = UPLOAD_PATHS):
+        self.app = app
+        self.max_bytes = max_bytes
+        self.paths = paths
+
+    def _too_large(self) -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File too large. Maximum file size is {MAX_UPLOAD_SIZE / 1024 / 1024:.0f} MB.",
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "POST" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        content_length = Headers(scope=scope).get("content-length")
+        if content_length and content_length.isdigit() and int(content_length) > self.max_bytes:
+            error = self._too_large()
+            response = JSONResponse({"detail": error.detail}, status_code=error.status_code)
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    # Raised inside request.form(); FastAPI re-raises HTTPExceptions as-is
+                    raise self._too_large()
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+
 # =============================================================================
 # REQUEST LOGGING MIDDLEWARE
 # =============================================================================
@@ -295,6 +356,11 @@ def setup_security(app: FastAPI) -> None:
     # Add rate limit exceeded handler
     app.add_exception_handler(RateLimitExceeded, rate_limit_exceeded_handler)
 
+    # Cut off oversized uploads before they are spooled. Added first so it sits
+    # innermost: its receive() errors must reach FastAPI's body parsing directly,
+    # not through BaseHTTPMiddleware's task group
+    app.add_middleware(UploadSizeLimitMiddleware, max_bytes=MAX_UPLOAD_SIZE + MULTIPART_OVERHEAD_BYTES)
+
     # Add security headers middleware
     app.add_middleware(SecurityHeadersMiddleware)
 
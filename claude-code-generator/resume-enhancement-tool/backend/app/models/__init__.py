@@ -3,5 +3,7 @@
 from .resume import Resume
 from .job import Job
 from .enhancement import Enhancement
+from .llm_result import LLMResult
+from .rendered_artifact import RenderedArtifact
 
-__all__ = ["Resume", "Job", "Enhancement"]
+__all__ = ["Resume", "Job", "Enhancement", "LLMResult", "RenderedArtifact"]
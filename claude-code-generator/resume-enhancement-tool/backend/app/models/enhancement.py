@@ -1,17 +1,37 @@
 """Enhancement database model."""
 
-from sqlalchemy import Column, String, Integer, Boolean, DateTime, Text, ForeignKey
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, Text, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import datetime
 import uuid
 
 from ..core.database import Base
 
+# Row predicates of the worker's claim queues (see app.services.job_queue)
+PENDING_ENHANCEMENT = text("status = 'pending'")
+PENDING_COVER_LETTER = text("status = 'completed' AND cover_letter_status = 'pending' AND job_id IS NOT NULL")
+IN_BATCH = text("batch_id IS NOT NULL")
+
 
 class Enhancement(Base):
     """Enhancement model for tracking resume enhancement requests."""
 
     __tablename__ = "enhancements"
+    __table_args__ = (
+        # List pages, newest first (app.api.pagination)
+        Index("ix_enhancements_user_id_created_at_id", "user_id", "created_at", "id"),
+        # Oldest-first claim queues; only the few waiting rows are indexed
+        Index(
+            "ix_enhancements_pending_created_at", "created_at",
+            postgresql_where=PENDING_ENHANCEMENT, sqlite_where=PENDING_ENHANCEMENT,
+        ),
+        Index(
+            "ix_enhancements_pending_cover_letter_created_at", "created_at",
+            postgresql_where=PENDING_COVER_LETTER, sqlite_where=PENDING_COVER_LETTER,
+        ),
+        # Message Batch lookups; rows outside a batch (nearly all) are left out
+        Index("ix_enhancements_batch_id", "batch_id", postgresql_where=IN_BATCH, sqlite_where=IN_BATCH),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
@@ -26,6 +46,7 @@ class Enhancement(Base):
     instructions_text = Column(Text, nullable=True)  # INSTRUCTIONS.md content
     enhanced_content = Column(Text, nullable=True)  # enhanced.md content
     cover_letter_content = Column(Text, nullable=True)  # cover_letter.md content
+    partial_content = Column(Text, nullable=True)  # Streamed output of the generation in progress (resume, then cover letter)
 
     # File path columns (for local file caching)
     output_path = Column(Text, nullable=True)  # Path to enhanced.md
@@ -44,9 +65,17 @@ class Enhancement(Base):
     ats_analysis = Column(Text, nullable=True)  # JSON: {keywords_found, keywords_missing, match_score, etc.}
     job_match_score = Column(Integer, nullable=True)  # 0-100 percentage
     achievement_suggestions = Column(Text, nullable=True)  # JSON: [{achievement, suggested_metric, location}]
+    keywords = Column(Text, nullable=True)  # JSON keyword set of enhanced_content, see app.services.keyword_index
+    keywords_version = Column(String(64), nullable=True)  # Extractor/taxonomy version of keywords
 
     status = Column(String(50), nullable=False, default="pending")  # 'pending', 'completed', 'failed'
     error_message = Column(Text, nullable=True)
+
+    # Worker lease fields (row-level job claiming across worker slots/processes)
+    claimed_by = Column(String(255), nullable=True)  # "<hostname>:<pid>:<slot>" of the owning worker slot
+    lease_expires_at = Column(DateTime, nullable=True)  # Claim is void after this time (crashed worker recovery)
+    batch_id = Column(String(255), nullable=True)  # Message Batch the generation is waiting on (worker.py --batch)
+
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     completed_at = Column(DateTime, nullable=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
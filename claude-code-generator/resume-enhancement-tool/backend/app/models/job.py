@@ -1,6 +1,6 @@
 """Job description database model."""
 
-from sqlalchemy import Column, String, DateTime, Text, ForeignKey
+from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import datetime
 import uuid
@@ -12,6 +12,9 @@ class Job(Base):
     """Job model for storing job descriptions."""
 
     __tablename__ = "jobs"
+    __table_args__ = (
+        Index("ix_jobs_user_id_created_at_id", "user_id", "created_at", "id"),  # List pages, newest first
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=False, index=True)
@@ -20,6 +23,10 @@ class Job(Base):
     description_text = Column(Text, nullable=False)
     file_path = Column(Text, nullable=False)  # Path to description.txt in workspace
     source = Column(String(50), nullable=False)  # 'upload', 'paste'
+    keywords = Column(Text, nullable=True)  # JSON keyword set, see app.services.keyword_index
+    keywords_version = Column(String(64), nullable=True)  # Extractor/taxonomy version of keywords
+    style_signals = Column(Text, nullable=True)  # JSON StyleAnalyzer job signals
+    style_signals_key = Column(String(64), nullable=True)  # Content hash the signals were computed for
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
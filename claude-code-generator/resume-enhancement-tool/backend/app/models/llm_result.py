@@ -0,0 +1,22 @@
+"""Cached Claude generation results."""
+
+from sqlalchemy import Column, String, Integer, DateTime, Text
+from datetime import datetime
+
+from ..core.database import Base
+
+
+class LLMResult(Base):
+    """Generated text keyed on a hash of the normalized request (see app.services.llm_cache)."""
+
+    __tablename__ = "llm_results"
+
+    cache_key = Column(String(64), primary_key=True)  # SHA-256 hex of the normalized request
+    model = Column(String(100), nullable=False)
+    content = Column(Text, nullable=False)
+    hit_count = Column(Integer, default=0, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)  # TTL is measured from here
+    last_used_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)  # LRU eviction order
+
+    def __repr__(self):
+        return f"<LLMResult(cache_key={self.cache_key}, model={self.model}, hits={self.hit_count})>"
@@ -0,0 +1,23 @@
+"""Cached PDF/DOCX renders."""
+
+from sqlalchemy import Column, String, Integer, DateTime, LargeBinary
+from datetime import datetime
+
+from ..core.database import Base
+
+
+class RenderedArtifact(Base):
+    """Rendered document keyed on a hash of its source and renderer (see app.services.artifact_cache)."""
+
+    __tablename__ = "rendered_artifacts"
+
+    cache_key = Column(String(64), primary_key=True)  # SHA-256 hex of (markdown, format, template, generator version)
+    format = Column(String(10), nullable=False)  # 'pdf' or 'docx'
+    content = Column(LargeBinary, nullable=False)
+    size_bytes = Column(Integer, nullable=False)
+    hit_count = Column(Integer, default=0, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    last_used_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)  # LRU eviction order
+
+    def __repr__(self):
+        return f"<RenderedArtifact(cache_key={self.cache_key}, format={self.format}, size={self.size_bytes})>"
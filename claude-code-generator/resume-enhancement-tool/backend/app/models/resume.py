@@ -1,6 +1,6 @@
 """Resume database model."""
 
-from sqlalchemy import Column, String, Integer, DateTime, Text, Boolean, ForeignKey
+from sqlalchemy import Column, String, Integer, DateTime, Text, Boolean, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import datetime
 import uuid
@@ -12,6 +12,9 @@ class Resume(Base):
     """Resume model for storing uploaded resumes."""
 
     __tablename__ = "resumes"
+    __table_args__ = (
+        Index("ix_resumes_user_id_created_at_id", "user_id", "created_at", "id"),  # List pages, newest first
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=False, index=True)
@@ -23,6 +26,8 @@ class Resume(Base):
     upload_date = Column(DateTime, default=datetime.utcnow, nullable=False)
     file_size_bytes = Column(Integer, nullable=False)
     word_count = Column(Integer, nullable=True)
+    keywords = Column(Text, nullable=True)  # JSON keyword set, see app.services.keyword_index
+    keywords_version = Column(String(64), nullable=True)  # Extractor/taxonomy version of keywords
 
     # Style preference fields
     selected_style = Column(String(50), nullable=True)  # professional, executive, technical, creative, concise
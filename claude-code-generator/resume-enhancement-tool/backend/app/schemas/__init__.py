@@ -1,5 +1,6 @@
 """Pydantic schemas for request/response validation."""
 
+from .pagination import PageInfo, MAX_PAGE_SIZE
 from .resume import ResumeCreate, ResumeResponse, ResumeListResponse
 from .job import JobCreate, JobResponse, JobListResponse
 from .enhancement import (
@@ -12,10 +13,16 @@ from .analysis import (
     AnalysisResponse,
     AchievementSuggestion,
     AchievementSuggestionsResponse,
+    JobMatchRequest,
+    JobMatch,
+    JobMatchResponse,
+    StyleMatchResponse,
 )
 from .comparison import ComparisonResponse
 
 __all__ = [
+    "PageInfo",
+    "MAX_PAGE_SIZE",
     "ResumeCreate",
     "ResumeResponse",
     "ResumeListResponse",
@@ -29,5 +36,9 @@ __all__ = [
     "AnalysisResponse",
     "AchievementSuggestion",
     "AchievementSuggestionsResponse",
+    "JobMatchRequest",
+    "JobMatch",
+    "JobMatchResponse",
+    "StyleMatchResponse",
     "ComparisonResponse",
 ]
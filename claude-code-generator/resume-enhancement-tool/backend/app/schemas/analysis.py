@@ -1,7 +1,10 @@
 """Schemas for analysis responses."""
 
-from pydantic import BaseModel
-from typing import List, Dict, Any, Optional
+from pydantic import BaseModel, Field
+from typing import List, Dict, Any, Literal, Optional
+from uuid import UUID
+
+MAX_MATCH_JOBS = 200
 
 
 class AnalysisResponse(BaseModel):
@@ -103,3 +106,81 @@ class AchievementSuggestionsResponse(BaseModel):
                 }
             }
         }
+
+
+class StyleMatchResponse(BaseModel):
+    """Fit of a resume's writing style to a saved job."""
+
+    resume_id: UUID
+    job_id: UUID
+    current_style: str
+    is_appropriate: bool
+    recommended_style: Optional[str] = Field(None, description="Better fitting style, if the gap is 10 points or more")
+    confidence_gap: int
+    current_score: int
+    recommended_score: int
+    reasoning: List[str]
+    job_signals: Dict[str, Any]
+    style_scores: Dict[str, int]
+
+
+class JobMatchRequest(BaseModel):
+    """Request to rank saved jobs against a resume."""
+
+    job_ids: Optional[List[UUID]] = Field(
+        None,
+        description="Jobs to score (default: all of the user's jobs)",
+        max_length=MAX_MATCH_JOBS,
+    )
+    limit: int = Field(20, description="Maximum number of ranked jobs to return", ge=1, le=MAX_MATCH_JOBS)
+    rank_by: Literal["keywords", "relevance"] = Field(
+        "keywords",
+        description="Order by ATS keyword match score or by BM25 relevance of the full text",
+    )
+
+
+class JobMatch(BaseModel):
+    """One job's match against the resume."""
+
+    job_id: UUID
+    title: str
+    company: Optional[str] = None
+    match_score: int
+    match_count: int
+    job_keyword_count: int
+    keywords_found: List[str]
+    keywords_missing: List[str]
+    relevance_score: float = Field(description="BM25 relevance of the job description to the resume (unbounded, higher is better)")
+    relevance_terms: List[str] = Field(description="Terms contributing most to relevance_score")
+
+
+class JobMatchResponse(BaseModel):
+    """Saved jobs ranked by ATS keyword match with a resume."""
+
+    resume_id: UUID
+    resume_keyword_count: int
+    jobs_scored: int
+    matches: List[JobMatch]
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "resume_id": "123e4567-e89b-12d3-a456-426614174000",
+                "resume_keyword_count": 12,
+                "jobs_scored": 2,
+                "matches": [
+                    {
+                        "job_id": "223e4567-e89b-12d3-a456-426614174000",
+                        "title": "Backend Engineer",
+                        "company": "Acme",
+                        "match_score": 75,
+                        "match_count": 3,
+                        "job_keyword_count": 4,
+                        "keywords_found": ["django", "postgresql", "python"],
+                        "keywords_missing": ["kubernetes"],
+                        "relevance_score": 14.2,
+                        "relevance_terms": ["django", "postgresql", "celery", "python", "api"]
+                    }
+                ]
+            }
+        }
@@ -8,6 +8,8 @@ from uuid import UUID
 from typing import Literal
 from pydantic import BaseModel, Field
 
+from .pagination import PageInfo
+
 # Valid enhancement types and industries
 VALID_ENHANCEMENT_TYPES = ("job_tailoring", "industry_revamp")
 VALID_INDUSTRIES = ("IT", "Cybersecurity", "Finance")
@@ -78,8 +80,7 @@ class EnhancementResponse(EnhancementBase):
         from_attributes = True
 
 
-class EnhancementListResponse(BaseModel):
+class EnhancementListResponse(PageInfo):
     """Schema for list of enhancements."""
 
     enhancements: list[EnhancementResponse]
-    total: int
@@ -7,6 +7,8 @@ from datetime import datetime
 from uuid import UUID
 from pydantic import BaseModel, Field
 
+from .pagination import PageInfo
+
 # SECURITY: Maximum lengths for input validation
 MAX_JOB_TITLE_LENGTH = 200
 MAX_COMPANY_LENGTH = 200
@@ -58,8 +60,7 @@ class JobResponse(JobBase):
         from_attributes = True
 
 
-class JobListResponse(BaseModel):
+class JobListResponse(PageInfo):
     """Schema for list of jobs."""
 
     jobs: list[JobResponse]
-    total: int
@@ -0,0 +1,23 @@
+"""Pagination fields shared by list responses."""
+
+from pydantic import BaseModel, Field
+
+# Largest page a list endpoint returns
+MAX_PAGE_SIZE = 500
+
+
+class PageInfo(BaseModel):
+    """Position and size of a page of a list response."""
+
+    total: int | None = Field(
+        None,
+        description="Number of matching records (null if include_total=false)"
+    )
+    total_exact: bool = Field(
+        True,
+        description="False if counting stopped early: there are at least `total` records"
+    )
+    next_cursor: str | None = Field(
+        None,
+        description="Pass as `cursor` to get the next page (null on the last page)"
+    )
@@ -7,6 +7,8 @@ from datetime import datetime
 from uuid import UUID
 from pydantic import BaseModel, Field
 
+from .pagination import PageInfo
+
 # SECURITY: Maximum lengths for input validation
 MAX_FILENAME_LENGTH = 255
 MAX_FORMAT_LENGTH = 10
@@ -51,8 +53,7 @@ class ResumeResponse(ResumeBase):
         from_attributes = True
 
 
-class ResumeListResponse(BaseModel):
+class ResumeListResponse(PageInfo):
     """Schema for list of resumes."""
 
     resumes: list[ResumeResponse]
-    total: int
@@ -0,0 +1,415 @@
+"""Rate-limited, retrying wrapper around the Anthropic client.
+
+Every Claude call in the backend (worker.py, AnthropicService, Message
+Batches) goes through RateLimitedAnthropic:
+- Token buckets cap requests and input tokens per minute. They start from
+  settings and are resized from the anthropic-ratelimit-* headers of every
+  response, so each process converges on the account's actual quota.
+- At most max_concurrency requests are in flight per process.
+- 408/409/429, 5xx (including 529 overloaded) and connection errors are
+  retried with full-jitter exponential backoff, honouring retry-after.
+  Streams that fail part-way (overloaded/rate limit error events, dropped
+  connections) are restarted from scratch by messages.stream_text().
+
+The SDK's built-in retries are disabled on wrapped clients so backoff is
+not applied twice.
+"""
+
+import json
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional
+
+import httpx
+from anthropic import Anthropic, APIConnectionError, APIStatusError, DefaultHttpxClient
+
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Status codes worth retrying besides 5xx (same set the SDK retries)
+RETRYABLE_STATUS_CODES = {408, 409, 429}
+
+# Error types of mid-stream error events, which arrive on a 200 response
+RETRYABLE_ERROR_TYPES = {"overloaded_error", "rate_limit_error", "api_error"}
+
+# Rough prompt size estimate used before the API reports real usage
+CHARS_PER_TOKEN = 4
+
+
+def is_retryable(error: Exception) -> bool:
+    """Whether an API error is transient (rate limited, overloaded, network)."""
+    if isinstance(error, (APIConnectionError, httpx.TransportError)):  # Includes APITimeoutError
+        return True
+    if isinstance(error, APIStatusError):
+        if error.status_code in RETRYABLE_STATUS_CODES or error.status_code >= 500:
+            return True
+        body = error.body if isinstance(error.body, dict) else {}
+        return (body.get("error") or {}).get("type") in RETRYABLE_ERROR_TYPES
+    return False
+
+
+def retry_after_seconds(headers: Optional[Mapping[str, str]]) -> Optional[float]:
+    """Parse the retry-after header (seconds) if present."""
+    if not headers:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+def estimate_input_tokens(request: Dict[str, Any]) -> int:
+    """Estimate input tokens of a Messages request from its prompt size."""
+    prompt = json.dumps([request.get("system", ""), request.get("messages", [])], default=str)
+    return max(1, len(prompt) // CHARS_PER_TOKEN)
+
+
+class TokenBucket:
+    """Per-minute budget that refills continuously."""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.level = float(per_minute)
+        self.updated = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self.updated)
+        self.level = min(self.capacity, self.level + elapsed * self.capacity / 60)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until `amount` is available (0 if available now)."""
+        self.refill(now)
+        if self.level >= amount:
+            return 0.0
+        return (amount - self.level) * 60 / self.capacity
+
+    def resize(self, limit: int, remaining: int, now: float) -> None:
+        """Adopt the server's view of the limit and what is left of it."""
+        self.refill(now)
+        self.capacity = float(limit)
+        self.level = min(self.level, float(remaining))
+
+
+class RateLimiter:
+    """Request/input-token buckets plus an in-flight ceiling, shared by threads."""
+
+    def __init__(
+        self,
+        requests_per_minute: int = 50,
+        input_tokens_per_minute: int = 30000,
+        max_concurrency: int = 4,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            requests_per_minute: Initial request budget (replaced by response headers)
+            input_tokens_per_minute: Initial input-token budget (replaced by response headers)
+            max_concurrency: Maximum requests in flight at once
+        """
+        self.requests = TokenBucket(requests_per_minute)
+        self.input_tokens = TokenBucket(input_tokens_per_minute)
+        self.max_concurrency = max_concurrency
+        self.in_flight = 0
+        self.blocked_until = 0.0
+        self._condition = threading.Condition()
+
+    def acquire(self, estimated_tokens: int = 1) -> None:
+        """Block until a request of this size may start."""
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                tokens = min(estimated_tokens, self.input_tokens.capacity)
+                wait = max(
+                    self.blocked_until - now,
+                    self.requests.wait_time(1, now),
+                    self.input_tokens.wait_time(tokens, now),
+                )
+
+                if self.in_flight < self.max_concurrency and wait <= 0:
+                    self.requests.level -= 1
+                    self.input_tokens.level -= tokens
+                    self.in_flight += 1
+                    return
+
+                # No timeout when only the concurrency ceiling blocks: release() notifies
+                self._condition.wait(timeout=wait if wait > 0 else None)
+
+    def release(self) -> None:
+        """Mark a request as finished."""
+        with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    def update(self, headers: Mapping[str, str], status_code: Optional[int] = None) -> None:
+        """
+        Resize the buckets from anthropic-ratelimit-* response headers.
+
+        Args:
+            headers: Response headers
+            status_code: Response status; a 429 pauses all requests for retry-after
+        """
+        with self._condition:
+            now = time.monotonic()
+            for bucket, names in (
+                (self.requests, ("requests",)),
+                (self.input_tokens, ("input-tokens", "tokens")),
+            ):
+                for name in names:
+                    limit = _int_header(headers, f"anthropic-ratelimit-{name}-limit")
+                    if limit:
+                        remaining = _int_header(headers, f"anthropic-ratelimit-{name}-remaining")
+                        bucket.resize(limit, limit if remaining is None else remaining, now)
+                        break
+
+            retry_after = retry_after_seconds(headers)
+            if status_code == 429 and retry_after:
+                self.blocked_until = max(self.blocked_until, now + retry_after)
+
+            self._condition.notify_all()
+
+    def observe_response(self, response: httpx.Response) -> None:
+        """httpx response hook: learn limits from every API response."""
+        self.update(response.headers, response.status_code)
+
+
+def _int_header(headers: Mapping[str, str], name: str) -> Optional[int]:
+    try:
+        return int(headers.get(name))
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimitedAnthropic:
+    """Anthropic client whose messages.create/stream are rate limited and retried.
+
+    message_batches wraps beta.messages.batches the same way. Other
+    attributes (api_key, beta, ...) pass through to the wrapped client.
+    """
+
+    def __init__(
+        self,
+        client: Anthropic,
+        limiter: RateLimiter,
+        max_retries: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Wrap a client.
+
+        Args:
+            client: Anthropic client (create it with max_retries=0)
+            limiter: Limiter shared by all clients in the process
+            max_retries: Retries after the first attempt for transient errors
+            base_delay: Backoff ceiling for the first retry (doubles per retry)
+            max_delay: Upper bound for the backoff ceiling
+            sleep: Sleep function (injectable for tests)
+        """
+        self.client = client
+        self.limiter = limiter
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._sleep = sleep
+        self.messages = _RateLimitedMessages(self)
+        self.message_batches = _RateLimitedBatches(self)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.client, name)
+
+    def call(self, method: Callable[..., Any], *args: Any, estimated_tokens: int = 1, **kwargs: Any) -> Any:
+        """
+        Call a client method under the limiter, retrying transient errors.
+
+        Args:
+            method: Bound method of the wrapped client
+            estimated_tokens: Input tokens to reserve per attempt
+            *args, **kwargs: Arguments for the method
+
+        Returns:
+            The method's result
+        """
+        attempt = 0
+        while True:
+            self.limiter.acquire(estimated_tokens)
+            try:
+                return method(*args, **kwargs)
+            except Exception as e:
+                delay = self._should_retry(attempt, e)
+                if delay is None:
+                    raise
+            finally:
+                self.limiter.release()
+
+            self._sleep(delay)
+            attempt += 1
+
+    def backoff(self, attempt: int, error: Exception) -> float:
+        """Full-jitter exponential delay, never shorter than retry-after."""
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+        retry_after = retry_after_seconds(getattr(getattr(error, "response", None), "headers", None))
+        return max(delay, retry_after or 0.0)
+
+    def _should_retry(self, attempt: int, error: Exception) -> Optional[float]:
+        """Delay before the next attempt, or None if the error must propagate."""
+        if attempt >= self.max_retries or not is_retryable(error):
+            return None
+        delay = self.backoff(attempt, error)
+        logger.warning(
+            f"Claude API call failed ({type(error).__name__}: {error}); "
+            f"retry {attempt + 1}/{self.max_retries} in {delay:.1f}s"
+        )
+        return delay
+
+
+class _RateLimitedMessages:
+    def __init__(self, owner: RateLimitedAnthropic):
+        self._owner = owner
+
+    def create(self, **request: Any) -> Any:
+        """messages.create with rate limiting and retries."""
+        owner = self._owner
+        return owner.call(owner.client.messages.create, estimated_tokens=estimate_input_tokens(request), **request)
+
+    @contextmanager
+    def stream(self, **request: Any) -> Iterator[Any]:
+        """
+        messages.stream with rate limiting; opening the stream is retried.
+
+        The concurrency slot is held until the stream is closed. Errors after
+        the stream opened propagate; stream_text() starts over on them.
+        """
+        owner = self._owner
+        estimate = estimate_input_tokens(request)
+        attempt = 0
+
+        while True:
+            owner.limiter.acquire(estimate)
+            manager = owner.client.messages.stream(**request)
+            try:
+                stream = manager.__enter__()
+            except Exception as e:
+                owner.limiter.release()
+                delay = owner._should_retry(attempt, e)
+                if delay is None:
+                    raise
+                owner._sleep(delay)
+                attempt += 1
+                continue
+
+            try:
+                yield stream
+            finally:
+                manager.__exit__(None, None, None)
+                owner.limiter.release()
+            return
+
+    def stream_text(
+        self,
+        on_text: Callable[[str], None],
+        on_restart: Callable[[], None] = lambda: None,
+        **request: Any,
+    ) -> Any:
+        """
+        Stream a message, starting over if it fails part-way with a transient error.
+
+        Overloaded and rate limit errors often arrive as error events after
+        some text has been sent, past the point stream() retries. The whole
+        stream is then requested again after the usual backoff.
+
+        Args:
+            on_text: Called with each text delta
+            on_restart: Called before starting over; discard the text received so far
+            **request: Keyword arguments for messages.stream
+
+        Returns:
+            The final Message
+        """
+        owner = self._owner
+        attempt = 0
+
+        while True:
+            opened = False
+            try:
+                with self.stream(**request) as stream:
+                    opened = True
+                    for text in stream.text_stream:
+                        on_text(text)
+                    return stream.get_final_message()
+            except Exception as e:
+                if not opened:
+                    raise  # stream() already retried opening it
+                delay = owner._should_retry(attempt, e)
+                if delay is None:
+                    raise
+
+            on_restart()
+            owner._sleep(delay)
+            attempt += 1
+
+
+class _RateLimitedBatches:
+    """beta.messages.batches calls with rate limiting and retries.
+
+    Each call counts as one request; batched prompts are billed against the
+    separate batch quota, not the input-token bucket. Iterating results()
+    after it returns is not retried.
+    """
+
+    def __init__(self, owner: RateLimitedAnthropic):
+        self._owner = owner
+
+    def create(self, **request: Any) -> Any:
+        owner = self._owner
+        return owner.call(owner.client.beta.messages.batches.create, **request)
+
+    def retrieve(self, batch_id: str) -> Any:
+        owner = self._owner
+        return owner.call(owner.client.beta.messages.batches.retrieve, batch_id)
+
+    def results(self, batch_id: str) -> Any:
+        owner = self._owner
+        return owner.call(owner.client.beta.messages.batches.results, batch_id)
+
+
+_shared_limiter: Optional[RateLimiter] = None
+_shared_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Process-wide limiter, so all clients in a process share one quota view."""
+    global _shared_limiter
+    with _shared_limiter_lock:
+        if _shared_limiter is None:
+            _shared_limiter = RateLimiter(
+                requests_per_minute=settings.ANTHROPIC_REQUESTS_PER_MINUTE,
+                input_tokens_per_minute=settings.ANTHROPIC_INPUT_TOKENS_PER_MINUTE,
+                max_concurrency=settings.ANTHROPIC_MAX_CONCURRENCY,
+            )
+        return _shared_limiter
+
+
+def create_anthropic_client(api_key: str) -> RateLimitedAnthropic:
+    """
+    Create an Anthropic client wired to the shared rate limiter.
+
+    Args:
+        api_key: Anthropic API key
+
+    Returns:
+        RateLimitedAnthropic wrapping a client with SDK retries disabled
+    """
+    limiter = get_rate_limiter()
+    client = Anthropic(
+        api_key=api_key,
+        max_retries=0,
+        http_client=DefaultHttpxClient(event_hooks={"response": [limiter.observe_response]}),
+    )
+    return RateLimitedAnthropic(client, limiter, max_retries=settings.ANTHROPIC_MAX_RETRIES)
@@ -5,16 +5,16 @@ SECURITY & COST OPTIMIZATION:
 - XML tagging for user content
 - Prompt injection protection via ai_security module
 - Token limits enforced
+- Rate limited with retries on 429/529 via the shared client wrapper
 """
 
 import asyncio
 import json
 import logging
 from typing import Dict
-from anthropic import Anthropic
-
 from ..config.styles import STYLES, get_style_names
 from ..utils.ai_security import sanitize_user_content, wrap_user_content
+from .anthropic_client import create_anthropic_client
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +31,7 @@ class AnthropicService:
         if not api_key:
             raise ValueError("Anthropic API key is required")
 
-        self.client = Anthropic(api_key=api_key)
+        self.client = create_anthropic_client(api_key)
         self.model = "claude-3-5-sonnet-20241022"
         logger.info(f"Anthropic service initialized with model: {self.model}")
 
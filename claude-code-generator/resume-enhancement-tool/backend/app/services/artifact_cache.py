@@ -0,0 +1,181 @@
+"""Cache of rendered PDF and DOCX downloads.
+
+Download routes render documents from the enhancement markdown. The files
+on disk disappear on every redeploy with an ephemeral filesystem, so each
+download after a deploy used to pay for a fresh WeasyPrint/python-docx
+render. Renders are stored in the rendered_artifacts table instead, keyed
+on a SHA-256 of (markdown, format, template, generator version): a
+document is rendered once per version and every worker process shares it.
+
+The key doubles as the download's ETag, so clients revalidating with
+If-None-Match get a 304 without the artifact being loaded at all.
+Least recently used entries are evicted once max_entries is exceeded.
+"""
+
+import hashlib
+import logging
+import threading
+from datetime import datetime
+from typing import Callable, Dict, Optional
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ..models.rendered_artifact import RenderedArtifact
+
+logger = logging.getLogger(__name__)
+
+
+def artifact_cache_key(source: str, format: str, template: str, generator_version: str) -> str:
+    """
+    Hash a render's inputs into a cache key.
+
+    Args:
+        source: Markdown being rendered
+        format: Output format ("pdf" or "docx")
+        template: Template identifier (e.g. PDFGenerator.template_fingerprint())
+        generator_version: Generator RENDER_VERSION
+
+    Returns:
+        SHA-256 hex digest
+    """
+    digest = hashlib.sha256()
+    for part in (format, template, generator_version, source):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def etag_for(key: str) -> str:
+    """Strong ETag header value for a cache key."""
+    return f'"{key}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag.
+
+    Args:
+        if_none_match: Header value (may list several tags, or be "*")
+        etag: ETag of the current representation
+
+    Returns:
+        True if the client's copy is current
+    """
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    # Weak comparison, as required for If-None-Match
+    return "*" in tags or etag in tags or f"W/{etag}" in tags
+
+
+class ArtifactCache:
+    """Database-backed render cache with LRU eviction."""
+
+    def __init__(self, max_entries: int = 500):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Entries kept before least recently used ones are evicted
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, db: Session, key: str) -> Optional[bytes]:
+        """
+        Look up a rendered artifact.
+
+        Args:
+            db: Database session
+            key: Key from artifact_cache_key()
+
+        Returns:
+            The rendered bytes, or None on a miss
+        """
+        entry = db.query(RenderedArtifact).filter(RenderedArtifact.cache_key == key).first()
+
+        if entry is None:
+            self._count(hit=False)
+            return None
+
+        entry.hit_count += 1
+        entry.last_used_at = datetime.utcnow()
+        db.commit()
+        self._count(hit=True)
+        return entry.content
+
+    def put(self, db: Session, key: str, format: str, content: bytes) -> None:
+        """
+        Store a rendered artifact and evict entries beyond the limit.
+
+        Args:
+            db: Database session
+            key: Key from artifact_cache_key()
+            format: Output format
+            content: Rendered bytes
+        """
+        now = datetime.utcnow()
+        db.add(RenderedArtifact(
+            cache_key=key,
+            format=format,
+            content=content,
+            size_bytes=len(content),
+            created_at=now,
+            last_used_at=now,
+        ))
+
+        try:
+            db.commit()
+        except IntegrityError:
+            # Another request rendered the same artifact first
+            db.rollback()
+            return
+
+        self._evict(db)
+
+    def get_or_render(self, db: Session, key: str, format: str, render: Callable[[], bytes]) -> bytes:
+        """
+        Return a cached artifact, rendering and storing it on a miss.
+
+        Args:
+            db: Database session
+            key: Key from artifact_cache_key()
+            format: Output format
+            render: Produces the artifact bytes; exceptions propagate and nothing is cached
+
+        Returns:
+            Rendered bytes
+        """
+        content = self.get(db, key)
+        if content is None:
+            content = render()
+            self.put(db, key, format, content)
+        return content
+
+    def stats(self) -> Dict[str, int]:
+        """Hit and miss counts since this process started."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _evict(self, db: Session) -> None:
+        excess = db.query(RenderedArtifact).count() - self.max_entries
+        if excess <= 0:
+            return
+
+        stale_keys = [
+            row.cache_key
+            for row in db.query(RenderedArtifact.cache_key).order_by(RenderedArtifact.last_used_at).limit(excess)
+        ]
+        db.query(RenderedArtifact).filter(RenderedArtifact.cache_key.in_(stale_keys)).delete(synchronize_session=False)
+        db.commit()
+        logger.info(f"Evicted {len(stale_keys)} least recently used rendered artifact(s)")
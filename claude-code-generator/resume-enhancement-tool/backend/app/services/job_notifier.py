@@ -0,0 +1,238 @@
+"""Job notification channels between the API and the enhancement worker.
+
+The API signals a notifier whenever it inserts a pending enhancement so idle
+worker slots wake immediately instead of waiting for the next poll. The
+worker still polls (with exponential backoff) as a safety net, so a lost
+notification only delays a job - it never drops it.
+
+Backends:
+- postgres: LISTEN/NOTIFY on JOB_CHANNEL (works across hosts)
+- socket: UDP datagrams on the loopback interface (SQLite / single-host dev)
+- inprocess: threading.Condition (API and worker in the same process, tests)
+- none: no notifications, worker relies on polling only
+"""
+
+import logging
+import select
+import socket
+import threading
+import time
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# LISTEN/NOTIFY channel name for new enhancement jobs
+JOB_CHANNEL = "enhancement_jobs"
+
+
+def libpq_dsn(database_url: str) -> str:
+    """
+    Connection string psycopg2 accepts for a SQLAlchemy database URL.
+
+    libpq rejects driver suffixes such as postgresql+psycopg2://, so the
+    dialect is reduced to plain postgresql; credentials, host and query
+    parameters (sslmode, ...) are kept.
+    """
+    return make_url(database_url).set(drivername="postgresql").render_as_string(hide_password=False)
+
+
+class JobNotifier:
+    """No-op notifier; base class for the notification backends.
+
+    Publishers call notify() after committing a new job. Worker processes
+    call wait() to block until a notification arrives or the timeout expires.
+    Neither side may raise: a failed notification degrades to polling.
+    """
+
+    def notify(self, db: Optional[Session] = None) -> None:
+        """Signal that a new job was committed.
+
+        Args:
+            db: Session used to insert the job (needed by the postgres backend)
+        """
+
+    def wait(self, timeout: float) -> bool:
+        """Block until a notification arrives or timeout seconds pass.
+
+        Args:
+            timeout: Maximum seconds to block
+
+        Returns:
+            True if woken by a notification, False on timeout
+        """
+        time.sleep(timeout)
+        return False
+
+    def close(self) -> None:
+        """Release listener resources."""
+
+
+class InProcessJobNotifier(JobNotifier):
+    """Notifier for an API and worker sharing one process."""
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._pending = 0
+
+    def notify(self, db: Optional[Session] = None) -> None:
+        with self._condition:
+            self._pending += 1
+            self._condition.notify_all()
+
+    def wait(self, timeout: float) -> bool:
+        with self._condition:
+            notified = self._condition.wait_for(lambda: self._pending > 0, timeout)
+            self._pending = 0
+            return notified
+
+
+class LocalSocketJobNotifier(JobNotifier):
+    """Notifier using UDP datagrams on the loopback interface.
+
+    Only one process per host can listen on the port; other worker
+    processes fall back to polling.
+    """
+
+    def __init__(self, port: int, host: str = "127.0.0.1"):
+        self.address = (host, port)
+        self._listener: Optional[socket.socket] = None
+        self._listen_failed = False
+
+    def notify(self, db: Optional[Session] = None) -> None:
+        try:
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sender:
+                sender.sendto(b"1", self.address)
+        except OSError as e:
+            logger.warning(f"Failed to send job notification: {e}")
+
+    def wait(self, timeout: float) -> bool:
+        listener = self._get_listener()
+        if listener is None:
+            return super().wait(timeout)
+
+        readable, _, _ = select.select([listener], [], [], timeout)
+        if not readable:
+            return False
+
+        # Drain queued datagrams so one wake-up covers a burst of inserts
+        while True:
+            try:
+                listener.recv(64)
+            except BlockingIOError:
+                return True
+
+    def _get_listener(self) -> Optional[socket.socket]:
+        if self._listener is None and not self._listen_failed:
+            try:
+                listener = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                listener.bind(self.address)
+                listener.setblocking(False)
+                self._listener = listener
+                logger.info(f"Listening for job notifications on udp://{self.address[0]}:{self.address[1]}")
+            except OSError as e:
+                self._listen_failed = True
+                logger.warning(f"Job notification listener unavailable, polling only: {e}")
+        return self._listener
+
+    def close(self) -> None:
+        if self._listener is not None:
+            self._listener.close()
+            self._listener = None
+
+
+class PostgresJobNotifier(JobNotifier):
+    """Notifier using PostgreSQL LISTEN/NOTIFY."""
+
+    def __init__(self, database_url: str, channel: str = JOB_CHANNEL):
+        self.database_url = database_url
+        self.channel = channel
+        self._connection = None
+
+    def notify(self, db: Optional[Session] = None) -> None:
+        if db is None:
+            return
+        try:
+            db.execute(text("SELECT pg_notify(:channel, '')"), {"channel": self.channel})
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"Failed to send job notification: {e}")
+
+    def wait(self, timeout: float) -> bool:
+        connection = self._get_connection()
+        if connection is None:
+            return super().wait(timeout)
+
+        try:
+            readable, _, _ = select.select([connection], [], [], timeout)
+            if not readable:
+                return False
+            connection.poll()
+            notified = bool(connection.notifies)
+            connection.notifies.clear()
+            return notified
+        except Exception as e:
+            # Connection dropped - reconnect on the next wait
+            logger.warning(f"Job notification listener error: {e}")
+            self.close()
+            return False
+
+    def _get_connection(self):
+        if self._connection is None:
+            try:
+                import psycopg2
+                from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+
+                connection = psycopg2.connect(libpq_dsn(self.database_url))
+                connection.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+                with connection.cursor() as cursor:
+                    cursor.execute(f"LISTEN {self.channel}")
+                self._connection = connection
+                logger.info(f"Listening for job notifications on channel {self.channel}")
+            except Exception as e:
+                logger.warning(f"Job notification listener unavailable, polling only: {e}")
+        return self._connection
+
+    def close(self) -> None:
+        if self._connection is not None:
+            try:
+                self._connection.close()
+            except Exception:
+                pass
+            self._connection = None
+
+
+def create_job_notifier(backend: str, database_url: str, port: int) -> JobNotifier:
+    """
+    Create a job notifier for the configured backend.
+
+    Args:
+        backend: 'auto', 'postgres', 'socket', 'inprocess' or 'none'
+        database_url: Database URL ('auto' picks postgres for PostgreSQL URLs)
+        port: Loopback UDP port for the socket backend
+
+    Returns:
+        JobNotifier instance
+
+    Raises:
+        ValueError: If backend is not recognised
+    """
+    if backend == "auto":
+        backend = "postgres" if database_url.startswith("postgresql") else "socket"
+
+    if backend == "postgres":
+        return PostgresJobNotifier(database_url)
+    if backend == "socket":
+        return LocalSocketJobNotifier(port)
+    if backend == "inprocess":
+        return InProcessJobNotifier()
+    if backend == "none":
+        return JobNotifier()
+
+    raise ValueError(
+        f"Invalid JOB_NOTIFIER: {backend}. Must be one of: auto, postgres, socket, inprocess, none"
+    )
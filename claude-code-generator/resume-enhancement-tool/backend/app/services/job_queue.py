@@ -0,0 +1,154 @@
+"""Row-level job claiming for the enhancement worker.
+
+Lets several worker slots (threads in one process, or separate processes)
+pull work from the enhancements table without processing the same row twice.
+
+Claims are recorded as a lease on the row (claimed_by + lease_expires_at):
+- PostgreSQL: candidate rows are locked with SELECT ... FOR UPDATE SKIP LOCKED,
+  so concurrent claimers never block on each other.
+- SQLite (and other dialects): a conditional UPDATE acts as a compare-and-set;
+  only the claimer whose UPDATE matched the row wins it.
+
+A lease that is not released (crashed worker) expires after lease_seconds,
+after which the row becomes claimable again.
+"""
+
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+
+from ..models.enhancement import Enhancement
+
+logger = logging.getLogger(__name__)
+
+# Number of candidate rows tried per claim attempt on the lease fallback path
+CLAIM_CANDIDATES = 5
+
+
+class EnhancementQueue:
+    """Claim and release pending enhancement and cover letter jobs."""
+
+    def __init__(self, lease_seconds: int = 900):
+        """
+        Initialize the queue.
+
+        Args:
+            lease_seconds: How long a claim stays valid without being released
+        """
+        self.lease_seconds = lease_seconds
+
+    def _lease_available(self, now: datetime):
+        """Filter matching rows that are unclaimed or whose lease has expired."""
+        return or_(
+            Enhancement.lease_expires_at.is_(None),
+            Enhancement.lease_expires_at < now,
+        )
+
+    def _pending_enhancement_filter(self, now: datetime):
+        return and_(
+            Enhancement.status == "pending",
+            Enhancement.batch_id.is_(None),  # Owned by a Message Batch until its results are collected
+            self._lease_available(now),
+        )
+
+    def _pending_cover_letter_filter(self, now: datetime):
+        return and_(
+            Enhancement.status == "completed",
+            Enhancement.job_id.isnot(None),
+            Enhancement.cover_letter_status == "pending",
+            self._lease_available(now),
+        )
+
+    def claim_enhancement(self, db: Session, worker_id: str) -> Optional[Enhancement]:
+        """
+        Claim the oldest pending enhancement.
+
+        Args:
+            db: Database session
+            worker_id: Identifier of the claiming worker slot
+
+        Returns:
+            The claimed Enhancement, or None if nothing is claimable
+        """
+        return self._claim(db, worker_id, self._pending_enhancement_filter)
+
+    def claim_cover_letter(self, db: Session, worker_id: str) -> Optional[Enhancement]:
+        """
+        Claim the oldest completed enhancement whose cover letter is pending.
+
+        Args:
+            db: Database session
+            worker_id: Identifier of the claiming worker slot
+
+        Returns:
+            The claimed Enhancement, or None if nothing is claimable
+        """
+        return self._claim(db, worker_id, self._pending_cover_letter_filter)
+
+    def release(self, db: Session, enhancement: Enhancement) -> None:
+        """
+        Release the lease held on an enhancement.
+
+        Args:
+            db: Database session
+            enhancement: Previously claimed Enhancement
+        """
+        enhancement.claimed_by = None
+        enhancement.lease_expires_at = None
+        db.commit()
+
+    def _claim(self, db: Session, worker_id: str, build_filter) -> Optional[Enhancement]:
+        now = datetime.utcnow()
+        lease_expires_at = now + timedelta(seconds=self.lease_seconds)
+
+        if db.get_bind().dialect.name == "postgresql":
+            enhancement = (
+                db.query(Enhancement)
+                .filter(build_filter(now))
+                .order_by(Enhancement.created_at)
+                .with_for_update(skip_locked=True)
+                .first()
+            )
+            if enhancement is None:
+                db.rollback()
+                return None
+
+            enhancement.claimed_by = worker_id
+            enhancement.lease_expires_at = lease_expires_at
+            db.commit()
+            logger.info(f"Claimed enhancement {enhancement.id} for {worker_id}")
+            return enhancement
+
+        # Lease fallback: conditional UPDATE per candidate, first match wins
+        candidate_ids = [
+            row.id
+            for row in db.query(Enhancement.id)
+            .filter(build_filter(now))
+            .order_by(Enhancement.created_at)
+            .limit(CLAIM_CANDIDATES)
+        ]
+
+        for candidate_id in candidate_ids:
+            claimed = (
+                db.query(Enhancement)
+                .filter(Enhancement.id == candidate_id, build_filter(now))
+                .update(
+                    {
+                        Enhancement.claimed_by: worker_id,
+                        Enhancement.lease_expires_at: lease_expires_at,
+                    },
+                    synchronize_session=False,
+                )
+            )
+            db.commit()
+
+            if claimed:
+                enhancement = db.query(Enhancement).filter(Enhancement.id == candidate_id).first()
+                db.refresh(enhancement)
+                logger.info(f"Claimed enhancement {enhancement.id} for {worker_id}")
+                return enhancement
+
+        return None
@@ -0,0 +1,169 @@
+"""Keyword sets extracted once, when resumes, jobs and enhancements are written.
+
+ATS analysis and job matching used to read the resume and job text back
+from disk and run keyword extraction on every request. The extracted
+keywords are now stored on the row itself (`keywords`, compact JSON) when
+the row is written: on upload, job creation and when the worker stores an
+enhanced resume. Readers take the stored set.
+
+Each set is stamped with `keywords_version` (extractor version plus the
+skills taxonomy's content hash). Editing the taxonomy or the extraction
+rules makes stored sets stale; keywords_for() re-extracts a stale row on
+first use and backfill_keywords.py refreshes all of them up front.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from ..models import Enhancement, Job, Resume
+from ..utils.ats_analyzer import ATSAnalyzer
+
+logger = logging.getLogger(__name__)
+
+# Bump when ATSAnalyzer.extract_keywords() changes in a way that alters results
+KEYWORD_INDEX_VERSION = "1"
+
+# Key order of ATSAnalyzer.extract_keywords(); empty groups are not stored
+KEYWORD_FIELDS = ("technical_skills", "soft_skills", "action_verbs", "certifications", "tools")
+
+
+def encode_keywords(keywords: Dict[str, List[str]]) -> str:
+    """Serialize a keyword set compactly (empty groups dropped)."""
+    return json.dumps({group: terms for group, terms in keywords.items() if terms}, separators=(",", ":"))
+
+
+def decode_keywords(data: str) -> Dict[str, List[str]]:
+    """Inverse of encode_keywords(); every group is present in the result."""
+    stored = json.loads(data)
+    return {group: stored.get(group, []) for group in KEYWORD_FIELDS}
+
+
+def _resume_text(resume: Resume) -> Optional[str]:
+    """Resume text from the database, falling back to extracted.txt for older rows."""
+    if resume.extracted_text is not None:
+        return resume.extracted_text
+    try:
+        return Path(resume.extracted_text_path).read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+class KeywordIndex:
+    """Stores and reads the keyword sets kept on Resume, Job and Enhancement rows."""
+
+    def __init__(self, analyzer: Optional[ATSAnalyzer] = None):
+        """
+        Initialize index.
+
+        Args:
+            analyzer: Analyzer used to extract keywords (default: shared taxonomy)
+        """
+        self.analyzer = analyzer or ATSAnalyzer()
+
+    @property
+    def version(self) -> str:
+        """Stamp for newly extracted sets; follows taxonomy reloads and edits."""
+        return f"{KEYWORD_INDEX_VERSION}:{self.analyzer.taxonomy.content_hash}"
+
+    def index(self, row, text: str) -> Dict[str, List[str]]:
+        """
+        Extract keywords from text and store them on a row (the caller commits).
+
+        Args:
+            row: Resume, Job or Enhancement
+            text: The row's text
+
+        Returns:
+            The extracted keywords
+        """
+        keywords = self.analyzer.extract_keywords(text)
+        row.keywords = encode_keywords(keywords)
+        row.keywords_version = self.version
+        return keywords
+
+    def stored(self, keywords: Optional[str], keywords_version: Optional[str]) -> Optional[Dict[str, List[str]]]:
+        """
+        Decode stored column values if they are current.
+
+        Args:
+            keywords: Row's keywords column
+            keywords_version: Row's keywords_version column
+
+        Returns:
+            Keywords, or None if missing or stale
+        """
+        if keywords is None or keywords_version != self.version:
+            return None
+        return decode_keywords(keywords)
+
+    def keywords_for(self, row, load_text: Callable[[], str]) -> Dict[str, List[str]]:
+        """
+        Keywords of a row, re-extracted if missing or stale.
+
+        A re-extracted set is stored on the row; commit the session to keep it.
+
+        Args:
+            row: Resume, Job or Enhancement
+            load_text: Returns the row's text; only called when re-extracting
+
+        Returns:
+            Keywords in ATSAnalyzer.extract_keywords() format
+        """
+        keywords = self.stored(row.keywords, row.keywords_version)
+        if keywords is None:
+            logger.info(f"Indexing keywords for {row!r}")
+            keywords = self.index(row, load_text())
+        return keywords
+
+    def backfill(self, db: Session, batch_size: int = 200) -> Dict[str, int]:
+        """
+        Index every row whose keywords are missing or stale.
+
+        Commits after each batch, so an interrupted run keeps its progress.
+
+        Args:
+            db: Database session
+            batch_size: Rows per batch
+
+        Returns:
+            Rows indexed per table
+        """
+        sources = {
+            Resume: _resume_text,
+            Job: lambda job: job.description_text,
+            Enhancement: lambda enhancement: enhancement.enhanced_content,
+        }
+        version = self.version
+        counts = {}
+
+        for model, text_of in sources.items():
+            skipped = set()
+            indexed = 0
+            while True:
+                query = db.query(model).filter(
+                    or_(model.keywords_version.is_(None), model.keywords_version != version)
+                )
+                if skipped:
+                    query = query.filter(~model.id.in_(skipped))
+                rows = query.order_by(model.id).limit(batch_size).all()
+                if not rows:
+                    break
+
+                for row in rows:
+                    text = text_of(row)
+                    if text is None:
+                        skipped.add(row.id)  # Nothing to index yet (e.g. enhancement not generated)
+                        continue
+                    self.index(row, text)
+                    indexed += 1
+                db.commit()
+
+            counts[model.__tablename__] = indexed
+            logger.info(f"Indexed keywords for {indexed} {model.__tablename__} ({len(skipped)} without text)")
+
+        return counts
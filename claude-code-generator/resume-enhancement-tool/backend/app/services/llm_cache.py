@@ -0,0 +1,161 @@
+"""Content-addressed cache of Claude generation results.
+
+Users often re-submit the same resume against the same job, or re-run an
+enhancement whose PDF step failed. The worker keys each Messages API request
+on a SHA-256 of its normalized parameters (model, system prompt, sanitized
+resume and job description, instructions - which carry the style) and
+reuses the stored text instead of paying for a fresh call.
+
+Entries live in the llm_results table so every worker process shares them.
+They expire after ttl_seconds and the least recently used entries are
+evicted once max_entries is exceeded.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Optional
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ..models.llm_result import LLMResult
+
+logger = logging.getLogger(__name__)
+
+# INSTRUCTIONS.md creation timestamp; differs per enhancement, never affects the output
+CREATED_LINE_PATTERN = re.compile(r"\*\*Created:\*\*[^\n]*")
+
+# Stands in for per-enhancement identifiers when hashing
+VOLATILE_PLACEHOLDER = "<id>"
+
+
+def _normalize(value: Any, volatile: Iterable[str]) -> Any:
+    if isinstance(value, str):
+        for token in volatile:
+            value = value.replace(token, VOLATILE_PLACEHOLDER)
+        return CREATED_LINE_PATTERN.sub("", value)
+    if isinstance(value, dict):
+        return {key: _normalize(item, volatile) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item, volatile) for item in value]
+    return value
+
+
+def request_cache_key(request: Dict[str, Any], volatile: Iterable[str] = ()) -> str:
+    """
+    Hash Messages API parameters into a cache key.
+
+    Args:
+        request: Keyword arguments for messages.create
+        volatile: Per-request identifiers (enhancement/resume/job IDs) that
+            appear in the prompt text but do not change the result
+
+    Returns:
+        SHA-256 hex digest
+    """
+    volatile = [token for token in volatile if token]
+    canonical = json.dumps(_normalize(request, volatile), sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class LLMResultCache:
+    """Database-backed generation cache with TTL and LRU eviction."""
+
+    def __init__(self, ttl_seconds: int = 604800, max_entries: int = 1000):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl_seconds: Age after which an entry is no longer served
+            max_entries: Entries kept before least recently used ones are evicted
+        """
+        self.ttl = timedelta(seconds=ttl_seconds)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, db: Session, key: str) -> Optional[str]:
+        """
+        Look up a cached result.
+
+        Args:
+            db: Database session
+            key: Key from request_cache_key()
+
+        Returns:
+            The cached text, or None on a miss (expired entries are removed)
+        """
+        now = datetime.utcnow()
+        entry = db.query(LLMResult).filter(LLMResult.cache_key == key).first()
+
+        if entry is not None and entry.created_at >= now - self.ttl:
+            entry.hit_count += 1
+            entry.last_used_at = now
+            db.commit()
+            self._count(hit=True)
+            return entry.content
+
+        if entry is not None:
+            db.delete(entry)
+            db.commit()
+        self._count(hit=False)
+        return None
+
+    def put(self, db: Session, key: str, model: str, content: str) -> None:
+        """
+        Store a result and evict entries beyond the limits.
+
+        Args:
+            db: Database session
+            key: Key from request_cache_key()
+            model: Model that generated the content
+            content: Generated text
+        """
+        now = datetime.utcnow()
+        entry = db.query(LLMResult).filter(LLMResult.cache_key == key).first()
+        if entry is None:
+            db.add(LLMResult(cache_key=key, model=model, content=content, created_at=now, last_used_at=now))
+        else:
+            entry.content = content
+            entry.created_at = now
+            entry.last_used_at = now
+
+        try:
+            db.commit()
+        except IntegrityError:
+            # Another worker stored the same key first
+            db.rollback()
+            return
+
+        self._evict(db, now)
+
+    def stats(self) -> Dict[str, int]:
+        """Hit and miss counts since this process started."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _evict(self, db: Session, now: datetime) -> None:
+        db.query(LLMResult).filter(LLMResult.created_at < now - self.ttl).delete(synchronize_session=False)
+
+        excess = db.query(LLMResult).count() - self.max_entries
+        if excess > 0:
+            stale_keys = [
+                row.cache_key
+                for row in db.query(LLMResult.cache_key).order_by(LLMResult.last_used_at).limit(excess)
+            ]
+            db.query(LLMResult).filter(LLMResult.cache_key.in_(stale_keys)).delete(synchronize_session=False)
+            logger.info(f"Evicted {len(stale_keys)} least recently used cached result(s)")
+
+        db.commit()
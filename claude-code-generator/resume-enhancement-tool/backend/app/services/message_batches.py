@@ -0,0 +1,201 @@
+"""Message Batches API support for bulk, non-interactive enhancements.
+
+`worker.py --batch` claims pending enhancements, builds the same Messages
+requests the interactive worker would send, and submits them as one Message
+Batch per WORKER_BATCH_MAX_REQUESTS rows. Batched requests are billed at a
+discount and processed asynchronously (usually within the hour, at most 24h),
+which suits overnight re-runs and admin bulk jobs.
+
+Submitted rows carry the batch id and are skipped by the regular worker
+slots (see app.services.job_queue). Once a batch has ended, each row is
+detached from it (first collector wins, so the --batch command and running
+workers can both poll) and continues through the normal persistence and
+render path.
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from ..models.enhancement import Enhancement
+from .anthropic_client import RateLimitedAnthropic
+
+logger = logging.getLogger(__name__)
+
+# Result types whose requests never ran; their rows go back to the regular queue
+RETRY_RESULT_TYPES = {"expired", "canceled"}
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one request in an ended Message Batch."""
+
+    enhancement_id: UUID
+    text: Optional[str] = None
+    usage: Any = None
+    error: Optional[str] = None
+    retry: bool = False
+
+
+class EnhancementBatches:
+    """Submit enhancement requests as Message Batches and collect the results."""
+
+    def __init__(self, client, lease_seconds: int = 900):
+        """
+        Initialize with an Anthropic client.
+
+        Args:
+            client: RateLimitedAnthropic, whose limiter and retries then cover the
+                batch calls, or a plain anthropic.Anthropic (Message Batches are
+                a beta API in SDK 0.40)
+            lease_seconds: Lease granted to the collector that takes a row (see take())
+        """
+        if isinstance(client, RateLimitedAnthropic):
+            self.batches = client.message_batches
+        else:
+            self.batches = client.beta.messages.batches
+        self.lease_seconds = lease_seconds
+
+    def submit(self, db: Session, requests: List[Tuple[Enhancement, Dict[str, Any]]]) -> str:
+        """
+        Submit one Message Batch and record its id on the rows.
+
+        Args:
+            db: Database session
+            requests: (enhancement, Messages API parameters) pairs
+
+        Returns:
+            The Message Batch id
+        """
+        batch = self.batches.create(
+            requests=[
+                {"custom_id": str(enhancement.id), "params": params}
+                for enhancement, params in requests
+            ]
+        )
+
+        for enhancement, _ in requests:
+            enhancement.batch_id = batch.id
+        db.commit()
+
+        logger.info(f"Submitted Message Batch {batch.id} with {len(requests)} enhancement(s)")
+        return batch.id
+
+    def pending_batch_ids(self, db: Session) -> List[str]:
+        """Ids of batches that still have pending enhancements waiting on them."""
+        rows = (
+            db.query(Enhancement.batch_id)
+            .filter(Enhancement.batch_id.isnot(None), Enhancement.status == "pending")
+            .distinct()
+        )
+        return [row.batch_id for row in rows]
+
+    def collect(self, batch_id: str) -> Optional[List[BatchResult]]:
+        """
+        Fetch the results of a batch.
+
+        Args:
+            batch_id: Message Batch id
+
+        Returns:
+            One BatchResult per request, or None while the batch is still processing
+        """
+        batch = self.batches.retrieve(batch_id)
+        if batch.processing_status != "ended":
+            return None
+
+        results = []
+        for entry in self.batches.results(batch_id):
+            result = entry.result
+            enhancement_id = UUID(entry.custom_id)
+
+            if result.type == "succeeded":
+                results.append(BatchResult(
+                    enhancement_id,
+                    text=result.message.content[0].text,
+                    usage=result.message.usage,
+                ))
+            elif result.type in RETRY_RESULT_TYPES:
+                results.append(BatchResult(
+                    enhancement_id,
+                    error=f"Batch request {result.type}",
+                    retry=True,
+                ))
+            else:
+                error = getattr(getattr(result, "error", None), "error", None)
+                results.append(BatchResult(
+                    enhancement_id,
+                    error=getattr(error, "message", None) or f"Batch request {result.type}",
+                ))
+
+        logger.info(f"Collected {len(results)} result(s) from Message Batch {batch_id}")
+        return results
+
+    def take(self, db: Session, enhancement_id: UUID, batch_id: str, worker_id: str) -> Optional[Enhancement]:
+        """
+        Detach a row from its batch so exactly one collector processes it.
+
+        The row is leased to the collector in the same UPDATE: the lease from
+        the original claim has long expired by the time a batch ends, and a
+        detached row without a fresh lease would be claimable by any worker
+        slot while the collector is still storing it.
+
+        Args:
+            db: Database session
+            enhancement_id: Enhancement from the batch result
+            batch_id: Batch the result came from
+            worker_id: Identifier of the collecting worker (becomes claimed_by)
+
+        Returns:
+            The Enhancement, or None if it was already taken or deleted
+        """
+        taken = (
+            db.query(Enhancement)
+            .filter(Enhancement.id == enhancement_id, Enhancement.batch_id == batch_id)
+            .update(
+                {
+                    Enhancement.batch_id: None,
+                    Enhancement.claimed_by: worker_id,
+                    Enhancement.lease_expires_at: datetime.utcnow() + timedelta(seconds=self.lease_seconds),
+                },
+                synchronize_session=False,
+            )
+        )
+        db.commit()
+
+        if not taken:
+            return None
+        return db.query(Enhancement).filter(Enhancement.id == enhancement_id).first()
+
+    def detach_remaining(self, db: Session, batch_id: str) -> int:
+        """
+        Return rows of an ended batch that had no result to the regular queue.
+
+        Args:
+            db: Database session
+            batch_id: Ended Message Batch id
+
+        Returns:
+            Number of rows detached
+        """
+        detached = (
+            db.query(Enhancement)
+            .filter(Enhancement.batch_id == batch_id)
+            .update(
+                {
+                    Enhancement.batch_id: None,
+                    Enhancement.claimed_by: None,
+                    Enhancement.lease_expires_at: None,
+                },
+                synchronize_session=False,
+            )
+        )
+        db.commit()
+
+        if detached:
+            logger.warning(f"{detached} enhancement(s) missing from Message Batch {batch_id} results")
+        return detached
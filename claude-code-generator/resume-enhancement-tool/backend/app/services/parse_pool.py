@@ -0,0 +1,179 @@
+"""Process pool for PDF text extraction.
+
+PDF parsing (pdfminer via pdfplumber) is pure-Python CPU work. PDFParsePool
+moves it out of the API process and parallelises it across pages:
+
+1. The page count is read in a worker.
+2. Pages are split into contiguous chunks, one per worker, and extracted
+   with pdfplumber in parallel.
+3. Pages pdfplumber failed on are retried with pypdf (only those pages).
+
+Each document has a wall-clock budget (PARSE_TIMEOUT_SECONDS). Workers
+enforce it themselves with SIGALRM; if a worker is stuck in native code and
+does not respond, the pool's processes are killed and replaced so a
+pathological PDF cannot tie up the API.
+"""
+
+import logging
+import math
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+from ..utils.document_parser import (
+    ParseTimeout,
+    build_pdf_result,
+    count_pdf_pages,
+    extract_pdf_pages,
+)
+
+logger = logging.getLogger(__name__)
+
+# Extra wait beyond the budget before a worker is considered hung
+HUNG_WORKER_GRACE_SECONDS = 5.0
+
+
+class PDFParsePool:
+    """Extract PDF text per page in a pool of worker processes."""
+
+    def __init__(self, max_workers: int = 2, timeout_seconds: float = 30.0):
+        """
+        Initialize pool (worker processes start on first use).
+
+        Args:
+            max_workers: Worker processes (also the max chunks per document)
+            timeout_seconds: Wall-clock budget per document
+        """
+        self.max_workers = max_workers
+        self.timeout_seconds = timeout_seconds
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def parse_pdf(self, file_path: Path) -> Dict[str, any]:
+        """
+        Parse a PDF in the pool.
+
+        Args:
+            file_path: Path to PDF file
+
+        Returns:
+            Same dictionary as DocumentParser.parse_file() for PDFs
+        """
+        deadline = time.monotonic() + self.timeout_seconds
+
+        try:
+            page_count = self._call(count_pdf_pages, deadline, file_path)
+        except ParseTimeout:
+            return self._failure(f"Parsing exceeded the {self.timeout_seconds:g}s time budget")
+        except Exception as e:  # Unreadable file or a crashed worker
+            return self._failure(str(e))
+
+        try:
+            texts: List[Optional[str]] = [None] * page_count
+            parsers = ["failed"] * page_count
+
+            chunk_size = max(1, math.ceil(page_count / self.max_workers))
+            chunks = [list(range(start, min(start + chunk_size, page_count)))
+                      for start in range(0, page_count, chunk_size)]
+            self._extract(file_path, chunks, "pdfplumber", deadline, texts, parsers)
+
+            # Fallback to pypdf only for the pages pdfplumber failed on
+            failed = [index for index, text in enumerate(texts) if text is None]
+            if failed:
+                logger.info(f"pdfplumber failed on {len(failed)} page(s) of {file_path.name}; retrying with pypdf")
+                self._extract(file_path, [failed], "pypdf", deadline, texts, parsers)
+        except ParseTimeout:
+            logger.warning(f"Parsing {file_path.name} exceeded its {self.timeout_seconds:g}s budget")
+            return self._failure(f"Parsing exceeded the {self.timeout_seconds:g}s time budget")
+
+        return build_pdf_result(texts, parsers)
+
+    def shutdown(self) -> None:
+        """Stop worker processes."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _extract(
+        self,
+        file_path: Path,
+        chunks: List[List[int]],
+        engine: str,
+        deadline: float,
+        texts: List[Optional[str]],
+        parsers: List[str],
+    ) -> None:
+        """Run extract_pdf_pages for each chunk and merge results into texts/parsers."""
+        futures = {
+            self._submit(extract_pdf_pages, deadline, file_path, chunk, engine): chunk
+            for chunk in chunks
+        }
+        self._wait(futures, deadline)
+
+        for future, chunk in futures.items():
+            try:
+                chunk_texts = future.result()
+            except Exception as e:
+                # Worker crashed (or the pool was recycled): these pages fall back
+                logger.warning(f"{engine} worker failed on {file_path.name}: {e}")
+                continue
+
+            for index, text in zip(chunk, chunk_texts):
+                if text is not None:
+                    texts[index] = text
+                    parsers[index] = engine
+
+    def _call(self, fn: Callable, deadline: float, *args):
+        future = self._submit(fn, deadline, *args)
+        self._wait({future: None}, deadline)
+        return future.result()
+
+    def _submit(self, fn: Callable, deadline: float, *args) -> Future:
+        remaining = max(0.001, deadline - time.monotonic())
+        return self._get_executor().submit(fn, *args, budget_seconds=remaining)
+
+    def _wait(self, futures: Dict[Future, Sequence[int]], deadline: float) -> None:
+        timeout = max(0.0, deadline - time.monotonic()) + HUNG_WORKER_GRACE_SECONDS
+        _, pending = wait(futures, timeout=timeout)
+        if pending:
+            logger.error("PDF parse worker did not respond to its time budget; replacing worker processes")
+            self._recycle()
+            raise ParseTimeout("Parsing exceeded its time budget")
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # spawn: don't fork the threaded API process
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def _recycle(self) -> None:
+        """Kill the current workers; the next call starts a fresh pool."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is None:
+            return
+        # ProcessPoolExecutor can't cancel a running task; killing its processes is
+        # the only way to reclaim a hung worker. Other documents in flight on this
+        # pool see BrokenProcessPool and fall back / fail like any worker crash.
+        for process in list((executor._processes or {}).values()):
+            process.kill()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _failure(error: str) -> Dict[str, any]:
+        return {
+            "text": "",
+            "format": "pdf",
+            "pages": 0,
+            "parser": "failed",
+            "success": False,
+            "error": error,
+        }
@@ -0,0 +1,116 @@
+"""Process-wide BM25 index over every stored job description.
+
+Term statistics are corpus-level (all users' jobs), which gives meaningful
+IDF weights even for users with a handful of saved jobs; scores are only
+ever computed for the requesting user's own jobs.
+
+Jobs created through this process are added as soon as they are stored.
+Jobs written by other processes (other API workers, scripts) are picked up
+by sync(), which compares the indexed ids with the jobs table at most every
+RELEVANCE_SYNC_SECONDS and only loads descriptions for ids it hasn't seen.
+The queries run without the index lock, so scoring is never blocked on the
+database; the lock is only held to apply the changes.
+
+Memory: every API process holds the postings and term lists of all users'
+job descriptions, roughly proportional to the total text of the jobs
+table. That is fine for thousands of saved jobs; far beyond that the
+statistics belong in the database or a search service.
+"""
+
+import logging
+import threading
+import time
+from typing import Iterable, List, Optional
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from ..models import Job
+from ..utils.relevance_engine import BM25Index, RelevanceResult
+
+logger = logging.getLogger(__name__)
+
+
+class JobRelevanceIndex:
+    """BM25 relevance of job descriptions to a resume, kept in step with the jobs table."""
+
+    def __init__(self, sync_interval: float = 30.0, batch_size: int = 500):
+        """
+        Initialize an empty index (filled by the first sync()).
+
+        Args:
+            sync_interval: Minimum seconds between comparisons with the jobs table
+            batch_size: Job descriptions loaded per query while syncing
+        """
+        self.sync_interval = sync_interval
+        self.batch_size = batch_size
+        self._index = BM25Index()
+        self._lock = threading.Lock()
+        self._synced_at: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def add_job(self, job_id: UUID, description: str) -> None:
+        """Index (or re-index) one job description."""
+        with self._lock:
+            self._index.add(job_id, description)
+
+    def remove_job(self, job_id: UUID) -> None:
+        """Drop a job from the index."""
+        with self._lock:
+            self._index.remove(job_id)
+
+    def sync(self, db: Session, force: bool = False) -> int:
+        """
+        Add jobs missing from the index and drop deleted ones.
+
+        Args:
+            db: Database session
+            force: Sync even if the last sync was less than sync_interval ago
+
+        Returns:
+            Number of jobs added or removed
+        """
+        if not force and self._synced_at is not None and time.monotonic() - self._synced_at < self.sync_interval:
+            return 0
+
+        stored = {job_id for (job_id,) in db.query(Job.id)}
+        with self._lock:
+            indexed = set(self._index.doc_ids())
+        missing = list(stored - indexed)
+        deleted = indexed - stored
+
+        loaded = []
+        for start in range(0, len(missing), self.batch_size):
+            batch = missing[start:start + self.batch_size]
+            loaded.extend(db.query(Job.id, Job.description_text).filter(Job.id.in_(batch)))
+
+        with self._lock:
+            for job_id in deleted:
+                self._index.remove(job_id)
+            for job_id, description in loaded:
+                # add_job() may have indexed it meanwhile, with the same text
+                if job_id not in self._index:
+                    self._index.add(job_id, description)
+            self._synced_at = time.monotonic()
+
+        if missing or deleted:
+            logger.info(f"Relevance index synced: +{len(missing)} -{len(deleted)} jobs ({len(self._index)} total)")
+        return len(missing) + len(deleted)
+
+    def score(self, db: Session, resume_text: str, job_ids: Iterable[UUID]) -> List[RelevanceResult]:
+        """
+        BM25 scores of jobs for a resume.
+
+        Args:
+            db: Database session (for sync())
+            resume_text: Resume text, used as the query
+            job_ids: Jobs to score
+
+        Returns:
+            Results best first (see BM25Index.score)
+        """
+        self.sync(db)
+        with self._lock:
+            return self._index.score(resume_text, doc_ids=job_ids)
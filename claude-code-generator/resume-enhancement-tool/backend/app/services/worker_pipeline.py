@@ -0,0 +1,84 @@
+"""Staged processing pipeline for the enhancement worker.
+
+Each stage owns a bounded queue and a fixed number of threads. A full queue
+blocks the upstream stage (backpressure), so a slow stage can never build an
+unbounded backlog in memory. Stages are chained by their handlers: a handler
+finishes its own work, then submits the item to the next stage.
+
+Used by worker.py to overlap network-bound Claude calls with CPU-bound
+PDF/DOCX rendering instead of running them serially per enhancement.
+"""
+
+import logging
+import queue
+import threading
+from concurrent.futures import Executor
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+# How often blocked stage threads re-check the stop event (seconds)
+STOP_CHECK_INTERVAL = 0.5
+
+
+class PipelineStage:
+    """A bounded work queue served by a fixed number of threads."""
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[[Any], None],
+        concurrency: int = 1,
+        queue_size: int = 4,
+    ):
+        """
+        Initialize a pipeline stage.
+
+        Args:
+            name: Stage name for logging
+            handler: Called with each item; must handle its own errors
+            concurrency: Number of threads serving this stage
+            queue_size: Maximum items waiting for this stage
+        """
+        self.name = name
+        self.handler = handler
+        self.concurrency = concurrency
+        self.queue: queue.Queue = queue.Queue(maxsize=queue_size)
+
+    def start(self, executor: Executor, stop_event: threading.Event) -> None:
+        """Start this stage's threads on the given executor."""
+        for _ in range(self.concurrency):
+            executor.submit(self._serve, stop_event)
+
+    def submit(self, item: Any, stop_event: threading.Event) -> bool:
+        """
+        Queue an item, blocking while the stage is full.
+
+        Args:
+            item: Work item for the handler
+            stop_event: Abort waiting once this is set
+
+        Returns:
+            True if queued, False if the pipeline stopped first
+        """
+        while not stop_event.is_set():
+            try:
+                self.queue.put(item, timeout=STOP_CHECK_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _serve(self, stop_event: threading.Event) -> None:
+        while not stop_event.is_set():
+            try:
+                item = self.queue.get(timeout=STOP_CHECK_INTERVAL)
+            except queue.Empty:
+                continue
+
+            try:
+                self.handler(item)
+            except Exception as e:
+                logger.error(f"Unhandled error in {self.name} stage: {e}", exc_info=True)
+            finally:
+                self.queue.task_done()
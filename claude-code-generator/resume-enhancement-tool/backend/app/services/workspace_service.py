@@ -1,15 +1,37 @@
 """Workspace service for managing resume files and enhancement requests."""
 
+from contextlib import contextmanager
 from pathlib import Path
 from uuid import uuid4
-from typing import Dict, Optional, Tuple
+from typing import BinaryIO, Dict, Iterator, Optional, Tuple
+import hashlib
+import os
 import shutil
 import json
 import logging
+import threading
 from datetime import datetime
 
+try:
+    import fcntl
+except ImportError:  # Windows: blob references are only serialized within the process
+    fcntl = None
+
+from ..config.resume_guidelines import RESUME_FORMATTING_GUIDELINES
+
 logger = logging.getLogger(__name__)
 
+# Bytes read per iteration when streaming uploads into the workspace
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+class FileTooLargeError(ValueError):
+    """Raised when a streamed upload exceeds its size limit."""
+
+    def __init__(self, max_bytes: int):
+        super().__init__(f"File exceeds {max_bytes} bytes")
+        self.max_bytes = max_bytes
+
 
 class WorkspaceService:
     """
@@ -27,12 +49,17 @@ class WorkspaceService:
             workspace_root: Root directory for workspace files
         """
         self.workspace_root = workspace_root
+        self.blobs_root = workspace_root / "resumes" / "blobs"
+        # Serializes adding and releasing blob references between this
+        # process's threads; _locked_blob() adds a file lock for other processes
+        self._blob_lock = threading.Lock()
         self._ensure_directories()
 
     def _ensure_directories(self) -> None:
         """Ensure all required workspace directories exist."""
         directories = [
             "resumes/original",
+            "resumes/blobs",
             "resumes/enhanced",
             "jobs",
             "templates/resume_formats",
@@ -63,33 +90,248 @@ class WorkspaceService:
         Returns:
             Tuple of (resume_id, resume_directory_path)
         """
+        with open(file_path, "rb") as source:
+            staged_path, _, sha256 = self.stage_upload(source, file_path.suffix)
+
+        resume_id, _ = self.store_blob(staged_path, sha256)
+        resume_dir = self.create_resume(resume_id, sha256, file_path.suffix, extracted_text, metadata)
+
+        return resume_id, resume_dir
+
+    # ------------------------------------------------------------------
+    # Content-addressed blob store
+    #
+    # resumes/blobs/<sha256>/
+    #     source.<ext>    original bytes (stored once per distinct file)
+    #     extracted.txt   extracted text
+    #     parse.json      cached DocumentParser result
+    #     refs/<id>       one empty file per resume referencing the blob
+    #
+    # resumes/blobs/.locks/<sha256>.lock is flock()ed while a reference is
+    # added or released, so API workers and scripts sharing the workspace
+    # never delete a blob another process is adding a reference to. Lock
+    # files stay behind (empty) when their blob is deleted.
+    #
+    # Each resumes/original/<id>/ directory hardlinks source.<ext> and
+    # extracted.txt from its blob (copies where hardlinks aren't supported),
+    # so existing paths keep working. A blob is removed when its last ref is.
+    # ------------------------------------------------------------------
+
+    def stage_upload(
+        self,
+        source: BinaryIO,
+        extension: str,
+        max_bytes: Optional[int] = None,
+    ) -> Tuple[Path, int, str]:
+        """
+        Stream an upload into the blob store's staging area in fixed-size chunks.
+
+        The file is hashed while it is written, and the copy stops as soon as
+        max_bytes is exceeded (the partial file is removed).
+
+        Args:
+            source: Readable binary file object (e.g. UploadFile.file)
+            extension: Source file extension including the dot (".pdf")
+            max_bytes: Optional size limit
+
+        Returns:
+            Tuple of (staged_path, size_bytes, sha256_hex)
+
+        Raises:
+            FileTooLargeError: If the upload is larger than max_bytes
+        """
+        staging_dir = self.blobs_root / ".staging"
+        staging_dir.mkdir(parents=True, exist_ok=True)
+        staged_path = staging_dir / f"{uuid4()}{extension}"
+
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            with open(staged_path, "wb") as f:
+                while chunk := source.read(UPLOAD_CHUNK_SIZE):
+                    size += len(chunk)
+                    if max_bytes is not None and size > max_bytes:
+                        raise FileTooLargeError(max_bytes)
+                    digest.update(chunk)
+                    f.write(chunk)
+        except BaseException:
+            staged_path.unlink(missing_ok=True)
+            raise
+
+        return staged_path, size, digest.hexdigest()
+
+    def store_blob(self, staged_path: Path, sha256: str) -> Tuple[str, Path]:
+        """
+        Move a staged upload into the blob store and reference it from a new resume ID.
+
+        If a blob with the same hash exists, the staged copy is discarded.
+
+        Args:
+            staged_path: Path returned by stage_upload()
+            sha256: Hash returned by stage_upload()
+
+        Returns:
+            Tuple of (resume_id, blob_source_path)
+        """
         resume_id = str(uuid4())
+        blob_dir = self.blobs_root / sha256
+
+        with self._locked_blob(sha256):
+            existing = self._blob_source(sha256)
+            if existing is None:
+                (blob_dir / "refs").mkdir(parents=True, exist_ok=True)
+                existing = blob_dir / f"source{staged_path.suffix}"
+                staged_path.replace(existing)
+            else:
+                staged_path.unlink(missing_ok=True)
+                logger.info(f"Duplicate upload, reusing blob {sha256[:12]}")
+
+            (blob_dir / "refs" / resume_id).touch()
+
+        return resume_id, existing
+
+    def release_blob(self, sha256: str, resume_id: str) -> bool:
+        """
+        Drop a resume's reference to a blob; delete the blob if it was the last.
+
+        Args:
+            sha256: Blob hash
+            resume_id: Referencing resume ID
+
+        Returns:
+            True if the blob was deleted
+        """
+        blob_dir = self.blobs_root / sha256
+
+        with self._locked_blob(sha256):
+            if not blob_dir.exists():
+                return False
+            (blob_dir / "refs" / resume_id).unlink(missing_ok=True)
+            refs_dir = blob_dir / "refs"
+            if refs_dir.exists() and any(refs_dir.iterdir()):
+                return False
+            shutil.rmtree(blob_dir, ignore_errors=True)
+
+        logger.info(f"Blob deleted (no references left): {sha256[:12]}")
+        return True
+
+    @contextmanager
+    def _locked_blob(self, sha256: str) -> Iterator[None]:
+        """Hold a blob's reference lock, across threads and processes."""
+        with self._blob_lock:
+            if fcntl is None:
+                yield
+                return
+            lock_path = self.blobs_root / ".locks" / f"{sha256}.lock"
+            lock_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(lock_path, "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)  # Released when the file is closed
+                yield
+
+    def blob_ref_count(self, sha256: str) -> int:
+        """Number of resumes referencing a blob."""
+        refs_dir = self.blobs_root / sha256 / "refs"
+        return len(list(refs_dir.iterdir())) if refs_dir.exists() else 0
+
+    def get_cached_parse(self, sha256: str) -> Optional[Dict]:
+        """
+        Get the cached DocumentParser result for a blob.
+
+        Args:
+            sha256: Blob hash
+
+        Returns:
+            Parse result dictionary, or None if the blob was never parsed
+        """
+        try:
+            with open(self.blobs_root / sha256 / "parse.json", "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def cache_parse(self, sha256: str, parse_result: Dict) -> None:
+        """
+        Cache a DocumentParser result (and its text) with the blob.
+
+        Args:
+            sha256: Blob hash
+            parse_result: Result of DocumentParser.parse_file()
+        """
+        blob_dir = self.blobs_root / sha256
+        self._write_atomic(blob_dir / "extracted.txt", parse_result.get("text", ""))
+        self._write_atomic(blob_dir / "parse.json", json.dumps(parse_result))
+
+    def create_resume(
+        self,
+        resume_id: str,
+        sha256: str,
+        extension: str,
+        extracted_text: str,
+        metadata: Dict,
+    ) -> Path:
+        """
+        Create a resume directory linked to its blob.
+
+        Args:
+            resume_id: Resume ID returned by store_blob()
+            sha256: Blob hash
+            extension: Source file extension including the dot (".pdf")
+            extracted_text: Text extracted from the resume
+            metadata: Metadata about the resume (filename, format, etc.)
+
+        Returns:
+            Resume directory path
+        """
+        blob_dir = self.blobs_root / sha256
         resume_dir = self.workspace_root / "resumes" / "original" / resume_id
         resume_dir.mkdir(parents=True, exist_ok=True)
 
-        # Copy original file
-        source_extension = file_path.suffix
-        dest_file = resume_dir / f"source{source_extension}"
-        shutil.copy(file_path, dest_file)
+        blob_text = blob_dir / "extracted.txt"
+        if not blob_text.exists() or blob_text.read_text(encoding="utf-8") != extracted_text:
+            self._write_atomic(blob_text, extracted_text)
 
-        # Save extracted text (for Claude Code to read)
-        with open(resume_dir / "extracted.txt", "w", encoding="utf-8") as f:
-            f.write(extracted_text)
+        # Link source and extracted text (for Claude Code to read) from the blob
+        self._link(self._blob_source(sha256), resume_dir / f"source{extension}")
+        self._link(blob_text, resume_dir / "extracted.txt")
 
         # Save metadata
         metadata_with_timestamp = {
             **metadata,
             "resume_id": resume_id,
+            "sha256": sha256,
             "stored_at": datetime.utcnow().isoformat(),
-            "source_file": f"source{source_extension}",
+            "source_file": f"source{extension}",
         }
 
         with open(resume_dir / "metadata.json", "w", encoding="utf-8") as f:
             json.dump(metadata_with_timestamp, f, indent=2)
 
-        logger.info(f"Resume stored: {resume_id}")
+        logger.info(f"Resume stored: {resume_id} (blob {sha256[:12]})")
 
-        return resume_id, resume_dir
+        return resume_dir
+
+    def _blob_source(self, sha256: str) -> Optional[Path]:
+        blob_dir = self.blobs_root / sha256
+        if not blob_dir.exists():
+            return None
+        return next(blob_dir.glob("source.*"), None)
+
+    @staticmethod
+    def _link(source: Path, dest: Path) -> None:
+        """Hardlink source to dest, copying where hardlinks aren't supported."""
+        dest.unlink(missing_ok=True)
+        try:
+            os.link(source, dest)
+        except OSError:
+            shutil.copy2(source, dest)
+
+    @staticmethod
+    def _write_atomic(path: Path, content: str) -> None:
+        """Write via a temp file and rename, so readers never see a partial file."""
+        temp_path = path.with_name(f".{path.name}.{uuid4().hex}")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(content)
+        temp_path.replace(path)
 
     def store_job(
         self,
@@ -267,162 +509,7 @@ The user has selected the **{style_config['name']}** writing style for their res
 **Status:** Pending
 
 {style_guidance}
-## Length Requirements (CRITICAL - MUST FOLLOW - 2026 BEST PRACTICES)
-
-**Target Page Length:** Based on 2026 industry research
-- Entry-level (0-5 years): **1 PAGE ONLY** (not 2 pages)
-- Mid-level (5-10 years): 1-2 pages
-- Senior (10+ years): 2 pages MAX
-
-**ABSOLUTE MAXIMUM WORD COUNTS:**
-- Entry-level (0-5 years): **400 WORDS MAX** = 1 PAGE ONLY
-- Mid-level (5-10 years): **600 WORDS MAX** = 1-2 PAGES
-- Senior (10+ years): **800 WORDS MAX** = 2 PAGES (fill both pages)
-
-**CRITICAL:** Count words BEFORE adding markdown syntax. If over limit, CUT content aggressively.
-
-**STRICT LIMITS:**
-- NEVER exceed 2 pages regardless of experience
-- NEVER exceed word count maximums (400/600/800)
-- Entry-level MUST be 1 page (66% of employers require this)
-- Minimize white space - use 0.5-0.75" margins if needed
-- Line spacing: 1.0-1.15 (single-spaced)
-
-## Formatting Rules (ULTRA-STRICT - ZERO WHITE SPACE TOLERANCE)
-
-❌ **ABSOLUTELY FORBIDDEN:**
-- NO decorative dividers (`---` or `===`)
-- NO emojis or special characters
-- NO blank lines between bullets
-- NO blank lines between skill categories
-- NO blank lines in Education section
-- NO blank lines in Certifications section
-- NO custom creative headers
-- NO more than 3-4 jobs listed
-- NO tables, text boxes, or graphics
-- NO "Professional Development" or "Hobbies" sections for entry-level
-- NO "Relevant Coursework" expansions in Education
-- NO certification descriptions (title and date ONLY)
-
-✅ **STRICT REQUIREMENTS:**
-- ONLY 4-5 blank lines in ENTIRE document (one between each major section)
-- Contact info: ONE line with pipes (|) separating elements
-- Professional Summary: 2-3 sentences (40-60 words MAX), NO blank lines before/after
-- Skills: Single-line categories with pipes (see format below), NO multi-line categories
-- Each job: Title/Company/Dates, then bullets immediately following
-- Education: Degree, University, Location, Dates - ONE line per degree, NO coursework
-- Certifications: Name - Issuer | Date - ONE line per cert, NO descriptions
-- Lead every bullet with action verb + quantified result
-
-## Skills Section Format (REQUIRED - SINGLE-LINE CATEGORIES)
-
-**WRONG (wastes 8+ lines):**
-```
-## Skills
-**System Administration:** Windows Server, Active Directory...
-
-**Infrastructure & Tools:** Azure, ServiceNow...
-
-**Networking & Security:** TCP/IP, DNS/DHCP...
-```
-
-**CORRECT (3-4 lines total with pipe-separated categories):**
-```
-## Skills
-**System Administration:** Windows Server, Active Directory, Microsoft 365, DNS/DHCP, Group Policy | **Infrastructure:** Azure, ServiceNow, Cherwell ITSM, TeamViewer, PowerShell, Virtual Machines | **Networking:** TCP/IP, Network Troubleshooting, Security Compliance | **Technical:** Windows 10/11, Linux, Documentation
-```
-
-**Format rules:**
-- Maximum 3-4 category groups
-- Each category on SAME line, separated by ` | `
-- NO blank lines between categories
-- Total Skills section: 2-4 lines maximum
-
-## Education & Certifications Format (ULTRA-CONDENSED)
-
-**Education - WRONG:**
-```
-**Bachelor of Cybersecurity** - Griffith University, Brisbane, QLD | March 2024 - 2026
-
-Relevant Coursework: Applied Network Security, Database Design...
-```
-
-**Education - CORRECT:**
-```
-## Education
-**Bachelor of Cybersecurity** - Griffith University, Brisbane, QLD | 2024-2026
-**Diploma of Information Technology** - Griffith College, Brisbane, QLD | 2022-2023
-```
-
-**Certifications - WRONG:**
-```
-**IT Support Technical Skills** - Udemy | June 2025
-
-Gained hands-on experience with Active Directory...
-```
-
-**Certifications - CORRECT (Name and date ONLY):**
-```
-## Certifications
-IT Support Technical Skills Helpdesk - Udemy | 2025
-Computer Systems and Networks - Griffith College | 2023
-Advent of Cyber - TryHackMe | 2024
-```
-
-**Format rules:**
-- ONE line per certification
-- NO descriptions or details whatsoever
-- NO blank lines between certifications
-- Format: `[Certification Name] - [Issuer] | [Year]`
-
-## Bullet Point Guidelines (CRITICAL - VARIES BY JOB)
-
-**Most Recent/Relevant Job:** 4-5 bullets
-**Second Most Recent Job:** 3-4 bullets
-**Older/Less Relevant Jobs:** 1-3 bullets (or remove if not relevant)
-
-**Each Bullet Must:**
-- Be 1-2 lines maximum (no paragraph bullets)
-- Start with strong action verb (Led, Developed, Implemented, Managed)
-- Include quantified results (numbers, percentages, scale)
-- Focus on achievements, NOT responsibilities
-
-## Content Prioritization (AGGRESSIVE REDUCTION)
-
-1. **Remove entirely:** Irrelevant jobs, generic skills, obvious duties
-2. **Condense:** Education (degree + dates only), Certifications (name + date)
-3. **Prioritize:** Most recent 2-3 relevant positions
-4. **Quantify:** Every bullet must have a metric (users, %, time saved, etc.)
-5. **Eliminate:** Verbose explanations, adjectives, filler words (the, an, a)
-6. **Cut:** Any section that doesn't directly support job qualifications
-
-## 2-Page Resume Formatting (FOR MID/SENIOR LEVEL ONLY - 10+ YEARS)
-
-**If using 2 pages, follow these rules:**
-
-1. **Page Distribution:**
-   - **Page 1:** Contact info, Professional Summary, Key Skills, most recent 2-3 jobs (detailed)
-   - **Page 2:** Older jobs (condensed 2-3 bullets each), Education, Certifications, optional Projects/Awards
-
-2. **Page Breaks:**
-   - DO NOT split a single job description between pages
-   - Finish one complete job on page 1, start fresh job on page 2
-   - Ensure page 1 ends with complete content (not mid-bullet)
-
-3. **Page 2 Header:**
-   - Include: [Name] | [Phone] | [Email] | Page 2
-   - Keeps pages connected if separated
-
-4. **Fill Both Pages:**
-   - AVOID 1.5-page resumes (looks incomplete)
-   - If you can't fill 2 full pages, use 1 page instead
-   - Balance white space - don't cram page 1 and leave page 2 sparse
-
-5. **Content Strategy:**
-   - Most important content on page 1 (first 30 seconds of review)
-   - Older experience gets less detail on page 2
-   - Recent jobs: 4-5 bullets | Older jobs: 2-3 bullets
-
+{RESUME_FORMATTING_GUIDELINES}
 ## Task
 
 Tailor the provided resume to match the specific job description. Focus on:
@@ -543,162 +630,7 @@ The user has selected the **{style_config['name']}** writing style for their res
 **Status:** Pending
 
 {style_guidance}
-## Length Requirements (CRITICAL - MUST FOLLOW - 2026 BEST PRACTICES)
-
-**Target Page Length:** Based on 2026 industry research
-- Entry-level (0-5 years): **1 PAGE ONLY** (not 2 pages)
-- Mid-level (5-10 years): 1-2 pages
-- Senior (10+ years): 2 pages MAX
-
-**ABSOLUTE MAXIMUM WORD COUNTS:**
-- Entry-level (0-5 years): **400 WORDS MAX** = 1 PAGE ONLY
-- Mid-level (5-10 years): **600 WORDS MAX** = 1-2 PAGES
-- Senior (10+ years): **800 WORDS MAX** = 2 PAGES (fill both pages)
-
-**CRITICAL:** Count words BEFORE adding markdown syntax. If over limit, CUT content aggressively.
-
-**STRICT LIMITS:**
-- NEVER exceed 2 pages regardless of experience
-- NEVER exceed word count maximums (400/600/800)
-- Entry-level MUST be 1 page (66% of employers require this)
-- Minimize white space - use 0.5-0.75" margins if needed
-- Line spacing: 1.0-1.15 (single-spaced)
-
-## Formatting Rules (ULTRA-STRICT - ZERO WHITE SPACE TOLERANCE)
-
-❌ **ABSOLUTELY FORBIDDEN:**
-- NO decorative dividers (`---` or `===`)
-- NO emojis or special characters
-- NO blank lines between bullets
-- NO blank lines between skill categories
-- NO blank lines in Education section
-- NO blank lines in Certifications section
-- NO custom creative headers
-- NO more than 3-4 jobs listed
-- NO tables, text boxes, or graphics
-- NO "Professional Development" or "Hobbies" sections for entry-level
-- NO "Relevant Coursework" expansions in Education
-- NO certification descriptions (title and date ONLY)
-
-✅ **STRICT REQUIREMENTS:**
-- ONLY 4-5 blank lines in ENTIRE document (one between each major section)
-- Contact info: ONE line with pipes (|) separating elements
-- Professional Summary: 2-3 sentences (40-60 words MAX), NO blank lines before/after
-- Skills: Single-line categories with pipes (see format below), NO multi-line categories
-- Each job: Title/Company/Dates, then bullets immediately following
-- Education: Degree, University, Location, Dates - ONE line per degree, NO coursework
-- Certifications: Name - Issuer | Date - ONE line per cert, NO descriptions
-- Lead every bullet with action verb + quantified result
-
-## Skills Section Format (REQUIRED - SINGLE-LINE CATEGORIES)
-
-**WRONG (wastes 8+ lines):**
-```
-## Skills
-**System Administration:** Windows Server, Active Directory...
-
-**Infrastructure & Tools:** Azure, ServiceNow...
-
-**Networking & Security:** TCP/IP, DNS/DHCP...
-```
-
-**CORRECT (3-4 lines total with pipe-separated categories):**
-```
-## Skills
-**System Administration:** Windows Server, Active Directory, Microsoft 365, DNS/DHCP, Group Policy | **Infrastructure:** Azure, ServiceNow, Cherwell ITSM, TeamViewer, PowerShell, Virtual Machines | **Networking:** TCP/IP, Network Troubleshooting, Security Compliance | **Technical:** Windows 10/11, Linux, Documentation
-```
-
-**Format rules:**
-- Maximum 3-4 category groups
-- Each category on SAME line, separated by ` | `
-- NO blank lines between categories
-- Total Skills section: 2-4 lines maximum
-
-## Education & Certifications Format (ULTRA-CONDENSED)
-
-**Education - WRONG:**
-```
-**Bachelor of Cybersecurity** - Griffith University, Brisbane, QLD | March 2024 - 2026
-
-Relevant Coursework: Applied Network Security, Database Design...
-```
-
-**Education - CORRECT:**
-```
-## Education
-**Bachelor of Cybersecurity** - Griffith University, Brisbane, QLD | 2024-2026
-**Diploma of Information Technology** - Griffith College, Brisbane, QLD | 2022-2023
-```
-
-**Certifications - WRONG:**
-```
-**IT Support Technical Skills** - Udemy | June 2025
-
-Gained hands-on experience with Active Directory...
-```
-
-**Certifications - CORRECT (Name and date ONLY):**
-```
-## Certifications
-IT Support Technical Skills Helpdesk - Udemy | 2025
-Computer Systems and Networks - Griffith College | 2023
-Advent of Cyber - TryHackMe | 2024
-```
-
-**Format rules:**
-- ONE line per certification
-- NO descriptions or details whatsoever
-- NO blank lines between certifications
-- Format: `[Certification Name] - [Issuer] | [Year]`
-
-## Bullet Point Guidelines (CRITICAL - VARIES BY JOB)
-
-**Most Recent/Relevant Job:** 4-5 bullets
-**Second Most Recent Job:** 3-4 bullets
-**Older/Less Relevant Jobs:** 1-3 bullets (or remove if not relevant)
-
-**Each Bullet Must:**
-- Be 1-2 lines maximum (no paragraph bullets)
-- Start with strong action verb (Led, Developed, Implemented, Managed)
-- Include quantified results (numbers, percentages, scale)
-- Focus on achievements, NOT responsibilities
-
-## Content Prioritization (AGGRESSIVE REDUCTION)
-
-1. **Remove entirely:** Irrelevant jobs, generic skills, obvious duties
-2. **Condense:** Education (degree + dates only), Certifications (name + date)
-3. **Prioritize:** Most recent 2-3 relevant positions
-4. **Quantify:** Every bullet must have a metric (users, %, time saved, etc.)
-5. **Eliminate:** Verbose explanations, adjectives, filler words (the, an, a)
-6. **Cut:** Any section that doesn't directly support job qualifications
-
-## 2-Page Resume Formatting (FOR MID/SENIOR LEVEL ONLY - 10+ YEARS)
-
-**If using 2 pages, follow these rules:**
-
-1. **Page Distribution:**
-   - **Page 1:** Contact info, Professional Summary, Key Skills, most recent 2-3 jobs (detailed)
-   - **Page 2:** Older jobs (condensed 2-3 bullets each), Education, Certifications, optional Projects/Awards
-
-2. **Page Breaks:**
-   - DO NOT split a single job description between pages
-   - Finish one complete job on page 1, start fresh job on page 2
-   - Ensure page 1 ends with complete content (not mid-bullet)
-
-3. **Page 2 Header:**
-   - Include: [Name] | [Phone] | [Email] | Page 2
-   - Keeps pages connected if separated
-
-4. **Fill Both Pages:**
-   - AVOID 1.5-page resumes (looks incomplete)
-   - If you can't fill 2 full pages, use 1 page instead
-   - Balance white space - don't cram page 1 and leave page 2 sparse
-
-5. **Content Strategy:**
-   - Most important content on page 1 (first 30 seconds of review)
-   - Older experience gets less detail on page 2
-   - Recent jobs: 4-5 bullets | Older jobs: 2-3 bullets
-
+{RESUME_FORMATTING_GUIDELINES}
 ## Task
 
 Perform a comprehensive revamp of the resume for the **{industry}** industry.
@@ -1068,8 +1000,18 @@ After writing `cover_letter.md`, the backend will:
             return False
 
         try:
+            sha256 = None
+            metadata_file = resume_dir / "metadata.json"
+            if metadata_file.exists():
+                with open(metadata_file, "r", encoding="utf-8") as f:
+                    sha256 = json.load(f).get("sha256")
+
             shutil.rmtree(resume_dir)
             logger.info(f"Resume deleted from workspace: {resume_id}")
+
+            # Remove the blob too if no other resume references it
+            if sha256:
+                self.release_blob(sha256, resume_id)
             return True
         except Exception as e:
             logger.error(f"Failed to delete resume {resume_id}: {e}")
@@ -1100,6 +1042,15 @@ After writing `cover_letter.md`, the backend will:
             shutil.rmtree(enhanced_dir)
             enhanced_dir.mkdir(parents=True, exist_ok=True)
 
+        # Every blob is unreferenced now. Each one is removed under its lock;
+        # .locks and .staging stay, since other processes may be using them
+        if self.blobs_root.exists():
+            for blob_dir in self.blobs_root.iterdir():
+                if blob_dir.name.startswith(".") or not blob_dir.is_dir():
+                    continue
+                with self._locked_blob(blob_dir.name):
+                    shutil.rmtree(blob_dir, ignore_errors=True)
+
         logger.info(f"Deleted all resumes: {original_count} original, {enhanced_count} enhanced")
         return original_count, enhanced_count
 
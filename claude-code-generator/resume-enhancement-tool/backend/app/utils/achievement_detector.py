@@ -1,23 +1,34 @@
-"""Detect achievements and suggest quantification."""
+"""Detect achievements and suggest quantification.
 
-from typing import Dict, List
+Each document is scanned once by an automaton over the achievement verbs
+and once by METRIC_PATTERN; both hit lists are mapped onto lines by offset,
+so only lines that contain a verb are looked at individually.
+"""
+
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Optional
 import re
 
+from .keyword_engine import KeywordEngine
+from .skills_taxonomy import SkillsTaxonomy, get_taxonomy
+
+# What follows an achievement verb: the rest of the sentence
+ACHIEVEMENT_CLAUSE = re.compile(r'\s+([^.]+?)(?:\.|$)')
+
+# Metrics that mean a line is already quantified (20%, $500, 5 years, 100 users, ...)
+# (within one line, like the per-line checks it replaces)
+METRIC_PATTERN = re.compile(
+    r'\d+[^\S\n]*(?:%|\$|years?|months?|weeks?|days?|hours?|users?|people|team members?|projects?|dollars?)',
+    re.IGNORECASE,
+)
+
 
 class AchievementDetector:
     """Detect achievements and suggest metrics for quantification."""
 
-    # Patterns for unquantified achievements
-    ACHIEVEMENT_PATTERNS = [
-        (r'(improved|increased|enhanced|optimized|boosted|elevated)\s+([^.]+?)(?:\.|$)', 'improvement'),
-        (r'(reduced|decreased|minimized|lowered|cut)\s+([^.]+?)(?:\.|$)', 'reduction'),
-        (r'(led|managed|coordinated|supervised|directed|oversaw)\s+([^.]+?)(?:\.|$)', 'leadership'),
-        (r'(developed|created|built|designed|implemented|launched|established)\s+([^.]+?)(?:\.|$)', 'creation'),
-        (r'(achieved|accomplished|delivered|completed|executed)\s+([^.]+?)(?:\.|$)', 'achievement'),
-        (r'(streamlined|automated|modernized|upgraded|transformed)\s+([^.]+?)(?:\.|$)', 'process'),
-    ]
-
-    # Metric suggestions based on achievement type
+    # Metric suggestions based on achievement type. Types are the action verb
+    # categories of the skills taxonomy; a line yields one achievement per type,
+    # in this order.
     METRIC_SUGGESTIONS = {
         'improvement': [
             'by X%',
@@ -60,6 +71,20 @@ class AchievementDetector:
         ]
     }
 
+    def __init__(self, taxonomy: Optional[SkillsTaxonomy] = None):
+        """Initialize detector.
+
+        Args:
+            taxonomy: Fixed skills taxonomy for achievement verbs; by default
+                the shared one from get_taxonomy() (also used by ATSAnalyzer)
+        """
+        self._taxonomy = taxonomy
+
+    @property
+    def taxonomy(self) -> SkillsTaxonomy:
+        """Skills taxonomy in use."""
+        return self._taxonomy or get_taxonomy()
+
     def detect_achievements(self, text: str) -> List[Dict[str, any]]:
         """Detect achievements that could be quantified.
 
@@ -71,16 +96,49 @@ class AchievementDetector:
             - achievement: Full text of the achievement
             - verb: Action verb used
             - location: Line number where found
+            - start, end: Character offsets of the achievement in text
             - suggested_metrics: List of metric suggestions
             - already_quantified: Whether metrics are already present
             - achievement_type: Type of achievement (improvement, leadership, etc.)
         """
+        return self.detect_many([text])[0]
 
-        achievements = []
+    def detect_many(self, documents: Iterable[str]) -> List[List[Dict[str, any]]]:
+        """Detect achievements in many documents (e.g. a user's whole history).
+
+        The verb automaton is compiled once for the batch; each document is
+        then scanned in a single pass.
+
+        Args:
+            documents: Texts to analyze
+
+        Returns:
+            Per document, the list detect_achievements() would return
+        """
+        engine = self.taxonomy.engine_for(tuple(self.METRIC_SUGGESTIONS))
+        return [self._detect(engine, text) for text in documents]
+
+    def _detect(self, engine: KeywordEngine, text: str) -> List[Dict[str, any]]:
+        type_rank = {achievement_type: rank for rank, achievement_type in enumerate(self.METRIC_SUGGESTIONS)}
         lines = text.split('\n')
+        line_starts = [0]
+        for line in lines[:-1]:
+            line_starts.append(line_starts[-1] + len(line) + 1)
+
+        # Lines with metrics are already quantified
+        quantified = {bisect_right(line_starts, match.start()) - 1 for match in METRIC_PATTERN.finditer(text)}
 
-        for line_num, line in enumerate(lines):
-            line = line.strip()
+        # Achievement verbs grouped by line; only these lines are examined
+        line_hits = {}
+        for hit in engine.find_all(text):
+            line_num = bisect_right(line_starts, hit.start) - 1
+            if line_num not in quantified:
+                line_hits.setdefault(line_num, []).append(hit)
+
+        achievements = []
+        for line_num in sorted(line_hits):
+            raw = lines[line_num]
+            line = raw.strip()
 
             # Skip empty lines and very short lines
             if len(line) < 10:
@@ -90,30 +148,28 @@ class AchievementDetector:
             if line.endswith(':') or line.isupper():
                 continue
 
-            for pattern, achievement_type in self.ACHIEVEMENT_PATTERNS:
-                matches = re.finditer(pattern, line, re.IGNORECASE)
-
-                for match in matches:
-                    verb = match.group(1).lower()
-                    achievement_text = match.group(2).strip()
-
-                    # Check if already has numbers (already quantified)
-                    # Look for patterns like: 20%, $500, 5 years, 100 users, etc.
-                    has_numbers = bool(re.search(r'\d+\s*(?:%|\$|years?|months?|weeks?|days?|hours?|users?|people|team members?|projects?|dollars?)', achievement_text, re.IGNORECASE))
-
-                    # Also check the full line for metrics
-                    full_line_has_numbers = bool(re.search(r'\d+\s*(?:%|\$|years?|months?|weeks?|days?|hours?|users?|people|team members?|projects?|dollars?)', line, re.IGNORECASE))
-
-                    if not full_line_has_numbers:
-                        achievements.append({
-                            'achievement': line,
-                            'verb': verb,
-                            'location': f'line {line_num + 1}',
-                            'suggested_metrics': self.METRIC_SUGGESTIONS.get(achievement_type, ['with specific numbers/metrics']),
-                            'already_quantified': False,
-                            'achievement_type': achievement_type
-                        })
-                        break  # Only match once per line
+            # Achievement verb followed by the rest of a sentence; the leftmost
+            # one of each type counts, reported in type order
+            offset = line_starts[line_num] + len(raw) - len(raw.lstrip())
+            best = {}
+            for hit in line_hits[line_num]:
+                if not ACHIEVEMENT_CLAUSE.match(line, hit.end - offset):
+                    continue
+                if hit.category not in best or hit.start < best[hit.category].start:
+                    best[hit.category] = hit
+
+            for category in sorted(best, key=type_rank.__getitem__):
+                hit = best[category]
+                achievements.append({
+                    'achievement': line,
+                    'verb': hit.term,
+                    'location': f'line {line_num + 1}',
+                    'start': offset,
+                    'end': offset + len(line),
+                    'suggested_metrics': self.METRIC_SUGGESTIONS[category],
+                    'already_quantified': False,
+                    'achievement_type': category
+                })
 
         return achievements
 
@@ -16,7 +16,9 @@ THREAT MODEL:
 
 import re
 import logging
-from typing import Optional, Dict, Any, List
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple
 from pydantic import BaseModel, ValidationError
 
 logger = logging.getLogger(__name__)
@@ -56,9 +58,124 @@ INJECTION_PATTERNS = [
     r"human:",
 ]
 
-# Compiled patterns for efficiency
+# Compiled patterns, used to confirm prefilter candidates
 COMPILED_PATTERNS = [re.compile(p, re.IGNORECASE) for p in INJECTION_PATTERNS]
 
+# A literal every match of each pattern contains, as it appears in
+# casefolded text. A cheap substring search for these picks the patterns a
+# text can possibly match; only those are scanned for. A pattern without an
+# entry here is always scanned for.
+PATTERN_TRIGGERS = {
+    r"ignore\s+(previous|above|all)\s+instructions?": "instruction",
+    r"disregard\s+(previous|above|all)\s+instructions?": "instruction",
+    r"forget\s+(previous|above|all)\s+instructions?": "instruction",
+    r"override\s+(previous|above|all)\s+instructions?": "instruction",
+    r"new\s+instructions?:": "instruction",
+    r"system\s+prompt:": "prompt:",
+    r"system\s+instructions?:": "instruction",
+    r"you\s+are\s+now\s+": "you",
+    r"act\s+as\s+": "act",
+    r"pretend\s+(to\s+be|you\s+are)": "pretend",
+    r"roleplay\s+as": "roleplay",
+    r"reveal\s+(your|the)\s+(system|instructions?|prompt)": "reveal",
+    r"show\s+(your|the)\s+(system|instructions?|prompt)": "show",
+    r"what\s+(are|is)\s+your\s+(system|instructions?|prompt)": "what",
+    r"output\s+your\s+(system|instructions?|prompt)": "output",
+    r"<\/?system>": "system>",
+    r"\[\[system\]\]": "[[system]]",
+    r"###\s*system": "###",
+    r"continue\s+from\s+here:": "continue",
+    r"assistant:": "assistant:",
+    r"human:": "human:",
+}
+
+# casefold() misses one character IGNORECASE treats as "i"
+_FOLD_FIXES = str.maketrans({"\u0131": "i"})
+
+
+def _non_capturing(pattern: str) -> str:
+    """Turn a pattern's capturing groups into non-capturing ones."""
+    return re.sub(r"(?<!\\)\((?!\?)", "(?:", pattern)
+
+
+@lru_cache(maxsize=64)
+def _combined_pattern(indexes: Tuple[int, ...]) -> "re.Pattern[str]":
+    """One alternation of the given INJECTION_PATTERNS, each in a named group
+    (p<index>) so a match reports which pattern it came from."""
+    return re.compile(
+        "|".join(f"(?P<p{index}>{_non_capturing(INJECTION_PATTERNS[index])})" for index in indexes),
+        re.IGNORECASE,
+    )
+
+
+def _matching_patterns(content: str) -> Tuple[int, ...]:
+    """Indexes of the patterns that occur in content.
+
+    Stage 1 rules patterns out by their trigger (substring searches over
+    the casefolded text); stage 2 confirms each remaining one with a search
+    that stops at its first match.
+    """
+    folded = content.casefold().translate(_FOLD_FIXES)
+    found: Dict[str, bool] = {}
+    matching = []
+    for index, pattern in enumerate(INJECTION_PATTERNS):
+        trigger = PATTERN_TRIGGERS.get(pattern, "")  # "" is in every text
+        if trigger not in found:
+            found[trigger] = trigger in folded
+        if found[trigger] and COMPILED_PATTERNS[index].search(content):
+            matching.append(index)
+    return tuple(matching)
+
+
+FILTERED_PLACEHOLDER = "[FILTERED]"
+
+# Sanitized texts kept in memory (the same resume or job is sanitized for
+# the enhancement and again for its cover letter)
+SANITIZE_CACHE_SIZE = 128
+
+
+@dataclass(frozen=True)
+class SanitizeResult:
+    """Sanitized text and what was filtered from it."""
+
+    text: str
+    pattern_hits: Dict[str, int]  # Injection pattern -> number of matches filtered
+
+    @property
+    def total_hits(self) -> int:
+        return sum(self.pattern_hits.values())
+
+
+@lru_cache(maxsize=SANITIZE_CACHE_SIZE)
+def scan_user_content(content: str) -> SanitizeResult:
+    """Filter injection patterns from content in a single pass.
+
+    Patterns content cannot match are ruled out first (see
+    _matching_patterns()), so clean text is never rewritten; the patterns
+    that do occur are filtered and counted in one scan of their combined
+    alternation. Where matches of different patterns overlap, the leftmost
+    one is filtered. Results are memoized by content (treat pattern_hits as
+    read-only).
+
+    Args:
+        content: Raw user content
+
+    Returns:
+        SanitizeResult with the filtered text and per-pattern hit counts
+    """
+    matching = _matching_patterns(content)
+    if not matching:
+        return SanitizeResult(content, {})
+
+    pattern_hits: Dict[str, int] = {}
+
+    def replace(match: re.Match) -> str:
+        pattern = INJECTION_PATTERNS[int(match.lastgroup[1:])]
+        pattern_hits[pattern] = pattern_hits.get(pattern, 0) + 1
+        return FILTERED_PLACEHOLDER
+
+    return SanitizeResult(_combined_pattern(matching).sub(replace, content), pattern_hits)
+
 
 def sanitize_user_content(content: str, context: str = "content") -> str:
     """Sanitize user content before including in AI prompts.
@@ -76,29 +193,22 @@ def sanitize_user_content(content: str, context: str = "content") -> str:
     if not content:
         return ""
 
-    sanitized = content
-    detected_patterns = []
-
-    for pattern in COMPILED_PATTERNS:
-        matches = pattern.findall(sanitized)
-        if matches:
-            detected_patterns.extend(matches)
-            # Replace with safe placeholder
-            sanitized = pattern.sub("[FILTERED]", sanitized)
+    result = scan_user_content(content)
 
-    if detected_patterns:
+    if result.pattern_hits:
         # AUDIT: Log potential injection attempt
         logger.warning(
             f"Potential prompt injection detected in {context}",
             extra={
                 "event": "prompt_injection_detected",
                 "context": context,
-                "patterns_found": len(detected_patterns),
-                # Don't log actual patterns to avoid log injection
+                "patterns_found": result.total_hits,
+                # Our own pattern definitions, not the matched text (avoids log injection)
+                "pattern_hits": dict(result.pattern_hits),
             }
         )
 
-    return sanitized
+    return result.text
 
 
 def wrap_user_content(content: str, tag_name: str) -> str:
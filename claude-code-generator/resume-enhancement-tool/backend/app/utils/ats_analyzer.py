@@ -1,51 +1,69 @@
 """ATS keyword analysis using rule-based extraction."""
 
-from typing import Dict, List, Set
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple, TypeVar
 import re
 
+from .keyword_engine import KeywordHit
+from .skills_taxonomy import SkillsTaxonomy, get_taxonomy
+
+# Taxonomy groups reported by extract_keywords()
+KEYWORD_GROUPS = ('technical_skills', 'soft_skills', 'action_verbs')
+
+# Certification phrases (kept separate: matches may overlap, e.g. "microsoft certified azure administrator")
+CERTIFICATION_PATTERNS = tuple(re.compile(pattern) for pattern in [
+    r'\b(?:aws|azure|gcp|google cloud)\s+certified\b',
+    r'\b(?:pmp|cissp|ccna|ccnp|mcse|cisa|cism|ceh)\b',
+    r'\bcertified\s+\w+\s+(?:professional|specialist|engineer|administrator)\b',
+    r'\b(?:comptia|cisco|microsoft|oracle|salesforce)\s+certified\b',
+])
+
+# Groups that count towards the match score (action verbs are less critical)
+SCORED_GROUPS = ('technical_skills', 'soft_skills', 'certifications')
+
+JobKey = TypeVar('JobKey', bound=Hashable)
+
+
+def scored_terms(keywords: Dict[str, List[str]]) -> Set[str]:
+    """Flatten the keyword groups that count towards the match score."""
+    return {term for group in SCORED_GROUPS for term in keywords.get(group, [])}
+
+
+def _match_score(match_count: int, job_keyword_count: int) -> int:
+    if job_keyword_count == 0:
+        return 100  # No requirements = perfect match
+    return int((match_count / job_keyword_count) * 100)
+
 
 class ATSAnalyzer:
     """Rule-based ATS keyword extraction and matching."""
 
-    # Common ATS keyword categories
-    TECHNICAL_SKILLS = {
-        'programming': [
-            'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'ruby',
-            'go', 'rust', 'php', 'swift', 'kotlin', 'scala', 'r', 'matlab'
-        ],
-        'frameworks': [
-            'react', 'angular', 'vue', 'django', 'flask', 'fastapi', 'spring',
-            'node.js', 'express', '.net', 'laravel', 'rails', 'next.js', 'svelte'
-        ],
-        'databases': [
-            'postgresql', 'mysql', 'mongodb', 'redis', 'elasticsearch', 'sql',
-            'nosql', 'oracle', 'cassandra', 'dynamodb', 'sqlite', 'mariadb'
-        ],
-        'cloud': [
-            'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'terraform', 'ansible',
-            'jenkins', 'gitlab', 'github actions', 'circleci', 'helm'
-        ],
-        'tools': [
-            'git', 'jira', 'confluence', 'linux', 'bash', 'ci/cd', 'agile',
-            'scrum', 'kanban', 'slack', 'teams', 'visual studio', 'vscode'
-        ]
-    }
+    def __init__(self, taxonomy: Optional[SkillsTaxonomy] = None):
+        """Initialize analyzer.
+
+        Args:
+            taxonomy: Fixed taxonomy; by default the shared one from get_taxonomy(),
+                which follows edits to the taxonomy file
+        """
+        self._taxonomy = taxonomy
+
+    @property
+    def taxonomy(self) -> SkillsTaxonomy:
+        """Skills taxonomy in use."""
+        return self._taxonomy or get_taxonomy()
 
-    SOFT_SKILLS = [
-        'leadership', 'communication', 'teamwork', 'problem solving', 'analytical',
-        'management', 'agile', 'scrum', 'collaboration', 'mentoring', 'training',
-        'presentation', 'negotiation', 'strategic thinking', 'decision making'
-    ]
+    def find_keywords(self, text: str) -> List[KeywordHit]:
+        """Find every taxonomy keyword in text, with its category and offsets.
 
-    ACTION_VERBS = [
-        'developed', 'designed', 'implemented', 'led', 'managed', 'created', 'built',
-        'improved', 'optimized', 'increased', 'reduced', 'achieved', 'delivered',
-        'coordinated', 'established', 'launched', 'streamlined', 'automated',
-        'architected', 'engineered', 'maintained', 'deployed', 'integrated'
-    ]
+        Args:
+            text: Text to analyze
+
+        Returns:
+            List of KeywordHit, one per occurrence
+        """
+        return self.taxonomy.find_all(text)
 
     def extract_keywords(self, text: str) -> Dict[str, List[str]]:
-        """Extract keywords from text using regex patterns.
+        """Extract taxonomy keywords from text in a single pass.
 
         Args:
             text: Text to analyze (job description or resume)
@@ -53,55 +71,22 @@ class ATSAnalyzer:
         Returns:
             Dictionary with categorized keywords:
             - technical_skills: programming, frameworks, databases, cloud, tools
+              (canonical terms, so "k8s" is reported as "kubernetes")
             - soft_skills: leadership, communication, etc.
             - action_verbs: developed, managed, etc.
             - certifications: AWS Certified, PMP, etc.
         """
         text_lower = text.lower()
 
-        keywords = {
-            'technical_skills': [],
-            'soft_skills': [],
-            'action_verbs': [],
-            'certifications': [],
-            'tools': []
-        }
-
-        # Extract technical skills (all categories combined)
-        for category, skills in self.TECHNICAL_SKILLS.items():
-            for skill in skills:
-                # Use word boundaries to avoid partial matches
-                pattern = r'\b' + re.escape(skill) + r'\b'
-                if re.search(pattern, text_lower):
-                    keywords['technical_skills'].append(skill)
-
-        # Extract soft skills
-        for skill in self.SOFT_SKILLS:
-            pattern = r'\b' + re.escape(skill) + r'\b'
-            if re.search(pattern, text_lower):
-                keywords['soft_skills'].append(skill)
-
-        # Extract action verbs
-        for verb in self.ACTION_VERBS:
-            pattern = r'\b' + re.escape(verb) + r'\b'
-            if re.search(pattern, text_lower):
-                keywords['action_verbs'].append(verb)
+        # Technical skills (all categories combined), soft skills and action verbs
+        keywords = self.taxonomy.extract_groups(text_lower, KEYWORD_GROUPS)
 
         # Extract certifications (pattern: AWS Certified, PMP, CISSP, etc.)
-        cert_patterns = [
-            r'\b(?:aws|azure|gcp|google cloud)\s+certified\b',
-            r'\b(?:pmp|cissp|ccna|ccnp|mcse|cisa|cism|ceh)\b',
-            r'\bcertified\s+\w+\s+(?:professional|specialist|engineer|administrator)\b',
-            r'\b(?:comptia|cisco|microsoft|oracle|salesforce)\s+certified\b'
-        ]
-
-        for pattern in cert_patterns:
-            matches = re.findall(pattern, text_lower)
-            keywords['certifications'].extend(matches)
-
-        # Remove duplicates while preserving order
-        for key in keywords:
-            keywords[key] = list(dict.fromkeys(keywords[key]))
+        certifications = []
+        for pattern in CERTIFICATION_PATTERNS:
+            certifications.extend(pattern.findall(text_lower))
+        keywords['certifications'] = list(dict.fromkeys(certifications))
+        keywords['tools'] = []
 
         return keywords
 
@@ -122,28 +107,13 @@ class ATSAnalyzer:
             - match_count: Number of matches
         """
 
-        # Flatten keywords for comparison (excluding action verbs - they're less critical)
-        resume_all = set(
-            resume_keywords.get('technical_skills', []) +
-            resume_keywords.get('soft_skills', []) +
-            resume_keywords.get('certifications', [])
-        )
-
-        job_all = set(
-            job_keywords.get('technical_skills', []) +
-            job_keywords.get('soft_skills', []) +
-            job_keywords.get('certifications', [])
-        )
+        resume_all = scored_terms(resume_keywords)
+        job_all = scored_terms(job_keywords)
 
         # Calculate matches
         matched = resume_all.intersection(job_all)
         missing = job_all - resume_all
-
-        # Calculate score (0-100)
-        if len(job_all) == 0:
-            match_score = 100  # No requirements = perfect match
-        else:
-            match_score = int((len(matched) / len(job_all)) * 100)
+        match_score = _match_score(len(matched), len(job_all))
 
         return {
             'match_score': match_score,
@@ -154,6 +124,74 @@ class ATSAnalyzer:
             'match_count': len(matched)
         }
 
+    def rank_jobs(
+        self,
+        resume_keywords: Dict[str, List[str]],
+        jobs: Iterable[Tuple[JobKey, Dict[str, List[str]]]],
+        limit: Optional[int] = None,
+    ) -> List[Tuple[JobKey, Dict[str, any]]]:
+        """Score one resume against many jobs and rank them.
+
+        Every distinct keyword gets a bit, so each job is an int bitmask and
+        scoring it is one AND plus two popcounts against the resume's mask.
+        Keyword lists are only decoded for the jobs that are returned.
+
+        Args:
+            resume_keywords: Keywords extracted from the resume (extracted once)
+            jobs: (key, job keywords) pairs; the key is handed back unchanged
+            limit: Return only the best N jobs (default: all)
+
+        Returns:
+            (key, match analysis) pairs, best match first; ties keep input order.
+            Match analysis has the same fields as calculate_match_score().
+        """
+        bits: Dict[str, int] = {}
+        vocabulary: List[str] = []
+
+        def to_mask(terms: Set[str]) -> int:
+            mask = 0
+            for term in terms:
+                bit = bits.get(term)
+                if bit is None:
+                    bit = bits[term] = 1 << len(vocabulary)
+                    vocabulary.append(term)
+                mask |= bit
+            return mask
+
+        resume_mask = to_mask(scored_terms(resume_keywords))
+        resume_count = resume_mask.bit_count()
+
+        scored = []
+        for index, (key, job_keywords) in enumerate(jobs):
+            job_mask = to_mask(scored_terms(job_keywords))
+            match_count = (job_mask & resume_mask).bit_count()
+            job_count = job_mask.bit_count()
+            scored.append((-_match_score(match_count, job_count), -match_count, index, key, job_mask))
+
+        scored.sort(key=lambda entry: entry[:3])
+        if limit is not None:
+            scored = scored[:limit]
+
+        def to_terms(mask: int) -> List[str]:
+            terms = []
+            while mask:
+                low = mask & -mask
+                terms.append(vocabulary[low.bit_length() - 1])
+                mask ^= low
+            return sorted(terms)
+
+        return [
+            (key, {
+                'match_score': -negative_score,
+                'keywords_found': to_terms(job_mask & resume_mask),
+                'keywords_missing': to_terms(job_mask & ~resume_mask),
+                'resume_keyword_count': resume_count,
+                'job_keyword_count': job_mask.bit_count(),
+                'match_count': -negative_matches,
+            })
+            for negative_score, negative_matches, _, key, job_mask in scored
+        ]
+
     def analyze_resume_vs_job(self, resume_text: str, job_text: str) -> Dict[str, any]:
         """Full analysis of resume against job description.
 
@@ -169,8 +207,18 @@ class ATSAnalyzer:
             - recommendations: List of actionable recommendations
         """
 
-        resume_keywords = self.extract_keywords(resume_text)
-        job_keywords = self.extract_keywords(job_text)
+        return self.analyze_keywords(self.extract_keywords(resume_text), self.extract_keywords(job_text))
+
+    def analyze_keywords(self, resume_keywords: Dict[str, List[str]], job_keywords: Dict[str, List[str]]) -> Dict[str, any]:
+        """Full analysis from already extracted keywords (e.g. stored keyword sets).
+
+        Args:
+            resume_keywords: Keywords extracted from resume
+            job_keywords: Keywords extracted from job description
+
+        Returns:
+            Same structure as analyze_resume_vs_job()
+        """
         match_analysis = self.calculate_match_score(resume_keywords, job_keywords)
 
         return {
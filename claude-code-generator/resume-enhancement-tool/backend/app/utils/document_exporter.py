@@ -0,0 +1,82 @@
+"""Export one markdown document to PDF, DOCX and HTML from a single parse."""
+
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Optional
+
+from .docx_generator import DOCXGenerator
+from .markdown_document import parse_markdown
+
+if TYPE_CHECKING:  # weasyprint needs system libraries; PDF export is optional
+    from .pdf_generator import PDFGenerator
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMATS = ("pdf", "docx", "html")
+
+
+class DocumentExporter:
+    """Render every requested format from one parse of the markdown."""
+
+    def __init__(self, pdf_generator: Optional["PDFGenerator"], docx_generator: DOCXGenerator):
+        """
+        Initialize exporter.
+
+        Args:
+            pdf_generator: PDF/HTML backend, or None if WeasyPrint is unavailable
+            docx_generator: DOCX backend
+        """
+        self.pdf_generator = pdf_generator
+        self.docx_generator = docx_generator
+
+    def export_all(
+        self,
+        markdown_path: Path,
+        outputs: Dict[str, Path],
+        template: str = "modern",
+    ) -> Dict[str, Dict[str, any]]:
+        """
+        Parse a markdown file once and write it in each requested format.
+
+        A failing format is logged and reported; the others are still written.
+
+        Args:
+            markdown_path: Path to markdown file
+            outputs: Output path per format ("pdf", "docx", "html")
+            template: Template for PDF and HTML
+
+        Returns:
+            Per format, {"success": True, "output_path": ...} or {"success": False, "error": ...}
+        """
+        unknown = set(outputs) - set(EXPORT_FORMATS)
+        if unknown:
+            raise ValueError(f"Unsupported export format(s): {sorted(unknown)}")
+
+        document = parse_markdown(Path(markdown_path).read_text(encoding="utf-8"))
+        results = {}
+
+        for format, output_path in outputs.items():
+            output_path = Path(output_path)
+            try:
+                if format in ("pdf", "html") and self.pdf_generator is None:
+                    raise RuntimeError("PDF generation is not available on this system")
+
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                if format == "pdf":
+                    result = self.pdf_generator.document_to_pdf(document, output_path, template=template)
+                    if not result.get("success"):
+                        raise RuntimeError(result.get("error", "PDF generation failed"))
+                elif format == "docx":
+                    self.docx_generator.document_to_docx(document, output_path)
+                else:
+                    output_path.write_text(
+                        self.pdf_generator.document_to_html(document, template=template), encoding="utf-8"
+                    )
+
+                results[format] = {"success": True, "output_path": str(output_path)}
+
+            except Exception as e:
+                logger.error(f"{format.upper()} export failed for {markdown_path}: {e}")
+                results[format] = {"success": False, "error": str(e)}
+
+        return results
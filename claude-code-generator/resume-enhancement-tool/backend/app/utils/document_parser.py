@@ -1,15 +1,170 @@
-"""Document parser for PDF and DOCX resumes."""
+"""Document parser for PDF and DOCX resumes.
 
+PDFs are extracted page by page: pdfplumber first, then pypdf for only the
+pages pdfplumber could not handle. The page-level functions below are
+module-level so app/services/parse_pool.py can run them in worker processes.
+"""
+
+import signal
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterator, List, Optional, Sequence
 import pdfplumber
 from pypdf import PdfReader
 from docx import Document
 
 
+class ParseTimeout(BaseException):
+    """Raised when a document exceeds its parsing time budget.
+
+    A BaseException so the broad `except Exception` handlers inside
+    pdfminer/pypdf can't swallow it.
+    """
+
+
+@contextmanager
+def time_budget(seconds: Optional[float]) -> Iterator[None]:
+    """
+    Raise ParseTimeout in the current code if it runs longer than `seconds`.
+
+    Uses SIGALRM, so it only applies in a process's main thread (e.g. a
+    parse pool worker) on platforms with setitimer; elsewhere it is a no-op.
+    """
+    if (
+        not seconds
+        or not hasattr(signal, "setitimer")
+        or threading.current_thread() is not threading.main_thread()
+    ):
+        yield
+        return
+
+    def expired(signum, frame):
+        raise ParseTimeout("Parsing exceeded its time budget")
+
+    previous = signal.signal(signal.SIGALRM, expired)
+    signal.setitimer(signal.ITIMER_REAL, max(seconds, 0.001))
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def count_pdf_pages(file_path: Path, budget_seconds: Optional[float] = None) -> int:
+    """
+    Count the pages of a PDF (pypdf, falling back to pdfplumber).
+
+    Raises:
+        ParseTimeout: If counting exceeds budget_seconds
+        Exception: If neither library can open the file
+    """
+    with time_budget(budget_seconds):
+        try:
+            return len(PdfReader(file_path).pages)
+        except Exception:
+            with pdfplumber.open(file_path) as pdf:
+                return len(pdf.pages)
+
+
+def extract_pdf_pages(
+    file_path: Path,
+    page_indices: Sequence[int],
+    engine: str = "pdfplumber",
+    budget_seconds: Optional[float] = None,
+) -> List[Optional[str]]:
+    """
+    Extract text from selected pages of a PDF.
+
+    Args:
+        file_path: Path to PDF file
+        page_indices: Zero-based page indices to extract
+        engine: "pdfplumber" or "pypdf"
+        budget_seconds: Wall-clock budget (enforced in worker processes only)
+
+    Returns:
+        Text per requested page; "" for a page without text, None for a page
+        that failed to extract (or all pages if the file could not be opened)
+
+    Raises:
+        ParseTimeout: If extraction exceeds budget_seconds
+    """
+    texts: List[Optional[str]] = [None] * len(page_indices)
+
+    with time_budget(budget_seconds):
+        try:
+            if engine == "pdfplumber":
+                document = pdfplumber.open(file_path)
+                pages = document.pages
+            else:
+                document = None
+                pages = PdfReader(file_path).pages
+        except Exception:
+            return texts
+
+        try:
+            for position, index in enumerate(page_indices):
+                try:
+                    texts[position] = pages[index].extract_text() or ""
+                except Exception:
+                    pass  # Left as None; the caller falls back for this page
+        finally:
+            if document is not None:
+                document.close()
+
+    return texts
+
+
+def build_pdf_result(texts: List[Optional[str]], parsers: List[str]) -> Dict[str, any]:
+    """
+    Assemble the parse_file() result for a PDF from per-page outcomes.
+
+    Args:
+        texts: Text per page (None where every parser failed)
+        parsers: Parser that produced each page ("pdfplumber", "pypdf" or "failed")
+
+    Returns:
+        Dictionary with extracted text and metadata
+    """
+    failed_pages = [number for number, text in enumerate(texts, start=1) if text is None]
+
+    if texts and len(failed_pages) == len(texts):
+        return {
+            "text": "",
+            "format": "pdf",
+            "pages": 0,
+            "parser": "failed",
+            "success": False,
+            "error": "No page of the PDF could be parsed",
+        }
+
+    used = [name for name in ("pdfplumber", "pypdf") if name in parsers]
+    result = {
+        "text": "\n\n".join(text for text in texts if text),
+        "format": "pdf",
+        "pages": len(texts),
+        "parser": "+".join(used) or "pdfplumber",
+        "success": True,
+    }
+    if failed_pages:
+        result["failed_pages"] = failed_pages
+    return result
+
+
 class DocumentParser:
     """Parse PDF and DOCX documents and extract text content."""
 
+    def __init__(self, pool=None):
+        """
+        Initialize parser.
+
+        Args:
+            pool: Optional PDFParsePool (app/services/parse_pool.py) that extracts
+                PDF pages in worker processes under a time budget. Without one,
+                PDFs are parsed in the calling thread.
+        """
+        self.pool = pool
+
     def parse_file(self, file_path: Path) -> Dict[str, any]:
         """
         Parse a document file and extract its text content.
@@ -38,7 +193,7 @@ class DocumentParser:
 
     def _parse_pdf(self, file_path: Path) -> Dict[str, any]:
         """
-        Parse a PDF file using pdfplumber (with pypdf fallback).
+        Parse a PDF file page by page using pdfplumber (with per-page pypdf fallback).
 
         Args:
             file_path: Path to PDF file
@@ -46,53 +201,33 @@ class DocumentParser:
         Returns:
             Dictionary with extracted text and metadata
         """
+        if self.pool is not None:
+            return self.pool.parse_pdf(file_path)
+
         try:
-            # Try pdfplumber first (better formatting and layout awareness)
-            with pdfplumber.open(file_path) as pdf:
-                pages_text = []
-                for page in pdf.pages:
-                    text = page.extract_text()
-                    if text:
-                        pages_text.append(text)
-
-                full_text = "\n\n".join(pages_text)
-
-                return {
-                    "text": full_text,
-                    "format": "pdf",
-                    "pages": len(pdf.pages),
-                    "parser": "pdfplumber",
-                    "success": True,
-                }
+            page_count = count_pdf_pages(file_path)
         except Exception as e:
-            # Fallback to pypdf if pdfplumber fails
-            try:
-                reader = PdfReader(file_path)
-                pages_text = []
-
-                for page in reader.pages:
-                    text = page.extract_text()
-                    if text:
-                        pages_text.append(text)
-
-                full_text = "\n\n".join(pages_text)
-
-                return {
-                    "text": full_text,
-                    "format": "pdf",
-                    "pages": len(reader.pages),
-                    "parser": "pypdf",
-                    "success": True,
-                }
-            except Exception as fallback_error:
-                return {
-                    "text": "",
-                    "format": "pdf",
-                    "pages": 0,
-                    "parser": "failed",
-                    "success": False,
-                    "error": str(fallback_error),
-                }
+            return {
+                "text": "",
+                "format": "pdf",
+                "pages": 0,
+                "parser": "failed",
+                "success": False,
+                "error": str(e),
+            }
+
+        texts = extract_pdf_pages(file_path, range(page_count), "pdfplumber")
+        parsers = ["pdfplumber" if text is not None else "failed" for text in texts]
+
+        # Fallback to pypdf only for the pages pdfplumber failed on
+        failed = [index for index, text in enumerate(texts) if text is None]
+        if failed:
+            for index, text in zip(failed, extract_pdf_pages(file_path, failed, "pypdf")):
+                if text is not None:
+                    texts[index] = text
+                    parsers[index] = "pypdf"
+
+        return build_pdf_result(texts, parsers)
 
     def _parse_docx(self, file_path: Path) -> Dict[str, any]:
         """
@@ -1,4 +1,4 @@
-"""Convert markdown resume to styled DOCX."""
+"""Convert markdown resume to styled DOCX (from the tree built by app.utils.markdown_document)."""
 
 from pathlib import Path
 from typing import Dict, Optional
@@ -6,12 +6,19 @@ from docx import Document
 from docx.shared import Pt, RGBColor, Inches
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml.ns import qn
-import re
+import xml.etree.ElementTree as etree
+
+from .markdown_document import MarkdownDocument, parse_markdown
+
+HEADING_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6')
 
 
 class DOCXGenerator:
     """Generate styled DOCX from markdown resume."""
 
+    # Bump when output changes for the same input; invalidates cached renders
+    RENDER_VERSION = "4"
+
     def __init__(self):
         """Initialize DOCX generator with default styling."""
         self.heading_sizes = {
@@ -44,14 +51,22 @@ class DOCXGenerator:
         with open(md_path, 'r', encoding='utf-8') as f:
             md_content = f.read()
 
+        self.document_to_docx(parse_markdown(md_content), docx_path)
+
+    def document_to_docx(self, document: MarkdownDocument, docx_path: Path) -> None:
+        """Render a parsed markdown document to a styled DOCX.
+
+        Args:
+            document: Output of parse_markdown()
+            docx_path: Path to output DOCX file
+        """
         # Create new document
         doc = Document()
 
         # Set page margins
         self._set_margins(doc)
 
-        # Parse markdown line by line
-        self._parse_and_add_content(doc, md_content)
+        self._add_blocks(doc, document.root)
 
         # Save document
         doc.save(str(docx_path))
@@ -69,161 +84,182 @@ class DOCXGenerator:
             section.left_margin = Inches(0.75)
             section.right_margin = Inches(0.75)
 
-    def _parse_and_add_content(self, doc: Document, md_content: str) -> None:
-        """Parse markdown and add formatted content to document.
+    def _add_blocks(self, doc: Document, parent: etree.Element, list_depth: int = 0) -> None:
+        """Add the block elements under parent to the document.
 
         Args:
             doc: Document object to add content to
-            md_content: Markdown text to parse
+            parent: Tree element whose children are blocks (h1-h6, p, ul, ol, hr, table, ...)
+            list_depth: Nesting level of the enclosing list, 0 outside lists
         """
 
-        lines = md_content.split('\n')
-        in_list = False
-        skip_next = False
-
-        for i, line in enumerate(lines):
-            line = line.rstrip()
-
-            # Skip this line if flagged
-            if skip_next:
-                skip_next = False
-                continue
+        for element in parent:
+            tag = element.tag
 
-            # Empty line - add spacing
-            if not line:
-                # Close list if we were in one
-                if in_list:
-                    in_list = False
-                doc.add_paragraph()
-                continue
+            # Headings (# Name, ## Section, ### Subsection and deeper)
+            if tag in HEADING_TAGS:
+                level = int(tag[1])
+                p = doc.add_heading(''.join(element.itertext()).strip(), level=level)
+                style_level = min(level, 3)
+                if level == 1:
+                    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+                for run in p.runs:
+                    run.font.size = Pt(self.heading_sizes[style_level])
+                    if style_level < 3:
+                        run.font.color.rgb = self.heading_colors[style_level]
+                    run.font.bold = True
 
             # Horizontal rule (---)
-            if line.strip() == '---':
+            elif tag == 'hr':
                 # Add a subtle separator paragraph
                 p = doc.add_paragraph()
                 p.add_run('_' * 80)
                 run = p.runs[0]
                 run.font.color.rgb = RGBColor(200, 200, 200)
                 run.font.size = Pt(6)
-                continue
 
-            # Heading 1 (# Name)
-            if line.startswith('# '):
-                text = line[2:].strip()
-                p = doc.add_heading(text, level=1)
-                p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                for run in p.runs:
-                    run.font.size = Pt(self.heading_sizes[1])
-                    run.font.color.rgb = self.heading_colors[1]
-                    run.font.bold = True
-                continue
+            # Bullet and numbered lists
+            elif tag in ('ul', 'ol'):
+                base_style = 'List Bullet' if tag == 'ul' else 'List Number'
+                style = base_style if list_depth == 0 else f'{base_style} {min(list_depth + 1, 3)}'
+                for item in element:
+                    self._add_list_item(doc, item, style, list_depth + 1)
 
-            # Heading 2 (## Section)
-            if line.startswith('## '):
-                text = line[3:].strip()
-                p = doc.add_heading(text, level=2)
-                for run in p.runs:
-                    run.font.size = Pt(self.heading_sizes[2])
-                    run.font.color.rgb = self.heading_colors[2]
-                    run.font.bold = True
-                continue
+            elif tag == 'p':
+                p = doc.add_paragraph()
+                self._add_formatted_text(p, element)
 
-            # Heading 3 (### Subsection)
-            if line.startswith('### '):
-                text = line[4:].strip()
-                p = doc.add_heading(text, level=3)
-                for run in p.runs:
-                    run.font.size = Pt(self.heading_sizes[3])
-                    run.font.bold = True
-                continue
-
-            # Bullet list (- item or * item)
-            if line.startswith('- ') or line.startswith('* '):
-                text = line[2:].strip()
-                p = doc.add_paragraph(style='List Bullet')
-                self._add_formatted_text(p, text)
-                in_list = True
-                continue
-
-            # Numbered list (1. item, 2. item, etc.)
-            if re.match(r'^\d+\.\s', line):
-                text = re.sub(r'^\d+\.\s', '', line)
-                p = doc.add_paragraph(style='List Number')
-                self._add_formatted_text(p, text)
-                in_list = True
-                continue
-
-            # Regular paragraph
-            if in_list:
-                in_list = False
-
-            p = doc.add_paragraph()
-            self._add_formatted_text(p, line)
-
-    def _add_formatted_text(self, paragraph, text: str) -> None:
-        """Add text with inline formatting (bold, italic, links) to paragraph.
+            elif tag == 'table':
+                self._add_table(doc, element)
+
+            # Code blocks (<pre><code>): one monospace paragraph, line breaks kept
+            elif tag == 'pre':
+                self._add_code_block(doc, element)
+
+            # Containers (blockquote, div): their own text, then their blocks in place
+            else:
+                self._add_loose_text(doc, element.text)
+                self._add_blocks(doc, element, list_depth)
+
+            self._add_loose_text(doc, element.tail)
+
+    def _add_loose_text(self, doc: Document, text: Optional[str]) -> None:
+        """Add text sitting directly in a container (outside any block) as a paragraph."""
+        if text and text.strip():
+            doc.add_paragraph(text.strip())
+
+    def _add_code_block(self, doc: Document, pre: etree.Element) -> None:
+        """Add a <pre> code block as a monospace paragraph.
+
+        Args:
+            doc: Document object to add content to
+            pre: <pre> element (usually wrapping <code>)
+        """
+        p = doc.add_paragraph()
+        for index, line in enumerate(''.join(pre.itertext()).rstrip('\n').split('\n')):
+            run = p.add_run()
+            if index:
+                run.add_break()
+            run.add_text(line)
+            run.font.name = 'Courier New'
+
+    def _add_list_item(self, doc: Document, item: etree.Element, style: str, list_depth: int) -> None:
+        """Add one <li>, which holds inline text or (in loose lists) paragraphs and sublists.
+
+        Args:
+            doc: Document object to add content to
+            item: <li> element
+            style: Paragraph style for this list level
+            list_depth: Nesting level of this item's list
+        """
+        p = doc.add_paragraph(style=style)
+        inline = etree.Element('span')
+        inline.text = item.text
+        for child in item:
+            if child.tag in ('ul', 'ol'):
+                self._add_blocks(doc, _wrap(child), list_depth)
+            elif child.tag == 'p':
+                if len(p.runs):
+                    p = doc.add_paragraph(style='List Continue')
+                self._add_formatted_text(p, child)
+            else:
+                inline.append(child)
+        if inline.text or len(inline):
+            self._add_formatted_text(p, inline)
+
+    def _add_table(self, doc: Document, table: etree.Element) -> None:
+        """Add a markdown table as a Word table.
+
+        Args:
+            doc: Document object to add content to
+            table: <table> element
+        """
+        rows = list(table.iter('tr'))
+        if not rows:
+            return
+        columns = max(len(row) for row in rows)
+        word_table = doc.add_table(rows=len(rows), cols=columns)
+        word_table.style = 'Table Grid'
+        for r, row in enumerate(rows):
+            for c, cell in enumerate(row):
+                paragraph = word_table.cell(r, c).paragraphs[0]
+                self._add_formatted_text(paragraph, cell, bold=cell.tag == 'th')
+
+    def _add_formatted_text(
+        self,
+        paragraph,
+        element: etree.Element,
+        bold: bool = False,
+        italic: bool = False,
+        link: bool = False,
+    ) -> None:
+        """Add an element's inline content (bold, italic, links, line breaks) to paragraph.
 
         Args:
             paragraph: Paragraph object to add text to
-            text: Text with markdown inline formatting
+            element: Element whose text and children are inline content
+            bold: Inherited bold formatting
+            italic: Inherited italic formatting
+            link: Inside a link - renders as blue underlined text
 
         Supports:
             - **bold text**
             - *italic text*
-            - [link text](url) - renders as blue underlined text
+            - [link text](url)
+            - `code`
         """
 
-        # Process bold, italic, and links
-        # Pattern priority: bold first (two asterisks), then links, then italic
-
-        remaining = text
-        while remaining:
-            # Check for bold (**text**)
-            bold_match = re.search(r'\*\*(.+?)\*\*', remaining)
-            # Check for italic (*text* but not **)
-            italic_match = re.search(r'(?<!\*)\*([^*]+?)\*(?!\*)', remaining)
-            # Check for links ([text](url))
-            link_match = re.search(r'\[([^\]]+)\]\(([^\)]+)\)', remaining)
-
-            # Find which match comes first
-            matches = []
-            if bold_match:
-                matches.append(('bold', bold_match.start(), bold_match))
-            if italic_match:
-                matches.append(('italic', italic_match.start(), italic_match))
-            if link_match:
-                matches.append(('link', link_match.start(), link_match))
-
-            if not matches:
-                # No more formatting, add remaining text
-                if remaining:
-                    paragraph.add_run(remaining)
-                break
-
-            # Sort by position and take the first
-            matches.sort(key=lambda x: x[1])
-            format_type, pos, match = matches[0]
-
-            # Add text before the match
-            if pos > 0:
-                paragraph.add_run(remaining[:pos])
-
-            # Add formatted text
-            if format_type == 'bold':
-                run = paragraph.add_run(match.group(1))
+        def add_run(text: str) -> None:
+            run = paragraph.add_run(text)
+            if bold:
                 run.bold = True
-                remaining = remaining[match.end():]
-            elif format_type == 'italic':
-                run = paragraph.add_run(match.group(1))
+            if italic:
                 run.italic = True
-                remaining = remaining[match.end():]
-            elif format_type == 'link':
-                # Render link as blue underlined text
-                link_text = match.group(1)
-                run = paragraph.add_run(link_text)
+            if link:
                 run.font.color.rgb = RGBColor(0, 102, 204)
                 run.font.underline = True
-                remaining = remaining[match.end():]
+            if element.tag == 'code':
+                run.font.name = 'Courier New'
+
+        if element.text:
+            add_run(element.text.strip('\n') if element.tag == 'p' else element.text)
+
+        for child in element:
+            if child.tag == 'br':
+                paragraph.add_run().add_break()
+                # nl2br keeps the source newline after <br>
+                tail = (child.tail or '').lstrip('\n')
+            else:
+                self._add_formatted_text(
+                    paragraph,
+                    child,
+                    bold=bold or child.tag in ('strong', 'b'),
+                    italic=italic or child.tag in ('em', 'i'),
+                    link=link or child.tag == 'a',
+                )
+                tail = child.tail
+            if tail:
+                add_run(tail.rstrip('\n') if child is element[-1] else tail)
 
     def create_from_text(self, text: str, output_path: Path, title: Optional[str] = None) -> None:
         """Create a DOCX document directly from text (without markdown file).
@@ -245,5 +281,12 @@ class DOCXGenerator:
                 run.font.color.rgb = RGBColor(0, 51, 102)
                 run.font.bold = True
 
-        self._parse_and_add_content(doc, text)
+        self._add_blocks(doc, parse_markdown(text).root)
         doc.save(str(output_path))
+
+
+def _wrap(element: etree.Element) -> etree.Element:
+    """Wrap a single block so _add_blocks() can render it."""
+    container = etree.Element('div')
+    container.append(element)
+    return container
@@ -0,0 +1,177 @@
+"""Multi-keyword matching in one pass over the text.
+
+KeywordEngine compiles every dictionary term into a single Aho-Corasick
+automaton when it is built. find_all() then walks the text once, so matching
+costs O(len(text) + hits) however many terms are loaded, instead of one regex
+search per term.
+
+Matches respect word boundaries the way \\b does for ordinary words: a term
+that starts (ends) with a letter, digit or underscore must not be preceded
+(followed) by one. Terms that start or end with punctuation, such as
+".net", "c++" or "c#", only need the boundary on their word-character side,
+so "c++ developer" and "asp.net" both match.
+
+Aliases (e.g. "k8s" for "kubernetes") are compiled into the same automaton
+and reported under the canonical term.
+
+When every spelling is a single word (e.g. the action verb categories),
+find_all() skips the automaton: the text is split into words by the regex
+engine and each word is looked up in a dict, which gives the same hits
+without a Python-level loop over every character.
+"""
+
+import re
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+
+# Maximal runs of word characters (the same characters as _is_word_char)
+WORD_PATTERN = re.compile(r"\w+")
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+@dataclass(frozen=True)
+class KeywordHit:
+    """One dictionary term found in a text."""
+
+    term: str  # Canonical term, also when an alias matched
+    category: str
+    start: int  # Offsets into text.lower() (the same as text for almost all input)
+    end: int
+
+
+class KeywordEngine:
+    """Aho-Corasick automaton over categorized keyword dictionaries."""
+
+    def __init__(self, dictionaries: Mapping[str, Iterable[str]], aliases: Optional[Mapping[str, str]] = None):
+        """
+        Compile dictionaries into one automaton.
+
+        Args:
+            dictionaries: Terms per category; a term may appear in several categories
+            aliases: Alternative spelling -> canonical term; matches every category of the term
+        """
+        spellings: Dict[str, List[str]] = {}
+        for alias, term in (aliases or {}).items():
+            spellings.setdefault(term.lower().strip(), []).append(alias)
+
+        self.categories: Tuple[str, ...] = tuple(dictionaries)
+        # (term, category, length, needs boundary before, needs boundary after)
+        self._terms: List[Tuple[str, str, int, bool, bool]] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[int]] = [[]]
+        words: Dict[str, List[int]] = {}
+
+        for category, terms in dictionaries.items():
+            for term in terms:
+                canonical = term.lower().strip()
+                if not canonical:
+                    continue
+
+                for spelling in [canonical] + spellings.get(canonical, []):
+                    key = spelling.lower().strip()
+                    if not key:
+                        continue
+
+                    node = 0
+                    for char in key:
+                        next_node = self._goto[node].get(char)
+                        if next_node is None:
+                            next_node = len(self._goto)
+                            self._goto[node][char] = next_node
+                            self._goto.append({})
+                            outputs.append([])
+                        node = next_node
+
+                    outputs[node].append(len(self._terms))
+                    words.setdefault(key, []).append(len(self._terms))
+                    self._terms.append((canonical, category, len(key), _is_word_char(key[0]), _is_word_char(key[-1])))
+
+        # Failure links by breadth-first search; each node also reports its suffixes' terms
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                outputs[child].extend(outputs[self._fail[child]])
+
+        self._outputs: List[Tuple[int, ...]] = [tuple(out) for out in outputs]
+
+        # Single-word dictionaries: word -> term indices, used instead of the automaton
+        self._words: Optional[Dict[str, Tuple[int, ...]]] = None
+        if all(WORD_PATTERN.fullmatch(word) for word in words):
+            self._words = {word: tuple(indices) for word, indices in words.items()}
+
+    def __len__(self) -> int:
+        """Number of (spelling, category) entries compiled."""
+        return len(self._terms)
+
+    def find_all(self, text: str) -> List[KeywordHit]:
+        """
+        Find every dictionary term in text.
+
+        Args:
+            text: Text to scan (matched case-insensitively)
+
+        Returns:
+            Hits in order of where they end in the text; overlapping terms are all reported
+        """
+        text = text.lower()
+        if self._words is not None:
+            return self._find_words(text)
+
+        length = len(text)
+        goto, fail, outputs, terms = self._goto, self._fail, self._outputs, self._terms
+        hits = []
+        node = 0
+
+        for i, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+
+            for term_index in outputs[node]:
+                term, category, term_length, bounded_start, bounded_end = terms[term_index]
+                start = i - term_length + 1
+                if bounded_start and start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                if bounded_end and i + 1 < length and _is_word_char(text[i + 1]):
+                    continue
+                hits.append(KeywordHit(term, category, start, i + 1))
+
+        return hits
+
+    def _find_words(self, text: str) -> List[KeywordHit]:
+        words, terms = self._words, self._terms
+        hits = []
+        for match in WORD_PATTERN.finditer(text):
+            indices = words.get(match.group())
+            if indices:
+                for term_index in indices:
+                    term, category = terms[term_index][:2]
+                    hits.append(KeywordHit(term, category, match.start(), match.end()))
+        return hits
+
+    def extract(self, text: str) -> Dict[str, List[str]]:
+        """
+        Group the distinct terms found in text by category.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Category -> terms in order of first appearance (every category present)
+        """
+        found: Dict[str, Dict[str, None]] = {category: {} for category in self.categories}
+        for hit in sorted(self.find_all(text), key=lambda hit: hit.start):
+            found[hit.category][hit.term] = None
+        return {category: list(terms) for category, terms in found.items()}
@@ -0,0 +1,128 @@
+"""Parse resume markdown once into a document tree shared by every export format.
+
+The markdown library already builds an ElementTree before serializing it to
+HTML. parse_markdown() keeps that tree alongside the HTML, so the PDF backend
+(HTML + WeasyPrint), the DOCX backend (walks the tree) and HTML export all
+read the same parse and render the same structure.
+
+Python-Markdown doesn't let a list interrupt a paragraph, but generated
+resumes put bullets directly under the title/company/dates line (see
+app/config/resume_guidelines.py). _ListInterrupt inserts the blank line
+the parser needs before such lists.
+"""
+
+import html
+import re
+import threading
+import xml.etree.ElementTree as etree
+from dataclasses import dataclass
+
+import markdown
+from markdown.preprocessors import Preprocessor
+from markdown.treeprocessors import Treeprocessor
+
+MARKDOWN_EXTENSIONS = [
+    "tables",  # Support tables
+    "nl2br",  # New line to <br>
+    "fenced_code",  # Code blocks
+    "sane_lists",  # Better list handling
+]
+
+# markdown.util.STX/ETX-wrapped references to raw HTML held in md.htmlStash
+_STASH_PLACEHOLDER = re.compile("\x02wzxhzdk:(\\d+)\x03")
+_TAG = re.compile(r"<[^>]+>")
+
+# A top-level bullet or numbered list item line; group 1 is the marker
+_LIST_ITEM = re.compile(r"^ {0,3}([-*+]|\d+\.) +\S")
+
+_local = threading.local()
+
+
+@dataclass
+class MarkdownDocument:
+    """A parsed markdown document."""
+
+    root: etree.Element  # <div> whose children are the block elements
+    html: str  # Body HTML, as markdown.markdown() would return it
+
+
+class _CaptureTree(Treeprocessor):
+    """Keep the finished tree; runs after inline processing and unescaping."""
+
+    root = None
+
+    def run(self, root: etree.Element) -> None:
+        self.root = root
+
+
+class _ListInterrupt(Preprocessor):
+    """Start a list on the line after a paragraph line, as the DOCX backend used to.
+
+    Also separates a numbered list directly following a bulleted one (and
+    vice versa), which sane_lists would otherwise fold into the last item.
+    Runs after fenced_code (priority 25), so code blocks are already stashed.
+    """
+
+    def run(self, lines):
+        result = []
+        list_kind = None  # "ul" or "ol" while inside a list block
+        for line in lines:
+            item = _LIST_ITEM.match(line)
+            if not line.strip():
+                list_kind = None
+            elif item:
+                kind = "ol" if item.group(1)[0].isdigit() else "ul"
+                if kind != list_kind and result and result[-1].strip():
+                    result.append("")
+                list_kind = kind
+            result.append(line)
+        return result
+
+
+def _parser() -> markdown.Markdown:
+    # Markdown instances keep per-document state and are not thread-safe
+    md = getattr(_local, "markdown", None)
+    if md is None:
+        md = markdown.Markdown(extensions=MARKDOWN_EXTENSIONS)
+        md.preprocessors.register(_ListInterrupt(md), "list_interrupt", 22)
+        md.treeprocessors.register(_CaptureTree(md), "capture", -1)
+        _local.markdown = md
+    return md
+
+
+def parse_markdown(md_content: str) -> MarkdownDocument:
+    """
+    Parse markdown into a tree and its HTML in one pass.
+
+    Raw HTML the markdown library stashes (fenced code, entities, inline
+    tags) is resolved to plain text in the tree; the HTML keeps it as-is.
+
+    Args:
+        md_content: Markdown text
+
+    Returns:
+        MarkdownDocument
+    """
+    md = _parser().reset()
+    body_html = md.convert(md_content)
+    capture = md.treeprocessors["capture"]
+    root, capture.root = capture.root, None
+    if root is None:
+        # convert() returns early for blank input
+        root = etree.Element("div")
+
+    def unstash(text: str) -> str:
+        def replace(match: re.Match) -> str:
+            index = int(match.group(1))
+            raw = md.htmlStash.rawHtmlBlocks[index] if index < len(md.htmlStash.rawHtmlBlocks) else ""
+            return html.unescape(_TAG.sub("", str(raw)))
+
+        return _STASH_PLACEHOLDER.sub(replace, text)
+
+    for element in root.iter():
+        if element.text:
+            element.text = unstash(element.text)
+        if element.tail:
+            element.tail = unstash(element.tail)
+
+    return MarkdownDocument(root=root, html=body_html)
@@ -1,20 +1,54 @@
-"""PDF generator for converting markdown resumes to PDF."""
-
+"""PDF generator for converting markdown resumes to PDF.
+
+PDFGenerator is long-lived: the worker and the download routes each hold one
+instance. Templates in resume_formats/ are read once at construction and
+split into the page HTML and a stylesheet. Each rendering thread keeps its
+own WeasyPrint FontConfiguration and compiled CSS objects, so template I/O,
+CSS parsing and font discovery are paid once per thread instead of on every
+document. Markdown is parsed by app.utils.markdown_document, whose output
+the DOCX generator renders too. Template edits take effect on restart.
+"""
+
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Dict
-import markdown
+from typing import Optional, Dict, Iterable, List, Tuple
+import hashlib
+import re
+import threading
 from weasyprint import HTML, CSS
+from weasyprint.text.fonts import FontConfiguration
 import logging
 
+from .markdown_document import MarkdownDocument, parse_markdown
+
 logger = logging.getLogger(__name__)
 
+# Plain <style> blocks are compiled once; blocks with attributes (e.g. media) stay inline
+_STYLE_BLOCK = re.compile(r"<style>(.*?)</style>", re.DOTALL | re.IGNORECASE)
+
+MAX_CUSTOM_STYLESHEETS = 32  # Per-thread compiled custom_css entries kept
+
+
+@dataclass(frozen=True)
+class ParsedTemplate:
+    """HTML template split into page markup and its stylesheet."""
+
+    name: str
+    source: str  # Template as written, for standalone HTML export
+    html: str  # Template with <style> blocks removed; contains {{content}}
+    css: str  # Concatenated <style> block contents
+    fingerprint: str  # Name plus a hash of the template source
+
 
 class PDFGenerator:
     """Convert markdown resumes to professionally formatted PDFs."""
 
+    # Bump when output changes for the same input; invalidates cached renders
+    RENDER_VERSION = "2"
+
     def __init__(self, templates_dir: Path):
         """
-        Initialize PDF generator.
+        Initialize PDF generator and load templates.
 
         Args:
             templates_dir: Directory containing HTML templates
@@ -22,6 +56,17 @@ class PDFGenerator:
         self.templates_dir = templates_dir
         self.templates_dir.mkdir(parents=True, exist_ok=True)
 
+        self._default_template = self._parse_template("default", self._get_default_template())
+        self._templates: Dict[str, ParsedTemplate] = {}
+        formats_dir = self.templates_dir / "resume_formats"
+        if formats_dir.is_dir():
+            for template_path in sorted(formats_dir.glob("*.html")):
+                self._templates[template_path.stem] = self._parse_template(
+                    template_path.stem, template_path.read_text(encoding="utf-8")
+                )
+        self._missing_templates = set()
+        self._local = threading.local()
+
     def markdown_to_pdf(
         self,
         markdown_path: Path,
@@ -47,47 +92,64 @@ class PDFGenerator:
         try:
             # Read markdown content
             with open(markdown_path, "r", encoding="utf-8") as f:
-                md_content = f.read()
-
-            # Convert markdown to HTML
-            html_content = markdown.markdown(
-                md_content,
-                extensions=[
-                    "tables",  # Support tables
-                    "nl2br",  # New line to <br>
-                    "fenced_code",  # Code blocks
-                    "sane_lists",  # Better list handling
-                ],
-            )
+                document = parse_markdown(f.read())
 
-            # Load HTML template
-            template_path = self.templates_dir / "resume_formats" / f"{template}.html"
+        except FileNotFoundError as e:
+            logger.error(f"File not found: {e}")
+            return {
+                "success": False,
+                "error": f"File not found: {e}",
+            }
+        except Exception as e:
+            logger.error(f"Error generating PDF: {e}")
+            return {
+                "success": False,
+                "error": str(e),
+            }
 
-            if not template_path.exists():
-                logger.warning(
-                    f"Template {template} not found, using default inline template"
-                )
-                template_html = self._get_default_template()
-            else:
-                with open(template_path, "r", encoding="utf-8") as f:
-                    template_html = f.read()
+        return self.document_to_pdf(document, output_path, template, custom_css)
+
+    def document_to_pdf(
+        self,
+        document: MarkdownDocument,
+        output_path: Path,
+        template: str = "modern",
+        custom_css: Optional[str] = None,
+    ) -> Dict[str, any]:
+        """
+        Render a parsed markdown document to PDF.
+
+        Args:
+            document: Output of parse_markdown()
+            output_path: Path for output PDF file
+            template: Template name
+            custom_css: Optional custom CSS string
+
+        Returns:
+            Dictionary with generation results (as markdown_to_pdf())
+        """
+        try:
+            output_path = Path(output_path)
+            state = self._thread_state()
+            parsed = self._get_template(template)
 
             # Insert content into template
-            full_html = template_html.replace("{{content}}", html_content)
+            full_html = parsed.html.replace("{{content}}", document.html)
 
-            # Load CSS if provided
-            css_objects = []
+            # Compiled template CSS, then custom CSS
+            stylesheets = []
+            if parsed.css:
+                stylesheets.append(self._stylesheet(state, parsed.css))
             if custom_css:
-                css_objects.append(CSS(string=custom_css))
+                stylesheets.append(self._stylesheet(state, custom_css, custom=True))
 
             # Convert HTML to PDF using WeasyPrint
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
-            html = HTML(string=full_html)
-            if css_objects:
-                pdf_doc = html.render(stylesheets=css_objects)
-            else:
-                pdf_doc = html.render()
+            pdf_doc = HTML(string=full_html).render(
+                stylesheets=stylesheets,
+                font_config=state.font_config,
+            )
 
             # Write PDF to file
             with open(output_path, 'wb') as f:
@@ -115,6 +177,98 @@ class PDFGenerator:
                 "error": str(e),
             }
 
+    def document_to_html(self, document: MarkdownDocument, template: str = "modern") -> str:
+        """
+        Render a parsed markdown document as a standalone HTML page.
+
+        Args:
+            document: Output of parse_markdown()
+            template: Template name
+
+        Returns:
+            The template, styles included, with the document as its content
+        """
+        return self._get_template(template).source.replace("{{content}}", document.html)
+
+    def render_many(
+        self,
+        documents: Iterable[Tuple[Path, Path]],
+        template: str = "modern",
+        custom_css: Optional[str] = None,
+    ) -> List[Dict[str, any]]:
+        """
+        Convert several markdown files to PDF with the same template.
+
+        All documents are rendered on the calling thread, so the compiled CSS
+        and font configuration are set up at most once.
+
+        Args:
+            documents: (markdown_path, output_path) pairs
+            template: Template name
+            custom_css: Optional custom CSS string
+
+        Returns:
+            One markdown_to_pdf() result per document, in order
+        """
+        return [
+            self.markdown_to_pdf(markdown_path, output_path, template=template, custom_css=custom_css)
+            for markdown_path, output_path in documents
+        ]
+
+    def template_fingerprint(self, template: str = "modern") -> str:
+        """
+        Identify the template markdown_to_pdf() would use.
+
+        Args:
+            template: Template name
+
+        Returns:
+            Template name plus a hash of its HTML ("default" if it doesn't exist)
+        """
+        parsed = self._templates.get(template)
+        if parsed is None:
+            return f"{template}:default"
+        return parsed.fingerprint
+
+    def _get_template(self, template: str) -> ParsedTemplate:
+        parsed = self._templates.get(template)
+        if parsed is not None:
+            return parsed
+
+        if template not in self._missing_templates:
+            self._missing_templates.add(template)
+            logger.warning(f"Template {template} not found, using default inline template")
+        return self._default_template
+
+    def _parse_template(self, name: str, source: str) -> ParsedTemplate:
+        css = "\n".join(block.strip() for block in _STYLE_BLOCK.findall(source))
+        return ParsedTemplate(
+            name=name,
+            source=source,
+            html=_STYLE_BLOCK.sub("", source),
+            css=css,
+            fingerprint=f"{name}:{hashlib.sha256(source.encode('utf-8')).hexdigest()[:16]}",
+        )
+
+    def _thread_state(self) -> threading.local:
+        # WeasyPrint font maps are not thread-safe
+        state = self._local
+        if not hasattr(state, "font_config"):
+            state.font_config = FontConfiguration()
+            state.stylesheets = {}
+            state.custom_stylesheets = {}
+        return state
+
+    def _stylesheet(self, state: threading.local, css: str, custom: bool = False) -> CSS:
+        cache = state.custom_stylesheets if custom else state.stylesheets
+        stylesheet = cache.get(css)
+        if stylesheet is None:
+            if custom and len(cache) >= MAX_CUSTOM_STYLESHEETS:
+                cache.clear()
+            stylesheet = CSS(string=css, font_config=state.font_config)
+            cache[css] = stylesheet
+        return stylesheet
+
     def _get_default_template(self) -> str:
         """
         Get default HTML template if custom template not found.
@@ -0,0 +1,81 @@
+"""Prompt caching helpers for Claude Messages API calls.
+
+Claude caches the processed prefix of a request (system, then messages) up
+to a block marked with cache_control. A cached prefix is only reused when it
+is byte-identical, so static text goes first and per-enhancement content
+(IDs, resume, job description) after the breakpoint.
+
+Prefixes shorter than the model's minimum cacheable length (1024 tokens for
+Sonnet) are processed normally; the breakpoint is then a no-op.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..config.resume_guidelines import RESUME_FORMATTING_GUIDELINES
+
+logger = logging.getLogger(__name__)
+
+EPHEMERAL_CACHE_CONTROL = {"type": "ephemeral"}
+
+# Left in INSTRUCTIONS.md text where the shared guidelines were lifted out
+GUIDELINES_REFERENCE = "(Resume formatting guidelines are provided in the system prompt.)\n"
+
+
+def build_system_blocks(*static_texts: Optional[str]) -> List[Dict[str, Any]]:
+    """
+    Build system prompt blocks with a cache breakpoint after the last one.
+
+    Args:
+        *static_texts: Text that is identical across calls; empty values are skipped
+
+    Returns:
+        List of text blocks for the ``system`` parameter
+    """
+    blocks = [{"type": "text", "text": text} for text in static_texts if text]
+    blocks[-1]["cache_control"] = EPHEMERAL_CACHE_CONTROL
+    return blocks
+
+
+def split_formatting_guidelines(instructions: str) -> Tuple[str, Optional[str]]:
+    """
+    Lift the shared formatting guidelines out of INSTRUCTIONS.md text.
+
+    Args:
+        instructions: Enhancement instructions as stored on the row
+
+    Returns:
+        Tuple of (instructions without the guidelines, guidelines or None if
+        the instructions do not contain them)
+    """
+    if RESUME_FORMATTING_GUIDELINES not in instructions:
+        return instructions, None
+
+    remaining = instructions.replace(RESUME_FORMATTING_GUIDELINES, GUIDELINES_REFERENCE, 1)
+    return remaining, RESUME_FORMATTING_GUIDELINES
+
+
+def log_cache_usage(usage: Any, label: str) -> Dict[str, int]:
+    """
+    Log token accounting for a Claude call, split into cache reads and writes.
+
+    Args:
+        usage: ``usage`` object from a Messages API response
+        label: What the call was for (used in the log line)
+
+    Returns:
+        Dict with input, cache_read, cache_write and output token counts
+    """
+    counts = {
+        "input": getattr(usage, "input_tokens", 0) or 0,
+        "cache_read": getattr(usage, "cache_read_input_tokens", 0) or 0,
+        "cache_write": getattr(usage, "cache_creation_input_tokens", 0) or 0,
+        "output": getattr(usage, "output_tokens", 0) or 0,
+    }
+
+    logger.info(
+        f"Claude usage for {label}: "
+        f"input={counts['input']} cache_read={counts['cache_read']} "
+        f"cache_write={counts['cache_write']} output={counts['output']}"
+    )
+    return counts
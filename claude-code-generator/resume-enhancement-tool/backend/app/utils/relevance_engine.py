@@ -0,0 +1,191 @@
+"""BM25 relevance between a resume and a corpus of job descriptions.
+
+ATSAnalyzer's match score only sees terms in the skills taxonomy. BM25Index
+scores every word instead, weighting terms by how rare they are across the
+whole corpus, so "terraform" in a job description counts even if it isn't
+in the taxonomy, and words every posting uses ("experience", "team") barely
+count at all.
+
+The index is an inverted index (term -> {document: term frequency}) kept
+up to date as documents are added or removed; corpus statistics (document
+count, average length, document frequencies) are maintained incrementally
+and IDF is computed at query time. A query only walks the postings of its
+own terms, so its cost grows with the number of documents sharing terms
+with the resume, not with the corpus size.
+"""
+
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+# Words, keeping the punctuation of terms like "c++", "c#", "node.js", "ci/cd"
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*(?:[./][a-z0-9+#]+)*")
+
+STOPWORDS = frozenset("""
+a about above after all also am an and any are as at be been being both but by can could did do does
+doing down during each few for from further had has have having he her here hers herself him himself
+his how i if in into is it its itself just me more most my myself no nor not now of off on once only
+or other our ours ourselves out over own same she should so some such than that the their theirs them
+themselves then there these they this those through to too under until up very was we were what when
+where which while who whom why will with would you your yours yourself yourselves
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase terms, without stopwords.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        Terms in order of appearance
+    """
+    return [
+        token
+        for token in TOKEN_PATTERN.findall(text.lower())
+        if token not in STOPWORDS and (len(token) > 1 or token in ("c", "r"))
+    ]
+
+
+@dataclass(frozen=True)
+class RelevanceResult:
+    """BM25 score of one document for a query."""
+
+    doc_id: Hashable
+    score: float
+    top_terms: List[Tuple[str, float]]  # (term, contribution), largest first
+
+
+class BM25Index:
+    """Incrementally updated BM25 inverted index."""
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        """
+        Initialize an empty index.
+
+        Args:
+            k1: Term frequency saturation
+            b: Document length normalization (0 = none, 1 = full)
+        """
+        self.k1 = k1
+        self.b = b
+        self._postings: Dict[str, Dict[Hashable, int]] = {}
+        self._doc_terms: Dict[Hashable, Tuple[str, ...]] = {}
+        self._doc_lengths: Dict[Hashable, int] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        """Number of indexed documents."""
+        return len(self._doc_lengths)
+
+    def __contains__(self, doc_id: Hashable) -> bool:
+        return doc_id in self._doc_lengths
+
+    def doc_ids(self) -> List[Hashable]:
+        """Indexed document ids, in indexing order."""
+        return list(self._doc_lengths)
+
+    @property
+    def average_length(self) -> float:
+        """Average document length in terms."""
+        return self._total_length / len(self._doc_lengths) if self._doc_lengths else 0.0
+
+    def add(self, doc_id: Hashable, text: str) -> None:
+        """
+        Index a document, replacing an earlier version with the same id.
+
+        Args:
+            doc_id: Document identifier
+            text: Document text
+        """
+        if doc_id in self._doc_lengths:
+            self.remove(doc_id)
+
+        tokens = tokenize(text)
+        counts = Counter(tokens)
+        for term, frequency in counts.items():
+            self._postings.setdefault(term, {})[doc_id] = frequency
+        self._doc_terms[doc_id] = tuple(counts)
+        self._doc_lengths[doc_id] = len(tokens)
+        self._total_length += len(tokens)
+
+    def remove(self, doc_id: Hashable) -> None:
+        """
+        Drop a document from the index (no-op if it isn't indexed).
+
+        Args:
+            doc_id: Document identifier
+        """
+        length = self._doc_lengths.pop(doc_id, None)
+        if length is None:
+            return
+        self._total_length -= length
+        for term in self._doc_terms.pop(doc_id):
+            postings = self._postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[term]
+
+    def idf(self, term: str) -> float:
+        """BM25 inverse document frequency of a term (0 if no document has it)."""
+        frequency = len(self._postings.get(term, ()))
+        if not frequency:
+            return 0.0
+        return math.log(1 + (len(self._doc_lengths) - frequency + 0.5) / (frequency + 0.5))
+
+    def score(
+        self,
+        query: str,
+        doc_ids: Optional[Iterable[Hashable]] = None,
+        limit: Optional[int] = None,
+        top_terms: int = 5,
+    ) -> List[RelevanceResult]:
+        """
+        Score documents against a query text (e.g. a resume).
+
+        Each distinct query term counts once, so a resume that repeats a
+        word many times doesn't outweigh the job description's own emphasis.
+
+        Args:
+            query: Query text
+            doc_ids: Only score these documents (default: all); unknown ids score 0
+            limit: Return only the best N documents (default: all)
+            top_terms: Contributing terms reported per document
+
+        Returns:
+            Results best first; ties are ordered by id's position in doc_ids (or indexing order)
+        """
+        order = list(doc_ids) if doc_ids is not None else list(self._doc_lengths)
+        candidates = set(order)
+        average_length = self.average_length or 1.0
+        k1, b = self.k1, self.b
+
+        contributions: Dict[Hashable, List[Tuple[float, str]]] = {doc_id: [] for doc_id in order}
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = self.idf(term)
+            # Walk the shorter side: the term's postings or the candidate set
+            if len(postings) <= len(candidates):
+                matches = ((doc_id, frequency) for doc_id, frequency in postings.items() if doc_id in candidates)
+            else:
+                matches = ((doc_id, postings[doc_id]) for doc_id in candidates if doc_id in postings)
+            for doc_id, frequency in matches:
+                norm = k1 * (1 - b + b * self._doc_lengths[doc_id] / average_length)
+                contributions[doc_id].append((idf * frequency * (k1 + 1) / (frequency + norm), term))
+
+        results = []
+        for doc_id in order:
+            terms = sorted(contributions[doc_id], reverse=True)
+            results.append(RelevanceResult(
+                doc_id=doc_id,
+                score=sum(weight for weight, _ in terms),
+                top_terms=[(term, weight) for weight, term in terms[:top_terms]],
+            ))
+
+        results.sort(key=lambda result: -result.score)  # Stable: ties keep input order
+        return results[:limit] if limit is not None else results
@@ -0,0 +1,229 @@
+"""Skills taxonomy shared by ATSAnalyzer, StyleAnalyzer and AchievementDetector.
+
+Terms, their categories and aliases live in a versioned JSON file
+(app/config/skills_taxonomy.json by default, see SKILLS_TAXONOMY_PATH):
+
+    {
+      "version": "2026.10.1",
+      "categories": {
+        "databases": {"group": "technical_skills", "terms": ["postgresql", ...]},
+        ...
+      },
+      "aliases": {"postgres": "postgresql", "k8s": "kubernetes", ...}
+    }
+
+Each category belongs to a group ("technical_skills", "soft_skills",
+"action_verbs"); analyzers report groups, AchievementDetector also uses the
+action verb categories. The file is compiled once into a KeywordEngine, and
+get_taxonomy() recompiles it when the file changes on disk, so edits apply
+without a restart and requests never pay the compile cost.
+
+The declared "version" is for people; results derived from the taxonomy
+(stored keyword sets, style signals) are stamped with content_hash, a hash
+of the compiled categories and aliases, so an edit that forgets to bump
+"version" still invalidates them.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from ..core.config import settings
+from .keyword_engine import KeywordEngine, KeywordHit
+
+logger = logging.getLogger(__name__)
+
+
+class TaxonomyError(ValueError):
+    """The taxonomy file is missing required fields or malformed."""
+
+
+@dataclass
+class SkillsTaxonomy:
+    """A compiled taxonomy version."""
+
+    version: str
+    groups: Dict[str, str]  # category -> group
+    content_hash: str  # Hash of groups, terms and aliases (see parse_taxonomy)
+    engine: KeywordEngine = field(repr=False)
+    dictionaries: Dict[str, List[str]] = field(default_factory=dict, repr=False)
+    aliases: Dict[str, str] = field(default_factory=dict, repr=False)
+    _engines: Dict[Tuple[str, ...], KeywordEngine] = field(default_factory=dict, init=False, repr=False)
+
+    def find_all(self, text: str) -> List[KeywordHit]:
+        """Find every taxonomy term in text (hits carry categories, see KeywordEngine.find_all)."""
+        return self.engine.find_all(text)
+
+    def extract_groups(self, text: str, groups: Tuple[str, ...]) -> Dict[str, List[str]]:
+        """
+        Find the distinct canonical terms in text, grouped.
+
+        Args:
+            text: Text to scan
+            groups: Groups to report
+
+        Returns:
+            Group -> terms in order of first appearance (every requested group present)
+        """
+        found: Dict[str, Dict[str, None]] = {group: {} for group in groups}
+        for hit in sorted(self.engine.find_all(text), key=lambda hit: hit.start):
+            group = self.groups[hit.category]
+            if group in found:
+                found[group][hit.term] = None
+        return {group: list(terms) for group, terms in found.items()}
+
+    def categories_in(self, group: str) -> List[str]:
+        """Categories belonging to a group, in file order."""
+        return [category for category, owner in self.groups.items() if owner == group]
+
+    def engine_for(self, categories: Tuple[str, ...]) -> KeywordEngine:
+        """
+        Automaton over only some categories (with their aliases), compiled once per taxonomy version.
+
+        Args:
+            categories: Categories to include; unknown ones are ignored
+
+        Returns:
+            KeywordEngine whose categories follow the given order
+        """
+        engine = self._engines.get(categories)
+        if engine is None:
+            dictionaries = {category: self.dictionaries[category] for category in categories if category in self.dictionaries}
+            engine = self._engines[categories] = KeywordEngine(dictionaries, self.aliases)
+        return engine
+
+
+def parse_taxonomy(data: dict) -> SkillsTaxonomy:
+    """
+    Compile taxonomy file contents.
+
+    Args:
+        data: Decoded JSON
+
+    Returns:
+        SkillsTaxonomy
+
+    Raises:
+        TaxonomyError: If the structure is invalid
+    """
+    if not isinstance(data, dict) or "version" not in data or not isinstance(data.get("categories"), dict):
+        raise TaxonomyError("Taxonomy needs a 'version' and a 'categories' object")
+
+    groups = {}
+    dictionaries = {}
+    for category, spec in data["categories"].items():
+        if not isinstance(spec, dict) or not isinstance(spec.get("group"), str) or not isinstance(spec.get("terms"), list):
+            raise TaxonomyError(f"Category '{category}' needs a 'group' string and a 'terms' list")
+        groups[category] = spec["group"]
+        dictionaries[category] = spec["terms"]
+
+    aliases = data.get("aliases", {})
+    if not isinstance(aliases, dict):
+        raise TaxonomyError("'aliases' must map alias -> term")
+    known_terms = {term.lower().strip() for terms in dictionaries.values() for term in terms}
+    unknown = sorted(term for term in aliases.values() if term.lower().strip() not in known_terms)
+    if unknown:
+        raise TaxonomyError(f"Aliases point to unknown terms: {unknown}")
+
+    # File order is kept: it decides category order and so which category a shared term reports
+    content = json.dumps([groups, dictionaries, aliases], separators=(",", ":"), ensure_ascii=False)
+
+    return SkillsTaxonomy(
+        version=str(data["version"]),
+        groups=groups,
+        content_hash=hashlib.sha256(content.encode("utf-8")).hexdigest()[:16],
+        engine=KeywordEngine(dictionaries, aliases),
+        dictionaries=dictionaries,
+        aliases=aliases,
+    )
+
+
+def load_taxonomy(path: Path) -> SkillsTaxonomy:
+    """Read and compile a taxonomy file."""
+    with open(path, "r", encoding="utf-8") as f:
+        return parse_taxonomy(json.load(f))
+
+
+class TaxonomyStore:
+    """Current taxonomy, recompiled when its file changes."""
+
+    def __init__(self, path: Path, check_interval: float = 5.0):
+        """
+        Load the taxonomy.
+
+        Args:
+            path: Taxonomy JSON file
+            check_interval: Minimum seconds between checks of the file's modification time
+
+        Raises:
+            OSError, ValueError: If the file can't be loaded at startup
+        """
+        self.path = Path(path)
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._stamp = self._file_stamp()
+        self._taxonomy = load_taxonomy(self.path)
+        self._checked_at = time.monotonic()
+        logger.info(
+            f"Loaded skills taxonomy {self._taxonomy.version} "
+            f"({self._taxonomy.content_hash}, {len(self._taxonomy.engine)} entries)"
+        )
+
+    def current(self) -> SkillsTaxonomy:
+        """Return the taxonomy, reloading it first if the file changed."""
+        if time.monotonic() - self._checked_at >= self.check_interval:
+            self.reload_if_changed()
+        return self._taxonomy
+
+    def reload_if_changed(self) -> bool:
+        """
+        Recompile the taxonomy if its file changed.
+
+        A file that fails to load is logged and the previous taxonomy kept.
+
+        Returns:
+            True if a new taxonomy was loaded
+        """
+        with self._lock:
+            self._checked_at = time.monotonic()
+            stamp = self._file_stamp()
+            if stamp == self._stamp:
+                return False
+            self._stamp = stamp
+
+            try:
+                taxonomy = load_taxonomy(self.path)
+            except (OSError, ValueError) as e:
+                logger.error(f"Keeping skills taxonomy {self._taxonomy.version}: failed to reload {self.path}: {e}")
+                return False
+
+            logger.info(
+                f"Reloaded skills taxonomy {self._taxonomy.version} ({self._taxonomy.content_hash}) "
+                f"-> {taxonomy.version} ({taxonomy.content_hash})"
+            )
+            self._taxonomy = taxonomy
+            return True
+
+    def _file_stamp(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+
+@lru_cache()
+def get_taxonomy_store() -> TaxonomyStore:
+    """Process-wide taxonomy store for SKILLS_TAXONOMY_PATH."""
+    return TaxonomyStore(Path(settings.SKILLS_TAXONOMY_PATH), settings.SKILLS_TAXONOMY_RELOAD_SECONDS)
+
+
+def get_taxonomy() -> SkillsTaxonomy:
+    """Current process-wide taxonomy."""
+    return get_taxonomy_store().current()
@@ -1,9 +1,22 @@
-"""Style analysis utility for matching writing styles to job descriptions."""
+"""Style analysis utility for matching writing styles to job descriptions.
 
+Scoring a style is arithmetic over a job's signals (seniority, industry,
+technical depth, ...). Extracting the signals is the expensive part, so the
+pattern tables are compiled once into grouped regexes, and signals are
+memoized per job content hash: in process for repeated calls with the same
+text, and on the Job row (style_signals) via signals_for_job().
+"""
+
+import hashlib
+import json
 import re
-from typing import Dict, List, Optional, Any
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Pattern
 from enum import Enum
 
+from .skills_taxonomy import SkillsTaxonomy, get_taxonomy
+
 
 class SeniorityLevel(str, Enum):
     """Experience levels for job analysis."""
@@ -23,6 +36,27 @@ class IndustryType(str, Enum):
     CREATIVE = "creative"
 
 
+# Bump when extract_job_signals() changes in a way that alters results
+SIGNALS_VERSION = "2"
+
+# Job signal sets kept in memory, least recently used evicted first
+SIGNALS_MEMO_SIZE = 512
+
+
+def _alternation(patterns: List[str]) -> str:
+    return "|".join(f"(?:{pattern})" for pattern in patterns)
+
+
+def _substring_scanner(keyword_sets: Dict[str, List[str]]) -> Pattern:
+    """One regex reporting every substring occurrence of every keyword, named by set."""
+    groups = "|".join(
+        f"(?P<{name}>{'|'.join(re.escape(keyword) for keyword in keywords)})"
+        for name, keywords in keyword_sets.items()
+    )
+    # Zero-width lookahead so occurrences inside other matches are reported too
+    return re.compile(f"(?=(?:{groups}))")
+
+
 class StyleAnalyzer:
     """
     Analyze job descriptions and recommend appropriate writing styles.
@@ -90,25 +124,6 @@ class StyleAnalyzer:
         ],
     }
 
-    # Technical skills patterns
-    TECHNICAL_KEYWORDS = [
-        # Programming languages
-        "python", "java", "javascript", "typescript", "go", "rust", "c++", "c#",
-        "ruby", "php", "swift", "kotlin", "scala", "r", "matlab",
-        # Frameworks
-        "react", "angular", "vue", "node.js", "django", "flask", "spring",
-        "fastapi", ".net", "rails", "express", "next.js",
-        # Databases
-        "sql", "postgresql", "mysql", "mongodb", "redis", "elasticsearch",
-        "dynamodb", "cassandra", "oracle",
-        # Cloud & Infrastructure
-        "aws", "azure", "gcp", "docker", "kubernetes", "terraform", "ansible",
-        "jenkins", "ci/cd", "devops",
-        # Tools & Technologies
-        "git", "github", "gitlab", "jira", "agile", "scrum", "microservices",
-        "api", "rest", "graphql", "kafka", "spark",
-    ]
-
     # Leadership keywords
     LEADERSHIP_KEYWORDS = [
         "lead", "manage", "mentor", "coach", "supervise", "oversee",
@@ -123,6 +138,47 @@ class StyleAnalyzer:
         "user-centric", "product-led", "design-thinking",
     ]
 
+    # Compliance/regulated environment keywords
+    COMPLIANCE_KEYWORDS = [
+        "compliance", "regulated", "regulation", "audit", "sox",
+        "hipaa", "gdpr", "iso", "certified", "governance",
+    ]
+
+    # Compiled once: one regex per seniority level (checked in order), each
+    # industry pattern on its own (a word such as "startup" counts for every
+    # industry listing it, so they can't share one alternation), and one
+    # scanner for the keyword lists
+    SENIORITY_REGEXES = {
+        level: re.compile(_alternation(patterns), re.IGNORECASE)
+        for level, patterns in SENIORITY_PATTERNS.items()
+    }
+    INDUSTRY_REGEXES = {
+        industry: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+        for industry, patterns in INDUSTRY_PATTERNS.items()
+    }
+    KEYWORD_SCANNER = _substring_scanner({
+        "leadership": LEADERSHIP_KEYWORDS,
+        "innovation": INNOVATION_KEYWORDS,
+        "compliance": COMPLIANCE_KEYWORDS,
+    })
+
+    def __init__(self, taxonomy: Optional[SkillsTaxonomy] = None):
+        """
+        Initialize analyzer.
+
+        Args:
+            taxonomy: Fixed skills taxonomy for technical keywords; by default
+                the shared one from get_taxonomy() (also used by ATSAnalyzer)
+        """
+        self._taxonomy = taxonomy
+        self._memo: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._memo_lock = threading.Lock()
+
+    @property
+    def taxonomy(self) -> SkillsTaxonomy:
+        """Skills taxonomy in use."""
+        return self._taxonomy or get_taxonomy()
+
     def analyze_job_style_match(
         self,
         job_description: str,
@@ -147,9 +203,19 @@ class StyleAnalyzer:
             - reasoning: List[str]
             - job_signals: Dict with extracted job characteristics
         """
-        # Extract job signals
-        signals = self.extract_job_signals(job_description, job_title)
+        return self.match_style(self.extract_job_signals(job_description, job_title), current_style)
 
+    def match_style(self, signals: Dict[str, Any], current_style: str) -> Dict[str, Any]:
+        """
+        Check a style against already extracted job signals (no text scanning).
+
+        Args:
+            signals: Result of extract_job_signals() or signals_for_job()
+            current_style: Currently selected style (professional, executive, etc.)
+
+        Returns:
+            Same structure as analyze_job_style_match()
+        """
         # Calculate scores for all styles
         style_scores = {
             "professional": self._calculate_professional_score(signals),
@@ -187,10 +253,27 @@ class StyleAnalyzer:
             "style_scores": style_scores,
         }
 
+    def signals_key(self, job_description: str, job_title: str = "") -> str:
+        """
+        Content hash identifying a job's signals.
+
+        Covers the text, SIGNALS_VERSION and the taxonomy's content hash
+        (technical depth counts taxonomy terms), so edits to any of them
+        invalidate it.
+        """
+        digest = hashlib.sha256()
+        for part in (SIGNALS_VERSION, self.taxonomy.content_hash, job_title, job_description):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
     def extract_job_signals(self, job_description: str, job_title: str = "") -> Dict[str, Any]:
         """
         Extract key signals from job description.
 
+        Results are memoized by content hash, so checking several styles or
+        resumes against the same job scans its text once.
+
         Args:
             job_description: Job description text
             job_title: Job title
@@ -198,39 +281,78 @@ class StyleAnalyzer:
         Returns:
             Dictionary with job characteristics
         """
+        key = self.signals_key(job_description, job_title)
+        with self._memo_lock:
+            signals = self._memo.get(key)
+            if signals is not None:
+                self._memo.move_to_end(key)
+                return dict(signals)
+
+        signals = self._extract_job_signals(job_description, job_title)
+        self._remember(key, signals)
+        return dict(signals)
+
+    def signals_for_job(self, job) -> Dict[str, Any]:
+        """
+        Signals of a stored job, read from the row when its content hash still matches.
+
+        Freshly extracted signals are stored on the row (style_signals,
+        style_signals_key); commit the session to keep them.
+
+        Args:
+            job: Job row
+
+        Returns:
+            Dictionary with job characteristics
+        """
+        key = self.signals_key(job.description_text, job.title or "")
+        if job.style_signals and job.style_signals_key == key:
+            signals = json.loads(job.style_signals)
+            self._remember(key, signals)
+            return dict(signals)
+
+        signals = self.extract_job_signals(job.description_text, job.title or "")
+        job.style_signals = json.dumps(signals, separators=(",", ":"))
+        job.style_signals_key = key
+        return signals
+
+    def _remember(self, key: str, signals: Dict[str, Any]) -> None:
+        with self._memo_lock:
+            self._memo[key] = signals
+            self._memo.move_to_end(key)
+            while len(self._memo) > SIGNALS_MEMO_SIZE:
+                self._memo.popitem(last=False)
+
+    def _extract_job_signals(self, job_description: str, job_title: str) -> Dict[str, Any]:
         combined_text = f"{job_title} {job_description}".lower()
+        keyword_sets = self._scan_keywords(combined_text)
 
         return {
             "seniority_level": self._detect_seniority(combined_text),
             "industry_type": self._detect_industry(combined_text),
             "technical_depth": self._count_technical_keywords(combined_text),
-            "leadership_focus": self._calculate_leadership_score(combined_text),
-            "innovation_focus": self._calculate_innovation_score(combined_text),
+            "leadership_focus": min(10, len(keyword_sets["leadership"])),
+            "innovation_focus": min(10, len(keyword_sets["innovation"])),
             "word_count": len(job_description.split()),
-            "has_compliance_keywords": self._has_compliance_keywords(combined_text),
+            "has_compliance_keywords": bool(keyword_sets["compliance"]),
         }
 
     def _detect_seniority(self, text: str) -> str:
         """Detect seniority level from text."""
         # Check in order: executive, senior, mid, entry
-        for level, patterns in self.SENIORITY_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, text, re.IGNORECASE):
-                    return level
+        for level, regex in self.SENIORITY_REGEXES.items():
+            if regex.search(text):
+                return level
 
         # Default to mid if can't determine
         return "mid"
 
     def _detect_industry(self, text: str) -> str:
         """Detect industry type from text."""
-        industry_scores = {}
-
-        for industry, patterns in self.INDUSTRY_PATTERNS.items():
-            score = 0
-            for pattern in patterns:
-                matches = len(re.findall(pattern, text, re.IGNORECASE))
-                score += matches
-            industry_scores[industry] = score
+        industry_scores = {
+            industry: sum(len(regex.findall(text)) for regex in regexes)
+            for industry, regexes in self.INDUSTRY_REGEXES.items()
+        }
 
         # Return industry with highest score, or "traditional" as default
         if max(industry_scores.values()) > 0:
@@ -238,39 +360,27 @@ class StyleAnalyzer:
         return "traditional"
 
     def _count_technical_keywords(self, text: str) -> int:
-        """Count technical keywords in text."""
-        count = 0
-        for keyword in self.TECHNICAL_KEYWORDS:
-            if keyword in text.lower():
-                count += 1
-        return count
+        """Count distinct technical skills in text (same terms ATSAnalyzer reports)."""
+        return len(self.taxonomy.extract_groups(text, ("technical_skills",))["technical_skills"])
+
+    def _scan_keywords(self, text: str) -> Dict[str, set]:
+        """Distinct leadership, innovation and compliance keywords occurring in text (as substrings)."""
+        found = {name: set() for name in self.KEYWORD_SCANNER.groupindex}
+        for match in self.KEYWORD_SCANNER.finditer(text):
+            found[match.lastgroup].add(match.group(match.lastgroup))
+        return found
 
     def _calculate_leadership_score(self, text: str) -> int:
         """Calculate leadership focus (0-10 scale)."""
-        count = 0
-        for keyword in self.LEADERSHIP_KEYWORDS:
-            if keyword in text.lower():
-                count += 1
-        return min(10, count)
+        return min(10, len(self._scan_keywords(text.lower())["leadership"]))
 
     def _calculate_innovation_score(self, text: str) -> int:
         """Calculate innovation focus (0-10 scale)."""
-        count = 0
-        for keyword in self.INNOVATION_KEYWORDS:
-            if keyword in text.lower():
-                count += 1
-        return min(10, count)
+        return min(10, len(self._scan_keywords(text.lower())["innovation"]))
 
     def _has_compliance_keywords(self, text: str) -> bool:
         """Check for compliance/regulated environment keywords."""
-        compliance_keywords = [
-            "compliance", "regulated", "regulation", "audit", "sox",
-            "hipaa", "gdpr", "iso", "certified", "governance",
-        ]
-        for keyword in compliance_keywords:
-            if keyword in text.lower():
-                return True
-        return False
+        return bool(self._scan_keywords(text.lower())["compliance"])
 
     def _calculate_professional_score(self, signals: Dict) -> int:
         """Calculate score for Professional style (0-100)."""
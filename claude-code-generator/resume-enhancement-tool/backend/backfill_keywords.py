@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""Index keywords for resumes, jobs and enhancements that have none or stale ones.
+
+Run after applying migration 010_keyword_columns, and after changing the
+skills taxonomy so requests don't pay for re-indexing on first use.
+
+Usage:
+    python backfill_keywords.py [--batch-size 200]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.core.database import SessionLocal
+from app.models.user import User  # Required for FK resolution
+from app.services.keyword_index import KeywordIndex
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backfill stored keyword sets")
+    parser.add_argument("--batch-size", type=int, default=200, help="Rows per commit")
+    args = parser.parse_args()
+
+    index = KeywordIndex()
+    db = SessionLocal()
+    try:
+        counts = index.backfill(db, batch_size=args.batch_size)
+    finally:
+        db.close()
+
+    print(f"Keyword index version {index.version}")
+    for table, count in counts.items():
+        print(f"  {table}: {count} rows indexed")
+
+
+if __name__ == "__main__":
+    main()
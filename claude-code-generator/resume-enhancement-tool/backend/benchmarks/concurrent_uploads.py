@@ -0,0 +1,125 @@
+"""
+Benchmark: request latency while resume uploads are being parsed.
+
+Fires CONCURRENCY simultaneous PDF uploads (repeated ROUNDS times) at the
+ASGI app in-process while a probe task hits GET /api/health every 10ms.
+Probe latency shows whether blocking work (PDF parsing, file I/O, SQLAlchemy)
+is stalling the event loop: with blocking handlers the probe waits for whole
+parses; with handlers running on the threadpool it stays in milliseconds.
+
+Requires reportlab (used by tests/utils.py to build the PDF).
+
+Usage (from backend/):
+    python benchmarks/concurrent_uploads.py [--concurrency 16] [--rounds 5] [--pages 6]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from uuid import uuid4
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+_tmp = Path(tempfile.mkdtemp(prefix="bench-uploads-"))
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key-32-characters-minimum-length")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_tmp / 'bench.db'}")
+os.environ.setdefault("WORKSPACE_ROOT", str(_tmp / "workspace"))
+
+import httpx  # noqa: E402
+from anyio import to_thread  # noqa: E402
+
+from app.api.dependencies import get_current_active_user  # noqa: E402
+from app.core.config import settings  # noqa: E402
+from app.core.database import Base, SessionLocal, engine  # noqa: E402
+from app.core.security import limiter  # noqa: E402
+from app.models.user import User  # noqa: E402
+from main import app  # noqa: E402
+from tests.utils import SAMPLE_RESUME_LONG, create_test_pdf_multipage  # noqa: E402
+
+
+def percentile(samples, pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize(name: str, samples) -> str:
+    ms = [s * 1000 for s in samples]
+    return (
+        f"{name:<8} n={len(ms):<5} p50={statistics.median(ms):8.1f}ms "
+        f"p95={percentile(ms, 95):8.1f}ms p99={percentile(ms, 99):8.1f}ms max={max(ms):8.1f}ms"
+    )
+
+
+def create_user() -> User:
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    user = User(id=uuid4(), email=f"bench-{uuid4().hex[:8]}@example.com", password_hash="x", is_active=True)
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    db.expunge(user)
+    db.close()
+    return user
+
+
+async def run(concurrency: int, rounds: int, pages: int) -> None:
+    to_thread.current_default_thread_limiter().total_tokens = settings.API_THREADPOOL_SIZE
+    limiter.enabled = False
+    user = create_user()
+    app.dependency_overrides[get_current_active_user] = lambda: user
+
+    pdf_bytes = create_test_pdf_multipage(SAMPLE_RESUME_LONG, pages=pages, file_path=_tmp / "resume.pdf").read_bytes()
+    upload_latencies, probe_latencies = [], []
+    done = asyncio.Event()
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def upload():
+            start = time.perf_counter()
+            response = await client.post(
+                "/api/resumes/upload",
+                files={"file": ("resume.pdf", pdf_bytes, "application/pdf")},
+            )
+            upload_latencies.append(time.perf_counter() - start)
+            response.raise_for_status()
+
+        async def probe():
+            while not done.is_set():
+                start = time.perf_counter()
+                await client.get("/api/health")
+                probe_latencies.append(time.perf_counter() - start)
+                await asyncio.sleep(0.01)
+
+        probe_task = asyncio.create_task(probe())
+        started = time.perf_counter()
+        for _ in range(rounds):
+            await asyncio.gather(*(upload() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+        done.set()
+        await probe_task
+
+    print(f"{concurrency} concurrent uploads x {rounds} rounds, {pages}-page PDF, "
+          f"threadpool={settings.API_THREADPOOL_SIZE}: {elapsed:.2f}s total")
+    print(summarize("upload", upload_latencies))
+    print(summarize("probe", probe_latencies))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--pages", type=int, default=6)
+    args = parser.parse_args()
+    asyncio.run(run(args.concurrency, args.rounds, args.pages))
+
+
+if __name__ == "__main__":
+    main()
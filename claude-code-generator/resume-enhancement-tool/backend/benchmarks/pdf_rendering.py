@@ -0,0 +1,100 @@
+"""
+Benchmark: PDF render time per document, cold vs long-lived generator.
+
+"cold" builds a new PDFGenerator for every document, which is what each
+render used to cost: the template is read and its CSS parsed and WeasyPrint
+discovers fonts from scratch. "warm" renders the same documents through one
+PDFGenerator.render_many(), the way the worker and download routes now use
+it. The first warm render pays the one-off setup; it is reported separately.
+
+Requires WeasyPrint's system libraries (pango).
+
+Results: not yet measured. No cold/warm numbers exist for the long-lived
+generator, and tests/test_pdf_generator.py has not run against it: the
+change was made on a host without pango. Both run in the backend image,
+which installs it:
+
+    docker compose run --rm -e REQUIRE_WEASYPRINT=1 backend python -m pytest tests/test_pdf_generator.py
+    docker compose run --rm backend python benchmarks/pdf_rendering.py
+
+Record the benchmark output here before relying on the speedup.
+
+Usage (from backend/):
+    python benchmarks/pdf_rendering.py [--documents 20] [--template professional]
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from app.utils.pdf_generator import PDFGenerator  # noqa: E402
+from tests.utils import SAMPLE_RESUME_LONG  # noqa: E402
+
+TEMPLATES_DIR = BACKEND_DIR / "workspace" / "templates"
+
+
+def summarize(name: str, samples) -> str:
+    ms = [s * 1000 for s in samples]
+    return (
+        f"{name:<6} n={len(ms):<4} mean={statistics.mean(ms):8.1f}ms "
+        f"p50={statistics.median(ms):8.1f}ms min={min(ms):8.1f}ms max={max(ms):8.1f}ms"
+    )
+
+
+def write_documents(tmp: Path, count: int):
+    documents = []
+    for i in range(count):
+        md_path = tmp / f"resume_{i}.md"
+        # Vary content slightly so nothing below us can short-circuit on identical input
+        md_path.write_text(f"# Candidate {i}\n\n{SAMPLE_RESUME_LONG}", encoding="utf-8")
+        documents.append((md_path, tmp / f"resume_{i}.pdf"))
+    return documents
+
+
+def run(count: int, template: str) -> None:
+    tmp = Path(tempfile.mkdtemp(prefix="bench-pdf-"))
+    documents = write_documents(tmp, count)
+
+    cold = []
+    for md_path, pdf_path in documents:
+        start = time.perf_counter()
+        result = PDFGenerator(TEMPLATES_DIR).markdown_to_pdf(md_path, pdf_path, template=template)
+        cold.append(time.perf_counter() - start)
+        assert result["success"], result.get("error")
+
+    generator = PDFGenerator(TEMPLATES_DIR)
+    warm = []
+    for document in documents:
+        start = time.perf_counter()
+        [result] = generator.render_many([document], template=template)
+        warm.append(time.perf_counter() - start)
+        assert result["success"], result.get("error")
+
+    start = time.perf_counter()
+    generator.render_many(documents, template=template)
+    batch = time.perf_counter() - start
+
+    print(f"{count} documents, template={template}")
+    print(summarize("cold", cold))
+    print(f"warm   first={warm[0] * 1000:8.1f}ms (thread setup)")
+    print(summarize("warm", warm[1:]))
+    print(f"batch  render_many total={batch * 1000:8.1f}ms ({batch * 1000 / count:.1f}ms/document)")
+    print(f"speedup (cold mean / warm mean): {statistics.mean(cold) / statistics.mean(warm[1:]):.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=20)
+    parser.add_argument("--template", default="professional")
+    args = parser.parse_args()
+    run(max(2, args.documents), args.template)
+
+
+if __name__ == "__main__":
+    main()
@@ -17,6 +17,7 @@ SECURITY FEATURES:
 import logging
 from pathlib import Path
 
+from anyio import to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -71,7 +72,7 @@ from pathlib import Path
 debug_router = APIRouter()
 
 @debug_router.get("/debug/worker-status")
-async def get_worker_status():
+def get_worker_status():
     workspace = Path(settings.WORKSPACE_ROOT)
     status = {"status": "unknown"}
     
@@ -113,6 +114,12 @@ async def validate_config_on_startup():
     logger.info(f"Version: {settings.APP_VERSION}")
     logger.info(f"Debug mode: {settings.DEBUG}")
 
+    # Route handlers are sync `def` so FastAPI runs their blocking work (document
+    # parsing, bcrypt, PDF rendering, SQLAlchemy) off the event loop on this pool.
+    # CPU-heavy sections are further capped by app/core/concurrency.py
+    to_thread.current_default_thread_limiter().total_tokens = settings.API_THREADPOOL_SIZE
+    logger.info(f"Threadpool size: {settings.API_THREADPOOL_SIZE}")
+
     # Validate production configuration
     issues = settings.validate_production_config()
 
@@ -154,6 +161,12 @@ async def shutdown_event():
     """
     logger.info("Shutting down Resume Enhancement Tool API...")
 
+    # Stop document parsing worker processes
+    from app.api.dependencies import get_parse_pool
+    parse_pool = get_parse_pool()
+    if parse_pool is not None:
+        parse_pool.shutdown()
+
     # Close database connections
     try:
         from app.core.database import engine
@@ -0,0 +1,75 @@
+"""
+Tests for the single-pass achievement detector.
+
+This module tests:
+- Line filtering (quantified lines, headers, short lines)
+- One achievement per verb type per line, and character offsets
+- Batch detection across documents
+"""
+
+import pytest
+
+from app.utils.achievement_detector import AchievementDetector
+
+DOCUMENT = """EXPERIENCE:
+  Led the migration to a new billing platform.
+Improved build times by 40% across teams
+Developed and improved the onboarding flow for new customers
+Built it
+"""
+
+
+class TestDetectAchievements:
+    """Test detection in one document."""
+
+    @pytest.mark.unit
+    def test_lines_filtered_and_offsets_reported(self):
+        """Test that quantified, header and short lines are skipped and offsets point at the line."""
+        achievements = AchievementDetector().detect_achievements(DOCUMENT)
+
+        assert [a["location"] for a in achievements] == ["line 2", "line 4", "line 4"]
+        for achievement in achievements:
+            assert DOCUMENT[achievement["start"]:achievement["end"]] == achievement["achievement"]
+        assert achievements[0]["achievement"] == "Led the migration to a new billing platform."
+
+    @pytest.mark.unit
+    def test_one_achievement_per_type_on_a_line(self):
+        """Test that each verb type on a line is reported once, in type order."""
+        achievements = AchievementDetector().detect_achievements(
+            "Developed and improved the onboarding flow, and led the platform team through the rollout"
+        )
+
+        assert [(a["achievement_type"], a["verb"]) for a in achievements] == [
+            ("improvement", "improved"),
+            ("leadership", "led"),
+            ("creation", "developed"),
+        ]
+
+    @pytest.mark.unit
+    def test_leftmost_verb_of_a_type_wins(self):
+        """Test that a type seen twice on a line is reported for its first verb."""
+        [achievement] = AchievementDetector().detect_achievements(
+            "Improved reliability and increased coverage of the nightly test suite"
+        )
+
+        assert achievement["verb"] == "improved"
+        assert achievement["achievement_type"] == "improvement"
+
+    @pytest.mark.unit
+    def test_metric_on_another_line_does_not_count(self):
+        """Test that metrics are matched within a line only."""
+        text = "Reduced deployment failures for the platform team 5\nyears of on-call rotations"
+
+        assert len(AchievementDetector().detect_achievements(text)) == 1
+
+
+class TestDetectMany:
+    """Test batch detection."""
+
+    @pytest.mark.unit
+    def test_matches_per_document_detection(self):
+        """Test that detect_many equals detect_achievements per document."""
+        detector = AchievementDetector()
+        documents = [DOCUMENT, "", "Managed vendor relationships for the whole region", DOCUMENT]
+
+        assert detector.detect_many(documents) == [detector.detect_achievements(d) for d in documents]
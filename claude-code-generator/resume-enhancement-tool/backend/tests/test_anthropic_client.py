@@ -0,0 +1,337 @@
+"""
+Tests for the rate-limited Anthropic client wrapper.
+
+This module tests:
+- Token buckets and the in-flight ceiling
+- Resizing limits from anthropic-ratelimit-* headers
+- Retrying transient errors with backoff
+- Message Batches calls going through the limiter and retries
+- End-to-end retry of a 429 through the real SDK (mock transport)
+- Restarting a stream that fails part-way
+"""
+
+import json
+import threading
+import time
+
+import httpx
+import pytest
+from anthropic import Anthropic, APIStatusError, BadRequestError, InternalServerError, RateLimitError
+
+from app.services.anthropic_client import (
+    RateLimitedAnthropic,
+    RateLimiter,
+    TokenBucket,
+    is_retryable,
+)
+
+API_URL = "https://api.anthropic.com/v1/messages"
+
+MESSAGE_BODY = {
+    "id": "msg_1",
+    "type": "message",
+    "role": "assistant",
+    "model": "claude-sonnet-4-20250514",
+    "content": [{"type": "text", "text": "# Jane Doe"}],
+    "stop_reason": "end_turn",
+    "stop_sequence": None,
+    "usage": {"input_tokens": 10, "output_tokens": 5},
+}
+
+
+def sse(*events) -> bytes:
+    """Server-sent event stream body from (event, data) pairs."""
+    return "".join(f"event: {event}\ndata: {json.dumps(data)}\n\n" for event, data in events).encode()
+
+
+def text_stream_events(*texts, error_type=None):
+    """Messages streaming events for texts, ending in an error event if error_type is given."""
+    message = {**MESSAGE_BODY, "content": [], "stop_reason": None}
+    events = [
+        ("message_start", {"type": "message_start", "message": message}),
+        ("content_block_start", {"type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""}}),
+    ]
+    events += [
+        ("content_block_delta", {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": text}})
+        for text in texts
+    ]
+    if error_type:
+        return events + [("error", {"type": "error", "error": {"type": error_type, "message": "try later"}})]
+    return events + [
+        ("content_block_stop", {"type": "content_block_stop", "index": 0}),
+        ("message_delta", {"type": "message_delta", "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                           "usage": {"output_tokens": 5}}),
+        ("message_stop", {"type": "message_stop"}),
+    ]
+
+
+def api_error(error_class, status_code: int, headers: dict = None):
+    response = httpx.Response(status_code, headers=headers or {}, request=httpx.Request("POST", API_URL))
+    return error_class("error", response=response, body=None)
+
+
+class FakeMessages:
+    """messages.create that fails with the queued errors, then succeeds."""
+
+    def __init__(self, errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def create(self, **request):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "response"
+
+
+class FakeBatches:
+    """beta.messages.batches whose retrieve() fails with the queued errors, then succeeds."""
+
+    def __init__(self, errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def retrieve(self, batch_id):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return batch_id
+
+
+def wrapped(errors, max_retries: int = 3):
+    client = type("FakeClient", (), {"messages": FakeMessages(errors), "api_key": "key"})()
+    delays = []
+    wrapper = RateLimitedAnthropic(client, RateLimiter(), max_retries=max_retries, sleep=delays.append)
+    return wrapper, client.messages, delays
+
+
+class TestRateLimiter:
+    """Test token buckets and the concurrency ceiling."""
+
+    @pytest.mark.unit
+    def test_bucket_refills_over_time(self):
+        """Test that a drained bucket reports the time to refill."""
+        bucket = TokenBucket(per_minute=60)
+        now = bucket.updated
+        bucket.level = 0
+
+        assert bucket.wait_time(1, now) == pytest.approx(1.0)
+        assert bucket.wait_time(1, now + 1) == 0
+
+    @pytest.mark.unit
+    def test_headers_resize_buckets(self):
+        """Test that rate-limit headers replace the configured budgets."""
+        limiter = RateLimiter(requests_per_minute=50, input_tokens_per_minute=30000)
+
+        limiter.update({
+            "anthropic-ratelimit-requests-limit": "1000",
+            "anthropic-ratelimit-requests-remaining": "3",
+            "anthropic-ratelimit-input-tokens-limit": "400000",
+            "anthropic-ratelimit-input-tokens-remaining": "399000",
+        })
+
+        assert limiter.requests.capacity == 1000
+        assert limiter.requests.level == pytest.approx(3, abs=0.1)
+        assert limiter.input_tokens.capacity == 400000
+
+    @pytest.mark.unit
+    def test_429_pauses_requests_for_retry_after(self):
+        """Test that a 429 with retry-after blocks new requests."""
+        limiter = RateLimiter()
+
+        limiter.update({"retry-after": "30"}, status_code=429)
+
+        assert limiter.blocked_until > time.monotonic() + 25
+
+    @pytest.mark.unit
+    def test_concurrency_ceiling(self):
+        """Test that acquire blocks while max_concurrency requests are in flight."""
+        limiter = RateLimiter(max_concurrency=1)
+        limiter.acquire()
+        acquired = threading.Event()
+
+        thread = threading.Thread(target=lambda: (limiter.acquire(), acquired.set()))
+        thread.start()
+
+        assert not acquired.wait(0.1)
+        limiter.release()
+        assert acquired.wait(1)
+        thread.join()
+
+
+class TestRetries:
+    """Test retrying of transient API errors."""
+
+    @pytest.mark.unit
+    def test_retryable_errors(self):
+        assert is_retryable(api_error(RateLimitError, 429))
+        assert is_retryable(api_error(InternalServerError, 529))
+        assert not is_retryable(api_error(BadRequestError, 400))
+        assert not is_retryable(ValueError("bad prompt"))
+
+    @pytest.mark.unit
+    def test_retries_until_success(self):
+        """Test that 429 and overloaded errors are retried."""
+        wrapper, messages, delays = wrapped([
+            api_error(RateLimitError, 429),
+            api_error(InternalServerError, 529),
+        ])
+
+        assert wrapper.messages.create(model="m", messages=[]) == "response"
+        assert messages.calls == 3
+        assert len(delays) == 2
+
+    @pytest.mark.unit
+    def test_non_retryable_error_raises_immediately(self):
+        """Test that client errors are not retried."""
+        wrapper, messages, delays = wrapped([api_error(BadRequestError, 400)])
+
+        with pytest.raises(BadRequestError):
+            wrapper.messages.create(model="m", messages=[])
+        assert messages.calls == 1
+        assert delays == []
+
+    @pytest.mark.unit
+    def test_gives_up_after_max_retries(self):
+        """Test that the last error propagates once retries are exhausted."""
+        wrapper, messages, _ = wrapped([api_error(RateLimitError, 429)] * 3, max_retries=2)
+
+        with pytest.raises(RateLimitError):
+            wrapper.messages.create(model="m", messages=[])
+        assert messages.calls == 3
+
+    @pytest.mark.unit
+    def test_backoff_honours_retry_after(self):
+        """Test that the delay is never shorter than retry-after."""
+        wrapper, _, delays = wrapped([api_error(RateLimitError, 429, {"retry-after": "7"})])
+
+        wrapper.messages.create(model="m", messages=[])
+
+        assert delays[0] >= 7
+
+    @pytest.mark.unit
+    def test_slot_released_after_failure(self):
+        """Test that failed attempts do not leak in-flight slots."""
+        wrapper, _, _ = wrapped([api_error(BadRequestError, 400)])
+
+        with pytest.raises(BadRequestError):
+            wrapper.messages.create(model="m", messages=[])
+        assert wrapper.limiter.in_flight == 0
+
+
+class TestMessageBatches:
+    """Test Message Batches calls through the wrapper."""
+
+    @pytest.mark.unit
+    def test_batch_calls_limited_and_retried(self):
+        """Test that batch calls take a request from the limiter and retry 429s."""
+        batches = FakeBatches([api_error(RateLimitError, 429)])
+        beta = type("FakeBeta", (), {"messages": type("FakeBetaMessages", (), {"batches": batches})()})()
+        client = type("FakeClient", (), {"beta": beta})()
+        limiter = RateLimiter(requests_per_minute=10)
+        delays = []
+        wrapper = RateLimitedAnthropic(client, limiter, sleep=delays.append)
+
+        assert wrapper.message_batches.retrieve("msgbatch_1") == "msgbatch_1"
+        assert batches.calls == 2
+        assert len(delays) == 1
+        assert limiter.requests.level < 9
+        assert limiter.in_flight == 0
+
+
+class TestEndToEnd:
+    """Test the wrapper around a real SDK client."""
+
+    @pytest.mark.integration
+    def test_429_retried_and_headers_observed(self):
+        """Test a 429 followed by success, with limits learned from the response."""
+        responses = [
+            httpx.Response(429, headers={"retry-after": "0"}, json={
+                "type": "error", "error": {"type": "rate_limit_error", "message": "slow down"},
+            }),
+            httpx.Response(200, headers={
+                "anthropic-ratelimit-requests-limit": "4000",
+                "anthropic-ratelimit-requests-remaining": "3999",
+            }, json=MESSAGE_BODY),
+        ]
+        limiter = RateLimiter()
+        client = Anthropic(
+            api_key="test-key",
+            max_retries=0,
+            http_client=httpx.Client(
+                transport=httpx.MockTransport(lambda request: responses.pop(0)),
+                event_hooks={"response": [limiter.observe_response]},
+            ),
+        )
+        wrapper = RateLimitedAnthropic(client, limiter, sleep=lambda delay: None)
+
+        message = wrapper.messages.create(
+            model="claude-sonnet-4-20250514",
+            max_tokens=100,
+            messages=[{"role": "user", "content": "Enhance my resume"}],
+        )
+
+        assert message.content[0].text == "# Jane Doe"
+        assert limiter.requests.capacity == 4000
+        assert wrapper.api_key == "test-key"
+
+
+class TestMidStreamRetry:
+    """Test messages.stream_text() restarting streams that fail part-way."""
+
+    def stream_text(self, bodies):
+        """Stream through the wrapper against canned SSE bodies; returns (message, texts, restarts, requests)."""
+        requests = []
+
+        def respond(request):
+            requests.append(request)
+            return httpx.Response(200, headers={"content-type": "text/event-stream"}, content=bodies.pop(0))
+
+        client = Anthropic(
+            api_key="test-key",
+            max_retries=0,
+            http_client=httpx.Client(transport=httpx.MockTransport(respond)),
+        )
+        wrapper = RateLimitedAnthropic(client, RateLimiter(), max_retries=2, sleep=lambda delay: None)
+        texts, restarts = [], []
+
+        message = wrapper.messages.stream_text(
+            texts.append,
+            lambda: restarts.append(len(texts)),
+            model="claude-sonnet-4-20250514",
+            max_tokens=100,
+            messages=[{"role": "user", "content": "Enhance"}],
+        )
+        return message, texts, restarts, requests
+
+    @pytest.mark.unit
+    def test_overloaded_mid_stream_restarts(self):
+        """Test that an overloaded error event after some text restarts the stream."""
+        bodies = [
+            sse(*text_stream_events("# Ja", error_type="overloaded_error")),
+            sse(*text_stream_events("# Jane", " Doe")),
+        ]
+
+        message, texts, restarts, requests = self.stream_text(bodies)
+
+        assert message.content[0].text == "# Jane Doe"
+        assert texts == ["# Ja", "# Jane", " Doe"]
+        assert restarts == [1]  # Caller told to discard "# Ja"
+        assert len(requests) == 2
+
+    @pytest.mark.unit
+    def test_non_retryable_error_event_raises(self):
+        """Test that an invalid request error mid-stream is not retried."""
+        bodies = [sse(*text_stream_events("# Ja", error_type="invalid_request_error"))]
+
+        with pytest.raises(APIStatusError):
+            self.stream_text(bodies)
+
+    @pytest.mark.unit
+    def test_gives_up_after_max_retries(self):
+        """Test that a stream failing every time raises once retries are exhausted."""
+        bodies = [sse(*text_stream_events("# Ja", error_type="overloaded_error")) for _ in range(3)]
+
+        with pytest.raises(APIStatusError):
+            self.stream_text(bodies)
+        assert bodies == []
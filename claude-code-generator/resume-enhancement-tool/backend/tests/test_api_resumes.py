@@ -146,6 +146,30 @@ class TestResumeUpload:
         assert "too large" in response.json()["detail"].lower()
         assert "10 MB" in response.json()["detail"]
 
+    @pytest.mark.api
+    def test_upload_resume_chunked_body_too_large(self, client):
+        """Test that a body without Content-Length is cut off once over the limit."""
+        boundary = "test-boundary"
+
+        def body():
+            yield (
+                f"--{boundary}\r\n"
+                'Content-Disposition: form-data; name="file"; filename="large.pdf"\r\n'
+                "Content-Type: application/pdf\r\n\r\n"
+            ).encode()
+            for _ in range(11):
+                yield b"x" * (1024 * 1024)
+            yield f"\r\n--{boundary}--\r\n".encode()
+
+        response = client.post(
+            "/api/resumes/upload",
+            content=body(),
+            headers={"Content-Type": f"multipart/form-data; boundary={boundary}"},
+        )
+
+        assert response.status_code == 413
+        assert "10 MB" in response.json()["detail"]
+
     @pytest.mark.api
     def test_upload_resume_no_filename(self, client):
         """Test rejection when filename is missing."""
@@ -0,0 +1,93 @@
+"""
+Tests for the rendered PDF/DOCX download cache.
+
+This module tests:
+- Cache key construction
+- ETag / If-None-Match matching
+- Render-once behaviour and LRU eviction
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models import RenderedArtifact
+from app.services.artifact_cache import ArtifactCache, artifact_cache_key, etag_for, etag_matches
+
+
+class TestArtifactCacheKey:
+    """Test cache key and ETag helpers."""
+
+    @pytest.mark.unit
+    def test_every_input_changes_key(self):
+        """Test that markdown, format, template and version are all part of the key."""
+        base = artifact_cache_key("# Jane Doe", "pdf", "modern:abc", "1")
+
+        assert base == artifact_cache_key("# Jane Doe", "pdf", "modern:abc", "1")
+        assert base != artifact_cache_key("# John Roe", "pdf", "modern:abc", "1")
+        assert base != artifact_cache_key("# Jane Doe", "docx", "modern:abc", "1")
+        assert base != artifact_cache_key("# Jane Doe", "pdf", "modern:def", "1")
+        assert base != artifact_cache_key("# Jane Doe", "pdf", "modern:abc", "2")
+
+    @pytest.mark.unit
+    def test_etag_matching(self):
+        """Test If-None-Match lists, wildcards and weak tags."""
+        etag = etag_for("abc")
+
+        assert etag_matches('"abc"', etag)
+        assert etag_matches('"xyz", "abc"', etag)
+        assert etag_matches('W/"abc"', etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches('"xyz"', etag)
+        assert not etag_matches(None, etag)
+
+
+class TestArtifactCache:
+    """Test cache storage and eviction."""
+
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_renders_once(self, test_db):
+        """Test that a second request is served without rendering."""
+        cache = ArtifactCache()
+        renders = []
+
+        def render() -> bytes:
+            renders.append(1)
+            return b"%PDF-1.7"
+
+        assert cache.get_or_render(test_db, "key-1", "pdf", render) == b"%PDF-1.7"
+        assert cache.get_or_render(test_db, "key-1", "pdf", render) == b"%PDF-1.7"
+
+        assert len(renders) == 1
+        assert cache.stats() == {"hits": 1, "misses": 1}
+        assert test_db.get(RenderedArtifact, "key-1").size_bytes == 8
+
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_failed_render_is_not_cached(self, test_db):
+        """Test that render errors propagate and leave no entry."""
+        cache = ArtifactCache()
+
+        def render() -> bytes:
+            raise RuntimeError("WeasyPrint failed")
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_render(test_db, "key-1", "pdf", render)
+
+        assert test_db.get(RenderedArtifact, "key-1") is None
+
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_least_recently_used_entry_is_evicted(self, test_db):
+        """Test that exceeding max_entries evicts the entry unused for longest."""
+        cache = ArtifactCache(max_entries=2)
+        cache.put(test_db, "old", "pdf", b"a")
+        cache.put(test_db, "recent", "docx", b"b")
+        test_db.get(RenderedArtifact, "old").last_used_at = datetime.utcnow() - timedelta(hours=1)
+        test_db.commit()
+
+        cache.put(test_db, "new", "pdf", b"c")
+
+        remaining = {row.cache_key for row in test_db.query(RenderedArtifact)}
+        assert remaining == {"recent", "new"}
@@ -0,0 +1,65 @@
+"""
+Tests for keeping blocking work off the event loop.
+
+This module tests:
+- Route handlers are sync (run on the threadpool) except streaming endpoints
+- cpu_bound() caps concurrent CPU-heavy sections
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from fastapi.routing import APIRoute
+
+from app.core.concurrency import cpu_bound
+from app.core.config import settings
+from main import app
+
+# Endpoints allowed to be coroutines: the SSE loop awaits, root does no I/O
+ASYNC_ENDPOINTS = {"stream_enhancement", "root"}
+
+
+class TestRouteHandlers:
+    """Test that handlers doing blocking I/O don't run on the event loop."""
+
+    @pytest.mark.unit
+    def test_blocking_routes_are_sync(self):
+        """Test that every API route except streaming is a plain function."""
+        offenders = [
+            route.path
+            for route in app.routes
+            if isinstance(route, APIRoute)
+            and route.endpoint.__name__ not in ASYNC_ENDPOINTS
+            and asyncio.iscoroutinefunction(route.endpoint)
+        ]
+
+        assert offenders == []
+
+
+class TestCpuBound:
+    """Test the CPU-heavy work limiter."""
+
+    @pytest.mark.unit
+    def test_caps_concurrent_sections(self):
+        """Test that no more than API_CPU_CONCURRENCY sections run at once."""
+        lock = threading.Lock()
+        active = {"now": 0, "peak": 0}
+
+        def work():
+            with cpu_bound():
+                with lock:
+                    active["now"] += 1
+                    active["peak"] = max(active["peak"], active["now"])
+                time.sleep(0.02)
+                with lock:
+                    active["now"] -= 1
+
+        threads = [threading.Thread(target=work) for _ in range(settings.API_CPU_CONCURRENCY * 3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert active["peak"] == settings.API_CPU_CONCURRENCY
@@ -0,0 +1,161 @@
+"""
+Tests for single-parse document export.
+
+This module tests:
+- parse_markdown() tree and HTML
+- DOCX rendering from the parsed tree
+- DocumentExporter.export_all() per-format results
+"""
+
+import xml.etree.ElementTree as etree
+
+import pytest
+from docx import Document
+
+from app.utils.document_exporter import DocumentExporter
+from app.utils.docx_generator import DOCXGenerator
+from app.utils.markdown_document import parse_markdown
+
+RESUME = """# Jane Doe
+**Senior Engineer** | R&D
+jane@example.com
+
+## Experience
+- Built **APIs** with *FastAPI*, see [site](https://example.com)
+- Cut costs 30%
+    - Nested detail
+
+1. First
+2. Second
+
+---
+
+| Skill | Years |
+|-------|-------|
+| Python | 8 |
+"""
+
+
+# Layout resume_guidelines.py asks for: bullets right under the dates line
+GUIDELINE_RESUME = """## Experience
+**Senior Engineer** | Acme Corp
+*Jan 2020 - Present*
+- Led migration of 40 services
+- Built the billing API
+    - Nested
+1. Ordered
+"""
+
+
+class TestParseMarkdown:
+    """Test the shared markdown parse."""
+
+    @pytest.mark.unit
+    def test_tree_and_html_come_from_one_parse(self):
+        """Test that the tree holds the same blocks the HTML does."""
+        document = parse_markdown(RESUME)
+
+        assert [child.tag for child in document.root] == ["h1", "p", "h2", "ul", "ol", "hr", "table"]
+        assert "<h1>Jane Doe</h1>" in document.html
+        assert "<strong>APIs</strong>" in document.html
+
+    @pytest.mark.unit
+    def test_stashed_html_is_plain_text_in_tree(self):
+        """Test that entities and fenced code resolve to text in the tree."""
+        document = parse_markdown("R&amp;D\n\n```\nx < y\n```\n")
+        text = "".join(document.root.itertext())
+
+        assert "R&D" in text
+        assert "x < y" in text
+        assert "\x02" not in text
+
+    @pytest.mark.unit
+    def test_blank_input(self):
+        """Test that blank markdown parses to an empty document."""
+        document = parse_markdown("   \n")
+
+        assert document.html == ""
+        assert len(document.root) == 0
+
+
+class TestDOCXFromTree:
+    """Test DOCX rendering from the parsed tree."""
+
+    @pytest.mark.unit
+    def test_structure_and_inline_formatting(self, tmp_path):
+        """Test headings, lists, inline runs and tables."""
+        md_path = tmp_path / "resume.md"
+        md_path.write_text(RESUME, encoding="utf-8")
+        docx_path = tmp_path / "resume.docx"
+
+        DOCXGenerator().markdown_to_docx(md_path, docx_path)
+        doc = Document(str(docx_path))
+        paragraphs = [(p.style.name, p.text) for p in doc.paragraphs]
+
+        assert ("Heading 1", "Jane Doe") in paragraphs
+        assert ("Heading 2", "Experience") in paragraphs
+        assert ("List Bullet 2", "Nested detail") in paragraphs
+        assert ("List Number", "Second") in paragraphs
+
+        bullet = next(p for p in doc.paragraphs if p.text.startswith("Built"))
+        assert [r.text for r in bullet.runs if r.bold] == ["APIs"]
+        assert [r.text for r in bullet.runs if r.italic] == ["FastAPI"]
+        assert "**" not in bullet.text
+
+        assert [cell.text for cell in doc.tables[0].rows[1].cells] == ["Python", "8"]
+
+    @pytest.mark.unit
+    def test_lists_directly_after_paragraph(self, tmp_path):
+        """Test bullets that follow the title/company/dates lines with no blank line."""
+        docx_path = tmp_path / "guidelines.docx"
+
+        DOCXGenerator().create_from_text(GUIDELINE_RESUME, docx_path)
+        paragraphs = [(p.style.name, p.text) for p in Document(str(docx_path)).paragraphs]
+
+        assert ("List Bullet", "Led migration of 40 services") in paragraphs
+        assert ("List Bullet", "Built the billing API") in paragraphs
+        assert ("List Bullet 2", "Nested") in paragraphs
+        assert ("List Number", "Ordered") in paragraphs
+        assert not any(text.lstrip().startswith("- ") for _, text in paragraphs)
+
+    @pytest.mark.unit
+    def test_code_block_and_container_text(self, tmp_path):
+        """Test that code blocks and text directly inside containers aren't dropped."""
+        markdown = "## Projects\n\nConfig:\n\n    deploy: true\n    replicas: 3\n\n> Quoted\n"
+        docx_path = tmp_path / "code.docx"
+
+        generator = DOCXGenerator()
+        generator.create_from_text(markdown, docx_path)
+        code = next(p for p in Document(str(docx_path)).paragraphs if "deploy" in p.text)
+
+        assert code.text == "deploy: true\nreplicas: 3"
+        assert {run.font.name for run in code.runs if run.text} == {"Courier New"}
+
+        doc = Document()
+        generator._add_blocks(doc, etree.fromstring("<div><blockquote>Loose text<p>Block</p>Tail text</blockquote></div>"))
+        assert [p.text for p in doc.paragraphs] == ["Loose text", "Block", "Tail text"]
+
+
+class TestExportAll:
+    """Test exporting several formats at once."""
+
+    @pytest.mark.unit
+    def test_failed_format_does_not_block_others(self, tmp_path):
+        """Test that DOCX is written when PDF export is unavailable."""
+        md_path = tmp_path / "resume.md"
+        md_path.write_text(RESUME, encoding="utf-8")
+        exporter = DocumentExporter(None, DOCXGenerator())
+
+        results = exporter.export_all(md_path, {"pdf": tmp_path / "resume.pdf", "docx": tmp_path / "out" / "resume.docx"})
+
+        assert results["docx"]["success"] is True
+        assert (tmp_path / "out" / "resume.docx").exists()
+        assert results["pdf"]["success"] is False
+
+    @pytest.mark.unit
+    def test_unknown_format_rejected(self, tmp_path):
+        """Test that unsupported formats raise before anything is written."""
+        exporter = DocumentExporter(None, DOCXGenerator())
+
+        with pytest.raises(ValueError):
+            exporter.export_all(tmp_path / "resume.md", {"rtf": tmp_path / "resume.rtf"})
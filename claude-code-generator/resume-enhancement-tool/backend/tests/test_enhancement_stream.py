@@ -0,0 +1,172 @@
+"""
+Tests for streaming enhancement progress over server-sent events.
+
+This module tests:
+- Delta frames built from partial and final content
+- Restarted generations and status changes
+- When a stream is considered finished
+- The /enhancements/{id}/stream endpoint
+"""
+
+import json
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.api.dependencies import get_current_active_user
+from app.api.routes import enhancements as enhancement_routes
+from app.api.routes.enhancements import build_stream_events
+from app.models import Enhancement
+from main import app
+
+
+def make_row(**overrides) -> SimpleNamespace:
+    """Build a stand-in for an Enhancement row."""
+    fields = {
+        "job_id": uuid4(),
+        "status": "pending",
+        "cover_letter_status": "pending",
+        "enhanced_content": None,
+        "cover_letter_content": None,
+        "partial_content": None,
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def parse_frames(frames) -> list:
+    """Turn SSE frames into (event, data) pairs."""
+    events = []
+    for frame in frames:
+        lines = frame.strip().split("\n")
+        event = lines[0].removeprefix("event: ")
+        data = json.loads(lines[1].removeprefix("data: "))
+        events.append((event, data))
+    return events
+
+
+class TestBuildStreamEvents:
+    """Test SSE frame building."""
+
+    @pytest.mark.unit
+    def test_partial_content_is_sent_as_deltas(self):
+        """Test that only newly streamed text is sent on each poll."""
+        sent = {}
+        build_stream_events(make_row(partial_content="# Jane"), sent)
+
+        frames, finished = build_stream_events(make_row(partial_content="# Jane Doe"), sent)
+
+        assert parse_frames(frames) == [("resume", {"text": " Doe"})]
+        assert finished is False
+
+    @pytest.mark.unit
+    def test_cover_letter_follows_final_resume(self):
+        """Test that partial content is attributed to the cover letter once the resume is stored."""
+        sent = {}
+        build_stream_events(make_row(partial_content="# Jane"), sent)
+
+        row = make_row(
+            status="completed",
+            cover_letter_status="in_progress",
+            enhanced_content="# Jane Doe",
+            partial_content="Dear",
+        )
+        events = parse_frames(build_stream_events(row, sent)[0])
+
+        assert ("resume", {"text": " Doe"}) in events
+        assert ("cover_letter", {"text": "Dear"}) in events
+
+    @pytest.mark.unit
+    def test_shorter_text_sends_reset(self):
+        """Test that a restarted generation resets the client's text."""
+        sent = {}
+        build_stream_events(make_row(partial_content="# Jane Doe"), sent)
+
+        frames, _ = build_stream_events(make_row(partial_content="# J"), sent)
+
+        assert parse_frames(frames) == [
+            ("reset", {"phase": "resume"}),
+            ("resume", {"text": "# J"}),
+        ]
+
+    @pytest.mark.unit
+    def test_status_sent_only_on_change(self):
+        """Test that unchanged statuses are not repeated."""
+        sent = {}
+        first, _ = build_stream_events(make_row(), sent)
+        second, _ = build_stream_events(make_row(), sent)
+
+        assert parse_frames(first) == [
+            ("status", {"status": "pending", "cover_letter_status": "pending"})
+        ]
+        assert second == []
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "overrides, expected",
+        [
+            ({"status": "completed", "cover_letter_status": "in_progress"}, False),
+            ({"status": "completed", "cover_letter_status": "completed"}, True),
+            ({"status": "completed", "cover_letter_status": "pending", "job_id": None}, True),
+            ({"status": "failed"}, True),
+        ],
+    )
+    def test_finished(self, overrides, expected):
+        """Test when the stream ends, including revamps without a cover letter."""
+        frames, finished = build_stream_events(make_row(**overrides), {})
+
+        assert finished is expected
+        assert (parse_frames(frames)[-1][0] == "done") is expected
+
+
+class TestStreamEndpoint:
+    """Test the /enhancements/{id}/stream endpoint."""
+
+    @pytest.fixture
+    def stream_user(self, client, test_db, monkeypatch):
+        """Authenticate as a fixed user and point the stream loop at the test database."""
+        user = SimpleNamespace(id=uuid4(), email="stream@example.com", is_active=True)
+        app.dependency_overrides[get_current_active_user] = lambda: user
+        monkeypatch.setattr(
+            enhancement_routes, "SessionLocal", sessionmaker(bind=test_db.get_bind())
+        )
+        return user
+
+    @pytest.mark.integration
+    @pytest.mark.api
+    def test_completed_enhancement_streams_full_text(self, client, test_db, stream_user):
+        """Test that a finished enhancement replays its content and closes."""
+        enhancement = Enhancement(
+            user_id=stream_user.id,
+            resume_id=uuid4(),
+            enhancement_type="industry_revamp",
+            status="completed",
+            enhanced_content="# Jane Doe",
+        )
+        test_db.add(enhancement)
+        test_db.commit()
+
+        response = client.get(f"/api/enhancements/{enhancement.id}/stream")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert "event: resume\ndata: {\"text\": \"# Jane Doe\"}" in response.text
+        assert response.text.rstrip().split("\n")[-2] == "event: done"
+
+    @pytest.mark.integration
+    @pytest.mark.api
+    def test_other_users_enhancement_returns_404(self, client, test_db, stream_user):
+        """Test that streams are subject to the usual ownership check."""
+        enhancement = Enhancement(
+            user_id=uuid4(),
+            resume_id=uuid4(),
+            enhancement_type="industry_revamp",
+        )
+        test_db.add(enhancement)
+        test_db.commit()
+
+        response = client.get(f"/api/enhancements/{enhancement.id}/stream")
+
+        assert response.status_code == 404
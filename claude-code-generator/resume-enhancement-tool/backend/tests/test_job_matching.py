@@ -0,0 +1,265 @@
+"""
+Tests for ranking saved jobs against one resume.
+
+This module tests:
+- ATSAnalyzer.rank_jobs scoring, ordering and limits
+- Agreement with calculate_match_score for single pairs
+- BM25 relevance scoring and incremental index updates
+- The POST /resumes/{id}/match endpoint
+"""
+
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.api.dependencies import get_current_active_user, get_relevance_index
+from app.models import Job, Resume
+from app.services.relevance_index import JobRelevanceIndex
+from app.utils.ats_analyzer import ATSAnalyzer
+from app.utils.relevance_engine import BM25Index, tokenize
+from main import app
+
+RESUME = "Senior engineer: Python, Django, PostgreSQL and AWS. Known for mentoring and leadership."
+
+
+def keywords(**groups):
+    return {
+        "technical_skills": groups.get("technical_skills", []),
+        "soft_skills": groups.get("soft_skills", []),
+        "action_verbs": [],
+        "certifications": groups.get("certifications", []),
+        "tools": [],
+    }
+
+
+class TestRankJobs:
+    """Test bitset scoring of many jobs."""
+
+    @pytest.mark.unit
+    def test_jobs_ranked_by_score_then_matches(self):
+        """Test ordering; ties keep input order."""
+        analyzer = ATSAnalyzer()
+        resume = keywords(technical_skills=["python", "django"], soft_skills=["leadership"])
+        jobs = [
+            ("half", keywords(technical_skills=["python", "react"])),
+            ("full", keywords(technical_skills=["python", "django"], soft_skills=["leadership"])),
+            ("none", keywords(technical_skills=["java"])),
+            ("half-small", keywords(technical_skills=["django", "go"])),
+        ]
+
+        ranked = analyzer.rank_jobs(resume, jobs)
+
+        assert [key for key, _ in ranked] == ["full", "half", "half-small", "none"]
+        assert ranked[0][1]["match_score"] == 100
+        assert ranked[1][1]["keywords_found"] == ["python"]
+        assert ranked[1][1]["keywords_missing"] == ["react"]
+        assert ranked[-1][1]["match_score"] == 0
+
+    @pytest.mark.unit
+    def test_limit(self):
+        """Test that only the best N jobs are returned."""
+        analyzer = ATSAnalyzer()
+        resume = keywords(technical_skills=["python"])
+        jobs = [(i, keywords(technical_skills=["python"] if i == 3 else ["java"])) for i in range(10)]
+
+        ranked = analyzer.rank_jobs(resume, jobs, limit=2)
+
+        assert [key for key, _ in ranked] == [3, 0]
+
+    @pytest.mark.unit
+    def test_matches_single_pair_analysis(self):
+        """Test that batch results equal calculate_match_score for each job."""
+        analyzer = ATSAnalyzer()
+        job_texts = [
+            "Python and Kubernetes engineer with strong communication",
+            "Django developer, PostgreSQL, AWS certified",
+            "Nothing relevant here",
+        ]
+        resume_keywords = analyzer.extract_keywords(RESUME)
+        job_keywords = [analyzer.extract_keywords(text) for text in job_texts]
+
+        ranked = dict(analyzer.rank_jobs(resume_keywords, enumerate(job_keywords)))
+
+        for i, keywords_ in enumerate(job_keywords):
+            assert ranked[i] == analyzer.calculate_match_score(resume_keywords, keywords_)
+
+
+class TestRelevance:
+    """Test the BM25 index."""
+
+    @pytest.mark.unit
+    def test_tokenize_keeps_technical_terms(self):
+        """Test that c++, node.js and ci/cd survive tokenization and stopwords go."""
+        assert tokenize("We use C++, Node.js and CI/CD with the team.") == ["use", "c++", "node.js", "ci/cd", "team"]
+
+    @pytest.mark.unit
+    def test_rare_terms_outweigh_common_ones(self):
+        """Test IDF weighting and top contributing terms."""
+        index = BM25Index()
+        index.add("infra", "Experience with Terraform and Python. Team player.")
+        index.add("web", "Experience with Python and React. Team player.")
+        index.add("data", "Experience with Python and Spark. Team player.")
+
+        results = index.score("Python developer, Terraform, team lead")
+
+        assert results[0].doc_id == "infra"
+        assert results[0].top_terms[0][0] == "terraform"
+        assert index.idf("python") < index.idf("terraform")
+
+    @pytest.mark.unit
+    def test_incremental_updates_match_rebuild(self):
+        """Test that adding and removing documents equals building from scratch."""
+        incremental = BM25Index()
+        incremental.add(1, "Python and Django")
+        incremental.add(2, "Go and Kubernetes")
+        incremental.add(3, "Rust and WebAssembly")
+        incremental.remove(2)
+        incremental.add(1, "Python, Django and Celery")
+
+        rebuilt = BM25Index()
+        rebuilt.add(3, "Rust and WebAssembly")
+        rebuilt.add(1, "Python, Django and Celery")
+
+        query = "Python Celery Rust Kubernetes"
+        assert len(incremental) == 2
+        assert {r.doc_id: r.score for r in incremental.score(query)} == {r.doc_id: r.score for r in rebuilt.score(query)}
+
+    @pytest.mark.unit
+    def test_scores_only_requested_documents(self):
+        """Test that doc_ids restricts scoring; unknown ids score 0."""
+        index = BM25Index()
+        index.add(1, "Python")
+        index.add(2, "Python")
+
+        results = index.score("python", doc_ids=[2, 99])
+
+        assert [r.doc_id for r in results] == [2, 99]
+        assert results[1].score == 0
+
+    @pytest.mark.database
+    def test_sync_picks_up_jobs_from_other_writers(self, test_db):
+        """Test that jobs written elsewhere are indexed and deleted ones dropped."""
+        index = JobRelevanceIndex(sync_interval=3600)
+        job = Job(user_id=uuid4(), title="A", description_text="Python", file_path="a.txt", source="paste")
+        test_db.add(job)
+        test_db.commit()
+
+        assert index.sync(test_db) == 1
+        assert index.sync(test_db) == 0  # Within sync_interval
+
+        test_db.delete(job)
+        test_db.commit()
+        assert index.sync(test_db, force=True) == 1
+        assert len(index) == 0
+
+    @pytest.mark.database
+    def test_sync_queries_outside_the_lock(self, test_db):
+        """Test that the database is read without holding the lock score() needs."""
+        index = JobRelevanceIndex(sync_interval=0, batch_size=1)
+        for title in ("A", "B"):
+            test_db.add(Job(user_id=uuid4(), title=title, description_text="Python", file_path="a.txt", source="paste"))
+        test_db.commit()
+        held = []
+
+        class Recording:
+            def query(self, *entities):
+                held.append(index._lock.locked())
+                return test_db.query(*entities)
+
+        assert index.sync(Recording()) == 2
+        assert held == [False, False, False]
+        assert len(index) == 2
+
+
+class TestMatchEndpoint:
+    """Test POST /resumes/{id}/match."""
+
+    @pytest.fixture
+    def match_user(self, client):
+        user = SimpleNamespace(id=uuid4(), email="match@example.com", is_active=True)
+        relevance_index = JobRelevanceIndex(sync_interval=0)
+        app.dependency_overrides[get_current_active_user] = lambda: user
+        app.dependency_overrides[get_relevance_index] = lambda: relevance_index
+        return user
+
+    def add_resume(self, test_db, user_id):
+        resume = Resume(
+            user_id=user_id,
+            filename="resume.pdf",
+            original_format="pdf",
+            file_path="source.pdf",
+            extracted_text_path="extracted.txt",
+            extracted_text=RESUME,
+            file_size_bytes=100,
+        )
+        test_db.add(resume)
+        test_db.commit()
+        return resume
+
+    def add_job(self, test_db, user_id, title, description):
+        job = Job(
+            user_id=user_id,
+            title=title,
+            description_text=description,
+            file_path="description.txt",
+            source="paste",
+        )
+        test_db.add(job)
+        test_db.commit()
+        return job
+
+    @pytest.mark.integration
+    @pytest.mark.api
+    def test_ranks_users_jobs(self, client, test_db, match_user):
+        """Test that all of the user's jobs are ranked and others ignored."""
+        resume = self.add_resume(test_db, match_user.id)
+        best = self.add_job(test_db, match_user.id, "Backend", "Python, Django and PostgreSQL")
+        worst = self.add_job(test_db, match_user.id, "Frontend", "React, TypeScript and Python")
+        self.add_job(test_db, uuid4(), "Someone else's", "Python, Django and PostgreSQL")
+
+        response = client.post(f"/api/resumes/{resume.id}/match", json={})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["jobs_scored"] == 2
+        assert [m["job_id"] for m in data["matches"]] == [str(best.id), str(worst.id)]
+        assert data["matches"][0]["match_score"] == 100
+        assert "react" in data["matches"][1]["keywords_missing"]
+        assert data["matches"][0]["relevance_score"] > 0
+
+    @pytest.mark.integration
+    @pytest.mark.api
+    def test_rank_by_relevance(self, client, test_db, match_user):
+        """Test ordering by BM25 relevance, which sees terms outside the taxonomy."""
+        resume = self.add_resume(test_db, match_user.id)
+        self.add_job(test_db, match_user.id, "Generic", "Python role")
+        specific = self.add_job(test_db, match_user.id, "Mentor", "Python role: mentoring juniors, senior engineer")
+
+        response = client.post(f"/api/resumes/{resume.id}/match", json={"rank_by": "relevance", "limit": 1})
+
+        assert response.status_code == 200
+        [match] = response.json()["matches"]
+        assert match["job_id"] == str(specific.id)
+        assert "senior" in match["relevance_terms"]
+
+    @pytest.mark.integration
+    @pytest.mark.api
+    def test_unknown_job_returns_404(self, client, test_db, match_user):
+        """Test that requesting another user's job is rejected."""
+        resume = self.add_resume(test_db, match_user.id)
+        other = self.add_job(test_db, uuid4(), "Someone else's", "Python")
+
+        response = client.post(f"/api/resumes/{resume.id}/match", json={"job_ids": [str(other.id)]})
+
+        assert response.status_code == 404
+
+    @pytest.mark.integration
+    @pytest.mark.api
+    def test_other_users_resume_returns_404(self, client, test_db, match_user):
+        """Test the usual ownership check."""
+        resume = self.add_resume(test_db, uuid4())
+
+        response = client.post(f"/api/resumes/{resume.id}/match", json={})
+
+        assert response.status_code == 404
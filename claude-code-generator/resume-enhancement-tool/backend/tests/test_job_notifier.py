@@ -0,0 +1,149 @@
+"""
+Tests for job notifiers - waking the worker when enhancements are queued.
+
+This module tests:
+- In-process notifications (shared API/worker process)
+- Loopback UDP notifications (SQLite / single-host deployments)
+- Backend selection from settings values
+- Listener connection strings from SQLAlchemy URLs
+"""
+
+import socket
+import threading
+import time
+
+import pytest
+
+from app.services.job_notifier import (
+    JobNotifier,
+    InProcessJobNotifier,
+    LocalSocketJobNotifier,
+    PostgresJobNotifier,
+    create_job_notifier,
+    libpq_dsn,
+)
+
+
+def free_udp_port() -> int:
+    """Find a free loopback UDP port."""
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+class TestInProcessJobNotifier:
+    """Test the in-process notifier."""
+
+    @pytest.mark.unit
+    def test_wait_times_out_without_notification(self):
+        """Test that wait returns False when nothing is published."""
+        notifier = InProcessJobNotifier()
+
+        assert notifier.wait(timeout=0.05) is False
+
+    @pytest.mark.unit
+    def test_notify_before_wait_is_not_lost(self):
+        """Test that a notification published before wait is delivered."""
+        notifier = InProcessJobNotifier()
+        notifier.notify()
+
+        assert notifier.wait(timeout=0.05) is True
+        assert notifier.wait(timeout=0.05) is False
+
+    @pytest.mark.unit
+    def test_notify_wakes_waiting_thread(self):
+        """Test that a blocked waiter wakes well before its timeout."""
+        notifier = InProcessJobNotifier()
+        results = []
+
+        def waiter():
+            start = time.monotonic()
+            results.append((notifier.wait(timeout=5), time.monotonic() - start))
+
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        time.sleep(0.05)
+        notifier.notify()
+        thread.join()
+
+        notified, elapsed = results[0]
+        assert notified is True
+        assert elapsed < 1
+
+
+class TestLocalSocketJobNotifier:
+    """Test the loopback UDP notifier."""
+
+    @pytest.mark.unit
+    def test_notify_reaches_listener(self):
+        """Test that a datagram from the API side wakes the listener."""
+        port = free_udp_port()
+        listener = LocalSocketJobNotifier(port)
+        try:
+            assert listener.wait(timeout=0.05) is False
+
+            LocalSocketJobNotifier(port).notify()
+
+            assert listener.wait(timeout=1) is True
+        finally:
+            listener.close()
+
+    @pytest.mark.unit
+    def test_burst_is_drained_in_one_wake(self):
+        """Test that several queued notifications produce a single wake-up."""
+        port = free_udp_port()
+        listener = LocalSocketJobNotifier(port)
+        try:
+            listener.wait(timeout=0.01)  # bind
+            sender = LocalSocketJobNotifier(port)
+            for _ in range(5):
+                sender.notify()
+            time.sleep(0.05)
+
+            assert listener.wait(timeout=1) is True
+            assert listener.wait(timeout=0.05) is False
+        finally:
+            listener.close()
+
+    @pytest.mark.unit
+    def test_notify_without_listener_does_not_raise(self):
+        """Test that publishing with no worker listening is harmless."""
+        LocalSocketJobNotifier(free_udp_port()).notify()
+
+
+class TestCreateJobNotifier:
+    """Test notifier backend selection."""
+
+    @pytest.mark.unit
+    def test_auto_selects_postgres_for_postgres_url(self):
+        notifier = create_job_notifier("auto", "postgresql://u:p@localhost/db", 47200)
+        assert isinstance(notifier, PostgresJobNotifier)
+
+    @pytest.mark.unit
+    def test_auto_selects_socket_for_sqlite(self):
+        notifier = create_job_notifier("auto", "sqlite:///./test.db", 47200)
+        assert isinstance(notifier, LocalSocketJobNotifier)
+
+    @pytest.mark.unit
+    def test_explicit_backends(self):
+        assert isinstance(create_job_notifier("inprocess", "sqlite://", 0), InProcessJobNotifier)
+        assert type(create_job_notifier("none", "sqlite://", 0)) is JobNotifier
+
+    @pytest.mark.unit
+    def test_invalid_backend_raises(self):
+        with pytest.raises(ValueError):
+            create_job_notifier("redis", "sqlite://", 0)
+
+
+class TestLibpqDsn:
+    """Test the connection string the Postgres listener connects with."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("url, expected", [
+        ("postgresql+psycopg2://u:p@db:5432/app", "postgresql://u:p@db:5432/app"),
+        ("postgresql://u:p@localhost/app", "postgresql://u:p@localhost/app"),
+        ("postgresql+psycopg2://u:p%40ss@db/app?sslmode=require", "postgresql://u:p%40ss@db/app?sslmode=require"),
+    ])
+    def test_sqlalchemy_url_converted(self, url, expected):
+        """Test that the driver suffix is dropped and credentials and options kept."""
+        assert libpq_dsn(url) == expected
@@ -0,0 +1,193 @@
+"""
+Tests for EnhancementQueue - row-level job claiming for the worker.
+
+This module tests:
+- Claiming pending enhancements and cover letters in created_at order
+- Lease exclusivity between worker slots
+- Lease expiry for crashed-worker recovery
+- Concurrent claiming from multiple threads without duplicates
+"""
+
+import threading
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base
+from app.models import Enhancement
+from app.services.job_queue import EnhancementQueue
+
+
+@pytest.fixture(scope="function")
+def queue_session_factory(tmp_path):
+    """File-backed SQLite database so each session gets its own connection."""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'queue.db'}",
+        connect_args={"check_same_thread": False, "timeout": 30},
+    )
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+
+
+def add_enhancement(db, minutes_ago: int, **overrides) -> Enhancement:
+    """Insert an enhancement row created `minutes_ago` minutes in the past."""
+    fields = {
+        "id": uuid4(),
+        "user_id": uuid4(),
+        "resume_id": uuid4(),
+        "job_id": uuid4(),
+        "enhancement_type": "job_tailoring",
+        "status": "pending",
+        "created_at": datetime.utcnow() - timedelta(minutes=minutes_ago),
+    }
+    fields.update(overrides)
+    enhancement = Enhancement(**fields)
+    db.add(enhancement)
+    db.commit()
+    return enhancement
+
+
+class TestClaimEnhancement:
+    """Test claiming of pending enhancements."""
+
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_claims_oldest_pending_first(self, queue_session_factory):
+        """Test that the oldest pending row is claimed and leased."""
+        db = queue_session_factory()
+        newer = add_enhancement(db, minutes_ago=1)
+        older = add_enhancement(db, minutes_ago=5)
+
+        claimed = EnhancementQueue().claim_enhancement(db, "host:1:0")
+
+        assert claimed.id == older.id
+        assert claimed.claimed_by == "host:1:0"
+        assert claimed.lease_expires_at > datetime.utcnow()
+        assert newer.id != claimed.id
+        db.close()
+
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_claimed_row_not_claimed_twice(self, queue_session_factory):
+        """Test that a second worker skips rows already under lease."""
+        db_a = queue_session_factory()
+        db_b = queue_session_factory()
+        first = add_enhancement(db_a, minutes_ago=5)
+        second = add_enhancement(db_a, minutes_ago=1)
+        queue = EnhancementQueue()
+
+        claimed_a = queue.claim_enhancement(db_a, "host:1:0")
+        claimed_b = queue.claim_enhancement(db_b, "host:2:0")
+
+        assert claimed_a.id == first.id
+        assert claimed_b.id == second.id
+        assert queue.claim_enhancement(db_b, "host:2:0") is None
+        db_a.close()
+        db_b.close()
+
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_expired_lease_is_reclaimable(self, queue_session_factory):
+        """Test that rows abandoned by a crashed worker are recovered."""
+        db = queue_session_factory()
+        add_enhancement(
+            db,
+            minutes_ago=5,
+            claimed_by="crashed:1:0",
+            lease_expires_at=datetime.utcnow() - timedelta(seconds=1),
+        )
+
+        claimed = EnhancementQueue().claim_enhancement(db, "host:1:0")
+
+        assert claimed is not None
+        assert claimed.claimed_by == "host:1:0"
+        db.close()
+
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_release_clears_lease(self, queue_session_factory):
+        """Test that releasing a row clears its lease columns."""
+        db = queue_session_factory()
+        add_enhancement(db, minutes_ago=5)
+        queue = EnhancementQueue()
+
+        claimed = queue.claim_enhancement(db, "host:1:0")
+        queue.release(db, claimed)
+
+        db.refresh(claimed)
+        assert claimed.claimed_by is None
+        assert claimed.lease_expires_at is None
+        db.close()
+
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_skips_non_pending(self, queue_session_factory):
+        """Test that completed and failed rows are never claimed."""
+        db = queue_session_factory()
+        add_enhancement(db, minutes_ago=5, status="completed")
+        add_enhancement(db, minutes_ago=4, status="failed")
+
+        assert EnhancementQueue().claim_enhancement(db, "host:1:0") is None
+        db.close()
+
+
+class TestClaimCoverLetter:
+    """Test claiming of pending cover letters."""
+
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_claims_completed_job_tailoring_only(self, queue_session_factory):
+        """Test that only completed job-tailoring rows with pending letters are claimed."""
+        db = queue_session_factory()
+        add_enhancement(db, minutes_ago=6, status="pending")
+        add_enhancement(
+            db, minutes_ago=5, status="completed", job_id=None, enhancement_type="industry_revamp"
+        )
+        ready = add_enhancement(db, minutes_ago=4, status="completed", cover_letter_status="pending")
+
+        claimed = EnhancementQueue().claim_cover_letter(db, "host:1:0")
+
+        assert claimed.id == ready.id
+        db.close()
+
+
+class TestConcurrentClaiming:
+    """Test claiming from several worker slots at once."""
+
+    @pytest.mark.integration
+    @pytest.mark.database
+    def test_threads_never_claim_same_row(self, queue_session_factory):
+        """Test that concurrent slots drain the queue without duplicates."""
+        db = queue_session_factory()
+        expected = {add_enhancement(db, minutes_ago=i).id for i in range(20)}
+        db.close()
+
+        queue = EnhancementQueue()
+        claimed_ids = []
+        lock = threading.Lock()
+
+        def drain(slot: int):
+            session = queue_session_factory()
+            try:
+                while True:
+                    enhancement = queue.claim_enhancement(session, f"host:1:{slot}")
+                    if enhancement is None:
+                        return
+                    with lock:
+                        claimed_ids.append(enhancement.id)
+            finally:
+                session.close()
+
+        threads = [threading.Thread(target=drain, args=(slot,)) for slot in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(claimed_ids) == len(set(claimed_ids))
+        assert set(claimed_ids) == expected
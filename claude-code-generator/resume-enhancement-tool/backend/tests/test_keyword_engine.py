@@ -0,0 +1,99 @@
+"""
+Tests for the single-pass keyword engine.
+
+This module tests:
+- Word-boundary handling for plain and punctuated terms
+- Overlapping and multi-category hits
+- The single-word lookup path giving the same hits as the automaton
+- ATSAnalyzer keyword extraction on top of the engine
+"""
+
+import pytest
+
+from app.utils.ats_analyzer import ATSAnalyzer
+from app.utils.keyword_engine import KeywordEngine
+
+
+class TestKeywordEngine:
+    """Test automaton matching."""
+
+    @pytest.mark.unit
+    def test_word_boundaries(self):
+        """Test that terms only match as whole words."""
+        engine = KeywordEngine({"skills": ["sql", "go", "java"]})
+
+        assert engine.extract("NoSQL, MySQL and Google; javascript")["skills"] == []
+        assert engine.extract("SQL, Go and Java.")["skills"] == ["sql", "go", "java"]
+
+    @pytest.mark.unit
+    def test_punctuated_terms(self):
+        """Test terms that start or end with punctuation."""
+        engine = KeywordEngine({"skills": ["c++", "c#", ".net", "node.js", "ci/cd"]})
+
+        found = engine.extract("C++ and C# on ASP.NET, Node.js, CI/CD")["skills"]
+
+        assert found == ["c++", "c#", ".net", "node.js", "ci/cd"]
+
+    @pytest.mark.unit
+    def test_offsets_overlaps_and_categories(self):
+        """Test that overlapping terms and shared terms are all reported."""
+        engine = KeywordEngine({"tech": ["github actions", "agile"], "soft": ["agile", "actions"]})
+
+        hits = engine.find_all("Agile team using GitHub Actions")
+        spans = {(hit.term, hit.category, hit.start, hit.end) for hit in hits}
+
+        assert spans == {
+            ("agile", "tech", 0, 5),
+            ("agile", "soft", 0, 5),
+            ("github actions", "tech", 17, 31),
+            ("actions", "soft", 24, 31),
+        }
+
+    @pytest.mark.unit
+    def test_aliases_report_canonical_term(self):
+        """Test that an alias hit carries the canonical term in each of its categories."""
+        engine = KeywordEngine({"cloud": ["kubernetes"], "ops": ["kubernetes"]}, aliases={"k8s": "kubernetes"})
+
+        hits = engine.find_all("Deployed on K8s")
+
+        assert {(hit.term, hit.category, hit.start, hit.end) for hit in hits} == {
+            ("kubernetes", "cloud", 12, 15),
+            ("kubernetes", "ops", 12, 15),
+        }
+
+    @pytest.mark.unit
+    def test_every_category_present(self):
+        """Test that categories without hits map to empty lists."""
+        engine = KeywordEngine({"a": ["python"], "b": ["rust"]})
+
+        assert engine.extract("Python") == {"a": ["python"], "b": []}
+
+    @pytest.mark.unit
+    def test_single_word_lookup_matches_automaton(self):
+        """Test that single-word dictionaries skip the automaton with identical hits."""
+        dictionaries = {"verbs": ["led", "built", "managed"], "lead": ["led"]}
+        text = "Led and co-led teams; built_in, rebuilt and managed: LED."
+        words = KeywordEngine(dictionaries)
+        automaton = KeywordEngine({**dictionaries, "phrase": ["two words"]})
+
+        assert words._words is not None and automaton._words is None
+        assert words.find_all(text) == [hit for hit in automaton.find_all(text) if hit.category != "phrase"]
+        assert [hit.term for hit in words.find_all(text)] == ["led", "led", "led", "led", "managed", "led", "led"]
+
+
+class TestATSAnalyzerExtraction:
+    """Test ATSAnalyzer keyword extraction."""
+
+    @pytest.mark.unit
+    def test_extract_keywords(self):
+        """Test categories, first-seen order and certifications."""
+        keywords = ATSAnalyzer().extract_keywords(
+            "Led a team building Python and React apps on AWS. Python daily. "
+            "AWS Certified, Microsoft Certified Azure Administrator. Strong communication."
+        )
+
+        assert keywords["technical_skills"] == ["python", "react", "aws", "azure"]
+        assert keywords["soft_skills"] == ["communication"]
+        assert keywords["action_verbs"] == ["led"]
+        assert keywords["certifications"] == ["aws certified", "certified azure administrator", "microsoft certified"]
+        assert keywords["tools"] == []
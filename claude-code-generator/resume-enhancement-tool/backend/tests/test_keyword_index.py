@@ -0,0 +1,139 @@
+"""
+Tests for keyword sets stored on resumes, jobs and enhancements.
+
+This module tests:
+- Compact encoding of keyword sets
+- Reading stored sets and re-indexing stale ones (including taxonomy edits)
+- Backfilling rows without keywords
+- Indexing on job creation
+"""
+
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.api.dependencies import get_current_active_user
+from app.models import Enhancement, Job, Resume
+from app.services.keyword_index import KeywordIndex, decode_keywords, encode_keywords
+from app.utils.ats_analyzer import ATSAnalyzer
+from app.utils.skills_taxonomy import parse_taxonomy
+from main import app
+
+JOB_TEXT = "We need a Python engineer with Kubernetes and PostgreSQL experience and strong communication."
+
+
+def make_job(user_id=None, description=JOB_TEXT) -> Job:
+    return Job(
+        user_id=user_id or uuid4(),
+        title="Engineer",
+        description_text=description,
+        file_path="description.txt",
+        source="paste",
+    )
+
+
+class TestKeywordIndex:
+    """Test storing and reading keyword sets."""
+
+    @pytest.mark.unit
+    def test_encoding_round_trip(self):
+        """Test that empty groups are dropped but restored on decode."""
+        keywords = ATSAnalyzer().extract_keywords(JOB_TEXT)
+        encoded = encode_keywords(keywords)
+
+        assert "tools" not in encoded
+        assert " " not in encoded
+        assert decode_keywords(encoded) == keywords
+
+    @pytest.mark.unit
+    def test_stored_keywords_are_used(self):
+        """Test that current stored sets are read without loading text."""
+        index = KeywordIndex()
+        job = make_job()
+        index.index(job, JOB_TEXT)
+
+        def load_text():
+            raise AssertionError("text should not be loaded")
+
+        assert "kubernetes" in index.keywords_for(job, load_text)["technical_skills"]
+
+    @pytest.mark.unit
+    def test_stale_keywords_are_reindexed(self):
+        """Test that a set from another taxonomy version is extracted again."""
+        index = KeywordIndex()
+        job = make_job()
+        job.keywords = encode_keywords({"technical_skills": ["cobol"]})
+        job.keywords_version = "0:old"
+
+        keywords = index.keywords_for(job, lambda: JOB_TEXT)
+
+        assert "cobol" not in keywords["technical_skills"]
+        assert job.keywords_version == index.version
+
+    @pytest.mark.unit
+    def test_taxonomy_edit_without_version_bump_is_stale(self):
+        """Test that the stamp follows taxonomy content, not its declared version."""
+        data = {
+            "version": "1",
+            "categories": {"cloud": {"group": "technical_skills", "terms": ["kubernetes"]}},
+        }
+        before = KeywordIndex(ATSAnalyzer(taxonomy=parse_taxonomy(data)))
+        data["categories"]["cloud"]["terms"].append("terraform")
+        after = KeywordIndex(ATSAnalyzer(taxonomy=parse_taxonomy(data)))
+
+        assert before.version != after.version
+        assert after.stored(encode_keywords({"technical_skills": ["kubernetes"]}), before.version) is None
+
+    @pytest.mark.database
+    def test_backfill(self, test_db):
+        """Test that rows without keywords are indexed and textless rows skipped."""
+        index = KeywordIndex()
+        job = make_job()
+        pending = Enhancement(user_id=uuid4(), resume_id=uuid4(), enhancement_type="industry_revamp")
+        done = Enhancement(
+            user_id=uuid4(),
+            resume_id=uuid4(),
+            enhancement_type="industry_revamp",
+            enhanced_content="# Jane\n\nPython and AWS",
+        )
+        resume = Resume(
+            user_id=uuid4(),
+            filename="resume.pdf",
+            original_format="pdf",
+            file_path="source.pdf",
+            extracted_text_path="extracted.txt",
+            extracted_text="Python developer",
+            file_size_bytes=100,
+        )
+        test_db.add_all([job, pending, done, resume])
+        test_db.commit()
+
+        counts = index.backfill(test_db, batch_size=1)
+
+        assert counts == {"resumes": 1, "jobs": 1, "enhancements": 1}
+        assert index.stored(done.keywords, done.keywords_version)["technical_skills"] == ["python", "aws"]
+        assert pending.keywords is None
+        assert index.backfill(test_db) == {"resumes": 0, "jobs": 0, "enhancements": 0}
+
+
+class TestIndexOnWrite:
+    """Test that write endpoints store keyword sets."""
+
+    @pytest.mark.integration
+    @pytest.mark.api
+    def test_create_job_stores_keywords(self, client, test_db, temp_workspace, monkeypatch):
+        """Test that POST /jobs indexes the description."""
+        from app.api.dependencies import get_workspace_service
+        from app.services.workspace_service import WorkspaceService
+
+        user = SimpleNamespace(id=uuid4(), email="jobs@example.com", is_active=True)
+        app.dependency_overrides[get_current_active_user] = lambda: user
+        app.dependency_overrides[get_workspace_service] = lambda: WorkspaceService(temp_workspace)
+
+        response = client.post("/api/jobs", json={"title": "Engineer", "description_text": JOB_TEXT})
+
+        assert response.status_code == 201
+        job = test_db.query(Job).one()
+        keywords = KeywordIndex().stored(job.keywords, job.keywords_version)
+        assert {"python", "kubernetes", "postgresql"} <= set(keywords["technical_skills"])
@@ -0,0 +1,96 @@
+"""
+Tests for the content-addressed Claude result cache.
+
+This module tests:
+- Cache key normalization (per-enhancement IDs, timestamps)
+- Hits, misses and TTL expiry
+- LRU eviction
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models import LLMResult
+from app.services.llm_cache import LLMResultCache, request_cache_key
+
+
+def make_request(instructions: str, resume: str = "<user_resume>Jane Doe</user_resume>") -> dict:
+    return {
+        "model": "claude-sonnet-4-20250514",
+        "max_tokens": 4096,
+        "system": [{"type": "text", "text": "You are a resume writer."}],
+        "messages": [{"role": "user", "content": f"{instructions}\n\n{resume}"}],
+    }
+
+
+class TestRequestCacheKey:
+    """Test cache key construction."""
+
+    @pytest.mark.unit
+    def test_enhancement_ids_and_timestamp_are_ignored(self):
+        """Test that the same inputs for two enhancements share a key."""
+        first = make_request("**Enhancement ID:** `enh-1`\nWrite to enh-1/enhanced.md\n**Created:** 2026-01-01T10:00:00")
+        second = make_request("**Enhancement ID:** `enh-2`\nWrite to enh-2/enhanced.md\n**Created:** 2026-02-01T12:30:00")
+
+        assert request_cache_key(first, ["enh-1"]) == request_cache_key(second, ["enh-2"])
+
+    @pytest.mark.unit
+    def test_content_changes_key(self):
+        """Test that different resume content produces a different key."""
+        first = make_request("Tailor it.", resume="<user_resume>Jane Doe</user_resume>")
+        second = make_request("Tailor it.", resume="<user_resume>John Roe</user_resume>")
+
+        assert request_cache_key(first) != request_cache_key(second)
+
+    @pytest.mark.unit
+    def test_model_changes_key(self):
+        """Test that the model is part of the key."""
+        request = make_request("Tailor it.")
+        other_model = dict(request, model="claude-3-5-haiku-20241022")
+
+        assert request_cache_key(request) != request_cache_key(other_model)
+
+
+class TestLLMResultCache:
+    """Test cache storage, expiry and eviction."""
+
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_miss_then_hit(self, test_db):
+        """Test that a stored result is served and counted."""
+        cache = LLMResultCache()
+
+        assert cache.get(test_db, "key-1") is None
+        cache.put(test_db, "key-1", "claude-sonnet-4-20250514", "# Jane Doe")
+
+        assert cache.get(test_db, "key-1") == "# Jane Doe"
+        assert cache.stats() == {"hits": 1, "misses": 1}
+        assert test_db.get(LLMResult, "key-1").hit_count == 1
+
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_expired_entry_is_a_miss(self, test_db):
+        """Test that entries older than the TTL are dropped."""
+        cache = LLMResultCache(ttl_seconds=60)
+        cache.put(test_db, "key-1", "claude-sonnet-4-20250514", "# Jane Doe")
+        test_db.get(LLMResult, "key-1").created_at = datetime.utcnow() - timedelta(minutes=5)
+        test_db.commit()
+
+        assert cache.get(test_db, "key-1") is None
+        assert test_db.get(LLMResult, "key-1") is None
+
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_least_recently_used_entry_is_evicted(self, test_db):
+        """Test that exceeding max_entries evicts the entry unused for longest."""
+        cache = LLMResultCache(max_entries=2)
+        cache.put(test_db, "old", "m", "a")
+        cache.put(test_db, "recent", "m", "b")
+        test_db.get(LLMResult, "old").last_used_at = datetime.utcnow() - timedelta(hours=1)
+        test_db.commit()
+
+        cache.put(test_db, "new", "m", "c")
+
+        remaining = {row.cache_key for row in test_db.query(LLMResult)}
+        assert remaining == {"recent", "new"}
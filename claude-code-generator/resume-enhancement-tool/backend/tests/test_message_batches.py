@@ -0,0 +1,167 @@
+"""
+Tests for Message Batches mode - bulk enhancement generation.
+
+This module tests (against a local fake batch server):
+- Submitting claimed enhancements as one batch
+- Batched rows being skipped by the regular worker queue
+- Collecting succeeded, errored and expired results
+- Exactly-once hand-off when several workers collect the same batch
+- The same flows through the rate-limited client wrapper
+"""
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from anthropic import Anthropic
+
+from app.models import Enhancement
+from app.services.anthropic_client import RateLimitedAnthropic, RateLimiter
+from app.services.job_queue import EnhancementQueue
+from app.services.message_batches import EnhancementBatches
+from tests.utils import FakeBatchServer
+
+
+@pytest.fixture
+def batch_server():
+    server = FakeBatchServer()
+    yield server
+    server.close()
+
+
+@pytest.fixture(params=["plain", "rate_limited"])
+def batches(request, batch_server):
+    client = Anthropic(api_key="test-key", base_url=batch_server.url, max_retries=0)
+    if request.param == "rate_limited":
+        client = RateLimitedAnthropic(client, RateLimiter(), sleep=lambda delay: None)
+    return EnhancementBatches(client)
+
+
+def add_pending(db, count: int) -> list:
+    """Insert pending enhancement rows."""
+    enhancements = [
+        Enhancement(
+            user_id=uuid4(),
+            resume_id=uuid4(),
+            enhancement_type="job_tailoring",
+            status="pending",
+        )
+        for _ in range(count)
+    ]
+    db.add_all(enhancements)
+    db.commit()
+    return enhancements
+
+
+def request_params(enhancement: Enhancement) -> dict:
+    return {
+        "model": "claude-sonnet-4-20250514",
+        "max_tokens": 4096,
+        "messages": [{"role": "user", "content": f"Enhance {enhancement.id}"}],
+    }
+
+
+class TestSubmit:
+    """Test batch submission."""
+
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_submit_records_batch_id(self, test_db, batches, batch_server):
+        """Test that every request is sent and each row records the batch."""
+        enhancements = add_pending(test_db, 3)
+
+        batch_id = batches.submit(test_db, [(e, request_params(e)) for e in enhancements])
+
+        sent = batch_server.requests[batch_id]
+        assert [request["custom_id"] for request in sent] == [str(e.id) for e in enhancements]
+        assert all(e.batch_id == batch_id for e in enhancements)
+        assert batches.pending_batch_ids(test_db) == [batch_id]
+
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_batched_rows_are_not_claimable(self, test_db, batches):
+        """Test that regular worker slots skip rows waiting on a batch."""
+        batched, regular = add_pending(test_db, 2)
+        batches.submit(test_db, [(batched, request_params(batched))])
+
+        claimed = EnhancementQueue().claim_enhancement(test_db, "worker-1")
+
+        assert claimed.id == regular.id
+        assert EnhancementQueue().claim_enhancement(test_db, "worker-2") is None
+
+
+class TestCollect:
+    """Test result collection."""
+
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_in_progress_batch_returns_none(self, test_db, batches):
+        """Test that unfinished batches are left alone."""
+        enhancements = add_pending(test_db, 1)
+        batch_id = batches.submit(test_db, [(e, request_params(e)) for e in enhancements])
+
+        assert batches.collect(batch_id) is None
+
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_results_by_type(self, test_db, batches, batch_server):
+        """Test succeeded, errored and expired results."""
+        ok, bad, late = add_pending(test_db, 3)
+        batch_id = batches.submit(test_db, [(e, request_params(e)) for e in (ok, bad, late)])
+        batch_server.end_batch(batch_id, {str(bad.id): "errored", str(late.id): "expired"})
+
+        results = {result.enhancement_id: result for result in batches.collect(batch_id)}
+
+        assert results[ok.id].text == f"# Enhanced {ok.id}"
+        assert results[ok.id].usage.cache_read_input_tokens == 1500
+        assert results[bad.id].text is None
+        assert results[bad.id].error == "prompt is too long"
+        assert results[bad.id].retry is False
+        assert results[late.id].retry is True
+
+
+class TestTake:
+    """Test detaching rows from a batch."""
+
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_take_succeeds_once(self, test_db, batches):
+        """Test that only the first collector gets the row."""
+        enhancement, = add_pending(test_db, 1)
+        batch_id = batches.submit(test_db, [(enhancement, request_params(enhancement))])
+
+        first = batches.take(test_db, enhancement.id, batch_id, "collector-1")
+        second = batches.take(test_db, enhancement.id, batch_id, "collector-2")
+
+        assert first.id == enhancement.id
+        assert first.batch_id is None
+        assert second is None
+
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_taken_row_is_leased_to_collector(self, test_db, batches):
+        """Test that a taken row isn't claimable while the collector stores it."""
+        enhancement, = add_pending(test_db, 1)
+        queue = EnhancementQueue(lease_seconds=1)
+        queue.claim_enhancement(test_db, "batch-worker")
+        batch_id = batches.submit(test_db, [(enhancement, request_params(enhancement))])
+        # The batch outlived the lease from the original claim
+        enhancement.lease_expires_at = datetime.utcnow() - timedelta(hours=1)
+        test_db.commit()
+
+        taken = batches.take(test_db, enhancement.id, batch_id, "collector-1")
+
+        assert taken.claimed_by == "collector-1"
+        assert queue.claim_enhancement(test_db, "worker-1") is None
+
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_detach_remaining_requeues_rows(self, test_db, batches):
+        """Test that rows missing from the results become claimable again."""
+        enhancement, = add_pending(test_db, 1)
+        queue = EnhancementQueue()
+        queue.claim_enhancement(test_db, "batch-worker")
+        batch_id = batches.submit(test_db, [(enhancement, request_params(enhancement))])
+
+        assert batches.detach_remaining(test_db, batch_id) == 1
+        assert queue.claim_enhancement(test_db, "worker-1").id == enhancement.id
@@ -0,0 +1,150 @@
+"""
+Tests for list endpoint pagination.
+
+This module tests:
+- Walking a list with keyset cursors, including created_at ties
+- Loading only the columns a list response shows
+- Capped totals
+- Cursor validation and the legacy skip parameter
+"""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import inspect
+
+from app.api.dependencies import get_current_active_user
+from app.api.pagination import count_up_to, decode_cursor, encode_cursor, paginate
+from app.core.config import settings
+from app.models import Enhancement
+from app.schemas import EnhancementResponse
+from main import app
+
+START = datetime(2026, 1, 1, 9, 0, 0)
+
+
+def add_enhancements(db, user_id, count, same_time=False):
+    """Store enhancements, newest last; same_time gives them one created_at."""
+    rows = [
+        Enhancement(
+            user_id=user_id,
+            resume_id=uuid4(),
+            enhancement_type="industry_revamp",
+            enhanced_content="# Resume\n" * 100,
+            created_at=START if same_time else START + timedelta(minutes=i),
+        )
+        for i in range(count)
+    ]
+    db.add_all(rows)
+    db.commit()
+    return rows
+
+
+class TestPaginate:
+    """Test the paginate() helper."""
+
+    @pytest.mark.unit
+    def test_cursor_round_trip(self):
+        """Test that a cursor decodes to the position it was made from."""
+        row_id = uuid4()
+        assert decode_cursor(encode_cursor(START, row_id)) == (START, row_id)
+
+    @pytest.mark.database
+    @pytest.mark.parametrize("same_time", [False, True])
+    def test_cursor_walk_visits_every_row_once(self, test_db, same_time):
+        """Test newest-first pages that neither skip nor repeat rows."""
+        user_id = uuid4()
+        rows = add_enhancements(test_db, user_id, 7, same_time=same_time)
+        add_enhancements(test_db, uuid4(), 3)  # Another user's
+        query = test_db.query(Enhancement).filter(Enhancement.user_id == user_id)
+
+        seen, cursor = [], None
+        while True:
+            page = paginate(query, Enhancement, EnhancementResponse, limit=3, cursor=cursor)
+            seen.extend(row.id for row in page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        expected = sorted(rows, key=lambda row: (row.created_at, str(row.id)), reverse=True)
+        assert seen == [row.id for row in expected]
+        assert page.total == 7
+
+    @pytest.mark.database
+    def test_large_columns_not_loaded(self, test_db):
+        """Test that columns outside the response schema stay unloaded."""
+        user_id = uuid4()
+        add_enhancements(test_db, user_id, 1)
+        test_db.expunge_all()
+
+        page = paginate(
+            test_db.query(Enhancement).filter(Enhancement.user_id == user_id),
+            Enhancement,
+            EnhancementResponse,
+            limit=10,
+        )
+
+        unloaded = inspect(page.items[0]).unloaded
+        assert {"enhanced_content", "cover_letter_content", "ats_analysis"} <= unloaded
+        assert "status" not in unloaded
+
+    @pytest.mark.database
+    def test_total_is_capped(self, test_db, monkeypatch):
+        """Test that counting stops at LIST_COUNT_LIMIT."""
+        user_id = uuid4()
+        add_enhancements(test_db, user_id, 5)
+        query = test_db.query(Enhancement).filter(Enhancement.user_id == user_id)
+        monkeypatch.setattr(settings, "LIST_COUNT_LIMIT", 3)
+
+        page = paginate(query, Enhancement, EnhancementResponse, limit=2)
+
+        assert (page.total, page.total_exact) == (3, False)
+        assert count_up_to(query, 5) == (5, True)
+
+
+class TestListEndpoints:
+    """Test pagination through the list endpoints."""
+
+    @pytest.fixture
+    def list_user(self, client):
+        user = SimpleNamespace(id=uuid4(), email="lists@example.com", is_active=True)
+        app.dependency_overrides[get_current_active_user] = lambda: user
+        return user
+
+    @pytest.mark.integration
+    @pytest.mark.api
+    def test_enhancements_cursor_pages(self, client, test_db, list_user):
+        """Test next_cursor and include_total on GET /enhancements."""
+        rows = add_enhancements(test_db, list_user.id, 3)
+
+        first = client.get("/api/enhancements", params={"limit": 2}).json()
+        second = client.get(
+            "/api/enhancements",
+            params={"limit": 2, "cursor": first["next_cursor"], "include_total": "false"},
+        ).json()
+
+        assert [e["id"] for e in first["enhancements"]] == [str(rows[2].id), str(rows[1].id)]
+        assert first["total"] == 3 and first["total_exact"] is True
+        assert [e["id"] for e in second["enhancements"]] == [str(rows[0].id)]
+        assert second["total"] is None and second["next_cursor"] is None
+
+    @pytest.mark.integration
+    @pytest.mark.api
+    def test_skip_still_supported(self, client, test_db, list_user):
+        """Test offset paging for older clients."""
+        rows = add_enhancements(test_db, list_user.id, 3)
+
+        data = client.get("/api/enhancements", params={"skip": 2}).json()
+
+        assert [e["id"] for e in data["enhancements"]] == [str(rows[0].id)]
+
+    @pytest.mark.integration
+    @pytest.mark.api
+    @pytest.mark.parametrize("path", ["/api/enhancements", "/api/jobs", "/api/resumes"])
+    def test_invalid_cursor_returns_400(self, client, list_user, path):
+        """Test that a malformed cursor is rejected."""
+        response = client.get(path, params={"cursor": "not-a-cursor"})
+
+        assert response.status_code == 400
@@ -0,0 +1,113 @@
+"""
+Tests for per-page PDF parsing and the parse process pool.
+
+This module tests:
+- Per-page pypdf fallback (only failed pages are re-parsed)
+- Pool results match in-process parsing
+- The per-document time budget
+"""
+
+import pdfplumber
+import pytest
+
+from app.services.parse_pool import PDFParsePool
+from app.utils.document_parser import DocumentParser, build_pdf_result
+from tests.utils import SAMPLE_RESUME_VALID, create_test_pdf_multipage
+
+
+@pytest.fixture(scope="module")
+def parse_pool():
+    pool = PDFParsePool(max_workers=2, timeout_seconds=60)
+    yield pool
+    pool.shutdown()
+
+
+class TestPerPageFallback:
+    """Test page-level fallback in the in-process parser."""
+
+    @pytest.mark.unit
+    @pytest.mark.parser
+    def test_only_failed_pages_use_pypdf(self, tmp_path, monkeypatch):
+        """Test that a page pdfplumber can't read is extracted by pypdf."""
+        pdf_path = create_test_pdf_multipage(SAMPLE_RESUME_VALID, pages=3, file_path=tmp_path / "cv.pdf")
+        original = pdfplumber.page.Page.extract_text
+
+        def flaky_extract(page, *args, **kwargs):
+            if page.page_number == 2:
+                raise ValueError("broken content stream")
+            return original(page, *args, **kwargs)
+
+        monkeypatch.setattr(pdfplumber.page.Page, "extract_text", flaky_extract)
+
+        result = DocumentParser().parse_file(pdf_path)
+
+        assert result["success"] is True
+        assert result["parser"] == "pdfplumber+pypdf"
+        assert result["pages"] == 3
+        assert "Page 2" in result["text"]
+
+    @pytest.mark.unit
+    @pytest.mark.parser
+    def test_build_result_reports_unparseable_pages(self):
+        """Test that pages no parser could read are listed, not fatal."""
+        result = build_pdf_result(["page one", None, ""], ["pdfplumber", "failed", "pdfplumber"])
+
+        assert result["success"] is True
+        assert result["text"] == "page one"
+        assert result["failed_pages"] == [2]
+
+    @pytest.mark.unit
+    @pytest.mark.parser
+    def test_all_pages_failed_is_an_error(self):
+        """Test that a document with no readable page fails."""
+        result = build_pdf_result([None, None], ["failed", "failed"])
+
+        assert result["success"] is False
+        assert result["parser"] == "failed"
+
+
+class TestPDFParsePool:
+    """Test parsing in worker processes."""
+
+    @pytest.mark.integration
+    @pytest.mark.parser
+    @pytest.mark.slow
+    def test_pool_matches_in_process_parse(self, tmp_path, parse_pool):
+        """Test that chunked parallel extraction preserves page order and text."""
+        pdf_path = create_test_pdf_multipage(SAMPLE_RESUME_VALID, pages=5, file_path=tmp_path / "cv.pdf")
+
+        pooled = DocumentParser(pool=parse_pool).parse_file(pdf_path)
+        inline = DocumentParser().parse_file(pdf_path)
+
+        assert pooled["success"] is True
+        assert pooled["pages"] == 5
+        assert pooled["text"] == inline["text"]
+
+    @pytest.mark.integration
+    @pytest.mark.parser
+    @pytest.mark.slow
+    def test_corrupted_pdf_fails_gracefully(self, tmp_path, parse_pool):
+        """Test that an unreadable file returns an error result."""
+        corrupted = tmp_path / "corrupted.pdf"
+        corrupted.write_text("This is not a valid PDF file!")
+
+        result = parse_pool.parse_pdf(corrupted)
+
+        assert result["success"] is False
+        assert result["text"] == ""
+
+    @pytest.mark.integration
+    @pytest.mark.parser
+    @pytest.mark.slow
+    def test_time_budget_enforced(self, tmp_path):
+        """Test that a document exceeding its budget fails instead of blocking."""
+        pdf_path = create_test_pdf_multipage(SAMPLE_RESUME_VALID, pages=20, file_path=tmp_path / "cv.pdf")
+        pool = PDFParsePool(max_workers=1, timeout_seconds=0.05)
+
+        try:
+            result = pool.parse_pdf(pdf_path)
+        finally:
+            pool.shutdown()
+
+        assert result["success"] is False
+        assert "time budget" in result["error"]
@@ -0,0 +1,120 @@
+"""
+Tests for the long-lived PDF generator.
+
+This module tests:
+- Templates are loaded and split into markup and CSS once
+- Per-thread font configuration and compiled stylesheets are reused
+- render_many output
+
+Skipped when WeasyPrint's system libraries (pango) are not installed,
+unless REQUIRE_WEASYPRINT=1 is set (then the import error fails the run).
+The backend image installs pango:
+
+    docker compose run --rm -e REQUIRE_WEASYPRINT=1 backend python -m pytest tests/test_pdf_generator.py
+"""
+
+import os
+import threading
+
+import pytest
+
+try:
+    from app.utils.pdf_generator import PDFGenerator
+except (ImportError, OSError) as e:
+    if os.environ.get("REQUIRE_WEASYPRINT") == "1":
+        raise
+    pytest.skip(f"WeasyPrint unavailable: {e}", allow_module_level=True)
+
+
+TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+    <style>
+        body { font-family: serif; }
+    </style>
+</head>
+<body>{{content}}</body>
+</html>"""
+
+
+@pytest.fixture
+def templates_dir(tmp_path):
+    formats_dir = tmp_path / "templates" / "resume_formats"
+    formats_dir.mkdir(parents=True)
+    (formats_dir / "plain.html").write_text(TEMPLATE, encoding="utf-8")
+    return tmp_path / "templates"
+
+
+class TestTemplates:
+    """Test template loading."""
+
+    @pytest.mark.unit
+    def test_templates_are_preloaded_and_split(self, templates_dir):
+        """Test that <style> blocks are moved out of the page markup."""
+        generator = PDFGenerator(templates_dir)
+        parsed = generator._get_template("plain")
+
+        assert "<style>" not in parsed.html
+        assert "{{content}}" in parsed.html
+        assert "font-family: serif" in parsed.css
+
+    @pytest.mark.unit
+    def test_template_edits_need_a_new_generator(self, templates_dir):
+        """Test that the fingerprint reflects the template loaded at startup."""
+        generator = PDFGenerator(templates_dir)
+        before = generator.template_fingerprint("plain")
+        (templates_dir / "resume_formats" / "plain.html").write_text(TEMPLATE + "<!-- v2 -->", encoding="utf-8")
+
+        assert generator.template_fingerprint("plain") == before
+        assert PDFGenerator(templates_dir).template_fingerprint("plain") != before
+
+    @pytest.mark.unit
+    def test_missing_template_uses_default(self, templates_dir):
+        """Test the inline default template fallback."""
+        generator = PDFGenerator(templates_dir)
+
+        assert generator._get_template("modern").name == "default"
+        assert generator.template_fingerprint("modern") == "modern:default"
+
+
+class TestRendering:
+    """Test per-thread state and rendering."""
+
+    @pytest.mark.unit
+    def test_thread_state_is_reused_per_thread(self, templates_dir):
+        """Test that each thread builds its pipeline once."""
+        generator = PDFGenerator(templates_dir)
+        first = generator._thread_state()
+        assert generator._thread_state() is first
+
+        other = []
+        thread = threading.Thread(target=lambda: other.append(generator._thread_state().font_config))
+        thread.start()
+        thread.join()
+        assert other[0] is not first.font_config
+
+    @pytest.mark.unit
+    def test_render_many(self, templates_dir, tmp_path):
+        """Test that each document is rendered and the template CSS compiled once."""
+        documents = []
+        for i in range(3):
+            md_path = tmp_path / f"resume_{i}.md"
+            md_path.write_text(f"# Candidate {i}\n\n- Python\n- SQL\n", encoding="utf-8")
+            documents.append((md_path, tmp_path / "out" / f"resume_{i}.pdf"))
+
+        generator = PDFGenerator(templates_dir)
+        results = generator.render_many(documents, template="plain")
+
+        assert [r["success"] for r in results] == [True, True, True]
+        assert all(pdf_path.read_bytes().startswith(b"%PDF") for _, pdf_path in documents)
+        assert len(generator._thread_state().stylesheets) == 1
+
+    @pytest.mark.unit
+    def test_html_export_keeps_template_styles(self, templates_dir):
+        """Test that standalone HTML includes the template's <style> block."""
+        from app.utils.markdown_document import parse_markdown
+
+        page = PDFGenerator(templates_dir).document_to_html(parse_markdown("# Jane Doe"), template="plain")
+
+        assert "font-family: serif" in page
+        assert "<h1>Jane Doe</h1>" in page
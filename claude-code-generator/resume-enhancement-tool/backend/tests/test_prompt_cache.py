@@ -0,0 +1,103 @@
+"""
+Tests for prompt caching helpers.
+
+This module tests:
+- Cache breakpoint placement on system prompt blocks
+- Lifting the shared formatting guidelines out of instructions
+- Cache read/write token accounting
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.config.resume_guidelines import RESUME_FORMATTING_GUIDELINES
+from app.utils.prompt_cache import (
+    GUIDELINES_REFERENCE,
+    build_system_blocks,
+    split_formatting_guidelines,
+    log_cache_usage,
+)
+
+
+class TestBuildSystemBlocks:
+    """Test system prompt block construction."""
+
+    @pytest.mark.unit
+    def test_breakpoint_on_last_block_only(self):
+        """Test that only the last static block carries cache_control."""
+        blocks = build_system_blocks("system prompt", "guidelines")
+
+        assert [block["text"] for block in blocks] == ["system prompt", "guidelines"]
+        assert "cache_control" not in blocks[0]
+        assert blocks[1]["cache_control"] == {"type": "ephemeral"}
+
+    @pytest.mark.unit
+    def test_missing_texts_are_skipped(self):
+        """Test that absent guidelines leave the breakpoint on the system prompt."""
+        blocks = build_system_blocks("system prompt", None)
+
+        assert len(blocks) == 1
+        assert blocks[0]["cache_control"] == {"type": "ephemeral"}
+
+
+class TestSplitFormattingGuidelines:
+    """Test extraction of the shared guidelines from instructions."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("enhancement_type", ["job_tailoring", "industry_revamp"])
+    def test_generated_instructions_share_guidelines(self, workspace_service, enhancement_type):
+        """Test that both instruction templates yield the same cacheable block."""
+        if enhancement_type == "job_tailoring":
+            instructions = workspace_service._create_job_tailoring_instructions(
+                "enh-1", "res-1", "job-1", "professional"
+            )
+        else:
+            instructions = workspace_service._create_industry_revamp_instructions(
+                "enh-2", "res-2", "Healthcare", None
+            )
+
+        remaining, guidelines = split_formatting_guidelines(instructions)
+
+        assert guidelines == RESUME_FORMATTING_GUIDELINES
+        assert RESUME_FORMATTING_GUIDELINES not in remaining
+        assert GUIDELINES_REFERENCE in remaining
+        assert "enh-" in remaining
+
+    @pytest.mark.unit
+    def test_custom_instructions_unchanged(self):
+        """Test that instructions without the guidelines pass through."""
+        remaining, guidelines = split_formatting_guidelines("Make it shorter.")
+
+        assert remaining == "Make it shorter."
+        assert guidelines is None
+
+
+class TestLogCacheUsage:
+    """Test token accounting."""
+
+    @pytest.mark.unit
+    def test_counts_cache_reads_and_writes(self, caplog):
+        """Test that cache token fields are reported separately."""
+        usage = SimpleNamespace(
+            input_tokens=120,
+            cache_read_input_tokens=1500,
+            cache_creation_input_tokens=0,
+            output_tokens=800,
+        )
+
+        with caplog.at_level("INFO"):
+            counts = log_cache_usage(usage, "resume abc")
+
+        assert counts == {"input": 120, "cache_read": 1500, "cache_write": 0, "output": 800}
+        assert "cache_read=1500" in caplog.text
+
+    @pytest.mark.unit
+    def test_missing_cache_fields_count_as_zero(self):
+        """Test usage objects from responses without caching information."""
+        usage = SimpleNamespace(input_tokens=10, output_tokens=5, cache_read_input_tokens=None)
+
+        counts = log_cache_usage(usage, "cover letter abc")
+
+        assert counts["cache_read"] == 0
+        assert counts["cache_write"] == 0
@@ -0,0 +1,242 @@
+"""
+Query plan regression tests for the hot queries.
+
+The statements the application emits are recorded while the real code
+paths run, then EXPLAINed. A plan that scans a whole hot table or sorts
+its rows instead of reading them in index order fails the test.
+
+Runs against in-memory SQLite, and against PostgreSQL when TEST_POSTGRES_URL
+points at a database the tests may create a scratch schema in. PostgreSQL
+prefers sequential scans on tiny tables, so enable_seqscan is turned off:
+the planner then only picks one when no index can serve the query.
+
+This module tests:
+- Worker claim queues (pending enhancements and cover letters)
+- Message Batch polling
+- List pages, cursor seeks and capped totals
+"""
+
+import json
+import os
+import re
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.api.pagination import paginate
+from app.core.database import Base
+from app.models import Enhancement, Job, Resume
+from app.models.user import User
+from app.schemas import EnhancementResponse, JobResponse, ResumeResponse
+from app.services.job_queue import EnhancementQueue
+from app.services.message_batches import EnhancementBatches
+
+HOT_TABLES = {"enhancements", "jobs", "resumes"}
+
+START = datetime(2026, 1, 1, 9, 0, 0)
+
+
+@pytest.fixture(params=["sqlite", "postgresql"])
+def plan_db(request):
+    """Session on a database with the full schema, for each backend."""
+    if request.param == "sqlite":
+        engine = create_engine(
+            "sqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        schema = None
+    else:
+        url = os.environ.get("TEST_POSTGRES_URL")
+        if not url:
+            pytest.skip("TEST_POSTGRES_URL not set")
+        schema = f"plan_test_{uuid4().hex[:8]}"
+        admin = create_engine(url)
+        with admin.begin() as conn:
+            conn.execute(text(f"CREATE SCHEMA {schema}"))
+        admin.dispose()
+        engine = create_engine(url, connect_args={"options": f"-csearch_path={schema}"})
+
+    Base.metadata.create_all(bind=engine)
+    db = Session(bind=engine)
+    try:
+        yield db
+    finally:
+        db.close()
+        if schema:
+            with engine.begin() as conn:
+                conn.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+        engine.dispose()
+
+
+@contextmanager
+def recorded_selects(db):
+    """Collect (statement, parameters) of every SELECT run on the session's engine."""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def plan_problems(db, statement, parameters):
+    """Full scans of hot tables, and sorts done for ORDER BY, in a statement's plan."""
+    conn = db.connection()
+    if conn.dialect.name == "sqlite":
+        details = [row[3] for row in conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters)]
+        return [
+            detail for detail in details
+            if re.fullmatch(r"SCAN (\w+)", detail) and detail.split()[1] in HOT_TABLES
+            or detail == "USE TEMP B-TREE FOR ORDER BY"
+        ]
+
+    conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+    [[plan]] = conn.exec_driver_sql("EXPLAIN (FORMAT JSON) " + statement, parameters).all()
+    plan = json.loads(plan) if isinstance(plan, str) else plan
+    ordered = "ORDER BY" in statement
+    problems, nodes = [], [plan[0]["Plan"]]
+    while nodes:
+        node = nodes.pop()
+        nodes.extend(node.get("Plans", []))
+        if node["Node Type"] == "Seq Scan" and node.get("Relation Name") in HOT_TABLES or ordered and node["Node Type"] == "Sort":
+            problems.append(f"{node['Node Type']} {node.get('Relation Name', '')}".strip())
+    return problems
+
+
+def assert_index_plans(db, statements):
+    """Fail with the offending plans if any recorded statement needs a scan or sort."""
+    assert statements, "no queries were recorded"
+    failures = {}
+    for statement, parameters in statements:
+        problems = plan_problems(db, statement, parameters)
+        if problems:
+            failures[statement] = problems
+    db.rollback()
+    assert not failures, failures
+
+
+# Rows get real parents: PostgreSQL enforces the foreign keys
+def add_user(db):
+    user = User(email=f"{uuid4().hex}@example.com", password_hash="x")
+    db.add(user)
+    db.commit()
+    return user.id
+
+
+def add_resume(db, user_id, created_at=START):
+    resume = Resume(user_id=user_id, filename="r.pdf", original_format="pdf", file_path="s.pdf",
+                    extracted_text_path="e.txt", file_size_bytes=1, created_at=created_at)
+    db.add(resume)
+    db.commit()
+    return resume
+
+
+def add_job(db, user_id, created_at=START):
+    job = Job(user_id=user_id, title="Engineer", description_text="Python", file_path="d.txt",
+              source="paste", created_at=created_at)
+    db.add(job)
+    db.commit()
+    return job
+
+
+def add_enhancements(db, user_id, with_job=False, **values):
+    resume_id = add_resume(db, user_id).id
+    job_id = add_job(db, user_id).id if with_job else None
+    rows = [
+        Enhancement(
+            user_id=user_id,
+            resume_id=resume_id,
+            job_id=job_id,
+            enhancement_type="job_tailoring",
+            created_at=START + timedelta(minutes=i),
+            **values,
+        )
+        for i in range(3)
+    ]
+    db.add_all(rows)
+    db.commit()
+    return rows
+
+
+class TestWorkerQueries:
+    """Test plans of the worker's polling queries."""
+
+    @pytest.mark.database
+    def test_claim_pending_enhancement(self, plan_db):
+        """Test that the oldest pending enhancement is found through the pending index."""
+        user_id = add_user(plan_db)
+        add_enhancements(plan_db, user_id, status="completed")
+        add_enhancements(plan_db, user_id, status="pending")
+
+        with recorded_selects(plan_db) as statements:
+            assert EnhancementQueue().claim_enhancement(plan_db, "worker:1") is not None
+
+        assert_index_plans(plan_db, statements)
+
+    @pytest.mark.database
+    def test_claim_pending_cover_letter(self, plan_db):
+        """Test that the cover letter queue is read through its partial index."""
+        user_id = add_user(plan_db)
+        add_enhancements(plan_db, user_id, with_job=True, status="completed", cover_letter_status="completed")
+        add_enhancements(plan_db, user_id, with_job=True, status="completed", cover_letter_status="pending")
+
+        with recorded_selects(plan_db) as statements:
+            assert EnhancementQueue().claim_cover_letter(plan_db, "worker:1") is not None
+
+        assert_index_plans(plan_db, statements)
+
+    @pytest.mark.database
+    def test_pending_batch_ids(self, plan_db):
+        """Test that Message Batch polling doesn't scan all enhancements."""
+        add_enhancements(plan_db, add_user(plan_db), status="pending", batch_id="msgbatch_1")
+        client = SimpleNamespace(beta=SimpleNamespace(messages=SimpleNamespace(batches=None)))
+
+        with recorded_selects(plan_db) as statements:
+            assert EnhancementBatches(client).pending_batch_ids(plan_db) == ["msgbatch_1"]
+
+        assert_index_plans(plan_db, statements)
+
+
+class TestListQueries:
+    """Test plans of list endpoint pages."""
+
+    def add_rows(self, db, model, user_id):
+        if model is Enhancement:
+            add_enhancements(db, user_id)
+            return
+        add = add_job if model is Job else add_resume
+        for i in range(3):
+            add(db, user_id, created_at=START + timedelta(minutes=i))
+
+    @pytest.mark.database
+    @pytest.mark.parametrize("model, schema", [
+        (Enhancement, EnhancementResponse),
+        (Job, JobResponse),
+        (Resume, ResumeResponse),
+    ])
+    def test_list_pages(self, plan_db, model, schema):
+        """Test first page, count and cursor seek use the (user_id, created_at, id) index."""
+        user_id = add_user(plan_db)
+        self.add_rows(plan_db, model, user_id)
+        self.add_rows(plan_db, model, add_user(plan_db))
+        query = plan_db.query(model).filter(model.user_id == user_id)
+
+        with recorded_selects(plan_db) as statements:
+            first = paginate(query, model, schema, limit=2)
+            paginate(query, model, schema, limit=2, cursor=first.next_cursor, include_total=False)
+
+        assert first.next_cursor is not None
+        assert_index_plans(plan_db, statements)
@@ -0,0 +1,137 @@
+"""
+Tests for the shared skills taxonomy.
+
+This module tests:
+- Loading, validation and alias resolution
+- Reloading when the file changes (and keeping the old version on errors)
+- Content hashes that follow edits regardless of the declared version
+- ATSAnalyzer, StyleAnalyzer and AchievementDetector using the same terms
+"""
+
+import json
+import os
+
+import pytest
+
+from app.utils.achievement_detector import AchievementDetector
+from app.utils.ats_analyzer import ATSAnalyzer
+from app.utils.skills_taxonomy import TaxonomyError, TaxonomyStore, get_taxonomy, parse_taxonomy
+from app.utils.style_analyzer import StyleAnalyzer
+
+
+def taxonomy_data(version: str = "1", extra_terms=()) -> dict:
+    return {
+        "version": version,
+        "categories": {
+            "cloud": {"group": "technical_skills", "terms": ["kubernetes", "aws", *extra_terms]},
+            "databases": {"group": "technical_skills", "terms": ["postgresql"]},
+            "soft_skills": {"group": "soft_skills", "terms": ["mentoring"]},
+            "reduction": {"group": "action_verbs", "terms": ["reduced"]},
+            "leadership": {"group": "action_verbs", "terms": ["led"]},
+        },
+        "aliases": {"k8s": "kubernetes", "postgres": "postgresql"},
+    }
+
+
+class TestTaxonomy:
+    """Test loading and validation."""
+
+    @pytest.mark.unit
+    def test_aliases_resolve_to_canonical_terms(self):
+        """Test that alias spellings are reported under the canonical term."""
+        taxonomy = parse_taxonomy(taxonomy_data())
+
+        found = taxonomy.extract_groups("Ran K8s on AWS with Postgres", ("technical_skills", "soft_skills"))
+
+        assert found == {"technical_skills": ["kubernetes", "aws", "postgresql"], "soft_skills": []}
+
+    @pytest.mark.unit
+    def test_invalid_files_rejected(self):
+        """Test that structural errors and dangling aliases raise TaxonomyError."""
+        with pytest.raises(TaxonomyError):
+            parse_taxonomy({"categories": {}})
+
+        data = taxonomy_data()
+        data["aliases"]["pg"] = "postgres-sql"
+        with pytest.raises(TaxonomyError):
+            parse_taxonomy(data)
+
+    @pytest.mark.unit
+    def test_content_hash_follows_terms_not_version(self):
+        """Test that the hash changes with the terms even if the version doesn't."""
+        base = parse_taxonomy(taxonomy_data("1"))
+
+        assert parse_taxonomy(taxonomy_data("2")).content_hash == base.content_hash
+        assert parse_taxonomy(taxonomy_data("1", extra_terms=["terraform"])).content_hash != base.content_hash
+
+        data = taxonomy_data("1")
+        data["aliases"]["eks"] = "kubernetes"
+        assert parse_taxonomy(data).content_hash != base.content_hash
+
+    @pytest.mark.unit
+    def test_bundled_taxonomy_loads(self):
+        """Test the taxonomy shipped in app/config."""
+        taxonomy = get_taxonomy()
+
+        assert taxonomy.version
+        assert "improvement" in taxonomy.categories_in("action_verbs")
+
+
+class TestTaxonomyStore:
+    """Test reloading on file change."""
+
+    @pytest.mark.unit
+    def test_reloads_changed_file(self, tmp_path):
+        """Test that edits are picked up and broken edits ignored."""
+        path = tmp_path / "taxonomy.json"
+        path.write_text(json.dumps(taxonomy_data("1")))
+        store = TaxonomyStore(path, check_interval=0)
+        assert store.current().version == "1"
+
+        path.write_text(json.dumps(taxonomy_data("2", extra_terms=["terraform"])))
+        os.utime(path, ns=(0, 10**18))
+        assert store.current().version == "2"
+        assert store.current().extract_groups("terraform", ("technical_skills",))["technical_skills"] == ["terraform"]
+
+        path.write_text("{not json")
+        os.utime(path, ns=(0, 2 * 10**18))
+        assert store.current().version == "2"
+
+    @pytest.mark.unit
+    def test_unchanged_file_is_not_recompiled(self, tmp_path):
+        """Test that checks without a file change keep the compiled taxonomy."""
+        path = tmp_path / "taxonomy.json"
+        path.write_text(json.dumps(taxonomy_data()))
+        store = TaxonomyStore(path, check_interval=0)
+        first = store.current()
+
+        assert store.reload_if_changed() is False
+        assert store.current() is first
+
+
+class TestAnalyzersAgree:
+    """Test that all analyzers read the same taxonomy."""
+
+    @pytest.mark.unit
+    def test_shared_terms(self):
+        """Test technical skills and achievement verbs across analyzers."""
+        taxonomy = parse_taxonomy(taxonomy_data())
+        text = "Led migration to k8s and Postgres\nReduced costs on AWS for the platform"
+
+        ats_skills = ATSAnalyzer(taxonomy).extract_keywords(text)["technical_skills"]
+        technical_depth = StyleAnalyzer(taxonomy).extract_job_signals(text)["technical_depth"]
+        achievements = AchievementDetector(taxonomy).detect_achievements(text)
+
+        assert ats_skills == ["kubernetes", "postgresql", "aws"]
+        assert technical_depth == len(ats_skills)
+        assert [(a["verb"], a["achievement_type"]) for a in achievements] == [
+            ("led", "leadership"),
+            ("reduced", "reduction"),
+        ]
+
+    @pytest.mark.unit
+    def test_verbs_inside_words_are_not_achievements(self):
+        """Test that "enabled" is not read as "led"."""
+        taxonomy = parse_taxonomy(taxonomy_data())
+
+        assert AchievementDetector(taxonomy).detect_achievements("Enabled faster deploys across teams") == []
@@ -0,0 +1,193 @@
+"""
+Tests for StyleAnalyzer job signals.
+
+This module tests:
+- Compiled pattern sets agree with the individual patterns
+- Signals memoized per content hash, in process and on the Job row
+- Style checks from stored signals
+- Signals stored by POST /jobs and read by the style-match endpoint
+"""
+
+import re
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.api.dependencies import get_current_active_user, get_style_analyzer, get_workspace_service
+from app.models import Job, Resume
+from app.services.workspace_service import WorkspaceService
+from app.utils.style_analyzer import StyleAnalyzer
+from main import app
+
+JOB_TITLE = "Senior Software Engineer"
+JOB_TEXT = (
+    "Fast-paced venture-backed startup building SaaS. Lead a team and mentor engineers "
+    "on Python, AWS and Kubernetes. HIPAA compliance experience. 7+ years."
+)
+
+
+class TestSignals:
+    """Test signal extraction."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("text", [
+        JOB_TEXT,
+        "Vice President of finance with P&L and budget responsibility",
+        "Entry-level UX role at a creative agency, product design and brand",
+        "Hospital clinical role for a nurse in a regulated environment",
+        "Nothing to see here",
+        "We are a fast-paced startup. Join our startup team and help an agile, venture-backed company",
+        "Innovative startup in healthcare: clinical software for hospital patients",
+    ])
+    def test_compiled_patterns_match_individual_patterns(self, text):
+        """Test seniority and industry detection against the per-pattern definitions."""
+        analyzer = StyleAnalyzer()
+        text = text.lower()
+
+        expected_level = next(
+            (level for level, patterns in analyzer.SENIORITY_PATTERNS.items()
+             if any(re.search(p, text, re.IGNORECASE) for p in patterns)),
+            "mid",
+        )
+        assert analyzer._detect_seniority(text) == expected_level
+
+        scores = {
+            industry: sum(len(re.findall(p, text, re.IGNORECASE)) for p in patterns)
+            for industry, patterns in analyzer.INDUSTRY_PATTERNS.items()
+        }
+        expected_industry = max(scores, key=scores.get) if max(scores.values()) > 0 else "traditional"
+        assert analyzer._detect_industry(text) == expected_industry
+
+        for keywords, name in [(analyzer.LEADERSHIP_KEYWORDS, "leadership"), (analyzer.COMPLIANCE_KEYWORDS, "compliance")]:
+            assert analyzer._scan_keywords(text)[name] == {k for k in keywords if k in text}
+
+    @pytest.mark.unit
+    def test_term_shared_by_industries_counts_for_each(self):
+        """Test that "startup" counts for both tech and startup."""
+        analyzer = StyleAnalyzer()
+
+        assert analyzer._detect_industry("we are a fast-paced startup. join our startup team") == "startup"
+
+    @pytest.mark.unit
+    def test_signals_memoized_by_content(self, monkeypatch):
+        """Test that the same job text is only scanned once."""
+        analyzer = StyleAnalyzer()
+        calls = []
+        extract = analyzer._extract_job_signals
+        monkeypatch.setattr(analyzer, "_extract_job_signals", lambda *args: calls.append(args) or extract(*args))
+
+        first = analyzer.analyze_job_style_match(JOB_TEXT, "professional", JOB_TITLE)
+        second = analyzer.analyze_job_style_match(JOB_TEXT, "technical", JOB_TITLE)
+        analyzer.extract_job_signals(JOB_TEXT + " Remote.", JOB_TITLE)
+
+        assert len(calls) == 2
+        assert first["job_signals"] == second["job_signals"]
+        assert first["style_scores"] == second["style_scores"]
+
+
+class TestJobSignals:
+    """Test signals stored on Job rows."""
+
+    @pytest.mark.database
+    def test_signals_persisted_and_invalidated(self, test_db):
+        """Test that stored signals are reused until the description changes."""
+        job = Job(user_id=uuid4(), title=JOB_TITLE, description_text=JOB_TEXT, file_path="d.txt", source="paste")
+        test_db.add(job)
+        test_db.commit()
+
+        signals = StyleAnalyzer().signals_for_job(job)
+        test_db.commit()
+        assert job.style_signals_key and job.style_signals
+        assert signals["seniority_level"] == "senior"
+
+        # A new analyzer (e.g. another process) reads the row instead of scanning
+        fresh = StyleAnalyzer()
+        fresh._extract_job_signals = lambda *args: pytest.fail("signals should come from the row")
+        assert fresh.signals_for_job(job) == signals
+
+        job.description_text = "Vice President, P&L ownership for the region"
+        assert StyleAnalyzer().signals_for_job(job)["seniority_level"] == "executive"
+
+    @pytest.mark.unit
+    def test_match_style_from_signals(self):
+        """Test that style checks from signals equal the full analysis."""
+        analyzer = StyleAnalyzer()
+        signals = analyzer.extract_job_signals(JOB_TEXT, JOB_TITLE)
+
+        for style in ("professional", "executive", "technical", "creative", "concise"):
+            assert analyzer.match_style(signals, style) == analyzer.analyze_job_style_match(JOB_TEXT, style, JOB_TITLE)
+
+
+class TestStyleMatchEndpoint:
+    """Test signals stored on job creation and GET /resumes/{id}/style-match/{job_id}."""
+
+    @pytest.fixture
+    def style_user(self, client, temp_workspace):
+        user = SimpleNamespace(id=uuid4(), email="style@example.com", is_active=True)
+        app.dependency_overrides[get_current_active_user] = lambda: user
+        app.dependency_overrides[get_workspace_service] = lambda: WorkspaceService(temp_workspace)
+        return user
+
+    def add_resume(self, test_db, user_id, selected_style=None):
+        resume = Resume(
+            user_id=user_id,
+            filename="resume.pdf",
+            original_format="pdf",
+            file_path="source.pdf",
+            extracted_text_path="extracted.txt",
+            file_size_bytes=100,
+            selected_style=selected_style,
+        )
+        test_db.add(resume)
+        test_db.commit()
+        return resume
+
+    @pytest.mark.integration
+    @pytest.mark.api
+    def test_style_checked_from_stored_signals(self, client, test_db, style_user):
+        """Test that POST /jobs stores signals and the style check reuses them."""
+        response = client.post("/api/jobs", json={"title": JOB_TITLE, "description_text": JOB_TEXT})
+        assert response.status_code == 201
+        job = test_db.query(Job).one()
+        assert job.style_signals_key == StyleAnalyzer().signals_key(JOB_TEXT, JOB_TITLE)
+
+        # A fresh analyzer (e.g. another worker) must not rescan the description
+        analyzer = StyleAnalyzer()
+        analyzer._extract_job_signals = lambda *args: pytest.fail("signals should come from the row")
+        app.dependency_overrides[get_style_analyzer] = lambda: analyzer
+        resume = self.add_resume(test_db, style_user.id, selected_style="creative")
+
+        data = client.get(f"/api/resumes/{resume.id}/style-match/{job.id}").json()
+
+        expected = StyleAnalyzer().analyze_job_style_match(JOB_TEXT, "creative", JOB_TITLE)
+        assert data["current_style"] == "creative"
+        assert data["style_scores"] == expected["style_scores"]
+        assert data["recommended_style"] == expected["recommended_style"]
+
+    @pytest.mark.integration
+    @pytest.mark.api
+    @pytest.mark.parametrize("params", [{}, {"style": "baroque"}])
+    def test_missing_or_unknown_style_returns_400(self, client, test_db, style_user, params):
+        """Test that a style is required, from the query or the resume."""
+        resume = self.add_resume(test_db, style_user.id)
+        job = Job(user_id=style_user.id, title=JOB_TITLE, description_text=JOB_TEXT, file_path="d.txt", source="paste")
+        test_db.add(job)
+        test_db.commit()
+
+        response = client.get(f"/api/resumes/{resume.id}/style-match/{job.id}", params=params)
+
+        assert response.status_code == 400
+
+    @pytest.mark.integration
+    @pytest.mark.api
+    def test_other_users_job_returns_404(self, client, test_db, style_user):
+        """Test that another user's job is not found."""
+        resume = self.add_resume(test_db, style_user.id, selected_style="technical")
+        job = Job(user_id=uuid4(), title=JOB_TITLE, description_text=JOB_TEXT, file_path="d.txt", source="paste")
+        test_db.add(job)
+        test_db.commit()
+
+        response = client.get(f"/api/resumes/{resume.id}/style-match/{job.id}")
+
+        assert response.status_code == 404
@@ -0,0 +1,105 @@
+"""
+Tests for PipelineStage - bounded, concurrent worker pipeline stages.
+
+This module tests:
+- Items flow through chained stages
+- Per-stage concurrency
+- Backpressure from bounded queues
+- Handler errors not stopping a stage
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.services.worker_pipeline import PipelineStage
+
+
+@pytest.fixture
+def stop_event():
+    event = threading.Event()
+    yield event
+    event.set()
+
+
+@pytest.fixture
+def executor(stop_event):
+    pool = ThreadPoolExecutor(max_workers=8)
+    yield pool
+    stop_event.set()
+    pool.shutdown(wait=True)
+
+
+class TestPipelineStage:
+    """Test pipeline stage behaviour."""
+
+    @pytest.mark.unit
+    def test_items_flow_through_chained_stages(self, executor, stop_event):
+        """Test that a handler can forward items to the next stage."""
+        results = []
+        second = PipelineStage("second", lambda item: results.append(item * 10))
+        first = PipelineStage("first", lambda item: second.submit(item + 1, stop_event))
+        first.start(executor, stop_event)
+        second.start(executor, stop_event)
+
+        for item in range(3):
+            first.submit(item, stop_event)
+        first.queue.join()
+        second.queue.join()
+
+        assert sorted(results) == [10, 20, 30]
+
+    @pytest.mark.unit
+    def test_concurrency_runs_items_in_parallel(self, executor, stop_event):
+        """Test that a stage with N threads handles N items at once."""
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def handler(item):
+            with lock:
+                active.append(item)
+                peak.append(len(active))
+            time.sleep(0.1)
+            with lock:
+                active.remove(item)
+
+        stage = PipelineStage("render", handler, concurrency=3, queue_size=10)
+        stage.start(executor, stop_event)
+        for item in range(6):
+            stage.submit(item, stop_event)
+        stage.queue.join()
+
+        assert max(peak) == 3
+
+    @pytest.mark.unit
+    def test_full_queue_blocks_until_stopped(self, stop_event):
+        """Test that submit blocks on a full queue and gives up on stop."""
+        stage = PipelineStage("render", lambda item: None, queue_size=1)
+        assert stage.submit("a", stop_event) is True
+
+        threading.Timer(0.2, stop_event.set).start()
+        start = time.monotonic()
+
+        assert stage.submit("b", stop_event) is False
+        assert time.monotonic() - start >= 0.2
+
+    @pytest.mark.unit
+    def test_handler_error_does_not_stop_stage(self, executor, stop_event):
+        """Test that a failing item does not kill the stage thread."""
+        handled = []
+
+        def handler(item):
+            if item == "bad":
+                raise RuntimeError("render failed")
+            handled.append(item)
+
+        stage = PipelineStage("render", handler)
+        stage.start(executor, stop_event)
+        stage.submit("bad", stop_event)
+        stage.submit("good", stop_event)
+        stage.queue.join()
+
+        assert handled == ["good"]
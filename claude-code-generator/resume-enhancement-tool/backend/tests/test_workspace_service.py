@@ -9,12 +9,20 @@ This module tests the workspace service responsible for:
 - Managing file paths
 """
 
+import hashlib
+import io
 import json
+import threading
 import pytest
 from pathlib import Path
 from uuid import uuid4
 
-from app.services.workspace_service import WorkspaceService
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from app.services.workspace_service import WorkspaceService, FileTooLargeError, UPLOAD_CHUNK_SIZE
 from tests.utils import (
     create_test_pdf,
     SAMPLE_RESUME_VALID,
@@ -191,6 +199,128 @@ class TestStoreResume:
         assert source_file.exists()
 
 
+class TestBlobStore:
+    """Test streaming uploads into the content-addressed blob store."""
+
+    @pytest.mark.unit
+    @pytest.mark.workspace
+    def test_stage_upload_writes_and_hashes(self, workspace_service):
+        """Test that a multi-chunk upload is written once and hashed on the way."""
+        content = b"%PDF-1.4 " + b"x" * (UPLOAD_CHUNK_SIZE * 3 + 17)
+
+        staged_path, size, sha256 = workspace_service.stage_upload(
+            io.BytesIO(content), ".pdf", max_bytes=len(content)
+        )
+
+        assert staged_path.read_bytes() == content
+        assert size == len(content)
+        assert sha256 == hashlib.sha256(content).hexdigest()
+
+    @pytest.mark.unit
+    @pytest.mark.workspace
+    def test_stage_upload_aborts_over_limit(self, workspace_service):
+        """Test that the copy stops at the limit and leaves nothing behind."""
+        with pytest.raises(FileTooLargeError):
+            workspace_service.stage_upload(io.BytesIO(b"x" * (UPLOAD_CHUNK_SIZE * 2)), ".pdf", max_bytes=1000)
+
+        assert list((workspace_service.blobs_root / ".staging").iterdir()) == []
+
+    @pytest.mark.unit
+    @pytest.mark.workspace
+    def test_identical_files_share_one_blob(self, workspace_service, tmp_path):
+        """Test that storing the same bytes twice keeps one copy with two references."""
+        pdf_path = create_test_pdf(SAMPLE_RESUME_VALID, tmp_path / "resume.pdf")
+
+        first_id, first_dir = workspace_service.store_resume(pdf_path, SAMPLE_RESUME_VALID, {})
+        second_id, second_dir = workspace_service.store_resume(pdf_path, SAMPLE_RESUME_VALID, {})
+
+        sha256 = json.loads((first_dir / "metadata.json").read_text())["sha256"]
+        blobs = [p for p in workspace_service.blobs_root.iterdir() if p.name not in (".staging", ".locks")]
+        assert [p.name for p in blobs] == [sha256]
+        assert workspace_service.blob_ref_count(sha256) == 2
+        assert first_id != second_id
+        assert (second_dir / "source.pdf").read_bytes() == pdf_path.read_bytes()
+
+    @pytest.mark.unit
+    @pytest.mark.workspace
+    def test_blob_deleted_with_last_reference(self, workspace_service, tmp_path):
+        """Test that deleting a resume keeps a blob other resumes still use."""
+        pdf_path = create_test_pdf(SAMPLE_RESUME_VALID, tmp_path / "resume.pdf")
+        first_id, first_dir = workspace_service.store_resume(pdf_path, SAMPLE_RESUME_VALID, {})
+        second_id, _ = workspace_service.store_resume(pdf_path, SAMPLE_RESUME_VALID, {})
+        sha256 = json.loads((first_dir / "metadata.json").read_text())["sha256"]
+
+        workspace_service.delete_resume(first_id)
+
+        assert (workspace_service.blobs_root / sha256).exists()
+        assert (workspace_service.get_resume_path(second_id) / "extracted.txt").read_text() == SAMPLE_RESUME_VALID
+
+        workspace_service.delete_resume(second_id)
+
+        assert not (workspace_service.blobs_root / sha256).exists()
+
+    @pytest.mark.unit
+    @pytest.mark.workspace
+    @pytest.mark.skipif(fcntl is None, reason="fcntl not available")
+    def test_release_waits_for_other_process_lock(self, temp_workspace):
+        """Test that a blob isn't deleted while another process holds its lock."""
+        service = WorkspaceService(temp_workspace)
+        staged_path, _, sha256 = service.stage_upload(io.BytesIO(b"data"), ".pdf")
+        resume_id, _ = service.store_blob(staged_path, sha256)
+        lock_path = service.blobs_root / ".locks" / f"{sha256}.lock"
+
+        # A separate open file stands in for another process holding the lock
+        with open(lock_path, "a") as other_process:
+            fcntl.flock(other_process, fcntl.LOCK_EX)
+            releasing = threading.Thread(target=service.release_blob, args=(sha256, resume_id))
+            releasing.start()
+            releasing.join(timeout=0.3)
+
+            assert releasing.is_alive()
+            assert (service.blobs_root / sha256).exists()
+
+        releasing.join(timeout=5)
+        assert not (service.blobs_root / sha256).exists()
+
+    @pytest.mark.unit
+    @pytest.mark.workspace
+    @pytest.mark.skipif(fcntl is None, reason="fcntl not available")
+    def test_delete_all_keeps_locks_and_staged_uploads(self, temp_workspace):
+        """Test that deleting everything takes each blob's lock and leaves .locks and .staging."""
+        service = WorkspaceService(temp_workspace)
+        staged_path, _, sha256 = service.stage_upload(io.BytesIO(b"data"), ".pdf")
+        service.store_blob(staged_path, sha256)
+        in_flight, _, _ = service.stage_upload(io.BytesIO(b"other"), ".pdf")
+        lock_path = service.blobs_root / ".locks" / f"{sha256}.lock"
+
+        with open(lock_path, "a") as other_process:
+            fcntl.flock(other_process, fcntl.LOCK_EX)
+            deleting = threading.Thread(target=service.delete_all_resumes)
+            deleting.start()
+            deleting.join(timeout=0.3)
+
+            assert deleting.is_alive()
+            assert (service.blobs_root / sha256).exists()
+
+        deleting.join(timeout=5)
+        assert not (service.blobs_root / sha256).exists()
+        assert lock_path.exists()
+        assert in_flight.exists()
+
+    @pytest.mark.unit
+    @pytest.mark.workspace
+    def test_parse_cache(self, workspace_service):
+        """Test that a cached parse result is returned for the same hash."""
+        staged_path, _, sha256 = workspace_service.stage_upload(io.BytesIO(b"data"), ".docx")
+        workspace_service.store_blob(staged_path, sha256)
+        result = {"text": SAMPLE_RESUME_VALID, "format": "docx", "parser": "python-docx", "success": True}
+
+        assert workspace_service.get_cached_parse(sha256) is None
+        workspace_service.cache_parse(sha256, result)
+
+        assert workspace_service.get_cached_parse(sha256) == result
+
+
 class TestStoreJob:
     """Test job description storage functionality."""
 
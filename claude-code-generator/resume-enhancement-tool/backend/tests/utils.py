@@ -517,3 +517,133 @@ def cleanup_workspace(workspace_path: Path):
 
     if workspace_path.exists():
         shutil.rmtree(workspace_path)
+
+
+# ============================================================================
+# Fake Anthropic Message Batches Server
+# ============================================================================
+
+class FakeBatchServer:
+    """
+    Local HTTP server implementing the Message Batches endpoints.
+
+    Point a real anthropic.Anthropic client at ``url`` (base_url). Batches
+    stay 'in_progress' until end_batch() is called; by default every request
+    succeeds with "# Enhanced <custom_id>".
+    """
+
+    def __init__(self):
+        import json
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        self.batches: Dict[str, Dict[str, Any]] = {}
+        self.requests: Dict[str, list] = {}
+        self.results: Dict[str, list] = {}
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send(self, body: str, content_type: str = "application/json"):
+                data = body.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                payload = json.loads(self.rfile.read(length))
+                batch_id = f"msgbatch_{len(server.batches) + 1}"
+                server.requests[batch_id] = payload["requests"]
+                server.batches[batch_id] = {
+                    "id": batch_id,
+                    "type": "message_batch",
+                    "processing_status": "in_progress",
+                    "request_counts": {
+                        "processing": len(payload["requests"]),
+                        "succeeded": 0,
+                        "errored": 0,
+                        "canceled": 0,
+                        "expired": 0,
+                    },
+                    "created_at": "2026-01-01T00:00:00Z",
+                    "expires_at": "2026-01-02T00:00:00Z",
+                    "ended_at": None,
+                    "archived_at": None,
+                    "cancel_initiated_at": None,
+                    "results_url": None,
+                }
+                self._send(json.dumps(server.batches[batch_id]))
+
+            def do_GET(self):
+                parts = self.path.split("?")[0].rstrip("/").split("/")
+                batch_id = parts[4]
+                if parts[-1] == "results":
+                    lines = [json.dumps(entry) for entry in server.results[batch_id]]
+                    self._send("\n".join(lines) + "\n", "application/binary")
+                else:
+                    self._send(json.dumps(server.batches[batch_id]))
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def end_batch(self, batch_id: str, outcomes: Optional[Dict[str, str]] = None):
+        """
+        Finish a batch.
+
+        Args:
+            batch_id: Batch to end
+            outcomes: Result type per custom_id ("succeeded", "errored",
+                "expired", "canceled"); omitted requests succeed
+        """
+        outcomes = outcomes or {}
+        results = []
+        for request in self.requests[batch_id]:
+            custom_id = request["custom_id"]
+            result_type = outcomes.get(custom_id, "succeeded")
+            if result_type == "succeeded":
+                result = {
+                    "type": "succeeded",
+                    "message": {
+                        "id": f"msg_{custom_id}",
+                        "type": "message",
+                        "role": "assistant",
+                        "model": request["params"]["model"],
+                        "content": [{"type": "text", "text": f"# Enhanced {custom_id}"}],
+                        "stop_reason": "end_turn",
+                        "stop_sequence": None,
+                        "usage": {
+                            "input_tokens": 100,
+                            "output_tokens": 50,
+                            "cache_read_input_tokens": 1500,
+                            "cache_creation_input_tokens": 0,
+                        },
+                    },
+                }
+            elif result_type == "errored":
+                result = {
+                    "type": "errored",
+                    "error": {
+                        "type": "error",
+                        "error": {"type": "invalid_request_error", "message": "prompt is too long"},
+                    },
+                }
+            else:
+                result = {"type": result_type}
+            results.append({"custom_id": custom_id, "result": result})
+
+        self.results[batch_id] = results
+        self.batches[batch_id]["processing_status"] = "ended"
+        self.batches[batch_id]["ended_at"] = "2026-01-01T01:00:00Z"
+        self.batches[batch_id]["results_url"] = f"{self.url}/v1/messages/batches/{batch_id}/results"
+
+    def close(self):
+        """Stop the server."""
+        self._server.shutdown()
+        self._server.server_close()
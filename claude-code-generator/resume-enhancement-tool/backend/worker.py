@@ -1,8 +1,22 @@
 """
 Background worker for processing resume enhancements using Claude API.
 
-This worker polls the database for pending enhancements and processes them
-automatically using the Anthropic Claude API.
+This worker picks up pending enhancements and processes them automatically
+using the Anthropic Claude API. The API signals new jobs through a job
+notifier (LISTEN/NOTIFY on PostgreSQL, loopback UDP otherwise), and idle
+slots fall back to polling with exponential backoff. Jobs are claimed row by row
+(FOR UPDATE SKIP LOCKED on PostgreSQL, lease fallback on SQLite), so
+WORKER_CONCURRENCY slots and multiple worker processes can run side by side.
+Claude generation, PDF/DOCX rendering and cover letters run as separate
+pipeline stages with bounded queues between them.
+
+`python worker.py --batch` submits pending enhancements as Message Batches
+instead (bulk, non-interactive runs); results are fed back into the same
+render pipeline by that command or by any running worker.
+
+Static prompt text (system prompts, the shared formatting guidelines and cover
+letter requirements) is sent ahead of a prompt-cache breakpoint so repeated
+calls reuse the cached prefix.
 
 SECURITY:
 - Uses XML tagging for user content (resume, job description)
@@ -12,17 +26,21 @@ SECURITY:
 
 import os
 import sys
+import json
+import argparse
 import time
+import socket
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
 from sqlalchemy.orm import Session
-from anthropic import Anthropic
 
 from app.core.database import SessionLocal, engine
 from app.models.enhancement import Enhancement
@@ -30,12 +48,26 @@ from app.models.user import User  # Required for FK resolution
 from app.models.resume import Resume  # Required for FK resolution
 from app.models.job import Job  # Required for FK resolution
 from app.core.config import settings
+from app.services.anthropic_client import create_anthropic_client
+from app.services.job_queue import EnhancementQueue
+from app.services.job_notifier import create_job_notifier
+from app.services.message_batches import EnhancementBatches, BatchResult
+from app.services.keyword_index import KeywordIndex
+from app.services.llm_cache import LLMResultCache, request_cache_key
+from app.services.worker_pipeline import PipelineStage
 from app.utils.pdf_generator import PDFGenerator
+from app.utils.docx_generator import DOCXGenerator
+from app.utils.document_exporter import DocumentExporter
 from app.utils.ai_security import (
     sanitize_user_content,
     wrap_user_content,
     validate_enhancement_response,
 )
+from app.utils.prompt_cache import (
+    build_system_blocks,
+    split_formatting_guidelines,
+    log_cache_usage,
+)
 
 # Configure logging
 logging.basicConfig(
@@ -44,6 +76,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Minimum seconds between partial_content writes while streaming
+STREAM_FLUSH_SECONDS = 0.5
+
 
 class EnhancementWorker:
     """Background worker for processing resume enhancements."""
@@ -63,11 +98,45 @@ class EnhancementWorker:
         os.environ.pop('http_proxy', None)
         os.environ.pop('https_proxy', None)
 
-        self.client = Anthropic(api_key=api_key)
+        # Rate limited and retried (429/529/5xx) - see app.services.anthropic_client
+        self.client = create_anthropic_client(api_key)
 
-        # Initialize PDF generator
+        # Initialize PDF and DOCX generators
         templates_dir = self.workspace_root / "templates"
         self.pdf_generator = PDFGenerator(templates_dir)
+        self.docx_generator = DOCXGenerator()
+        self.exporter = DocumentExporter(self.pdf_generator, self.docx_generator)
+
+        # Row-level job claiming shared by all worker slots
+        self.queue = EnhancementQueue(lease_seconds=settings.WORKER_LEASE_SECONDS)
+        self._stop = threading.Event()
+
+        # Identical normalized requests reuse earlier Claude output
+        self.result_cache = LLMResultCache(
+            ttl_seconds=settings.LLM_CACHE_TTL_SECONDS,
+            max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+        )
+
+        # Keyword sets stored with each enhanced resume for ATS analysis
+        self.keyword_index = KeywordIndex()
+
+        # Message Batches mode (worker.py --batch); running workers collect results too
+        self.batches = EnhancementBatches(self.client, lease_seconds=settings.WORKER_LEASE_SECONDS)
+
+        # Job notifications wake idle slots; polling with backoff is the fallback
+        self.notifier = create_job_notifier(
+            settings.JOB_NOTIFIER, settings.DATABASE_URL, settings.JOB_NOTIFY_PORT
+        )
+        self._wakeup = threading.Condition()
+        self._wakeup_generation = 0
+
+        # Pipeline stages fed by the generation slots (threads started in run())
+        self.render_stage = PipelineStage(
+            "render", self._render_stage, queue_size=settings.WORKER_STAGE_QUEUE_SIZE
+        )
+        self.cover_letter_stage = PipelineStage(
+            "cover_letter", self._cover_letter_stage, queue_size=settings.WORKER_STAGE_QUEUE_SIZE
+        )
 
         logger.info("EnhancementWorker initialized successfully")
         logger.info(f"Workspace root (absolute): {self.workspace_root.resolve()}")
@@ -103,7 +172,10 @@ class EnhancementWorker:
 
     def process_enhancement(self, enhancement: Enhancement, db: Session) -> bool:
         """
-        Process a single enhancement using Claude API.
+        Process a single enhancement end to end in the calling thread.
+
+        Runs generation, rendering and the cover letter serially. The worker
+        loop uses the staged pipeline instead (see run()).
 
         Args:
             enhancement: Enhancement object to process
@@ -112,126 +184,198 @@ class EnhancementWorker:
         Returns:
             True if successful, False otherwise
         """
-        logger.info(f"Processing enhancement {enhancement.id}")
-
         try:
-            # Build paths for file storage
-            enhancement_dir = self.workspace_root / "resumes" / "enhanced" / str(enhancement.id)
-            enhancement_dir.mkdir(parents=True, exist_ok=True)
+            self.generate_enhancement(enhancement, db)
+            self.render_enhancement(enhancement, db)
+        except Exception as e:
+            self._fail_enhancement(enhancement, db, e)
+            return False
 
-            # Read from database first, fall back to files if not available
-            # This ensures compatibility with both old file-based records and new DB-based records
-            instructions = enhancement.instructions_text
-            if not instructions:
-                instructions_path = enhancement_dir / "INSTRUCTIONS.md"
-                instructions = self.read_file(instructions_path)
-                logger.info(f"Instructions loaded from file (DB column was empty)")
-
-            # Get resume text from database
-            resume = db.query(Resume).filter(Resume.id == enhancement.resume_id).first()
-            if not resume:
-                raise ValueError(f"Resume not found: {enhancement.resume_id}")
-
-            resume_text = resume.extracted_text
-            if not resume_text:
-                resume_dir = self.workspace_root / "resumes" / "original" / str(enhancement.resume_id)
-                resume_path = resume_dir / "extracted.txt"
-                resume_text = self.read_file(resume_path)
-                logger.info(f"Resume text loaded from file (DB column was empty)")
-
-            if not instructions or not resume_text:
-                raise ValueError("Missing required data (instructions or resume text not found in DB or files)")
-
-            # Read job description from database if this is job tailoring
-            job_description = ""
-            if enhancement.job_id:
-                job = db.query(Job).filter(Job.id == enhancement.job_id).first()
-                if job:
-                    job_description = job.description_text or ""
-                if not job_description:
-                    # Fall back to file
-                    job_dir = self.workspace_root / "jobs" / str(enhancement.job_id)
-                    job_path = job_dir / "description.txt"
-                    job_description = self.read_file(job_path)
-                    logger.info(f"Job description loaded from file (DB column was empty)")
+        # Generate cover letter if this is a job tailoring enhancement
+        if enhancement.job_id:
+            logger.info(f"Generating cover letter for enhancement {enhancement.id}")
+            self.process_cover_letter(enhancement, db)
 
-            # Build prompts for Claude with security measures
-            system_prompt = self._build_system_prompt()
-            user_prompt = self._build_prompt(instructions, resume_text, job_description, enhancement)
+        return True
 
-            logger.info(f"Calling Claude API for enhancement {enhancement.id}")
-            logger.info(f"User prompt length: {len(user_prompt)} characters")
+    def generate_enhancement(self, enhancement: Enhancement, db: Session) -> Path:
+        """
+        Generate the enhanced resume with Claude and persist the markdown.
 
-            # Call Claude API with separate system prompt (SECURITY: prevents prompt injection)
-            response = self.client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=4096,  # COST CONTROL: Reasonable limit for full resumes
-                temperature=0.7,
-                system=system_prompt,  # SECURITY: System prompt separate from user content
-                messages=[{
-                    "role": "user",
-                    "content": user_prompt
-                }]
-            )
+        The enhancement stays 'pending' until render_enhancement completes it.
 
-            # Extract the enhanced resume from response
-            enhanced_resume = response.content[0].text
+        Args:
+            enhancement: Enhancement object to process
+            db: Database session
 
-            # SECURITY: Validate the response structure
-            is_valid, validation_msg = validate_enhancement_response(enhanced_resume)
-            if not is_valid:
-                logger.warning(f"Enhancement response validation warning: {validation_msg}")
+        Returns:
+            Path to the saved enhanced.md
 
-            logger.info(f"Claude API response received ({len(enhanced_resume)} characters)")
+        Raises:
+            ValueError: If instructions or resume text are missing
+        """
+        logger.info(f"Processing enhancement {enhancement.id}")
 
-            # Save enhanced resume to file (for local caching) and database
-            output_path = enhancement_dir / "enhanced.md"
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(enhanced_resume)
+        request = self.build_generation_request(enhancement, db)
 
-            logger.info(f"Saved enhanced resume to {output_path}")
+        # Call Claude API with separate system prompt (SECURITY: prevents prompt injection)
+        enhanced_resume = self._generate_cached(enhancement, db, "resume", **request)
 
-            # Generate PDF from markdown
-            pdf_path = enhancement_dir / "enhanced.pdf"
-            logger.info(f"Generating PDF for enhancement {enhancement.id}")
+        return self.store_enhanced_resume(enhancement, db, enhanced_resume)
 
-            pdf_result = self.pdf_generator.markdown_to_pdf(
-                markdown_path=output_path,
-                output_path=pdf_path,
-                template="modern"
-            )
+    def build_generation_request(self, enhancement: Enhancement, db: Session) -> dict:
+        """
+        Build the Messages API parameters for generating an enhanced resume.
 
-            if pdf_result.get("success"):
-                logger.info(f"PDF generated successfully: {pdf_path}")
-            else:
-                logger.error(f"PDF generation failed: {pdf_result.get('error')}")
+        Shared by the interactive path and Message Batches (--batch) mode.
 
-            # Update enhancement in database (store content for Render compatibility)
-            enhancement.enhanced_content = enhanced_resume  # Store in DB for persistence
-            enhancement.output_path = f"workspace/resumes/enhanced/{enhancement.id}/enhanced.md"
-            enhancement.pdf_path = f"workspace/resumes/enhanced/{enhancement.id}/enhanced.pdf" if pdf_result.get("success") else None
-            enhancement.status = "completed"
-            enhancement.completed_at = datetime.utcnow()
-            db.commit()
+        Args:
+            enhancement: Enhancement object to process
+            db: Database session
 
-            logger.info(f"Enhancement {enhancement.id} completed successfully")
+        Returns:
+            Keyword arguments for messages.create
 
-            # Generate cover letter if this is a job tailoring enhancement
-            if enhancement.job_id:
-                logger.info(f"Generating cover letter for enhancement {enhancement.id}")
-                self.process_cover_letter(enhancement, db)
+        Raises:
+            ValueError: If instructions or resume text are missing
+        """
+        enhancement_dir = self.workspace_root / "resumes" / "enhanced" / str(enhancement.id)
+
+        # Read from database first, fall back to files if not available
+        # This ensures compatibility with both old file-based records and new DB-based records
+        instructions = enhancement.instructions_text
+        if not instructions:
+            instructions_path = enhancement_dir / "INSTRUCTIONS.md"
+            instructions = self.read_file(instructions_path)
+            logger.info(f"Instructions loaded from file (DB column was empty)")
+
+        # Get resume text from database
+        resume = db.query(Resume).filter(Resume.id == enhancement.resume_id).first()
+        if not resume:
+            raise ValueError(f"Resume not found: {enhancement.resume_id}")
+
+        resume_text = resume.extracted_text
+        if not resume_text:
+            resume_dir = self.workspace_root / "resumes" / "original" / str(enhancement.resume_id)
+            resume_path = resume_dir / "extracted.txt"
+            resume_text = self.read_file(resume_path)
+            logger.info(f"Resume text loaded from file (DB column was empty)")
+
+        if not instructions or not resume_text:
+            raise ValueError("Missing required data (instructions or resume text not found in DB or files)")
+
+        # Read job description from database if this is job tailoring
+        job_description = ""
+        if enhancement.job_id:
+            job = db.query(Job).filter(Job.id == enhancement.job_id).first()
+            if job:
+                job_description = job.description_text or ""
+            if not job_description:
+                # Fall back to file
+                job_dir = self.workspace_root / "jobs" / str(enhancement.job_id)
+                job_path = job_dir / "description.txt"
+                job_description = self.read_file(job_path)
+                logger.info(f"Job description loaded from file (DB column was empty)")
+
+        # Build prompts for Claude with security measures. The shared formatting
+        # guidelines move into the cached system prefix.
+        instructions, guidelines = split_formatting_guidelines(instructions)
+        system_prompt = build_system_blocks(self._build_system_prompt(), guidelines)
+        user_prompt = self._build_prompt(instructions, resume_text, job_description, enhancement)
+
+        logger.info(f"User prompt length: {len(user_prompt)} characters")
+
+        return dict(
+            model="claude-sonnet-4-20250514",
+            max_tokens=4096,  # COST CONTROL: Reasonable limit for full resumes
+            temperature=0.7,
+            system=system_prompt,  # SECURITY: System prompt separate from user content
+            messages=[{
+                "role": "user",
+                "content": user_prompt
+            }]
+        )
+
+    def store_enhanced_resume(self, enhancement: Enhancement, db: Session, enhanced_resume: str) -> Path:
+        """
+        Validate and persist a generated resume (file and database).
 
-            return True
+        Args:
+            enhancement: Enhancement the resume was generated for
+            db: Database session
+            enhanced_resume: Markdown returned by Claude
 
-        except Exception as e:
-            logger.error(f"Error processing enhancement {enhancement.id}: {e}", exc_info=True)
+        Returns:
+            Path to the saved enhanced.md
+        """
+        enhancement_dir = self.workspace_root / "resumes" / "enhanced" / str(enhancement.id)
+        enhancement_dir.mkdir(parents=True, exist_ok=True)
 
-            # Update enhancement with error
-            enhancement.status = "failed"
-            enhancement.error_message = str(e)
-            db.commit()
+        # SECURITY: Validate the response structure
+        is_valid, validation_msg = validate_enhancement_response(enhanced_resume)
+        if not is_valid:
+            logger.warning(f"Enhancement response validation warning: {validation_msg}")
 
-            return False
+        logger.info(f"Claude API response received ({len(enhanced_resume)} characters)")
+
+        # Save enhanced resume to file (for local caching) and database
+        output_path = enhancement_dir / "enhanced.md"
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(enhanced_resume)
+
+        enhancement.enhanced_content = enhanced_resume  # Store in DB for persistence
+        enhancement.partial_content = None  # Streaming finished; final content is authoritative
+        enhancement.output_path = f"workspace/resumes/enhanced/{enhancement.id}/enhanced.md"
+        self.keyword_index.index(enhancement, enhanced_resume)
+        db.commit()
+
+        logger.info(f"Saved enhanced resume to {output_path}")
+        return output_path
+
+    def render_enhancement(self, enhancement: Enhancement, db: Session) -> None:
+        """
+        Render PDF and DOCX for a generated enhancement and mark it completed.
+
+        Rendering failures are logged, not raised: the markdown is already
+        persisted and the download routes regenerate missing files.
+
+        Args:
+            enhancement: Enhancement whose enhanced.md has been generated
+            db: Database session
+        """
+        enhancement_dir = self.workspace_root / "resumes" / "enhanced" / str(enhancement.id)
+        output_path = enhancement_dir / "enhanced.md"
+        if not output_path.exists() and enhancement.enhanced_content:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_path.write_text(enhancement.enhanced_content, encoding="utf-8")
+
+        # Generate PDF and DOCX from one parse so downloads don't render on request
+        logger.info(f"Exporting PDF and DOCX for enhancement {enhancement.id}")
+        results = self.exporter.export_all(
+            output_path,
+            {"pdf": enhancement_dir / "enhanced.pdf", "docx": enhancement_dir / "enhanced.docx"},
+            template="modern",
+        )
+
+        # Update enhancement in database
+        enhancement.pdf_path = f"workspace/resumes/enhanced/{enhancement.id}/enhanced.pdf" if results["pdf"]["success"] else None
+        enhancement.docx_path = f"workspace/resumes/enhanced/{enhancement.id}/enhanced.docx" if results["docx"]["success"] else None
+        enhancement.status = "completed"
+        enhancement.completed_at = datetime.utcnow()
+        db.commit()
+
+        logger.info(f"Enhancement {enhancement.id} completed successfully")
+
+    def _fail_enhancement(self, enhancement: Enhancement, db: Session, error: Exception) -> None:
+        """Record an enhancement failure."""
+        logger.error(f"Error processing enhancement {enhancement.id}: {error}", exc_info=True)
+
+        # Update enhancement with error
+        db.rollback()
+        enhancement.status = "failed"
+        enhancement.error_message = str(error)
+        enhancement.partial_content = None
+        db.commit()
 
     def process_cover_letter(self, enhancement: Enhancement, db: Session) -> bool:
         """
@@ -274,13 +418,17 @@ class EnhancementWorker:
                 raise ValueError("Missing enhanced resume or job description")
 
             # Build cover letter prompts with security measures
-            system_prompt = self._build_cover_letter_system_prompt()
+            system_prompt = build_system_blocks(
+                self._build_cover_letter_system_prompt(),
+                self._build_cover_letter_requirements(),
+            )
             user_prompt = self._build_cover_letter_prompt(enhanced_resume, job_description, enhancement)
 
-            logger.info(f"Calling Claude API for cover letter {enhancement.id}")
-
             # Call Claude API with separate system prompt (SECURITY: prevents prompt injection)
-            response = self.client.messages.create(
+            cover_letter = self._generate_cached(
+                enhancement,
+                db,
+                "cover letter",
                 model="claude-sonnet-4-20250514",
                 max_tokens=1000,  # COST CONTROL: Cover letters are short (200 words max)
                 temperature=0.7,
@@ -291,9 +439,6 @@ class EnhancementWorker:
                 }]
             )
 
-            # Extract cover letter
-            cover_letter = response.content[0].text
-
             logger.info(f"Cover letter generated ({len(cover_letter)} characters)")
 
             # Save cover letter to file (for local caching) and database
@@ -303,25 +448,20 @@ class EnhancementWorker:
 
             logger.info(f"Saved cover letter to {cover_letter_path}")
 
-            # Generate PDF from cover letter markdown
-            cover_letter_pdf_path = enhancement_dir / "cover_letter.pdf"
-            logger.info(f"Generating cover letter PDF for enhancement {enhancement.id}")
-
-            cover_pdf_result = self.pdf_generator.markdown_to_pdf(
-                markdown_path=cover_letter_path,
-                output_path=cover_letter_pdf_path,
-                template="modern"
+            # Generate PDF and DOCX from the cover letter markdown in one pass
+            logger.info(f"Exporting cover letter PDF and DOCX for enhancement {enhancement.id}")
+            cover_results = self.exporter.export_all(
+                cover_letter_path,
+                {"pdf": enhancement_dir / "cover_letter.pdf", "docx": enhancement_dir / "cover_letter.docx"},
+                template="modern",
             )
 
-            if cover_pdf_result.get("success"):
-                logger.info(f"Cover letter PDF generated successfully: {cover_letter_pdf_path}")
-            else:
-                logger.error(f"Cover letter PDF generation failed: {cover_pdf_result.get('error')}")
-
             # Update enhancement in database (store content for Render compatibility)
             enhancement.cover_letter_content = cover_letter  # Store in DB for persistence
+            enhancement.partial_content = None  # Streaming finished; final content is authoritative
             enhancement.cover_letter_path = f"workspace/resumes/enhanced/{enhancement.id}/cover_letter.md"
-            enhancement.cover_letter_pdf_path = f"workspace/resumes/enhanced/{enhancement.id}/cover_letter.pdf" if cover_pdf_result.get("success") else None
+            enhancement.cover_letter_pdf_path = f"workspace/resumes/enhanced/{enhancement.id}/cover_letter.pdf" if cover_results["pdf"]["success"] else None
+            enhancement.cover_letter_docx_path = f"workspace/resumes/enhanced/{enhancement.id}/cover_letter.docx" if cover_results["docx"]["success"] else None
             enhancement.cover_letter_status = "completed"
             db.commit()
 
@@ -332,12 +472,95 @@ class EnhancementWorker:
             logger.error(f"Error processing cover letter for {enhancement.id}: {e}", exc_info=True)
 
             # Update enhancement with error
+            db.rollback()
             enhancement.cover_letter_status = "failed"
             enhancement.cover_letter_error = str(e)
+            enhancement.partial_content = None
             db.commit()
 
             return False
 
+    def _generate_cached(self, enhancement: Enhancement, db: Session, purpose: str, **request) -> str:
+        """
+        Return cached output for an identical request, or call Claude and cache it.
+
+        Enhancement, resume and job IDs are normalized out of the cache key,
+        so re-submitting the same resume, job and style is a cache hit.
+        """
+        cache_key = None
+        if settings.LLM_CACHE_ENABLED:
+            cache_key = request_cache_key(
+                request,
+                volatile=[str(enhancement.id), str(enhancement.resume_id), str(enhancement.job_id or "")],
+            )
+            try:
+                cached = self.result_cache.get(db, cache_key)
+            except Exception as e:
+                db.rollback()
+                logger.warning(f"Result cache lookup failed: {e}")
+                cached = None
+            if cached is not None:
+                logger.info(f"Result cache hit for {purpose} {enhancement.id}")
+                return cached
+
+        logger.info(f"Calling Claude API for {purpose} {enhancement.id}")
+        text = self._generate_text(enhancement, db, purpose, **request)
+
+        if cache_key:
+            try:
+                self.result_cache.put(db, cache_key, request["model"], text)
+            except Exception as e:
+                db.rollback()
+                logger.warning(f"Failed to store result in cache: {e}")
+        return text
+
+    def _generate_text(self, enhancement: Enhancement, db: Session, purpose: str, **request) -> str:
+        """
+        Call Claude and return the generated text.
+
+        With WORKER_STREAMING enabled the Messages streaming API is used and
+        text is flushed into enhancement.partial_content as it arrives (at
+        most every STREAM_FLUSH_SECONDS), which GET /enhancements/{id}/stream
+        relays to the browser. A stream that fails part-way with a transient
+        error is restarted from scratch (see messages.stream_text()), and
+        partial_content is cleared so the browser discards the abandoned text.
+
+        Args:
+            enhancement: Enhancement being generated
+            db: Database session
+            purpose: What is being generated (for usage logging)
+            **request: Keyword arguments for messages.create / messages.stream
+
+        Returns:
+            Full generated text
+        """
+        if not settings.WORKER_STREAMING:
+            response = self.client.messages.create(**request)
+            log_cache_usage(response.usage, f"{purpose} {enhancement.id}")
+            return response.content[0].text
+
+        chunks = []
+        last_flush = time.monotonic()
+
+        def on_text(text: str) -> None:
+            nonlocal last_flush
+            chunks.append(text)
+            if time.monotonic() - last_flush >= STREAM_FLUSH_SECONDS:
+                enhancement.partial_content = "".join(chunks)
+                db.commit()
+                last_flush = time.monotonic()
+
+        def on_restart() -> None:
+            chunks.clear()
+            if enhancement.partial_content:
+                enhancement.partial_content = None
+                db.commit()
+
+        response = self.client.messages.stream_text(on_text, on_restart, **request)
+
+        log_cache_usage(response.usage, f"{purpose} {enhancement.id}")
+        return response.content[0].text
+
     def _build_cover_letter_system_prompt(self) -> str:
         """Build the system prompt for cover letter generation with security guardrails."""
         return """You are a professional cover letter writer. Your task is to create compelling cover letters.
@@ -354,30 +577,9 @@ OUTPUT REQUIREMENTS:
 - Keep to 175-200 words maximum.
 - Do not include explanations or commentary."""
 
-    def _build_cover_letter_prompt(
-        self,
-        enhanced_resume: str,
-        job_description: str,
-        enhancement: Enhancement
-    ) -> str:
-        """Build the user prompt for cover letter generation with XML-tagged content.
-
-        SECURITY: User content is sanitized and wrapped in XML tags.
-        """
-        # SECURITY: Sanitize and wrap content
-        sanitized_resume = sanitize_user_content(enhanced_resume, "cover_letter_resume")
-        wrapped_resume = wrap_user_content(sanitized_resume, "enhanced_resume")
-
-        sanitized_job = sanitize_user_content(job_description, "cover_letter_job")
-        wrapped_job = wrap_user_content(sanitized_job, "job_description")
-
-        prompt = f"""# SOURCE MATERIALS
-
-{wrapped_resume}
-
-{wrapped_job}
-
-# COVER LETTER REQUIREMENTS
+    def _build_cover_letter_requirements(self) -> str:
+        """Build the static cover letter requirements (cached system prompt block)."""
+        return """# COVER LETTER REQUIREMENTS
 
 **Length:** 175-200 words maximum (STRICT LIMIT - single page only)
 **Style:** Professional, formal tone matching the resume
@@ -400,11 +602,34 @@ OUTPUT REQUIREMENTS:
 
 **Word Count Validation:**
 Before submitting, count words. Must be 175-200 words total.
-If over 200 words, cut content aggressively.
+If over 200 words, cut content aggressively."""
+
+    def _build_cover_letter_prompt(
+        self,
+        enhanced_resume: str,
+        job_description: str,
+        enhancement: Enhancement
+    ) -> str:
+        """Build the user prompt for cover letter generation with XML-tagged content.
+
+        SECURITY: User content is sanitized and wrapped in XML tags.
+        """
+        # SECURITY: Sanitize and wrap content
+        sanitized_resume = sanitize_user_content(enhanced_resume, "cover_letter_resume")
+        wrapped_resume = wrap_user_content(sanitized_resume, "enhanced_resume")
+
+        sanitized_job = sanitize_user_content(job_description, "cover_letter_job")
+        wrapped_job = wrap_user_content(sanitized_job, "job_description")
+
+        prompt = f"""# SOURCE MATERIALS
+
+{wrapped_resume}
+
+{wrapped_job}
 
 # YOUR TASK
 
-Generate a professional cover letter following ALL requirements above. Output ONLY the cover letter in markdown format.
+Generate a professional cover letter following ALL cover letter requirements in your instructions. Output ONLY the cover letter in markdown format.
 
 Output the cover letter now:
 """
@@ -486,77 +711,388 @@ Output the enhanced resume in markdown format now:
 
         return prompt
 
-    def run(self, poll_interval: int = 10):
+    def process_next(self, db: Session, worker_id: str) -> bool:
         """
-        Run the worker in a continuous loop.
+        Claim one job and run its generation stage.
+
+        Generated enhancements are handed to the render stage (and from there
+        to the cover letter stage); the lease is released by the last stage
+        that touches the row.
 
         Args:
-            poll_interval: Seconds to wait between polling cycles
+            db: Database session
+            worker_id: Identifier of the worker slot claiming the job
+
+        Returns:
+            True if a job was claimed, False if the queue was empty
         """
-        logger.info(f"Worker started. Polling every {poll_interval} seconds...")
+        enhancement = self.queue.claim_enhancement(db, worker_id)
+        if enhancement:
+            handed_off = False
+            try:
+                self.generate_enhancement(enhancement, db)
+                handed_off = self.render_stage.submit(enhancement.id, self._stop)
+            except Exception as e:
+                self._fail_enhancement(enhancement, db, e)
+            finally:
+                if not handed_off:
+                    self._release(enhancement, db)
+            return True
+
+        enhancement = self.queue.claim_cover_letter(db, worker_id)
+        if enhancement:
+            if not self.cover_letter_stage.submit(enhancement.id, self._stop):
+                self._release(enhancement, db)
+            return True
+
+        return False
+
+    def _render_stage(self, enhancement_id) -> None:
+        """Render stage handler: PDF/DOCX, then hand off to the cover letter stage."""
+        db = SessionLocal()
+        try:
+            enhancement = db.query(Enhancement).filter(Enhancement.id == enhancement_id).first()
+            if not enhancement:
+                return
 
-        while True:
             try:
-                # Create database session
-                db = SessionLocal()
+                self.render_enhancement(enhancement, db)
+            except Exception as e:
+                self._fail_enhancement(enhancement, db, e)
+                self._release(enhancement, db)
+                return
 
-                try:
-                    # Get pending enhancements
-                    pending = self.get_pending_enhancements(db)
+            # Generate cover letter if this is a job tailoring enhancement
+            if enhancement.job_id and self.cover_letter_stage.submit(enhancement.id, self._stop):
+                return
+            self._release(enhancement, db)
+        finally:
+            db.close()
+
+    def _cover_letter_stage(self, enhancement_id) -> None:
+        """Cover letter stage handler: generate and render the cover letter."""
+        db = SessionLocal()
+        try:
+            enhancement = db.query(Enhancement).filter(Enhancement.id == enhancement_id).first()
+            if not enhancement:
+                return
+
+            logger.info(f"Generating cover letter for enhancement {enhancement.id}")
+            try:
+                self.process_cover_letter(enhancement, db)
+            finally:
+                self._release(enhancement, db)
+        finally:
+            db.close()
+
+    def _release(self, enhancement: Enhancement, db: Session) -> None:
+        """Release the lease on a claimed enhancement (expiry covers failures here)."""
+        try:
+            self.queue.release(db, enhancement)
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Failed to release lease on enhancement {enhancement.id}: {e}")
+
+    def submit_batches(self, limit: Optional[int] = None) -> List[str]:
+        """
+        Claim pending enhancements and submit them as Message Batches.
 
-                    if pending:
-                        logger.info(f"Found {len(pending)} pending enhancement(s)")
+        Args:
+            limit: Maximum enhancements to submit (default: all claimable)
 
-                        for enhancement in pending:
-                            logger.info(f"Processing enhancement {enhancement.id}")
-                            self.process_enhancement(enhancement, db)
-                    else:
-                        logger.debug("No pending enhancements")
+        Returns:
+            Ids of the submitted batches
+        """
+        worker_id = f"{socket.gethostname()}:{os.getpid()}:batch"
+        batch_size = settings.WORKER_BATCH_MAX_REQUESTS
+        batch_ids = []
+        submitted = 0
+        exhausted = False
+
+        while not exhausted and (limit is None or submitted < limit):
+            db = SessionLocal()
+            try:
+                requests = []
+                while len(requests) < batch_size and (limit is None or submitted + len(requests) < limit):
+                    enhancement = self.queue.claim_enhancement(db, worker_id)
+                    if not enhancement:
+                        exhausted = True
+                        break
+
+                    try:
+                        requests.append((enhancement, self.build_generation_request(enhancement, db)))
+                    except Exception as e:
+                        self._fail_enhancement(enhancement, db, e)
+                        self._release(enhancement, db)
+
+                if not requests:
+                    break
+
+                try:
+                    batch_ids.append(self.batches.submit(db, requests))
+                except Exception:
+                    db.rollback()
+                    for enhancement, _ in requests:
+                        self._release(enhancement, db)
+                    raise
+                submitted += len(requests)
+            finally:
+                db.close()
+
+        logger.info(f"Submitted {submitted} enhancement(s) in {len(batch_ids)} Message Batch(es)")
+        return batch_ids
+
+    def collect_batches(self) -> int:
+        """
+        Feed the results of ended Message Batches into the render pipeline.
+
+        Returns:
+            Number of batches still processing
+        """
+        db = SessionLocal()
+        try:
+            processing = 0
+            for batch_id in self.batches.pending_batch_ids(db):
+                results = self.batches.collect(batch_id)
+                if results is None:
+                    processing += 1
+                    continue
+
+                for result in results:
+                    self._apply_batch_result(db, batch_id, result)
+                self.batches.detach_remaining(db, batch_id)
+            return processing
+        finally:
+            db.close()
+
+    def _apply_batch_result(self, db: Session, batch_id: str, result: BatchResult) -> None:
+        """Persist one batch result and hand it to the render stage."""
+        worker_id = f"{socket.gethostname()}:{os.getpid()}:batch"
+        enhancement = self.batches.take(db, result.enhancement_id, batch_id, worker_id)
+        if not enhancement:
+            return  # Collected by another worker, or deleted
+
+        handed_off = False
+        try:
+            if result.text is not None:
+                log_cache_usage(result.usage, f"batched resume {enhancement.id}")
+                self.store_enhanced_resume(enhancement, db, result.text)
+                handed_off = self.render_stage.submit(enhancement.id, self._stop)
+            elif result.retry:
+                logger.info(f"Enhancement {enhancement.id} returned to the queue ({result.error})")
+            else:
+                self._fail_enhancement(enhancement, db, RuntimeError(result.error))
+        except Exception as e:
+            self._fail_enhancement(enhancement, db, e)
+        finally:
+            if not handed_off:
+                self._release(enhancement, db)
+
+    def _poll_batches(self) -> None:
+        """Collect Message Batch results in the background of a running worker."""
+        while not self._stop.is_set():
+            try:
+                self.collect_batches()
+            except Exception as e:
+                logger.error(f"Error collecting Message Batch results: {e}", exc_info=True)
+            self._stop.wait(settings.WORKER_BATCH_POLL_SECONDS)
 
-                    # Get pending cover letters
-                    pending_cover_letters = self.get_pending_cover_letters(db)
+    def run_batch(self, wait: bool = True) -> None:
+        """
+        Submit all pending enhancements as Message Batches.
 
-                    if pending_cover_letters:
-                        logger.info(f"Found {len(pending_cover_letters)} pending cover letter(s)")
+        Args:
+            wait: Poll until every batch has ended and its results are rendered
+                (otherwise a running worker collects them)
+        """
+        batch_ids = self.submit_batches()
+        if not wait or not batch_ids:
+            return
+
+        thread_count = settings.WORKER_RENDER_CONCURRENCY + settings.WORKER_COVER_LETTER_CONCURRENCY
+        self.render_stage.concurrency = settings.WORKER_RENDER_CONCURRENCY
+        self.cover_letter_stage.concurrency = settings.WORKER_COVER_LETTER_CONCURRENCY
+
+        with ThreadPoolExecutor(max_workers=thread_count, thread_name_prefix="enhancement-batch") as pool:
+            self.render_stage.start(pool, self._stop)
+            self.cover_letter_stage.start(pool, self._stop)
+
+            while not self._stop.is_set():
+                processing = self.collect_batches()
+                if not processing:
+                    break
+                logger.info(f"Waiting for {processing} Message Batch(es) to finish processing...")
+                self._stop.wait(settings.WORKER_BATCH_POLL_SECONDS)
+
+            if not self._stop.is_set():
+                self.render_stage.queue.join()
+                self.cover_letter_stage.queue.join()
+            self.stop()
+
+    def _run_slot(self, slot: int, poll_interval: int, max_poll_interval: int) -> None:
+        """
+        Claim and process jobs until stopped, waiting only when the queue is empty.
 
-                        for enhancement in pending_cover_letters:
-                            logger.info(f"Processing cover letter for {enhancement.id}")
-                            self.process_cover_letter(enhancement, db)
-                    else:
-                        logger.debug("No pending cover letters")
+        An idle slot wakes as soon as a job notification arrives. Without
+        notifications it polls with exponential backoff, starting at
+        poll_interval and doubling up to max_poll_interval.
 
+        Args:
+            slot: Slot number within this worker process
+            poll_interval: Initial seconds to wait after finding no claimable job
+            max_poll_interval: Upper bound for the backoff delay
+        """
+        worker_id = f"{socket.gethostname()}:{os.getpid()}:{slot}"
+        logger.info(f"Worker slot {worker_id} started")
+        delay = poll_interval
+
+        while not self._stop.is_set():
+            # Snapshot before claiming so a notification that arrives while
+            # the queue is being checked is not slept through
+            seen_generation = self._wakeup_generation
+            processed = False
+            try:
+                db = SessionLocal()
+                try:
+                    processed = self.process_next(db, worker_id)
                 finally:
                     db.close()
-
             except Exception as e:
-                logger.error(f"Error in worker loop: {e}", exc_info=True)
+                logger.error(f"Error in worker slot {worker_id}: {e}", exc_info=True)
+
+            if processed:
+                delay = poll_interval
+                continue
+
+            logger.debug(f"No claimable jobs for slot {worker_id}, waiting up to {delay}s")
+            with self._wakeup:
+                notified = self._wakeup.wait_for(
+                    lambda: self._wakeup_generation != seen_generation or self._stop.is_set(),
+                    timeout=delay,
+                )
+            delay = poll_interval if notified else min(delay * 2, max_poll_interval)
+
+    def _listen_for_jobs(self) -> None:
+        """Relay job notifications from the notifier to idle worker slots."""
+        while not self._stop.is_set():
+            try:
+                notified = self.notifier.wait(timeout=1.0)
+            except Exception as e:
+                logger.error(f"Error waiting for job notifications: {e}", exc_info=True)
+                self._stop.wait(1.0)
+                continue
+
+            if notified:
+                logger.debug("Job notification received, waking idle slots")
+                self._wake_slots()
+
+        self.notifier.close()
 
-            # Write heartbeat
+    def _wake_slots(self) -> None:
+        with self._wakeup:
+            self._wakeup_generation += 1
+            self._wakeup.notify_all()
+
+    def _write_heartbeat(self, concurrency: int) -> None:
+        """Write worker status to the workspace for the debug endpoint."""
+        try:
+            db = SessionLocal()
             try:
                 # Count total enhancements to verify DB integrity
                 total_enhancements = db.query(Enhancement).count()
-                pending_count = len(pending) if 'pending' in locals() else 0
-                
-                with open(self.workspace_root / "worker_heartbeat.json", "w") as f:
-                    import json
-                    status = {
-                        "last_beat": datetime.now().isoformat(),
-                        "status": "running",
-                        "api_key_configured": bool(self.client.api_key),
-                        "pending_enhancements": pending_count,
-                        "total_db_records": total_enhancements,
-                        "db_url_masked": str(settings.DATABASE_URL).split("@")[-1] if "@" in str(settings.DATABASE_URL) else "sqlite"
-                    }
-                    json.dump(status, f)
-            except Exception as hb_err:
-                logger.error(f"Failed to write heartbeat: {hb_err}")
-
-            # Wait before next poll
-            time.sleep(poll_interval)
+                pending_count = db.query(Enhancement).filter(Enhancement.status == "pending").count()
+            finally:
+                db.close()
+
+            with open(self.workspace_root / "worker_heartbeat.json", "w") as f:
+                status = {
+                    "last_beat": datetime.now().isoformat(),
+                    "status": "running",
+                    "api_key_configured": bool(self.client.api_key),
+                    "worker_slots": concurrency,
+                    "llm_cache": self.result_cache.stats(),
+                    "pending_enhancements": pending_count,
+                    "total_db_records": total_enhancements,
+                    "db_url_masked": str(settings.DATABASE_URL).split("@")[-1] if "@" in str(settings.DATABASE_URL) else "sqlite"
+                }
+                json.dump(status, f)
+        except Exception as hb_err:
+            logger.error(f"Failed to write heartbeat: {hb_err}")
+
+    def stop(self) -> None:
+        """Signal all worker slots to stop after their current job."""
+        self._stop.set()
+        self._wake_slots()
+
+    def run(
+        self,
+        poll_interval: int = 10,
+        concurrency: int = 1,
+        max_poll_interval: Optional[int] = None,
+        render_concurrency: Optional[int] = None,
+        cover_letter_concurrency: Optional[int] = None,
+    ):
+        """
+        Run the worker as a staged pipeline.
+
+        Stages: generation (Claude call + markdown persistence) -> rendering
+        (PDF/DOCX) -> cover letter. Each stage has its own threads and a
+        bounded queue, so CPU-bound rendering overlaps with network-bound
+        generation. Generation slots claim rows independently (see
+        app.services.job_queue), so several worker processes can share the
+        queue without processing the same enhancement twice. Idle slots are
+        woken by job notifications (see app.services.job_notifier).
+
+        Args:
+            poll_interval: Initial seconds an idle slot waits before polling again
+                (also the heartbeat interval)
+            concurrency: Number of generation slots in this process
+            max_poll_interval: Upper bound for the idle backoff
+                (defaults to WORKER_MAX_POLL_SECONDS)
+            render_concurrency: Render stage threads (defaults to WORKER_RENDER_CONCURRENCY)
+            cover_letter_concurrency: Cover letter stage threads
+                (defaults to WORKER_COVER_LETTER_CONCURRENCY)
+        """
+        render_concurrency = render_concurrency or settings.WORKER_RENDER_CONCURRENCY
+        cover_letter_concurrency = cover_letter_concurrency or settings.WORKER_COVER_LETTER_CONCURRENCY
+        self.render_stage.concurrency = render_concurrency
+        self.cover_letter_stage.concurrency = cover_letter_concurrency
+
+        max_poll_interval = max(poll_interval, max_poll_interval or settings.WORKER_MAX_POLL_SECONDS)
+        logger.info(
+            f"Worker started with {concurrency} slot(s). "
+            f"Idle polling backs off from {poll_interval}s to {max_poll_interval}s between notifications..."
+        )
+
+        thread_count = 2 + concurrency + render_concurrency + cover_letter_concurrency
+        with ThreadPoolExecutor(max_workers=thread_count, thread_name_prefix="enhancement-slot") as pool:
+            pool.submit(self._listen_for_jobs)
+            pool.submit(self._poll_batches)
+            self.render_stage.start(pool, self._stop)
+            self.cover_letter_stage.start(pool, self._stop)
+            for slot in range(concurrency):
+                pool.submit(self._run_slot, slot, poll_interval, max_poll_interval)
+
+            while not self._stop.is_set():
+                self._write_heartbeat(concurrency)
+                self._stop.wait(poll_interval)
 
 
 def main():
     """Main entry point for the worker."""
+    parser = argparse.ArgumentParser(description="Resume enhancement worker")
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Submit pending enhancements as Message Batches, wait for the results and exit",
+    )
+    parser.add_argument(
+        "--no-wait",
+        action="store_true",
+        help="With --batch, exit after submitting (a running worker collects the results)",
+    )
+    args = parser.parse_args()
+
     logger.info("Starting Enhancement Worker...")
 
     # Verify database connection
@@ -573,7 +1109,15 @@ def main():
     # Create and run worker
     try:
         worker = EnhancementWorker()
-        worker.run(poll_interval=10)
+        if args.batch:
+            worker.run_batch(wait=not args.no_wait)
+            return
+        worker.run(
+            poll_interval=10,
+            concurrency=settings.WORKER_CONCURRENCY,
+            render_concurrency=settings.WORKER_RENDER_CONCURRENCY,
+            cover_letter_concurrency=settings.WORKER_COVER_LETTER_CONCURRENCY,
+        )
     except Exception as e:
         logger.critical(f"Worker failed to start: {e}", exc_info=True)
         # Write error to workspace for debugging
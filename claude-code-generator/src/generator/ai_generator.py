@@ -16,6 +16,7 @@ from anthropic import Anthropic, APIError, APIConnectionError, RateLimitError
 from datetime import datetime
 
 from .constants import CLAUDE_MODEL, API_TEMPERATURE
+from .api_client import RateLimitedClient, client_options, get_rate_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -158,9 +159,13 @@ class AIAgentGenerator:
         self.config = config
         self.cache_manager = cache_manager
 
-        # Initialize Claude client if API key available
+        # Initialize Claude client if API key available (rate limited, retries 429/529)
         if self.config.api_key:
-            self.client = Anthropic(api_key=self.config.api_key)
+            limiter = get_rate_limiter()
+            self.client = RateLimitedClient(
+                Anthropic(api_key=self.config.api_key, **client_options(limiter)),
+                limiter,
+            )
         else:
             self.client = None
             if self.config.enabled:
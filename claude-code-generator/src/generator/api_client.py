@@ -0,0 +1,263 @@
+"""
+Claude API Client Wrapper - Rate limiting and retries for Anthropic API calls.
+
+Wraps an Anthropic client so messages.create is:
+- Throttled by token buckets for requests and input tokens per minute. The
+  buckets start from constants and are resized from the anthropic-ratelimit-*
+  headers of every response (observed through an httpx response hook).
+- Capped at API_MAX_CONCURRENCY requests in flight.
+- Retried with full-jitter exponential backoff on 408/409/429, 5xx
+  (including 529 overloaded) and connection errors, honouring retry-after.
+
+The backend (resume-enhancement-tool) ships the same design in
+app/services/anthropic_client.py.
+"""
+
+import json
+import logging
+import random
+import threading
+import time
+from collections.abc import Mapping
+from typing import Any, Callable, Optional
+
+import httpx
+from anthropic import APIConnectionError, APIStatusError, DefaultHttpxClient
+
+from .constants import (
+    API_INPUT_TOKENS_PER_MINUTE,
+    API_MAX_CONCURRENCY,
+    API_MAX_RETRIES,
+    API_REQUESTS_PER_MINUTE,
+)
+
+logger = logging.getLogger(__name__)
+
+# Status codes worth retrying besides 5xx (same set the SDK retries)
+RETRYABLE_STATUS_CODES = {408, 409, 429}
+
+# Rough prompt size estimate used before the API reports real usage
+CHARS_PER_TOKEN = 4
+
+
+def is_retryable(error: Exception) -> bool:
+    """Check whether an API error is transient (rate limited, overloaded, network)."""
+    if isinstance(error, APIConnectionError):
+        return True
+    if isinstance(error, APIStatusError):
+        return error.status_code in RETRYABLE_STATUS_CODES or error.status_code >= 500
+    return False
+
+
+def _header_number(headers: Optional[Mapping[str, str]], name: str) -> Optional[float]:
+    if not headers:
+        return None
+    try:
+        return float(headers.get(name))
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """Per-minute budget that refills continuously."""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.level = float(per_minute)
+        self.updated = time.monotonic()
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until `amount` is available (0 if available now)."""
+        elapsed = max(0.0, now - self.updated)
+        self.level = min(self.capacity, self.level + elapsed * self.capacity / 60)
+        self.updated = now
+        if self.level >= amount:
+            return 0.0
+        return (amount - self.level) * 60 / self.capacity
+
+
+class RateLimiter:
+    """Request/input-token buckets plus an in-flight ceiling, shared by threads."""
+
+    def __init__(
+        self,
+        requests_per_minute: int = API_REQUESTS_PER_MINUTE,
+        input_tokens_per_minute: int = API_INPUT_TOKENS_PER_MINUTE,
+        max_concurrency: int = API_MAX_CONCURRENCY,
+    ):
+        """
+        Initialize rate limiter.
+
+        Args:
+            requests_per_minute: Initial request budget (replaced by response headers)
+            input_tokens_per_minute: Initial input-token budget (replaced by response headers)
+            max_concurrency: Maximum requests in flight at once
+        """
+        self.requests = TokenBucket(requests_per_minute)
+        self.input_tokens = TokenBucket(input_tokens_per_minute)
+        self.max_concurrency = max_concurrency
+        self.in_flight = 0
+        self.blocked_until = 0.0
+        self._condition = threading.Condition()
+
+    def acquire(self, estimated_tokens: int = 1) -> None:
+        """Block until a request of this size may start."""
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                tokens = min(estimated_tokens, self.input_tokens.capacity)
+                wait = max(
+                    self.blocked_until - now,
+                    self.requests.wait_time(1, now),
+                    self.input_tokens.wait_time(tokens, now),
+                )
+
+                if self.in_flight < self.max_concurrency and wait <= 0:
+                    self.requests.level -= 1
+                    self.input_tokens.level -= tokens
+                    self.in_flight += 1
+                    return
+
+                self._condition.wait(timeout=wait if wait > 0 else None)
+
+    def release(self) -> None:
+        """Mark a request as finished."""
+        with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    def update(self, headers: Mapping[str, str], status_code: Optional[int] = None) -> None:
+        """
+        Resize buckets from anthropic-ratelimit-* response headers.
+
+        Args:
+            headers: Response headers
+            status_code: Response status; a 429 pauses all requests for retry-after
+        """
+        with self._condition:
+            now = time.monotonic()
+            for bucket, names in (
+                (self.requests, ("requests",)),
+                (self.input_tokens, ("input-tokens", "tokens")),
+            ):
+                for name in names:
+                    limit = _header_number(headers, f"anthropic-ratelimit-{name}-limit")
+                    if limit:
+                        remaining = _header_number(headers, f"anthropic-ratelimit-{name}-remaining")
+                        bucket.wait_time(0, now)  # Refill up to now before resizing
+                        bucket.capacity = limit
+                        bucket.level = min(bucket.level, limit if remaining is None else remaining)
+                        break
+
+            retry_after = _header_number(headers, "retry-after")
+            if status_code == 429 and retry_after:
+                self.blocked_until = max(self.blocked_until, now + retry_after)
+
+            self._condition.notify_all()
+
+    def observe_response(self, response: httpx.Response) -> None:
+        """httpx response hook: learn limits from every API response."""
+        self.update(response.headers, response.status_code)
+
+
+def client_options(limiter: RateLimiter) -> dict[str, Any]:
+    """
+    Keyword arguments for Anthropic(...) when the client will be wrapped.
+
+    Disables SDK retries (RateLimitedClient retries instead) and installs the
+    limiter's response hook.
+
+    Args:
+        limiter: Limiter that should observe rate-limit headers
+
+    Returns:
+        Dictionary of client keyword arguments
+    """
+    return {
+        "max_retries": 0,
+        "http_client": DefaultHttpxClient(event_hooks={"response": [limiter.observe_response]}),
+    }
+
+
+class RateLimitedClient:
+    """Anthropic client whose messages.create is rate limited and retried."""
+
+    def __init__(
+        self,
+        client: Any,
+        limiter: RateLimiter,
+        max_retries: int = API_MAX_RETRIES,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Wrap an Anthropic client.
+
+        Args:
+            client: Anthropic client (created with client_options())
+            limiter: Rate limiter shared by wrapped clients
+            max_retries: Retries after the first attempt for transient errors
+            base_delay: Backoff ceiling for the first retry (doubles per retry)
+            max_delay: Upper bound for the backoff ceiling
+            sleep: Sleep function (injectable for tests)
+        """
+        self.client = client
+        self.limiter = limiter
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._sleep = sleep
+        self.messages = _RateLimitedMessages(self)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.client, name)
+
+    def backoff(self, attempt: int, error: Exception) -> float:
+        """Full-jitter exponential delay, never shorter than retry-after."""
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+        headers = getattr(getattr(error, "response", None), "headers", None)
+        return max(delay, _header_number(headers, "retry-after") or 0.0)
+
+
+class _RateLimitedMessages:
+    def __init__(self, owner: RateLimitedClient):
+        self._owner = owner
+
+    def create(self, **request: Any) -> Any:
+        """messages.create with rate limiting and retries."""
+        owner = self._owner
+        prompt = json.dumps([request.get("system", ""), request.get("messages", [])], default=str)
+        estimate = max(1, len(prompt) // CHARS_PER_TOKEN)
+        attempt = 0
+
+        while True:
+            owner.limiter.acquire(estimate)
+            try:
+                return owner.client.messages.create(**request)
+            except Exception as e:
+                if attempt >= owner.max_retries or not is_retryable(e):
+                    raise
+                delay = owner.backoff(attempt, e)
+                logger.warning(
+                    f"Claude API call failed ({type(e).__name__}); "
+                    f"retry {attempt + 1}/{owner.max_retries} in {delay:.1f}s"
+                )
+            finally:
+                owner.limiter.release()
+
+            owner._sleep(delay)
+            attempt += 1
+
+
+_shared_limiter: Optional[RateLimiter] = None
+_shared_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Get the process-wide rate limiter shared by all generators."""
+    global _shared_limiter
+    with _shared_limiter_lock:
+        if _shared_limiter is None:
+            _shared_limiter = RateLimiter()
+        return _shared_limiter
@@ -13,6 +13,12 @@ MAX_API_TOKENS = 2000
 PLUGIN_RECOMMENDATION_MAX_TOKENS = 1500
 API_TEMPERATURE = 0.3
 
+# Claude API rate limiting and retries (see generator/api_client.py)
+API_MAX_RETRIES = 5  # Retries for 429/529/5xx/connection errors
+API_MAX_CONCURRENCY = 4  # Requests in flight at once
+API_REQUESTS_PER_MINUTE = 50  # Starting budget; resized from rate-limit headers
+API_INPUT_TOKENS_PER_MINUTE = 30000  # Starting budget; resized from rate-limit headers
+
 # ==================== Project Configuration ====================
 
 # Project name validation
@@ -0,0 +1,145 @@
+"""
+Unit tests for the rate-limited Claude API client wrapper.
+
+Tests cover:
+- Token buckets and header-driven limits
+- Retrying 429/529 with backoff
+- Non-retryable errors and retry exhaustion
+- AIAgentGenerator using the wrapped client
+"""
+
+import time
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+from anthropic import BadRequestError, InternalServerError, RateLimitError
+
+from src.generator.ai_generator import AIAgentGenerator, AIGenerationConfig
+from src.generator.api_client import (
+    RateLimitedClient,
+    RateLimiter,
+    TokenBucket,
+    is_retryable,
+)
+
+
+def api_error(error_class, status_code, headers=None):
+    """Build an SDK error with a real response attached."""
+    request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+    response = httpx.Response(status_code, headers=headers or {}, request=request)
+    return error_class("error", response=response, body=None)
+
+
+def make_wrapper(side_effect, max_retries=3):
+    """Wrap a mock client whose messages.create follows side_effect."""
+    client = Mock()
+    client.messages.create.side_effect = side_effect
+    delays = []
+    wrapper = RateLimitedClient(client, RateLimiter(), max_retries=max_retries, sleep=delays.append)
+    return wrapper, client, delays
+
+
+class TestRateLimiter:
+    """Test token buckets and rate-limit headers."""
+
+    def test_bucket_refills_over_time(self):
+        """Test that a drained bucket reports the time to refill."""
+        bucket = TokenBucket(per_minute=60)
+        now = bucket.updated
+        bucket.level = 0
+
+        assert bucket.wait_time(1, now) == pytest.approx(1.0)
+        assert bucket.wait_time(1, now + 1) == 0
+
+    def test_headers_resize_buckets(self):
+        """Test that rate-limit headers replace the starting budgets."""
+        limiter = RateLimiter(requests_per_minute=50)
+
+        limiter.update(
+            {
+                "anthropic-ratelimit-requests-limit": "1000",
+                "anthropic-ratelimit-requests-remaining": "3",
+            }
+        )
+
+        assert limiter.requests.capacity == 1000
+        assert limiter.requests.level == pytest.approx(3, abs=0.1)
+
+    def test_429_pauses_requests(self):
+        """Test that a 429 with retry-after blocks new requests."""
+        limiter = RateLimiter()
+
+        limiter.update({"retry-after": "30"}, status_code=429)
+
+        assert limiter.blocked_until > time.monotonic() + 25
+
+
+class TestRetries:
+    """Test retrying of transient API errors."""
+
+    def test_retryable_errors(self):
+        """Test which errors are considered transient."""
+        assert is_retryable(api_error(RateLimitError, 429))
+        assert is_retryable(api_error(InternalServerError, 529))
+        assert not is_retryable(api_error(BadRequestError, 400))
+        assert not is_retryable(Exception("API Error"))
+
+    def test_retries_until_success(self):
+        """Test that 429 and overloaded errors are retried."""
+        wrapper, client, delays = make_wrapper(
+            [
+                api_error(RateLimitError, 429),
+                api_error(InternalServerError, 529),
+                "response",
+            ]
+        )
+
+        assert wrapper.messages.create(model="m", messages=[]) == "response"
+        assert client.messages.create.call_count == 3
+        assert len(delays) == 2
+        assert wrapper.limiter.in_flight == 0
+
+    def test_non_retryable_error_raises(self):
+        """Test that client errors propagate without retrying."""
+        wrapper, client, delays = make_wrapper([api_error(BadRequestError, 400)])
+
+        with pytest.raises(BadRequestError):
+            wrapper.messages.create(model="m", messages=[])
+        assert client.messages.create.call_count == 1
+        assert delays == []
+
+    def test_gives_up_after_max_retries(self):
+        """Test that the last error propagates once retries are exhausted."""
+        wrapper, client, _ = make_wrapper([api_error(RateLimitError, 429)] * 3, max_retries=2)
+
+        with pytest.raises(RateLimitError):
+            wrapper.messages.create(model="m", messages=[])
+        assert client.messages.create.call_count == 3
+
+    def test_backoff_honours_retry_after(self):
+        """Test that the delay is never shorter than retry-after."""
+        wrapper, _, delays = make_wrapper(
+            [
+                api_error(RateLimitError, 429, {"retry-after": "7"}),
+                "response",
+            ]
+        )
+
+        wrapper.messages.create(model="m", messages=[])
+
+        assert delays[0] >= 7
+
+
+class TestGeneratorIntegration:
+    """Test that AIAgentGenerator goes through the wrapper."""
+
+    @patch("src.generator.ai_generator.Anthropic")
+    def test_client_is_rate_limited(self, mock_anthropic_class):
+        """Test that the generator disables SDK retries and wraps the client."""
+        generator = AIAgentGenerator(AIGenerationConfig(enabled=True, api_key="test-key"))
+
+        assert isinstance(generator.client, RateLimitedClient)
+        kwargs = mock_anthropic_class.call_args.kwargs
+        assert kwargs["api_key"] == "test-key"
+        assert kwargs["max_retries"] == 0